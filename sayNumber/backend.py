@@ -2,32 +2,75 @@
 # This program is free software; find details in file LICENCE or here:
 # https://raw.github.com/camillo/sayNumber/master/sayNumber/LICENSE
 
+import bisect
 import os
-from logging import getLogger
+import re
+import sys
+from array import array
+from collections import OrderedDict, deque
 
-latinLogger = getLogger("latin")
+# The tables, that are already in use; key is (delimiter, synonym, chuquet, stem). See _latinTable.
+_latinTables = {}
 
 
-def _sayLatin(numberToSay, delimiter='', synonym=False, chuquet=False, **_):
-    if not 0 <= numberToSay < 1000:
-        raise ValueError("Number must be 0-999; given: [%s]." % numberToSay)
+def _latinTable(delimiter='', synonym=False, chuquet=False, stem=False):
+    """
+    @return tuple with the joined latin prefixes for 0 to 999; see latinNumbers.buildTable.
+    """
+    key = (delimiter, bool(synonym), bool(chuquet), stem)
+    try:
+        return _latinTables[key]
+    except KeyError:
+        # Only tables without delimiter are precomputed; the packed ones load much faster than latinNumbers.
+        if delimiter:
+            from latinNumbers import buildTable
+            table = buildTable(*key)
+        else:
+            from latinTables import unpackTable
+            table = unpackTable(*key[1:])
+        _latinTables[key] = table
+        return table
+
+
+# The logger for the latin prefixes; None, until somebody did import logging. See _logsLatin.
+_latinLogger = None
+
+
+def _logsLatin():
+    """
+    @return True, if the latin prefixes get logged. logging is slow to import; if nobody did import it, it cannot be
+            configured and nothing gets logged. This is not free either; ask once per word, not per latin part.
+    """
+    global _latinLogger
+    if _latinLogger is None:
+        logging = sys.modules.get("logging")
+        if logging is None:
+            return False
+        _latinLogger = logging.getLogger("latin")
+    return _latinLogger.isEnabledFor(sys.modules["logging"].INFO)
 
-    from latinNumbers import LATIN_NUMBERS, LATIN_SYNONYMS, CHUQUET_PREFIXES
+
+def _logLatin(numberToSay, synonym, chuquet):
+    from latinNumbers import LATIN_SYNONYMS, CHUQUET_PREFIXES
+    latinLogger = _latinLogger
     if chuquet and numberToSay in CHUQUET_PREFIXES:
         latinLogger.debug("using chuquet prefix")
-        target = CHUQUET_PREFIXES[numberToSay]
     elif synonym and numberToSay in LATIN_SYNONYMS:
         latinLogger.debug("using synonym")
-        target = LATIN_SYNONYMS[numberToSay]
     else:
         latinLogger.debug("using normal latin prefix" + (
                           "; no chuquet prefix available" if chuquet
                           else "; no synonym available" if synonym
                           else ''))
-        target = LATIN_NUMBERS[numberToSay]
+    latinLogger.info("%s -> %s", numberToSay, _latinTable('-', synonym, chuquet)[numberToSay])
+
 
-    latinLogger.info("%s -> %s", numberToSay, "-".join(target))
-    return delimiter.join(target)
+def _sayLatin(numberToSay, delimiter='', synonym=False, chuquet=False, **_):
+    if not 0 <= numberToSay < 1000:
+        raise ValueError("Number must be 0-999; given: [%s]." % numberToSay)
+    if _logsLatin():
+        _logLatin(numberToSay, synonym, chuquet)
+    return _latinTable(delimiter, synonym, chuquet)[numberToSay]
 
 
 def sayLatin(numberToSay, delimiter='', synonym=False, chuquet=False):
@@ -44,6 +87,30 @@ def sayLatin(numberToSay, delimiter='', synonym=False, chuquet=False):
     return _sayLatin(numberToSay, delimiter, synonym, chuquet)
 
 
+def _thousandGroups(number):
+    """
+    Helper that splits a positive int into its base 1000 digits.
+    @return list of ints from 0 to 999, starting with the highest one.
+    """
+    ret = []
+    while number > 0:
+        number, current = divmod(number, 1000)
+        ret.append(current)
+    ret.reverse()
+    return ret
+
+
+def _sayLatinGroup(group, delimiter='', synonym=False, chuquet=False, logLatin=None, **_):
+    """
+    Build the part of a word, that stands for one base 1000 digit of the latin number; followed by the delimiter.
+    @param logLatin True, if the latin prefixes get logged; asks _logsLatin, if not given.
+    """
+    if _logsLatin() if logLatin is None else logLatin:
+        _logLatin(group, synonym, chuquet)
+    # The stem table has the trailing 'a' of a ten prefix without hundred prefix already changed to 'i'.
+    return _latinTable(delimiter, synonym, chuquet, stem=True)[group] + delimiter
+
+
 def _sayLongScale(zerosAfterOne, plural=False, delimiter='', **kwargs):
     """
     Build the word for the number, starting with a 1, followed by as many 0 as specified in zeros.
@@ -56,21 +123,10 @@ def _sayLongScale(zerosAfterOne, plural=False, delimiter='', **kwargs):
     if zerosAfterOne % 3 > 0:
         raise ValueError("Zeros mod 3 must be 0.")
     sixes, lliarde = divmod(zerosAfterOne, 6)
-    ret = ""
-    while sixes > 0:
-        # We do one thousand block per iteration, starting with the the lowest value.
-        current = sixes % 1000
-        prefix = _sayLatin(current, delimiter, **kwargs)
-        # If we combine a ten prefix, without a hundred prefix, the 'a' changes to 'i' if present at last position.
-        if 100 > current > 9 and prefix[-1] == "a":
-            prefix = prefix[:-1] + 'i'
-        prefix += delimiter
-        # This is the prefix for separating the thousand blocks. We skip this, if this is the first iteration.
-        if ret:
-            prefix += "lli" + delimiter
-        ret = prefix + ret
-        sixes -= current
-        sixes /= 1000
+    # Every base 1000 digit of sixes makes one latin part; the parts are separated by "lli".
+    logLatin = _logsLatin()
+    ret = ("lli" + delimiter).join([_sayLatinGroup(group, delimiter, logLatin=logLatin, **kwargs)
+                                    for group in _thousandGroups(sixes)])
     # Now add the postfix to make a word.
     if lliarde:
         ret += "lliard"
@@ -94,17 +150,124 @@ def _sayShortScale(zerosAfterOne, plural=False, **kwargs):
     return _sayLongScale(longScaleZeros, plural=plural, **kwargs)
 
 
+class ScaleWordCache(object):
+    """
+    Least recently used cache for scale words, like they get build by sayByExp.
+    The key is the count of zeros, the plural flag and all options, that change the word (see _scaleWordOptions).
+    """
+
+    def __init__(self, maxSize=4096):
+        self.maxSize = maxSize
+        self.hits, self.misses, self.evictions = 0, 0, 0
+        self._words = OrderedDict()
+
+    def get(self, key):
+        """ @return the cached word for key, or None if not cached. """
+        word = self._words.pop(key, None)
+        if word is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            # Re-insert to mark the word as most recently used.
+            self._words[key] = word
+        return word
+
+    def put(self, key, word):
+        """ Cache the word; evicts the least recently used words, if the cache is full. """
+        if self.maxSize < 1:
+            return
+        self._words[key] = word
+        while len(self._words) > self.maxSize:
+            self._words.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxSize):
+        """ Set the maximum count of cached words; 0 disables the cache. """
+        self.maxSize = maxSize
+        while len(self._words) > max(maxSize, 0):
+            self._words.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """ Remove all words and reset the counters. """
+        self._words.clear()
+        self.hits, self.misses, self.evictions = 0, 0, 0
+
+    def info(self):
+        """ @return dict with the counters, the current and the maximum size. """
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'size': len(self._words), 'maxSize': self.maxSize}
+
+    def __len__(self):
+        return len(self._words)
+
+
+# Used by sayByExp and by say/iterSay for numbers, that do not have more thousand blocks than the cache can hold.
+scaleWordCache = ScaleWordCache()
+
+
+def _scaleWordOptions(shortScale=False, forceZ=False, forceC=False, delimiter='', synonym=False, chuquet=False, **_):
+    """ The options, that change a scale word; part of the key for the scaleWordCache. """
+    return bool(shortScale), bool(forceZ), bool(forceC), delimiter, bool(synonym), bool(chuquet)
+
+
+# Exponents given as string with more digits than this are never converted to int; see iterSayByExp.
+MAX_INT_EXPONENT_DIGITS = 18
+
+
+def _divmodDecimal(digits, divisor, chunkSize=MAX_INT_EXPONENT_DIGITS):
+    """
+    Helper that divides a number, given as string of digits, by a small int; in linear time, unlike int(digits).
+    @return tuple (quotient as string of digits, remainder as int).
+    """
+    quotient, remainder = [], 0
+    for start in xrange(0, len(digits), chunkSize):
+        chunk = digits[start:start + chunkSize]
+        current, remainder = divmod(remainder * 10 ** len(chunk) + int(chunk), divisor)
+        quotient.append("%0*d" % (len(chunk), current))
+    return "".join(quotient).lstrip("0") or "0", remainder
+
+
+def _decrementDecimal(digits):
+    """ Helper that subtracts 1 from a number > 0, given as string of digits. """
+    head = digits.rstrip("0")
+    return (head[:-1] + str(int(head[-1]) - 1)).lstrip("0") + "9" * (len(digits) - len(head))
+
+
+def iterSayByExp(zerosAfterOne, plural=False, shortScale=False, forceZ=False, forceC=False, delimiter='',
+                 synonym=False, chuquet=False, chunkGroups=4096, **_):
+    """
+    Build the same word as sayByExp piece by piece; for exponents with millions of digits.
+    The exponent may be given as string of digits; it never gets converted to int and its base 1000 digits are sliced
+    out of the string. This keeps the work linear to the count of digits.
+    @param chunkGroups Count of latin parts per yielded piece.
+    @return generator of strings; joined, they make the word.
+    """
+    word = sayScaleWord(zerosAfterOne, plural, shortScale, forceZ, forceC, delimiter, synonym, chuquet)
+    for piece in word.iterChunks(chunkGroups):
+        yield piece
+
+
 def sayByExp(zerosAfterOne, plural=False, shortScale=False, forceZ=False, forceC=False, **kwargs):
     """
     Build the word for the number, starting with a 1, followed by as many "0" as specified in zeros.
-    @param zerosAfterOne the number of "0", following the "1". Must be 3 at least and zeros % 3 == 0.
+    @param zerosAfterOne the number of "0", following the "1". Must be 3 at least and zeros % 3 == 0. Can be a string
+                         of digits; very long ones get said by iterSayByExp, without converting them to int.
     @param plural True, if the plural form should be returned, False for singular.
     @param shortScale True, to use us/uk system, german otherwise
     """
+    if isinstance(zerosAfterOne, basestring):
+        if len(zerosAfterOne) > MAX_INT_EXPONENT_DIGITS:
+            return "".join(iterSayByExp(zerosAfterOne, plural, shortScale, forceZ, forceC, **kwargs))
+        zerosAfterOne = int(zerosAfterOne)
     if zerosAfterOne < 3:
         raise ValueError('Zeros must be 3 or greater.')
     if zerosAfterOne % 3 > 0:
         raise ValueError("Zeros mod 3 must be 0.")
+    key = (zerosAfterOne, bool(plural)) + _scaleWordOptions(shortScale, forceZ, forceC, **kwargs)
+    ret = scaleWordCache.get(key)
+    if ret is not None:
+        return ret
     if zerosAfterOne == 3:
         ret = "thousand"
     elif shortScale:
@@ -113,56 +276,1440 @@ def sayByExp(zerosAfterOne, plural=False, shortScale=False, forceZ=False, forceC
         ret = _sayLongScale(zerosAfterOne, plural, **kwargs)
     if forceC or (shortScale and not forceZ):
         ret = ret.replace("z", "c")
+    scaleWordCache.put(key, ret)
     return ret
 
 
+def sayPowerOfTen(zerosAfterOne, forceSingular=False, forcePlural=False, **kwargs):
+    """
+    Build the word for the number, starting with a 1, followed by as many "0" as specified in zerosAfterOne; like
+    "100 milliards" for 11 zeros.
+    @param zerosAfterOne Count of "0"; can be a string of digits, see sayByExp.
+    @return the word for given number; the leading digits are written as number.
+    """
+    leading, zeros, plural = _splitPowerOfTen(zerosAfterOne, forceSingular, forcePlural)
+    return leading + " " + sayByExp(zeros, plural, **kwargs)
+
+
+def _splitPowerOfTen(zerosAfterOne, forceSingular=False, forcePlural=False):
+    """
+    Helper that splits a power of ten in its leading digits and the part, that gets said by a scale word.
+    @return tuple (leading digits like "100", zeros of the scale word, plural).
+    """
+    zeros = zerosAfterOne
+    if isinstance(zeros, basestring) and len(zeros) > MAX_INT_EXPONENT_DIGITS:
+        zerosLeft = _divmodDecimal(zeros, 3)[1]
+        for _ in xrange(zerosLeft):
+            zeros = _decrementDecimal(zeros)
+    else:
+        zeros, zerosLeft = divmod(int(zeros), 3)
+        zeros *= 3
+    plural = forcePlural or (zerosLeft and not forceSingular)
+    return "1" + "0" * zerosLeft, zeros, plural
+
+
+def iterSayPowerOfTen(zerosAfterOne, forceSingular=False, forcePlural=False, chunkGroups=4096, **kwargs):
+    """
+    Build the same word as sayPowerOfTen piece by piece; the scale word of an exponent with more than
+    MAX_INT_EXPONENT_DIGITS digits is kept as ScaleWord and never built at once.
+    @return generator of strings; joined, they make the word.
+    """
+    leading, zeros, plural = _splitPowerOfTen(zerosAfterOne, forceSingular, forcePlural)
+    if not isinstance(zeros, basestring):
+        yield leading + " " + sayByExp(zeros, plural, **kwargs)
+        return
+    yield leading + " "
+    for piece in sayScaleWord(zeros, plural, **kwargs).iterChunks(chunkGroups):
+        yield piece
+
+
+class ScaleWord(object):
+    """
+    A scale word, kept as the base 1000 digits of its latin number and its suffix, instead of its characters: an array
+    of indices into the prefix table takes 2 bytes per base 1000 digit, the word a dozen characters and more. The
+    characters are made on demand, piece by piece; so the word of an exponent with millions of digits can be measured,
+    compared and written, without building it. See sayScaleWord.
+    Two instances are equal, if they have the same latin number, suffix and options.
+    """
+
+    def __init__(self, groups, suffix, delimiter='', synonym=False, chuquet=False, replaceZ=False):
+        """
+        @param groups array('H') with the base 1000 digits of the latin number, starting with the highest one; empty
+                      for "thousand".
+        @param suffix "llion" or "lliard", followed by "s" for the plural; "thousand" for thousand.
+        @param replaceZ True, to say c instead of z.
+        """
+        self.groups = groups
+        self.suffix = suffix
+        self.options = (delimiter, bool(synonym), bool(chuquet), bool(replaceZ))
+        self._length = None
+        self._hash = None
+
+    def iterChunks(self, chunkGroups=4096):
+        """
+        @param chunkGroups Count of latin parts per yielded piece.
+        @return generator of strings; joined, they make the word.
+        """
+        delimiter, synonym, chuquet, replaceZ = self.options
+        table = _latinTable(delimiter, synonym, chuquet, stem=True)
+        logLatin = _logsLatin()
+        separator = "lli" + delimiter
+        count, piece = len(self.groups), ""
+        for start in xrange(0, count, chunkGroups):
+            groups = self.groups[start:start + chunkGroups]
+            if logLatin:
+                for group in groups:
+                    _logLatin(group, synonym, chuquet)
+            piece = (separator if start else "") + separator.join([table[group] + delimiter for group in groups])
+            if start + chunkGroups < count:
+                yield piece.replace("z", "c") if replaceZ else piece
+        piece += self.suffix
+        yield piece.replace("z", "c") if replaceZ else piece
+
+    def write(self, out):
+        """ Write the word to the file like object out, piece by piece. """
+        for piece in self.iterChunks():
+            out.write(piece)
+
+    def __str__(self):
+        return "".join(self.iterChunks())
+
+    def __len__(self):
+        """ The count of characters of the word; counted from the lengths of the prefixes, without building it. """
+        if self._length is None:
+            from itertools import imap
+            delimiter, synonym, chuquet, _ = self.options
+            lengths = _prefixLengths(delimiter, synonym, chuquet)
+            count = len(self.groups)
+            self._length = (sum(imap(lengths.__getitem__, self.groups)) + max(count - 1, 0) * (3 + len(delimiter)) +
+                            len(self.suffix))
+        return self._length
+
+    def __eq__(self, other):
+        if not isinstance(other, ScaleWord):
+            return NotImplemented
+        return self.suffix == other.suffix and self.options == other.options and self.groups == other.groups
+
+    def __ne__(self, other):
+        ret = self.__eq__(other)
+        return ret if ret is NotImplemented else not ret
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((self.groups.tostring(), self.suffix, self.options))
+        return self._hash
+
+    def __repr__(self):
+        return "ScaleWord(%d groups, %r)" % (len(self.groups), self.suffix)
+
+
+def sayScaleWord(zerosAfterOne, plural=False, shortScale=False, forceZ=False, forceC=False, delimiter='',
+                 synonym=False, chuquet=False, **_):
+    """
+    Build the same word as sayByExp, as ScaleWord; in time and memory linear to the count of digits of zerosAfterOne.
+    @param zerosAfterOne The count of "0", following the "1"; an int or a string of digits, that never gets converted
+                         to int. Must be 3 at least and zeros mod 3 == 0.
+    """
+    zeros = str(zerosAfterOne).lstrip("0") or "0"
+    if len(zeros) == 1 and zeros < "3":
+        raise ValueError('Zeros must be 3 or greater.')
+    thirds, rest = _divmodDecimal(zeros, 3)
+    if rest:
+        raise ValueError("Zeros mod 3 must be 0.")
+    replaceZ = forceC or (shortScale and not forceZ)
+    if zeros == "3":
+        return ScaleWord(array('H'), "thousand", delimiter, synonym, chuquet, replaceZ)
+    if shortScale:
+        # Same as _sayShortScale: the long scale word for 2 * zeros - 6 zeros.
+        sixes, lliarde = _decrementDecimal(thirds), 0
+    else:
+        sixes, lliarde = _divmodDecimal(zeros, 6)
+    groups = array('H', (int(group) for _, group in _iterThousandBlocks(sixes)))
+    return ScaleWord(groups, ("lliard" if lliarde else "llion") + ("s" if plural else ""), delimiter, synonym, chuquet,
+                     replaceZ)
+
+
+# The lengths of the stem tables, that are already in use; key is (delimiter, synonym, chuquet). See _prefixLengths.
+_prefixLengthTables = {}
+
+
+def _prefixLengths(delimiter='', synonym=False, chuquet=False):
+    """ @return list with the length of the latin part of a scale word for 0 to 999, including the delimiter. """
+    key = (delimiter, synonym, chuquet)
+    ret = _prefixLengthTables.get(key)
+    if ret is None:
+        ret = [len(prefix) + len(delimiter) for prefix in _latinTable(delimiter, synonym, chuquet, stem=True)]
+        _prefixLengthTables[key] = ret
+    return ret
+
+
+class _ScaleWordLengths(object):
+    """
+    Count the characters of the scale words, that _ScaleWords builds, without building them. The length of all latin
+    parts but the lowest one is kept, so counting a word costs the same for any exponent.
+    """
+
+    def __init__(self, shortScale=False, delimiter='', synonym=False, chuquet=False, **_):
+        self.shortScale = shortScale
+        self.lengths = _prefixLengths(delimiter, synonym, chuquet)
+        self.separatorLength = len("lli" + delimiter)
+        # The length of the latin parts, each followed by "lli", for sixes // 1000.
+        self.heads = {}
+
+    def length(self, zerosAfterOne, plural=False):
+        """ The length of sayByExp(zerosAfterOne, plural, ...) with the options given to the constructor. """
+        if zerosAfterOne == 3:
+            return len("thousand")
+        longScaleZeros = 2 * zerosAfterOne - 6 if self.shortScale else zerosAfterOne
+        sixes, lliarde = divmod(longScaleZeros, 6)
+        high, low = divmod(sixes, 1000)
+        return self.head(high) + self.lengths[low] + len("lliard" if lliarde else "llion") + (1 if plural else 0)
+
+    def head(self, high):
+        """ The length of all latin parts but the lowest one, for sixes // 1000. """
+        ret = self.heads.get(high)
+        if ret is None:
+            ret = sum([self.lengths[group] + self.separatorLength for group in _thousandGroups(high)])
+            self.heads[high] = ret
+        return ret
+
+
+def sayByExpLength(zerosAfterOne, plural=False, shortScale=False, forceZ=False, forceC=False, **kwargs):
+    """
+    Count the characters of sayByExp(zerosAfterOne, plural, ...) without building the word; c or z does not change it.
+    @param zerosAfterOne Like for sayByExp; an exponent with more than MAX_INT_EXPONENT_DIGITS digits costs time linear
+                         to its digits, see sayScaleWord.
+    """
+    if isinstance(zerosAfterOne, basestring) and len(zerosAfterOne) > MAX_INT_EXPONENT_DIGITS:
+        return len(sayScaleWord(zerosAfterOne, plural, shortScale, **kwargs))
+    zerosAfterOne = int(zerosAfterOne)
+    if zerosAfterOne < 3:
+        raise ValueError('Zeros must be 3 or greater.')
+    if zerosAfterOne % 3 > 0:
+        raise ValueError("Zeros mod 3 must be 0.")
+    return _ScaleWordLengths(shortScale, **kwargs).length(zerosAfterOne, plural)
+
+
+class _ScaleWords(object):
+    """
+    Build the words for descending exponents, as needed for the thousand blocks of one number.
+    Going down one block, only the lowest latin part of the word changes (long scale: every second block); the higher
+    parts are kept and reused.
+    """
+
+    def __init__(self, shortScale=False, forceZ=False, forceC=False, delimiter='', cache=None, batch=False, **kwargs):
+        """ @param batch True, if the instance says many numbers; it keeps the words it got from the cache then. """
+        self.cache = cache
+        self.options = _scaleWordOptions(shortScale, forceZ, forceC, delimiter, **kwargs)
+        self.shortScale = shortScale
+        self.replaceZ = forceC or (shortScale and not forceZ)
+        self.delimiter = delimiter
+        self.synonym, self.chuquet = kwargs.get('synonym', False), kwargs.get('chuquet', False)
+        self.latin = _latinTable(delimiter, self.synonym, self.chuquet, stem=True)
+        self.logLatin = _logsLatin()
+        self.sixes = None
+        self.groups = None
+        # head holds all latin parts but the lowest one, each followed by "lli"; stem holds all latin parts.
+        self.head = ""
+        self.stem = ""
+        # The words, this instance did already get from the cache; a dict is much faster than the LRU cache.
+        self.words = {} if batch else None
+
+    def _sayGroup(self, group):
+        if self.logLatin:
+            _logLatin(group, self.synonym, self.chuquet)
+        ret = self.latin[group] + self.delimiter
+        return ret.replace("z", "c") if self.replaceZ else ret
+
+    def _setSixes(self, sixes):
+        if sixes == self.sixes:
+            return
+        if self.sixes is not None and sixes == self.sixes - 1 and self.groups[-1] > 0:
+            # Only the lowest base 1000 digit changes.
+            self.groups[-1] -= 1
+        else:
+            self.groups = _thousandGroups(sixes)
+            self.head = "".join([self._sayGroup(group) + "lli" + self.delimiter for group in self.groups[:-1]])
+        self.sixes = sixes
+        self.stem = self.head + self._sayGroup(self.groups[-1])
+
+    def word(self, zerosAfterOne, plural=False):
+        """
+        Build the same word as sayByExp(zerosAfterOne, plural, ...) with the options given to the constructor.
+        """
+        if zerosAfterOne == 3:
+            return "thousand"
+        if self.cache is not None:
+            ret = self.words.get((zerosAfterOne, plural)) if self.words is not None else None
+            if ret is None:
+                key = (zerosAfterOne, bool(plural)) + self.options
+                ret = self.cache.get(key)
+                if ret is None:
+                    ret = self._build(zerosAfterOne, plural)
+                    self.cache.put(key, ret)
+                if self.words is not None:
+                    self.words[(zerosAfterOne, plural)] = ret
+            return ret
+        return self._build(zerosAfterOne, plural)
+
+    def _build(self, zerosAfterOne, plural):
+        longScaleZeros = 2 * zerosAfterOne - 6 if self.shortScale else zerosAfterOne
+        sixes, lliarde = divmod(longScaleZeros, 6)
+        self._setSixes(sixes)
+        ret = self.stem + ("lliard" if lliarde else "llion")
+        return ret + 's' if plural else ret
+
+
+def _groupLengths(length, grouping):
+    """
+    Helper that computes the groups of a number with length digits, like the locale module does.
+    @param grouping The grouping list of locale.localeconv().
+    @return tuple (headLength, repeat, repeatCount, tailLengths): the leftmost group, the count of following groups
+            with repeat digits and the remaining groups, all from left to right.
+    """
+    import locale
+    tail, repeat = [], None
+    for interval in grouping:
+        if interval == locale.CHAR_MAX:
+            break
+        if interval == 0:
+            if not tail:
+                raise ValueError("invalid grouping")
+            # The last interval gets repeated for all remaining digits.
+            repeat = tail[-1]
+            break
+        tail.append(interval)
+    tailLengths, rest = [], length
+    for interval in tail:
+        if rest <= 0:
+            break
+        tailLengths.append(min(interval, rest))
+        rest -= interval
+    tailLengths.reverse()
+    rest = max(rest, 0)
+    if not rest:
+        return 0, repeat, 0, tailLengths
+    if not repeat:
+        return rest, repeat, 0, tailLengths
+    headLength = rest % repeat or repeat
+    return headLength, repeat, (rest - headLength) // repeat, tailLengths
+
+
+def _numericGrouping(grouping=True):
+    """
+    @return tuple (thousands separator, grouping list) of the LC_NUMERIC locale; (None, None) if there is nothing to
+            group.
+    """
+    import locale
+    conv = locale.localeconv()
+    if not grouping or not conv['grouping'] or not conv['thousands_sep']:
+        return None, None
+    return conv['thousands_sep'], conv['grouping']
+
+
+def iterGroupedNumber(number, grouping=True, chunkGroups=4096):
+    """
+    Format a number like locale.format("%d", int(number), grouping=grouping), but without converting it to int.
+    The thousands separator and the grouping are read once from the LC_NUMERIC locale.
+    @param number The number (can be a string of digits, int or a buffer like NumberFile.digits).
+    @param chunkGroups Count of groups per yielded chunk; a buffer without grouping is yielded in chunks of as many
+                       blocks of thousands.
+    @return generator of strings; joined, they make the formatted number.
+    """
+    if not isinstance(number, buffer):
+        number = str(number).lstrip('0') or '0'
+    separator, localeGrouping = _numericGrouping(grouping)
+    if not separator:
+        if isinstance(number, buffer):
+            for start in xrange(0, len(number), 3 * chunkGroups):
+                yield number[start:start + 3 * chunkGroups]
+        else:
+            yield number
+        return
+    headLength, repeat, repeatCount, tailLengths = _groupLengths(len(number), localeGrouping)
+    position = headLength
+    if headLength:
+        yield number[:headLength]
+    end = position + repeat * repeatCount if repeat else position
+    while position < end:
+        chunkEnd = min(end, position + repeat * chunkGroups)
+        groups = [number[start:start + repeat] for start in xrange(position, chunkEnd, repeat)]
+        yield separator + separator.join(groups)
+        position = chunkEnd
+    for groupLength in tailLengths:
+        yield (separator if position else '') + number[position:position + groupLength]
+        position += groupLength
+
+
+def iterGroupedPowerOfTen(zeros, grouping=True, chunkGroups=4096):
+    """
+    Format 10^zeros like iterGroupedNumber, without building the digits first; zeros may be bigger than sys.maxint.
+    @param chunkGroups Count of groups (or digits, if not grouped) per yielded chunk.
+    @return generator of strings; joined, they make the formatted number.
+    """
+    separator, localeGrouping = _numericGrouping(grouping)
+    if not separator:
+        headLength, repeat, repeatCount, tailLengths = zeros + 1, None, 0, []
+    else:
+        headLength, repeat, repeatCount, tailLengths = _groupLengths(zeros + 1, localeGrouping)
+    if headLength:
+        yield "1"
+        zerosLeft = headLength - 1
+        while zerosLeft > 0:
+            chunk = min(zerosLeft, chunkGroups)
+            yield "0" * chunk
+            zerosLeft -= chunk
+    if repeatCount:
+        group = separator + "0" * repeat
+        while repeatCount > 0:
+            chunk = min(repeatCount, chunkGroups)
+            yield group * chunk
+            repeatCount -= chunk
+    for groupLength in tailLengths:
+        if headLength:
+            yield separator + "0" * groupLength
+        else:
+            # The group with the "1".
+            yield "1" + "0" * (groupLength - 1)
+            headLength = groupLength
+
+
+def groupedPowerOfTenLength(zeros, grouping=True):
+    """ @return the length of the string iterGroupedPowerOfTen would make, without building it. """
+    separator, localeGrouping = _numericGrouping(grouping)
+    if not separator:
+        return zeros + 1
+    headLength, _, repeatCount, tailLengths = _groupLengths(zeros + 1, localeGrouping)
+    groups = (1 if headLength else 0) + repeatCount + len(tailLengths)
+    return zeros + 1 + (groups - 1) * len(separator)
+
+
+# Maps random bytes to digits; bytes from 250 on get dropped, so that every digit is equally likely.
+_BYTES_TO_DIGITS = "".join([str(byte % 10) for byte in range(250)]) + "\0" * 6
+_DROPPED_BYTES = "".join([chr(byte) for byte in range(250, 256)])
+
+
+def _iterRandomDigits(count, generator, chunkSize=1 << 16):
+    """
+    Helper that makes random digits in chunks, without a python call per digit.
+    @param generator The random.Random to use.
+    @return generator of strings with count digits in total.
+    """
+    from binascii import unhexlify
+    while count > 0:
+        # Mapping drops about 2% of the bytes; ask for a bit more.
+        byteCount = min(chunkSize, count + count // 32 + 16)
+        randomBytes = unhexlify("%0*x" % (byteCount * 2, generator.getrandbits(byteCount * 8)))
+        digits = randomBytes.translate(_BYTES_TO_DIGITS, _DROPPED_BYTES)[:count]
+        count -= len(digits)
+        yield digits
+
+
+def randomNumber(digits, seed=None):
+    """
+    Build a random number with given count of digits.
+    @param seed Seed for the random generator, to get the same number again; random if None.
+    @return the number as string; it never starts with 0.
+    """
+    import random
+    if digits < 1:
+        return ""
+    generator = random.Random(seed)
+    return str(generator.randint(1, 9)) + "".join(_iterRandomDigits(digits - 1, generator))
+
+
+def _iterThousandBlocks(number):
+    """
+    Helper that walks the given number in blocks of thousands, by index instead of slicing off the remaining digits.
+    @param number The number as string.
+    @return generator of (blocksLeft, block) tuples; as higher blocksLeft, as higher the value. The last block has 1.
+    """
+    length = len(number)
+    blocksLeft = (length + 2) // 3
+    start, end = 0, length % 3 or 3
+    while start < length:
+        yield blocksLeft, number[start:end]
+        blocksLeft -= 1
+        start, end = end, end + 3
+
+
 def _splitThousandBlocks(number):
     """
     Helper that splits the given number to blocks of thousands.
     @return array of blocks. As lower the index, as higher the value.
     """
-    ret = []
-    currentNumber = str(number)
-    firstNumbers = len(number) % 3
-    if firstNumbers:
-        ret.append(currentNumber[0:firstNumbers])
-        currentNumber = currentNumber[firstNumbers:]
-    while len(currentNumber) > 0:
-        ret.append(currentNumber[0:3])
-        currentNumber = currentNumber[3:]
-    return ret
+    return [block for _, block in _iterThousandBlocks(str(number))]
+
 
+# Finds the next digit, that is not 0.
+_NON_ZERO = re.compile("[1-9]")
 
-def say(number, byLine=False, forceSingular=False, forcePlural=False, **kwargs):
+# Runs of zeros are compared with slices of this; much faster than a regex search for long runs.
+_ZEROS = "0" * (1 << 16)
+
+
+def _findNonZero(number, start):
+    """
+    Helper that finds the next digit, that is not 0; the compared slices start small and grow, so a short run of
+    zeros is cheap and a long one gets compared in big chunks.
+    @return the index of the digit or None, if there are only zeros left.
+    """
+    length, chunkLength = len(number), 64
+    while start < length:
+        chunk = number[start:start + chunkLength]
+        if chunk != _ZEROS[:len(chunk)]:
+            return start + _NON_ZERO.search(chunk).start()
+        start += len(chunk)
+        chunkLength = min(2 * chunkLength, len(_ZEROS))
+    return None
+
+
+def _findNonZeroBefore(number, end):
+    """
+    Helper like _findNonZero, but searching towards the start; the compared slices end at end and grow.
+    @return the index after the last digit before end, that is not 0, or None, if there are only zeros before end.
+    """
+    chunkLength = 64
+    while end > 0:
+        start = max(end - chunkLength, 0)
+        chunk = number[start:end]
+        if chunk != _ZEROS[:len(chunk)]:
+            return start + len(chunk.rstrip("0"))
+        end = start
+        chunkLength = min(2 * chunkLength, len(_ZEROS))
+    return None
+
+
+def _iterNonZeroBlocks(number):
+    """
+    Helper like _iterThousandBlocks, but without the "000" blocks. A run of zeros gets skipped at once (see
+    _findNonZero), so a sparse number costs only as much as its non zero blocks.
+    """
+    length = len(number)
+    blocksLeft = (length + 2) // 3
+    start, end = 0, length % 3 or 3
+    while start < length:
+        block = number[start:end]
+        if block == "000":
+            nonZero = _findNonZero(number, end)
+            if nonZero is None:
+                return
+            # Jump to the block of the found digit; all blocks in between are "000".
+            skipped = (nonZero - start) // 3
+            start, end = start + 3 * skipped, end + 3 * skipped
+            blocksLeft -= skipped
+            block = number[start:end]
+        yield blocksLeft, block
+        blocksLeft -= 1
+        start, end = end, end + 3
+
+
+# Finds a character, that is not a digit.
+_NON_DIGIT = re.compile("[^0-9]")
+
+
+class NumberFile(object):
+    """
+    A file, that holds one number, mapped into memory; for numbers with billions of digits.
+    The digits are never copied into one string: digits is a buffer of the mapped file, that can be given to iterSay
+    and iterGroupedNumber. The pages of the file are read, when the blocks get said. Whitespace around the number and
+    leading zeros are skipped.
+    """
+
+    def __init__(self, path):
+        import mmap
+        with open(path, 'rb') as numberFile:
+            if not os.fstat(numberFile.fileno()).st_size:
+                raise ValueError("No number in file %s." % path)
+            self._map = mmap.mmap(numberFile.fileno(), 0, access=mmap.ACCESS_READ)
+        start, end = 0, len(self._map)
+        while start < end and self._map[start].isspace():
+            start += 1
+        while end > start and self._map[end - 1].isspace():
+            end -= 1
+        if start == end:
+            raise ValueError("No number in file %s." % path)
+        self._checkDigits(path, start, end)
+        digits = buffer(self._map, start, end - start)
+        nonZero = _findNonZero(digits, 0)
+        self.digits = buffer(digits, nonZero) if nonZero is not None else "0"
+
+    def _checkDigits(self, path, start, end, chunkLength=1 << 20):
+        # Deleting the digits of a chunk is much faster than a regex search for anything else.
+        for chunkStart in xrange(start, end, chunkLength):
+            chunk = self._map[chunkStart:min(end, chunkStart + chunkLength)]
+            if chunk.translate(None, "0123456789"):
+                invalid = _NON_DIGIT.search(chunk)
+                raise ValueError("No number in file %s; found '%s' at byte %d." % (
+                                 path, invalid.group(), chunkStart + invalid.start()))
+
+    def close(self):
+        """ Release the file; digits must not be used any more. """
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+
+def _iterComponents(number, scaleWords, forceSingular=False, forcePlural=False, blocksBelow=0):
+    """
+    Helper that builds the components of given number, using scaleWords (a _ScaleWords) for the scale words.
+    @param number The number as string.
+    @param blocksBelow Count of thousand blocks, that follow number; used to say a segment of a bigger number.
+    """
+    for blocksLeft, thousandBlock in _iterNonZeroBlocks(number):
+        blocksLeft += blocksBelow
+        thousandValue = int(thousandBlock)
+        if blocksLeft > 1:
+            plural = forcePlural or (thousandValue > 1 and not forceSingular)
+            yield "%d %s" % (thousandValue, scaleWords.word((blocksLeft - 1) * 3, plural))
+        else:
+            yield str(thousandValue)
+
+
+# Numbers with fewer thousand blocks are said by the pure python path; for them, NumPy costs more than it saves. The
+# engine wins only by 10 to 20 percent; below about 10^5 blocks, it is not faster at all.
+NUMPY_MIN_BLOCKS = 1 << 17
+
+# If numpy was not imported yet, the NumPy engine is used only for numbers with this many thousand blocks; importing
+# numpy takes about 75 ms, that a smaller number does not save.
+NUMPY_IMPORT_MIN_BLOCKS = 1 << 19
+
+# The NumPy engine decodes this many thousand blocks at once; the arrays stay small for numbers of any size.
+NUMPY_CHUNK_BLOCKS = 1 << 16
+
+# The numpy module, None if it is not installed or False, if it was not imported yet; see _importNumpy.
+_numpy = False
+
+
+def _importNumpy():
+    """ @return the numpy module or None, if it is not installed; it gets imported on first use only. """
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = None
+    return _numpy
+
+
+def _numpyFor(number):
+    """
+    @return numpy, if the NumPy engine should say number; None for small numbers, if NumPy is not installed and if the
+            first block is a short run of zeros, that the pure python path says as "0 ...".
+    """
+    blocks = (len(number) + 2) // 3
+    if blocks < NUMPY_MIN_BLOCKS or (len(number) % 3 and number[0] == "0"):
+        return None
+    if blocks < NUMPY_IMPORT_MIN_BLOCKS and _numpy is False and "numpy" not in sys.modules:
+        return None
+    return _importNumpy()
+
+
+def _iterBlockValues(numpy, number, chunkBlocks=NUMPY_CHUNK_BLOCKS):
+    """
+    NumPy engine: decode the digits of chunkBlocks thousand blocks at once; a short first block gets padded with zeros.
+    @return generator of (blocksLeft, values) tuples; values is an uint16 array of the block values of a chunk and
+            blocksLeft is the one of its first block, like in _iterThousandBlocks.
+    """
+    length = len(number)
+    blocksLeft = (length + 2) // 3
+    padding = -length % 3
+    weights = numpy.array((100, 10, 1), numpy.uint16)
+    start, end = 0, min(3 * chunkBlocks - padding, length)
+    while start < length:
+        digits = numpy.frombuffer(number, numpy.uint8, end - start, start) - ord("0")
+        if start == 0 and padding:
+            digits = numpy.concatenate((numpy.zeros(padding, numpy.uint8), digits))
+        # Characters below "0" wrap around, so they are greater than 9 too.
+        if (digits > 9).any():
+            raise ValueError("Not a number: found a character, that is not a digit.")
+        values = digits.reshape(-1, 3).astype(numpy.uint16).dot(weights)
+        yield blocksLeft, values
+        blocksLeft -= len(values)
+        start, end = end, min(end + 3 * chunkBlocks, length)
+
+
+def _iterComponentsNumpy(numpy, number, scaleWords, forceSingular=False, forcePlural=False, blocksBelow=0):
+    """
+    NumPy engine of _iterComponents: the block values, the "000" blocks and the plural forms of a chunk of blocks are
+    found at once, as arrays; only the strings get built one by one. Builds the same components as _iterComponents.
+    """
+    for blocksLeft, values in _iterBlockValues(numpy, number):
+        nonZero = numpy.flatnonzero(values)
+        values = values[nonZero]
+        plurals = ((values > 1) & (not forceSingular)) | bool(forcePlural)
+        zeros = (blocksLeft + blocksBelow - 1 - nonZero) * 3
+        for value, zerosAfterBlock, plural in zip(values.tolist(), zeros.tolist(), plurals.tolist()):
+            if zerosAfterBlock:
+                yield "%d %s" % (value, scaleWords.word(zerosAfterBlock, plural))
+            else:
+                yield str(value)
+
+
+def _isCacheable(number):
+    """ A number with more blocks than the cache can hold would only push out the words worth keeping. """
+    return (len(number) + 2) // 3 <= scaleWordCache.maxSize
+
+
+def _joinComponents(components, byLine=False):
+    # Join once at the end; adding up the result piece by piece is quadratic for numbers with many blocks.
+    if byLine:
+        return "".join([component + os.linesep for component in components])
+    return " ".join(components)
+
+
+# The parallel mode does not start more processes than needed to give each at least this many thousand blocks.
+PARALLEL_MIN_BLOCKS = 1000
+
+# Bigger numbers are split in segments of at most about twice this many thousand blocks; only 2 * workers finished
+# segments wait for the consumer, so the memory stays flat for numbers of any size (like NumberFile.digits).
+PARALLEL_SEGMENT_BLOCKS = 1 << 15
+
+
+def _saySegment(task):
+    """ Worker for the parallel mode of iterSay; builds the components of one segment of thousand blocks. """
+    digits, blocksBelow, forceSingular, forcePlural, options = task
+    scaleWords, numpy = _ScaleWords(**options), _numpyFor(digits)
+    if numpy is not None:
+        components = _iterComponentsNumpy(numpy, digits, scaleWords, forceSingular, forcePlural, blocksBelow)
+    else:
+        components = _iterComponents(digits, scaleWords, forceSingular, forcePlural, blocksBelow)
+    return list(components)
+
+
+def _iterSegments(number, segments):
+    """
+    Helper that splits the given number in segments of whole thousand blocks.
+    @return generator of (digits, blocksBelow) tuples, starting with the highest segment.
+    """
+    blocks = (len(number) + 2) // 3
+    # The first block may be shorter than 3 digits; all other blocks start 3 digits after their predecessor.
+    firstLength = len(number) % 3 or 3
+    offset = lambda block: firstLength + 3 * (block - 1) if block else 0
+    for segment in range(segments):
+        start, end = blocks * segment // segments, blocks * (segment + 1) // segments
+        yield number[offset(start):offset(end)], blocks - end
+
+
+def _iterComponentsParallel(number, workers, forceSingular=False, forcePlural=False, **kwargs):
+    """
+    Build the components of given number in a pool of worker processes; every worker says a segment of thousand blocks.
+    At most 2 * workers segments are said ahead; see PARALLEL_SEGMENT_BLOCKS.
+    @return generator of the components, in the same order as _iterComponents.
+    """
+    from multiprocessing import Pool
+    options = dict(zip(('shortScale', 'forceZ', 'forceC', 'delimiter', 'synonym', 'chuquet'),
+                       _scaleWordOptions(**kwargs)))
+    blocks = (len(number) + 2) // 3
+    segments = max(min(workers * 4, blocks // PARALLEL_MIN_BLOCKS), blocks // PARALLEL_SEGMENT_BLOCKS)
+    pool = Pool(min(workers, segments))
+    try:
+        pending = deque()
+        for digits, blocksBelow in _iterSegments(number, segments):
+            if len(pending) >= 2 * workers:
+                for component in pending.popleft().get():
+                    yield component
+            task = (digits, blocksBelow, forceSingular, forcePlural, options)
+            pending.append(pool.apply_async(_saySegment, (task, )))
+        while pending:
+            for component in pending.popleft().get():
+                yield component
+        pool.close()
+    finally:
+        pool.terminate()
+
+
+def iterSay(number, forceSingular=False, forcePlural=False, workers=None, **kwargs):
+    """
+    Build the word for given number component by component.
+    @param number The number to build (can be a string, int or a buffer like NumberFile.digits).
+    @param workers Say the thousand blocks in that many processes; only used for numbers with at least
+                   2 * PARALLEL_MIN_BLOCKS thousand blocks.
+    Numbers with at least NUMPY_MIN_BLOCKS thousand blocks are decoded by the NumPy engine, if numpy was imported
+    already; numbers with at least NUMPY_IMPORT_MIN_BLOCKS, if NumPy is installed.
+    @return generator of the components (like "42 millions"), starting with the highest one.
+    """
+    if not isinstance(number, buffer):
+        number = str(number)
+    if workers > 1 and (len(number) + 2) // 3 >= 2 * PARALLEL_MIN_BLOCKS:
+        return _iterComponentsParallel(number, workers, forceSingular, forcePlural, **kwargs)
+    scaleWords = _ScaleWords(cache=scaleWordCache if _isCacheable(number) else None, **kwargs)
+    numpy = _numpyFor(number)
+    if numpy is not None:
+        return _iterComponentsNumpy(numpy, number, scaleWords, forceSingular, forcePlural)
+    return _iterComponents(number, scaleWords, forceSingular, forcePlural)
+
+
+def say(number, byLine=False, lazy=False, **kwargs):
     """
     Build the  world for given number.
     @param number The number to build (can be a string or int).
     @param byLine True, if a \n should be added between the parts of the spoken word.
+    @param workers Say the thousand blocks of big numbers in that many processes; see iterSay.
+    @param lazy True, to get a Name, that builds only the components, that get used.
     @return the word for given number.
     """
-    number = str(number)
-    if number < 1000:
-        return number
-    blocks = _splitThousandBlocks(number)
-    blocksLeft = len(blocks)
-    ret = ""
-    isFirstComponent = True
-    for thousandBlock in blocks:
+    if lazy:
+        return Name(number, byLine, **kwargs)
+    return _joinComponents(iterSay(number, **kwargs), byLine)
+
+
+# Name finds this many components by scanning from the start or from the end of the number; to get further, it builds
+# the index of the runs of "000" blocks.
+NAME_SCAN_COMPONENTS = 4096
+
+
+class Name(object):
+    """
+    The word for a number, that builds only the components, that get used; see say(number, lazy=True).
+    The components can be got by index and slice, like from the list of iterSay, the characters by text(start, stop).
+    The first and the last components are found by scanning from the start or the end of the number. Any other
+    component needs the index of the runs of "000" blocks; it gets built once, in time linear to the digits but without
+    building any word. In there, a component is found in O(log count of runs).
+    """
+
+    def __init__(self, number, byLine=False, forceSingular=False, forcePlural=False, **kwargs):
+        """ @param number The number (can be a string, int or a buffer like NumberFile.digits). """
+        self.number = number if isinstance(number, buffer) else str(number)
+        self.byLine = byLine
+        self.forceSingular, self.forcePlural = forceSingular, forcePlural
+        self.options = kwargs
+        self.blocks = (len(self.number) + 2) // 3
+        self.firstLength = len(self.number) % 3 or 3
+        self.scaleWords = _ScaleWords(cache=scaleWordCache if _isCacheable(self.number) else None, **kwargs)
+        self.scaleWordLengths = _ScaleWordLengths(**kwargs)
+        # The blocks of the first and the last components, as far as they are scanned; see _block.
+        self._head, self._headScan = [], self._iterBlocks()
+        self._tail, self._tailScan = [], self._iterBlocksReversed()
+        # The count of components and the runs of "000" blocks; see _buildIndex.
+        self._count, self._runComponents, self._runSkipped = None, None, None
+
+    def _bounds(self, block):
+        """ @return tuple (start, end) of the digits of a block; 0 is the highest block. """
+        end = self.firstLength + 3 * block
+        return end - 3 if block else 0, end
+
+    def _iterBlocks(self):
+        """ @return generator of the blocks, that make a component; starting with the highest one. """
+        for blocksLeft, _ in _iterNonZeroBlocks(self.number):
+            yield self.blocks - blocksLeft
+
+    def _iterBlocksReversed(self):
+        """ Like _iterBlocks, but starting with the lowest block; runs of zeros are skipped at once. """
+        block = self.blocks - 1
+        while block >= 0:
+            start, end = self._bounds(block)
+            if end - start == 3 and self.number[start:end] == "000":
+                nonZero = _findNonZeroBefore(self.number, start)
+                if nonZero is None:
+                    # A short highest block like "00" is said as 0, like in _iterNonZeroBlocks.
+                    if self.firstLength < 3:
+                        yield 0
+                    return
+                block = 0 if nonZero <= self.firstLength else 1 + (nonZero - 1 - self.firstLength) // 3
+            yield block
+            block -= 1
+
+    def _buildIndex(self):
+        """
+        Count the components and find the runs of "000" blocks between them: the block of a component is its index
+        plus the count of "000" blocks before it, which changes only after a run.
+        """
+        runComponents, runSkipped = array('l'), array('l')
+        count, skipped = 0, 0
+        numpy = _numpyFor(self.number)
+        if numpy is not None:
+            for blocksLeft, values in _iterBlockValues(numpy, self.number):
+                blocks = numpy.flatnonzero(values) + (self.blocks - blocksLeft)
+                skips = blocks - numpy.arange(count, count + len(blocks))
+                runs = numpy.flatnonzero(numpy.diff(numpy.concatenate(([skipped], skips))))
+                runComponents.extend((runs + count).tolist())
+                runSkipped.extend(skips[runs].tolist())
+                if len(blocks):
+                    count, skipped = count + len(blocks), int(skips[-1])
+        else:
+            for block in self._iterBlocks():
+                if block - count != skipped:
+                    skipped = block - count
+                    runComponents.append(count)
+                    runSkipped.append(skipped)
+                count += 1
+        self._count, self._runComponents, self._runSkipped = count, runComponents, runSkipped
+
+    def _block(self, component):
+        """
+        @param component Index of a component; negative ones count from the end.
+        @return the block of the component; raises IndexError, if there is no such component.
+        """
+        if self._count is None:
+            if component >= 0:
+                found, scan, index = self._head, self._headScan, component
+            else:
+                found, scan, index = self._tail, self._tailScan, -component - 1
+            if index < len(found):
+                return found[index]
+            if index < NAME_SCAN_COMPONENTS:
+                for block in scan:
+                    found.append(block)
+                    if index < len(found):
+                        return block
+                raise IndexError("component index out of range")
+            self._buildIndex()
+        if component < 0:
+            component += self._count
+        if not 0 <= component < self._count:
+            raise IndexError("component index out of range")
+        run = bisect.bisect_right(self._runComponents, component)
+        return component + (self._runSkipped[run - 1] if run else 0)
+
+    def _blockOrNone(self, component):
         try:
-            if thousandBlock == "000":
-                continue
-            if not byLine and not isFirstComponent:
-                ret += " "
-            thousandValue = int(thousandBlock)
-            ret += str(thousandValue)
-            if blocksLeft > 1:
-                ret += " "
-                plural = forcePlural or (thousandValue > 1 and not forceSingular)
-                ret += sayByExp((blocksLeft - 1) * 3, plural=plural, **kwargs)
-            if byLine:
-                ret += os.linesep
-        finally:
-            blocksLeft -= 1
-            isFirstComponent = False
-
-    return ret
\ No newline at end of file
+            return self._block(component)
+        except IndexError:
+            return None
+
+    def _component(self, block):
+        """ Build the component of a block, like _iterComponents. """
+        start, end = self._bounds(block)
+        thousandValue = int(self.number[start:end])
+        blocksLeft = self.blocks - block
+        if blocksLeft > 1:
+            plural = self.forcePlural or (thousandValue > 1 and not self.forceSingular)
+            return "%d %s" % (thousandValue, self.scaleWords.word((blocksLeft - 1) * 3, plural))
+        return str(thousandValue)
+
+    def _componentLength(self, block):
+        """ Count the characters of the component of a block, without building it; see sayLength. """
+        start, end = self._bounds(block)
+        thousandValue = int(self.number[start:end])
+        blocksLeft = self.blocks - block
+        ret = len(str(thousandValue))
+        if blocksLeft > 1:
+            plural = self.forcePlural or (thousandValue > 1 and not self.forceSingular)
+            ret += 1 + self.scaleWordLengths.length((blocksLeft - 1) * 3, plural)
+        return ret
+
+    def __len__(self):
+        """ The count of components. """
+        if self._count is None:
+            self._buildIndex()
+        return self._count
+
+    def __getitem__(self, item):
+        """ A component or, for a slice, a list of them; the first and last ones can be got without the index. """
+        if not isinstance(item, slice):
+            return self._component(self._block(item))
+        start, stop, step = item.start, item.stop, item.step
+        ret = []
+        if step in (None, 1) and (start or 0) >= 0 and stop is not None and stop >= 0:
+            for component in xrange(start or 0, stop):
+                block = self._blockOrNone(component)
+                if block is None:
+                    break
+                ret.append(self._component(block))
+        elif step in (None, 1) and start is not None and start < 0 and (stop is None or stop < 0):
+            for component in xrange(start, stop or 0):
+                block = self._blockOrNone(component)
+                if block is not None:
+                    ret.append(self._component(block))
+        else:
+            ret = [self[component] for component in xrange(*item.indices(len(self)))]
+        return ret
+
+    def __iter__(self):
+        return iterSay(self.number, forceSingular=self.forceSingular, forcePlural=self.forcePlural, **self.options)
+
+    def __str__(self):
+        return _joinComponents(iter(self), self.byLine)
+
+    def __repr__(self):
+        return "Name(%d digits)" % len(self.number)
+
+    def textLength(self):
+        """ The count of characters of str(self); see sayLength. """
+        return sayLength(self.number, self.byLine, self.forceSingular, self.forcePlural, **self.options)
+
+    def text(self, start=None, stop=None):
+        """
+        The characters start to stop, like str(self)[start:stop]; only the components, that overlap, are built.
+        Negative positions count from the end. A negative start with a positive stop (or the other way round) needs the
+        count of all characters; see textLength.
+        """
+        if start is not None and start < 0 and (stop is None or stop < 0):
+            return self._textOfTail(-start, None if stop is None else -stop)
+        if (start is not None and start < 0) or (stop is not None and stop < 0):
+            start, stop, _ = slice(start, stop).indices(self.textLength())
+        return self._textOfHead(start or 0, stop)
+
+    def _textOfHead(self, start, stop):
+        """ Helper for text; walks the components from the first one. """
+        separator = os.linesep if self.byLine else " "
+        parts, offset, first, component = [], 0, None, 0
+        while stop is None or offset < stop:
+            block = self._blockOrNone(component)
+            if block is None:
+                break
+            length = self._componentLength(block) + len(separator)
+            if offset + length > start:
+                if first is None:
+                    first = offset
+                parts.append(self._component(block) + separator)
+            offset += length
+            component += 1
+        if parts and not self.byLine and self._blockOrNone(component) is None:
+            # There is no blank after the last component.
+            parts[-1] = parts[-1][:-1]
+        ret = "".join(parts)
+        return ret[start - first:None if stop is None else stop - first] if parts else ""
+
+    def _textOfTail(self, fromEnd, toEnd):
+        """ Helper for text; walks the components from the last one; fromEnd and toEnd count from the end. """
+        separator = os.linesep if self.byLine else " "
+        parts, length, component = [], 0, -1
+        while length < fromEnd:
+            block = self._blockOrNone(component)
+            if block is None:
+                break
+            part = self._component(block) + (separator if self.byLine or component != -1 else "")
+            parts.append(part)
+            length += len(part)
+            component -= 1
+        parts.reverse()
+        ret = "".join(parts)
+        return ret[max(len(ret) - fromEnd, 0):None if toEnd is None else max(len(ret) - toEnd, 0)]
+
+
+def sayLength(number, byLine=False, forceSingular=False, forcePlural=False, **kwargs):
+    """
+    Count the characters of say(number, byLine, ...) without building the word; from the values of the thousand blocks
+    and the lengths of the latin prefixes. Like iterSay, runs of "000" blocks are skipped at once; so the time is
+    linear to the count of non zero blocks.
+    @param number The number (can be a string, int or a buffer like NumberFile.digits).
+    """
+    if not isinstance(number, buffer):
+        number = str(number)
+    scaleWords = _ScaleWordLengths(**kwargs)
+    numpy = _numpyFor(number)
+    if numpy is not None:
+        ret, count = _sayLengthNumpy(numpy, number, scaleWords, forceSingular, forcePlural)
+    else:
+        ret, count = _sayLength(number, scaleWords, forceSingular, forcePlural)
+    # The components are separated by blanks or each one is followed by a line break; see _joinComponents.
+    return ret + (count * len(os.linesep) if byLine else max(count - 1, 0))
+
+
+def _sayLength(number, scaleWords, forceSingular=False, forcePlural=False):
+    """
+    Helper that counts the characters of the components of number; scaleWords is a _ScaleWordLengths.
+    @return tuple (characters, count of components).
+    """
+    ret, count = 0, 0
+    for blocksLeft, thousandBlock in _iterNonZeroBlocks(number):
+        thousandValue = int(thousandBlock)
+        count += 1
+        ret += 1 if thousandValue < 10 else 2 if thousandValue < 100 else 3
+        if blocksLeft > 1:
+            plural = forcePlural or (thousandValue > 1 and not forceSingular)
+            ret += 1 + scaleWords.length((blocksLeft - 1) * 3, plural)
+    return ret, count
+
+
+def _sayLengthNumpy(numpy, number, scaleWords, forceSingular=False, forcePlural=False):
+    """
+    NumPy engine of _sayLength: the lengths of the values and of the scale words of a chunk of blocks are counted at
+    once, as arrays.
+    """
+    lengths = numpy.array(scaleWords.lengths)
+    ret, count = 0, 0
+    for blocksLeft, values in _iterBlockValues(numpy, number):
+        nonZero = numpy.flatnonzero(values)
+        values = values[nonZero]
+        count += len(values)
+        ret += len(values) + int((values >= 10).sum()) + int((values >= 100).sum())
+        left = blocksLeft - nonZero
+        scaled = left > 1
+        values, zeros = values[scaled], (left[scaled] - 1) * 3
+        longScaleZeros = 2 * zeros - 6 if scaleWords.shortScale else zeros
+        sixes, lliarde = longScaleZeros // 6, longScaleZeros % 6
+        highs, heads = numpy.unique(sixes // 1000, return_inverse=True)
+        wordLengths = (numpy.array([scaleWords.head(high) for high in highs.tolist()], numpy.int64)[heads] +
+                       lengths[sixes % 1000] + len("llion") + (lliarde > 0) +
+                       (((values > 1) & (not forceSingular)) | bool(forcePlural)))
+        wordLengths[zeros == 3] = len("thousand")
+        ret += len(values) + int(wordLengths.sum())
+    return ret, count
+
+
+def sayMany(numbers, byLine=False, forceSingular=False, forcePlural=False, **kwargs):
+    """
+    Build the words for many numbers, that are said the same way; the options are resolved only once and the scale
+    words are shared between the numbers.
+    @param numbers Iterable of numbers (can be strings or ints).
+    @return generator of the words, in the same order as numbers.
+    """
+    cachedScaleWords = _ScaleWords(cache=scaleWordCache, batch=True, **kwargs)
+    scaleWords = _ScaleWords(**kwargs)
+    for number in numbers:
+        number = str(number)
+        components = _iterComponents(number, cachedScaleWords if _isCacheable(number) else scaleWords,
+                                     forceSingular, forcePlural)
+        yield _joinComponents(components, byLine)
+
+
+# Terms of a sum like "3e1000000+42": a coefficient (can have decimals) with an optional exponent.
+_TERM = re.compile(r"^(\d+)(?:\.(\d+))?(?:[eE](\d+))?$")
+_POWER_TERM = re.compile(r"^(?:(\d+)(?:\.(\d+))?\*)?10(?:\^|\*\*)(\d+)$")
+
+
+def parseTerms(expression):
+    """
+    Parse a sum of terms; allowed terms are 42, 3e9, 6.02214129e23, 7*10^27, 7*10**27 and 10^100.
+    @return list of (coefficient, exponent) tuples; the coefficient is a string of digits.
+    """
+    ret = []
+    for term in expression.replace(" ", "").split("+"):
+        match = _TERM.match(term) or _POWER_TERM.match(term)
+        if not match:
+            raise ValueError("Not a valid term: [%s]; use forms like 42, 3e9, 7*10^27 or 10^100." % term)
+        coefficient, decimals, exponent = match.groups()
+        coefficient, decimals = coefficient or "1", (decimals or "").rstrip("0")
+        exponent = int(exponent or 0) - len(decimals)
+        if exponent < 0:
+            raise ValueError("Not an integer: [%s]." % term)
+        ret.append((coefficient + decimals, exponent))
+    return ret
+
+
+def sparseBlocks(terms):
+    """
+    Normalize a sum of terms into thousand blocks, without building the digits of the sum.
+    @param terms A string for parseTerms, an iterable of (coefficient, exponent) tuples or a dict
+                 {exponent: coefficient}.
+    @return list of (zerosAfterBlock, value) tuples, starting with the highest block; blocks with value 0 are left out.
+    """
+    if isinstance(terms, basestring):
+        terms = parseTerms(terms)
+    elif hasattr(terms, "items"):
+        terms = [(coefficient, exponent) for exponent, coefficient in terms.items()]
+    blocks = {}
+    for coefficient, exponent in terms:
+        lowestBlock, zeros = divmod(exponent, 3)
+        digits = str(coefficient).lstrip("0") + "0" * zeros
+        for blocksLeft, block in _iterNonZeroBlocks(digits):
+            index = lowestBlock + blocksLeft - 1
+            blocks[index] = blocks.get(index, 0) + int(block)
+    # Carry the overflow of a block to the next one, starting with the lowest block.
+    indexes = sorted(blocks)
+    position = 0
+    while position < len(indexes):
+        index = indexes[position]
+        carry, blocks[index] = divmod(blocks[index], 1000)
+        if carry:
+            if index + 1 not in blocks:
+                bisect.insort(indexes, index + 1)
+                blocks[index + 1] = 0
+            blocks[index + 1] += carry
+        position += 1
+    return [(index * 3, blocks[index]) for index in reversed(indexes) if blocks[index]]
+
+
+def iterSayTerms(terms, forceSingular=False, forcePlural=False, **kwargs):
+    """
+    Build the word for a sum of terms component by component; the same components as iterSay for the expanded sum.
+    @param terms see sparseBlocks.
+    @return generator of the components, starting with the highest one.
+    """
+    blocks = sparseBlocks(terms)
+    if not blocks:
+        yield "0"
+    scaleWords = _ScaleWords(cache=scaleWordCache, **kwargs)
+    for zeros, value in blocks:
+        if zeros:
+            plural = forcePlural or (value > 1 and not forceSingular)
+            yield "%d %s" % (value, scaleWords.word(zeros, plural))
+        else:
+            yield str(value)
+
+
+def sayTerms(terms, byLine=False, **kwargs):
+    """
+    Build the word for a sum of terms, like "3e1000000+42", without building its digits.
+    @param terms see sparseBlocks.
+    @return the word for the sum.
+    """
+    return _joinComponents(iterSayTerms(terms, **kwargs), byLine)
+
+
+# Reverse latin tables for parse; key is (synonym, chuquet). See _reverseLatinTable.
+_reverseLatinTables = {}
+
+
+def _reverseLatinTable(synonym=False, chuquet=False):
+    """
+    @return dict, that maps the latin parts of scale words (with all c replaced by z) back to their numbers 0-999.
+    """
+    key = (bool(synonym), bool(chuquet))
+    if key not in _reverseLatinTables:
+        table = _latinTable('', synonym, chuquet, stem=True)
+        _reverseLatinTables[key] = dict((latin.replace("c", "z"), number) for number, latin in enumerate(table))
+    return _reverseLatinTables[key]
+
+
+def _parseScaleWord(word, shortScale, reverseTable):
+    """
+    Helper that maps a scale word back to its count of zeros.
+    A word is made of latin parts, separated by "lli"; none of the latin parts contains "lli" or ends with "l", so
+    splitting at "lli" gives the latin parts and the suffix ("on" or "ard").
+    """
+    if word == "thousand":
+        return 3
+    parts = word.rstrip("s").replace("c", "z").split("lli")
+    suffix = parts.pop()
+    if suffix not in ("on", "ard") or not parts or (shortScale and suffix == "ard"):
+        raise ValueError("Not a scale word: [%s]." % word)
+    sixes = 0
+    for part in parts:
+        group = reverseTable.get(part)
+        if group is None or (group == 0 and not sixes):
+            raise ValueError("Not a scale word: [%s]; unknown latin part [%s]." % (word, part))
+        sixes = sixes * 1000 + group
+    if shortScale:
+        return 3 * sixes + 3
+    return 6 * sixes + (3 if suffix == "ard" else 0)
+
+
+def iterParse(text, shortScale=False, synonym=False, chuquet=False, delimiter='', **_):
+    """
+    Map a word, as built by say, back to the number; the reverse of iterSay. Runs in time linear to the length of text.
+    @param text The word; components may be separated by blanks or line breaks.
+    @return generator of (zerosAfterBlock, value) tuples, starting with the highest block; like sparseBlocks.
+    """
+    reverseTable = _reverseLatinTable(synonym, chuquet)
+    tokens = iter(text.split())
+    lastZeros = None
+    token = next(tokens, None)
+    while token is not None:
+        if not token.isdigit() or not 0 < int(token) < 1000:
+            if token == "0" and lastZeros is None and next(tokens, None) is None:
+                # The word for 0 is just "0".
+                return
+            raise ValueError("Not a value from 1 to 999: [%s]." % token)
+        value, zeros = int(token), 0
+        token = next(tokens, None)
+        if token is not None and not token.isdigit():
+            zeros = _parseScaleWord(token.replace(delimiter, "") if delimiter else token, shortScale, reverseTable)
+            token = next(tokens, None)
+        if lastZeros is not None and zeros >= lastZeros:
+            raise ValueError("Components must be in descending order.")
+        lastZeros = zeros
+        yield zeros, value
+
+
+def parse(text, **kwargs):
+    """
+    Map a word, as built by say, back to the number; see iterParse.
+    @return list of (zerosAfterBlock, value) tuples; use iterDigits to get the digits.
+    """
+    return list(iterParse(text, **kwargs))
+
+
+def iterDigits(blocks, chunkBlocks=4096):
+    """
+    Build the digits of a number, given as (zerosAfterBlock, value) tuples like parse or sparseBlocks return them.
+    @param chunkBlocks Count of "000" blocks per yielded chunk for runs of zeros.
+    @return generator of strings; joined, they make the number.
+    """
+    lastZeros = None
+    for zeros, value in blocks:
+        if lastZeros is None:
+            yield str(value)
+        else:
+            for chunk in _iterZeroBlocks((lastZeros - zeros) // 3 - 1, chunkBlocks):
+                yield chunk
+            yield "%03d" % value
+        lastZeros = zeros
+    if lastZeros is None:
+        yield "0"
+    else:
+        for chunk in _iterZeroBlocks(lastZeros // 3, chunkBlocks):
+            yield chunk
+
+
+def _iterZeroBlocks(count, chunkBlocks):
+    while count > 0:
+        chunk = min(count, chunkBlocks)
+        yield "000" * chunk
+        count -= chunk
+
+
+# The phases, that enableStats times: functions of this module or Class.method; True marks generators, that are timed
+# item by item.
+STATS_PHASES = (('_latinTable', False), ('_sayLatin', False), ('_splitThousandBlocks', False),
+                ('_iterNonZeroBlocks', True), ('_iterComponents', True), ('_iterBlockValues', True),
+                ('_iterComponentsNumpy', True), ('_sayLength', False), ('_sayLengthNumpy', False),
+                ('_ScaleWords.word', False), ('_ScaleWords._build', False), ('_ScaleWords._sayGroup', False),
+                ('Name._buildIndex', False), ('Name._component', False),
+                ('sayByExp', False), ('iterSayByExp', True), ('sayScaleWord', False), ('_joinComponents', False),
+                ('iterGroupedNumber', True), ('iterGroupedPowerOfTen', True), ('_iterRandomDigits', True),
+                ('parseTerms', False))
+
+# The Stats, that get collected right now; None, if disabled. See enableStats.
+stats = None
+
+_END = object()
+
+
+def _peakMemory():
+    """
+    @return tuple (peak resident memory of this process, of its finished child processes) in KiB; tracemalloc is not
+            available for python 2, so this is what the kernel counts.
+    """
+    import resource
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+
+class Stats(object):
+    """
+    Time, calls and bytes produced per phase, as collected by enableStats. The time of a phase does not include the
+    time of the phases it calls, so the phases add up to the total; what is left is "other".
+    For generators, calls counts the items.
+    """
+
+    def __init__(self, start=None):
+        """ @param start When the run started, as time.time(); now per default. """
+        from time import time
+        self.clock = time
+        self.start = start or time()
+        self.end = None
+        # name -> [calls, seconds, bytes]
+        self.phases = OrderedDict()
+        self._stack = []
+        self._since = None
+        self._originals = []
+
+    def add(self, name, seconds, calls=1, produced=0):
+        """ Count the time of a phase, that was measured outside, like the argument parsing of say.py. """
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = [0, 0.0, 0]
+        phase[0] += calls
+        phase[1] += seconds
+        phase[2] += produced
+
+    def enter(self, name):
+        now = self.clock()
+        if self._stack:
+            self.add(self._stack[-1], now - self._since, 0)
+        self._stack.append(name)
+        self._since = now
+
+    def leave(self, result=None, calls=1):
+        """ @param result What the phase produced; strings and buffers count as bytes produced. """
+        now = self.clock()
+        produced = len(result) if isinstance(result, (basestring, buffer)) else 0
+        self.add(self._stack.pop(), now - self._since, calls, produced)
+        self._since = now
+
+    def wrap(self, owner, name, generator=False, label=None):
+        """
+        Replace the function name of owner (a module or a class) by one, that gets timed as phase label; see unwrap.
+        """
+        from functools import wraps
+        function = vars(owner)[name]
+        label = label or name
+        stats = self
+
+        if generator:
+            @wraps(function)
+            def timed(*args, **kwargs):
+                items = function(*args, **kwargs)
+                while True:
+                    item = _END
+                    stats.enter(label)
+                    try:
+                        item = next(items, _END)
+                    finally:
+                        stats.leave(item, item is not _END)
+                    if item is _END:
+                        return
+                    yield item
+        else:
+            @wraps(function)
+            def timed(*args, **kwargs):
+                ret = None
+                stats.enter(label)
+                try:
+                    ret = function(*args, **kwargs)
+                finally:
+                    stats.leave(ret)
+                return ret
+
+        self._originals.append((owner, name, function))
+        setattr(owner, name, timed)
+
+    def unwrap(self):
+        """ Put back all functions, that were replaced by wrap. """
+        while self._originals:
+            owner, name, function = self._originals.pop()
+            setattr(owner, name, function)
+
+    def stop(self):
+        """ Stop the clock of the total time; phases, that run later, are still counted. """
+        self.end = self.end or self.clock()
+
+    def asDict(self):
+        """
+        @return dict with the total seconds, the peak memory and the phases, slowest first; ready for json.dump.
+        """
+        total = (self.end or self.clock()) - self.start
+        phases = sorted(self.phases.items(), key=lambda item: -item[1][1])
+        memory, childMemory = _peakMemory()
+        return {'seconds': total, 'other': total - sum([seconds for _, (_, seconds, _) in phases]),
+                'maxRssKiB': memory, 'childMaxRssKiB': childMemory,
+                'phases': [{'name': name, 'calls': calls, 'seconds': seconds, 'bytes': produced}
+                           for name, (calls, seconds, produced) in phases]}
+
+    def report(self, out=None):
+        """ Write a table of the phases, slowest first, with the total time and the peak memory; to stderr. """
+        out = out or sys.stderr
+        ret = self.asDict()
+        total = max(ret['seconds'], 10 ** -9)
+        out.write("%-28s %10s %10s %7s %12s\n" % ("phase", "calls", "seconds", "%", "bytes"))
+        for phase in ret['phases']:
+            out.write("%-28s %10d %10.4f %6.1f%% %12d\n" % (phase['name'], phase['calls'], phase['seconds'],
+                                                           100 * phase['seconds'] / total, phase['bytes']))
+        out.write("%-28s %10s %10.4f %6.1f%%\n" % ("other", "", ret['other'], 100 * ret['other'] / total))
+        out.write("%-28s %10s %10.4f\n" % ("total", "", ret['seconds']))
+        out.write("peak memory: %d KiB; child processes: %d KiB\n" % (ret['maxRssKiB'], ret['childMaxRssKiB']))
+
+
+def enableStats(start=None):
+    """
+    Start to time the STATS_PHASES. Their functions get replaced by timed ones until disableStats, so there are no
+    costs at all, as long as no stats are collected. Phases, that run in worker processes (-j), are not counted; the
+    time shows up in the phase, that waits for the workers.
+    @param start When the run started, as time.time(); now per default.
+    @return the Stats; also in the module attribute stats.
+    """
+    global stats
+    disableStats()
+    stats = Stats(start)
+    module = sys.modules[__name__]
+    for name, generator in STATS_PHASES:
+        owner, _, attribute = name.rpartition(".")
+        stats.wrap(getattr(module, owner) if owner else module, attribute, generator, name)
+    return stats
+
+
+def disableStats():
+    """ Stop to collect stats and put back the functions, that were timed. """
+    global stats
+    if stats is not None:
+        stats.unwrap()
+        stats = None
@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+# Copyright (C) 2013 Daniel Marohn - daniel.marohn@gmail.com
+# This program is free software; find details in file LICENCE or here:
+# https://raw.github.com/camillo/sayNumber/master/sayNumber/LICENSE
+
+"""
+Measure how the backend scales with the size of the number.
+say() must stay linear in the number of digits; the time per digit should not grow from line to line.
+With -s/--startup, measure how long short lived runs of say.py take instead; with -b/--bulk, how say.py -i/--input
+scales with the count of worker processes.
+
+With -S/--suite, run the cases of suiteCases: the hot paths of the backend and the command line paths of say.py.
+Every case runs in its own process, so the peak memory (max rss) can be measured per case. The results can be saved
+with --json and compared with saved results with --compare; a case, that got slower or needs more memory than the
+tolerance allows, makes bench.py exit with status 1.
+"""
+
+import json
+import os
+import pkgutil
+import platform
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser, SUPPRESS
+from collections import OrderedDict
+
+
+def timeIt(function, *args, **kwargs):
+    """ Call function once and return the used wall clock seconds. """
+    start = time.time()
+    function(*args, **kwargs)
+    return time.time() - start
+
+
+def benchSayScaling(maxExponent, repeat=1):
+    """
+    Time say() for random numbers with 10^3 to 10^maxExponent digits.
+    @return list of (digits, seconds) tuples; seconds is the best of repeat runs.
+    """
+    from backend import say, randomNumber
+    ret = []
+    for exponent in range(3, maxExponent + 1):
+        digits = 10 ** exponent
+        number = randomNumber(digits, seed=0)
+        # Warm up, so the first row does not include the imports and the filling of the caches.
+        say(number)
+        ret.append((digits, min([timeIt(say, number) for _ in range(repeat)])))
+    return ret
+
+
+def printScaling(results, out=sys.stdout):
+    """ Write the results of benchSayScaling as table; the last column is the growth factor of the time per digit. """
+    out.write("%12s %12s %14s %8s\n" % ("digits", "seconds", "ns per digit", "growth"))
+    lastPerDigit = None
+    for digits, seconds in results:
+        perDigit = seconds * 10 ** 9 / digits
+        growth = "%8.2f" % (perDigit / lastPerDigit) if lastPerDigit else "%8s" % "-"
+        out.write("%12d %12.4f %14.1f %s\n" % (digits, seconds, perDigit, growth))
+        lastPerDigit = perDigit
+
+
+def benchStartup(repeat=20):
+    """
+    Time complete runs of the interpreter, like a shell script starts say.py; for small numbers, the imports dominate.
+    @return list of (name, seconds) tuples; seconds is the best of repeat runs.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    commands = [("python -c pass", ["-c", "pass"]),
+                ("import backend", ["-c", "import backend"]),
+                ("say.py 1234567", [os.path.join(here, "say.py"), "1234567"])]
+    ret = []
+    with open(os.devnull, "w") as devnull:
+        for name, arguments in commands:
+            call = lambda: subprocess.check_call([sys.executable] + arguments, cwd=here, stdout=devnull)
+            ret.append((name, min([timeIt(call) for _ in range(repeat)])))
+    return ret
+
+
+def printStartup(results, out=sys.stdout):
+    """ Write the results of benchStartup as table; the last column is without the time of the bare interpreter. """
+    out.write("%-16s %10s %14s\n" % ("run", "ms", "ms own"))
+    interpreter = results[0][1]
+    for name, seconds in results:
+        out.write("%-16s %10.1f %14.1f\n" % (name, seconds * 1000, (seconds - interpreter) * 1000))
+
+
+def benchBulk(count, maxWorkers, repeat=1):
+    """
+    Time bulk.sayFile for count random numbers with 1 to 60 digits, with 1, 2, 4 ... maxWorkers processes.
+    @return list of (workers, seconds) tuples; seconds is the best of repeat runs.
+    """
+    import random
+    from StringIO import StringIO
+    from bulk import sayFile
+    generator = random.Random(0)
+    text = "".join([str(generator.randint(0, 10 ** generator.randint(1, 60))) + "\n" for _ in xrange(count)])
+    ret, workers = [], 1
+    while True:
+        ret.append((workers, min([timeIt(sayFile, StringIO(text), StringIO(), workers=workers)
+                                  for _ in range(repeat)])))
+        if workers >= maxWorkers:
+            return ret
+        workers = min(workers * 2, maxWorkers)
+
+
+def printBulk(results, count, out=sys.stdout):
+    """ Write the results of benchBulk as table; speedup is against one worker, the ideal is the count of workers. """
+    out.write("%8s %12s %14s %8s\n" % ("workers", "seconds", "numbers per s", "speedup"))
+    for workers, seconds in results:
+        out.write("%8d %12.4f %14d %8.2f\n" % (workers, seconds, count / seconds, results[0][1] / seconds))
+
+
+def _sayCase(digits, **options):
+    from backend import say, randomNumber
+    number = randomNumber(digits, seed=0)
+    return lambda: say(number, **options)
+
+
+def _sayEngineCase(digits, engine):
+    """ Say with the NumPy engine or the pure python path only, whatever the size; shows where NumPy starts to win. """
+    import backend
+    if engine == "numpy":
+        backend._importNumpy()
+        backend.NUMPY_MIN_BLOCKS = backend.NUMPY_IMPORT_MIN_BLOCKS = 1
+    else:
+        backend._numpy = None
+    return _sayCase(digits)
+
+
+def _sayByExpCase(zeros, **options):
+    from backend import sayByExp, scaleWordCache
+    # Without the cache, every call builds the word.
+    scaleWordCache.resize(0)
+    return lambda: sayByExp(zeros, **options)
+
+
+def _sayLongScaleCase(zeros):
+    from backend import _sayLongScale
+    return lambda: _sayLongScale(zeros)
+
+
+def _splitCase(digits):
+    from backend import _splitThousandBlocks, randomNumber
+    number = randomNumber(digits, seed=0)
+    return lambda: _splitThousandBlocks(number)
+
+
+def suiteCases(maxExponent=6):
+    """
+    The cases of the suite; the key is the name of the case.
+    A case is a function, that prepares the input and returns the callable to time, or the arguments for say.py; the
+    time of say.py is the time of the whole process, with startup.
+    @param maxExponent say numbers up to 10^maxExponent digits.
+    """
+    ret = OrderedDict()
+    for exponent in range(1, maxExponent + 1):
+        ret["say digits=10^%d" % exponent] = lambda digits=10 ** exponent: _sayCase(digits)
+    for shortScale in (False, True):
+        for synonym in (False, True):
+            for chuquet in (False, True):
+                options = dict(shortScale=shortScale, synonym=synonym, chuquet=chuquet)
+                name = "say digits=10^4 " + ",".join(["%s=%d" % item for item in sorted(options.items())])
+                ret[name] = lambda options=options: _sayCase(10 ** 4, **options)
+    engines = ("python", "numpy") if pkgutil.find_loader("numpy") else ("python",)
+    for exponent in range(3, maxExponent + 1):
+        for engine in engines:
+            ret["say digits=10^%d engine=%s" % (exponent, engine)] = \
+                lambda digits=10 ** exponent, engine=engine: _sayEngineCase(digits, engine)
+    # The largest one is the exponent of a googolplex.
+    for exponent in (1, 3, 10, 30, 100):
+        ret["sayByExp zeros=3*10^%d" % exponent] = lambda zeros=3 * 10 ** exponent: _sayByExpCase(zeros)
+        ret["sayByExp zeros=3*10^%d shortScale=1" % exponent] = \
+            lambda zeros=3 * 10 ** exponent: _sayByExpCase(zeros, shortScale=True)
+        ret["_sayLongScale zeros=6*10^%d" % exponent] = lambda zeros=6 * 10 ** exponent: _sayLongScaleCase(zeros)
+    ret["sayByExp zeros=3*10^100000 (string)"] = lambda: _sayByExpCase('3' + '0' * 100000)
+    for exponent in range(1, maxExponent + 1):
+        ret["_splitThousandBlocks digits=10^%d" % exponent] = lambda digits=10 ** exponent: _splitCase(digits)
+    ret["say.py 1234567"] = ["1234567"]
+    ret["say.py --random 10^5"] = ["--random", "--seed", "0", str(10 ** 5)]
+    ret["say.py --random 10^5 --numeric --grouping"] = ["--random", "--seed", "0", "--numeric", "--grouping",
+                                                        str(10 ** 5)]
+    ret["say.py --zeros 10^6"] = ["--zeros", str(10 ** 6)]
+    ret["say.py --googolplex"] = ["--googolplex"]
+    return ret
+
+
+def _autoRange(function, minSeconds=0.2):
+    """ @return seconds per call; fast functions are called in loops, until a loop takes at least minSeconds. """
+    def loop(count):
+        for _ in xrange(count):
+            function()
+
+    loops = 1
+    while True:
+        seconds = timeIt(loop, loops)
+        if seconds >= minSeconds or loops >= 10 ** 6:
+            return seconds / loops
+        loops *= 10 if seconds < minSeconds / 10 else 2
+
+
+def runCase(name, maxExponent=6, repeat=1):
+    """ Run one case of the suite in this process; this is bench.py --case. @return the best seconds per call. """
+    function = suiteCases(maxExponent)[name]()
+    # Warm up; the first call would include the imports, like the one of numpy.
+    function()
+    return min([_autoRange(function) for _ in range(repeat)])
+
+
+def _measureProcess(command):
+    """ Run command; @return tuple (output, wall clock seconds, max rss in KB) of the process. """
+    start = time.time()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, cwd=os.path.dirname(os.path.abspath(__file__)))
+    output = process.stdout.read()
+    # wait4 gives the resource usage of this process only; RUSAGE_CHILDREN would be the maximum of all children.
+    _, status, usage = os.wait4(process.pid, 0)
+    seconds = time.time() - start
+    if status:
+        raise RuntimeError("%s failed with status %d" % (" ".join(command), status))
+    return output, seconds, usage.ru_maxrss
+
+
+def benchSuite(maxExponent=6, repeat=1, select=None, out=sys.stdout):
+    """
+    Run the cases of the suite, each in its own process.
+    @param select Run only cases, that have this in their names.
+    @return dict with the environment and the results; per case the seconds and the max rss in KB.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    cases = OrderedDict()
+    if out:
+        out.write("%-50s %14s %10s\n" % ("case", "seconds", "rss MB"))
+    for name, case in suiteCases(maxExponent).items():
+        if select and select not in name:
+            continue
+        if isinstance(case, list):
+            command = [sys.executable, os.path.join(here, "say.py")] + case
+            _, seconds, maxRss = min([_measureProcess(command) for _ in range(repeat)], key=lambda result: result[1])
+        else:
+            command = [sys.executable, os.path.abspath(__file__), "--case", name, "-m", str(maxExponent),
+                       "-r", str(repeat)]
+            output, _, maxRss = _measureProcess(command)
+            seconds = float(output)
+        cases[name] = {'seconds': seconds, 'maxRssKB': maxRss}
+        if out:
+            out.write("%-50s %14.6f %10d\n" % (name, seconds, maxRss / 1024))
+            out.flush()
+    return {'python': platform.python_version(), 'platform': platform.platform(), 'cases': cases}
+
+
+def compareSuite(results, old, tolerance=0.2, out=sys.stdout):
+    """
+    Compare the results of benchSuite with old results.
+    @param tolerance A case may be that much slower (0.2 is 20%) or need that much more memory.
+    @return list of the names of the cases, that got worse.
+    """
+    ret = []
+    out.write("%-50s %12s %12s %7s %9s %9s %7s\n" % ("case", "seconds", "old", "ratio", "rss MB", "old", "ratio"))
+    for name, result in results['cases'].items():
+        if name not in old['cases']:
+            continue
+        before = old['cases'][name]
+        timeRatio = result['seconds'] / max(before['seconds'], 10 ** -9)
+        memoryRatio = float(result['maxRssKB']) / max(before['maxRssKB'], 1)
+        worse = timeRatio > 1 + tolerance or memoryRatio > 1 + tolerance
+        if worse:
+            ret.append(name)
+        out.write("%-50s %12.6f %12.6f %7.2f %9d %9d %7.2f%s\n" % (
+                  name, result['seconds'], before['seconds'], timeRatio, result['maxRssKB'] / 1024,
+                  before['maxRssKB'] / 1024, memoryRatio, "  WORSE" if worse else ""))
+    return ret
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="benchmark the backend of say.py")
+    parser.add_argument('-m', '--maxExponent', type=int, default=6,
+                        help='say numbers up to 10^MAXEXPONENT digits; default 6, use 7 to see 10 000 000 digits')
+    parser.add_argument('-r', '--repeat', type=int,
+                        help='take the best of REPEAT runs; default 1, or 20 with -s/--startup')
+    parser.add_argument('-s', '--startup', action='store_true', help='time the startup of say.py instead')
+    parser.add_argument('-b', '--bulk', type=int, metavar='COUNT',
+                        help='time say.py -i/--input for COUNT numbers with 1, 2, 4 ... JOBS processes instead')
+    parser.add_argument('-j', '--jobs', type=int,
+                        help='the maximum of processes for -b/--bulk; default: count of CPUs')
+    parser.add_argument('-S', '--suite', action='store_true',
+                        help='run the benchmark suite instead: the backend hot paths and the say.py paths')
+    parser.add_argument('-k', '--select', metavar='TEXT',
+                        help='run only the cases of the suite with TEXT in their names')
+    parser.add_argument('--json', metavar='FILE', help='save the results of the suite to FILE')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare the suite with the results saved in FILE; exit with status 1, ' +
+                             'if a case got worse')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='a case got worse, if it is that much slower or needs that much more memory; default 0.2')
+    parser.add_argument('--case', help=SUPPRESS)
+    args = parser.parse_args()
+    if args.case:
+        print runCase(args.case, args.maxExponent, args.repeat or 1)
+    elif args.suite or args.compare:
+        results = benchSuite(args.maxExponent, args.repeat or 1, args.select, None if args.compare else sys.stdout)
+        if args.json:
+            with open(args.json, 'w') as jsonFile:
+                json.dump(results, jsonFile, indent=2)
+        if args.compare:
+            with open(args.compare) as jsonFile:
+                worse = compareSuite(results, json.load(jsonFile, object_pairs_hook=OrderedDict), args.tolerance)
+            sys.exit(1 if worse else 0)
+    elif args.startup:
+        printStartup(benchStartup(args.repeat or 20))
+    elif args.bulk:
+        from multiprocessing import cpu_count
+        printBulk(benchBulk(args.bulk, args.jobs or cpu_count(), args.repeat or 1), args.bulk)
+    else:
+        printScaling(benchSayScaling(args.maxExponent, args.repeat or 1))
@@ -83,6 +83,7 @@ def createSource():
 # https://raw.github.com/camillo/sayNumber/master/sayNumber/LICENSE
 
 # This file is auto generated, running python buildLatinNumbers.py.
+# Changes to this file will be overridden without warning, when running buildLatinNumbers.py again (will not happen automatically).
 
 # These are valid synonyms, that can be used.
 LATIN_SYNONYMS = {
@@ -125,9 +126,90 @@ CHUQUET_PREFIXES = {
         line += "],"
         ret += line + "\r"
     ret += "}"
+    ret += TABLES_SOURCE
     return ret
 
 
+# buildTable joins the prefixes for all numbers; the joined tables without delimiter are stored in latinTables.py.
+TABLES_SOURCE = """
+
+
+def buildTable(delimiter='', synonym=False, chuquet=False, stem=False):
+    \"\"\"
+    Join the prefixes for all numbers from 0 to 999.
+    @param delimiter Separates the prefixes.
+    @param synonym Use LATIN_SYNONYMS, if available.
+    @param chuquet Use CHUQUET_PREFIXES, if available; wins against synonym.
+    @param stem True, to replace a trailing 'a' of numbers 10-99 with 'i', as needed to build a word like trigintillion.
+    @return tuple with the joined prefixes; the index is the number.
+    \"\"\"
+    ret = []
+    for number in range(1000):
+        if chuquet and number in CHUQUET_PREFIXES:
+            target = CHUQUET_PREFIXES[number]
+        elif synonym and number in LATIN_SYNONYMS:
+            target = LATIN_SYNONYMS[number]
+        else:
+            target = LATIN_NUMBERS[number]
+        latin = delimiter.join(target)
+        if stem and 100 > number > 9 and latin[-1] == 'a':
+            latin = latin[:-1] + 'i'
+        ret.append(latin)
+    return tuple(ret)
+"""
+
+
+def createPackedSource():
+    """
+    Build the source of latinTables.py: the tables of buildTable without delimiter, for every variant packed into one
+    string plus the offsets of the numbers in it. Loading them is a plain unmarshal of two constants from the .pyc
+    file; nothing needs to get joined at startup.
+    """
+    latinNumbers = {}
+    exec createSource() in latinNumbers
+    packed, offsets = [], {}
+    position = 0
+    for key in [(synonym, chuquet, stem) for synonym in (False, True) for chuquet in (False, True)
+                for stem in (False, True)]:
+        offsets[key] = [position]
+        for latin in latinNumbers['buildTable']('', *key):
+            packed.append(latin)
+            position += len(latin)
+            offsets[key].append(position)
+
+    ret = """# Copyright (C) 2013 Daniel Marohn - daniel.marohn@gmail.com
+# This program is free software; find details in file LICENCE or here:
+# https://raw.github.com/camillo/sayNumber/master/sayNumber/LICENSE
+
+# This file is auto generated, running python buildLatinNumbers.py -p.
+# Changes to this file will be overridden without warning, when running buildLatinNumbers.py again (will not happen automatically).
+
+# The joined prefixes of the numbers 0 to 999 of all tables in one string; see unpackTable.
+PACKED = %r
+
+# Where the prefixes of the numbers start in PACKED; the last offset is the end of 999.
+# Key is (synonym, chuquet, stem).
+OFFSETS = {
+""" % "".join(packed)
+    for key in sorted(offsets):
+        ret += "    %r: %r,\n" % (key, tuple(offsets[key]))
+    ret += UNPACK_SOURCE
+    return ret
+
+
+UNPACK_SOURCE = """}
+
+
+def unpackTable(synonym=False, chuquet=False, stem=False):
+    \"\"\"
+    @return tuple with the joined prefixes for 0 to 999;
+            the same as latinNumbers.buildTable('', synonym, chuquet, stem).
+    \"\"\"
+    offsets = OFFSETS[(synonym, chuquet, stem)]
+    return tuple([PACKED[offsets[number]:offsets[number + 1]] for number in range(1000)])
+"""
+
+
 if __name__ == "__main__":
     # If you start this script (python buildLatinNumbers.py), the dicts in latinNumbers.py get generated. We do this
     # precalculation to save time, building REALLY(!) big numbers.
@@ -137,6 +219,10 @@ if __name__ == "__main__":
     parser = ArgumentParser(description="create source for latinNumbers.py")
     parser.add_argument('-o', '--outfile', nargs='?', type=FileType('w'), default=sys.stdout, const="latinNumbers.py",
                         help='write to OUTFILE; latinNumbers.py, if stands alone')
+    parser.add_argument('-p', '--packedfile', nargs='?', type=FileType('w'), const="latinTables.py",
+                        help='write the packed tables to PACKEDFILE too; latinTables.py, if stands alone')
     args = parser.parse_args()
     source = createSource()
-    args.outfile.write(source)
\ No newline at end of file
+    args.outfile.write(source)
+    if args.packedfile:
+        args.packedfile.write(createPackedSource())
\ No newline at end of file
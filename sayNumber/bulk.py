@@ -0,0 +1,142 @@
+# Copyright (C) 2013 Daniel Marohn - daniel.marohn@gmail.com
+# This program is free software; find details in file LICENCE or here:
+# https://raw.github.com/camillo/sayNumber/master/sayNumber/LICENSE
+
+"""
+Say every number of a file, one number per line; this is say.py --input.
+The file is read in chunks of lines and the words of a chunk are written at once. All numbers of a chunk are said by
+one backend.sayMany, so the scale words are shared between them. With more than one worker, the chunks are said in a
+pool of processes and written in the order of the input.
+"""
+
+import sys
+import time
+from collections import deque
+from itertools import islice
+
+# The size of the file buffers.
+BUFFER_BYTES = 1 << 20
+
+# Lines per chunk.
+CHUNK_SIZE = 10000
+
+# The options, that change the text of a chunk; only these are sent to the workers.
+CHUNK_OPTIONS = ('numeric', 'grouping', 'byLine', 'forceSingular', 'forcePlural', 'shortScale', 'forceZ', 'forceC',
+                 'delimiter', 'synonym', 'chuquet')
+
+
+def iterNumberChunks(inFile, chunkSize=CHUNK_SIZE):
+    """
+    Read the numbers of inFile in chunks of chunkSize lines; empty lines are skipped.
+    @return generator of lists of numbers, as strings of digits.
+    """
+    lines, lineNumber = iter(inFile), 0
+    while True:
+        chunk = list(islice(lines, chunkSize))
+        if not chunk:
+            return
+        numbers = []
+        for line in chunk:
+            lineNumber += 1
+            number = line.strip()
+            if not number:
+                continue
+            if not number.isdigit():
+                raise ValueError("line %d: not a number: '%s'" % (lineNumber, number))
+            # Leading zeros are dropped, like int() does it.
+            numbers.append(number.lstrip('0') or '0')
+        yield numbers
+
+
+def sayChunk(numbers, numeric=False, grouping=False, **kwargs):
+    """
+    Say the numbers like say.py does: the numeric form first, if requested, and a \\n after each word.
+    @param kwargs The options for backend.sayMany, like shortScale or byLine.
+    @return the text for all numbers.
+    """
+    from backend import sayMany, iterGroupedNumber
+    ret = []
+    for number, word in zip(numbers, sayMany(numbers, **kwargs)):
+        if numeric:
+            ret.extend(iterGroupedNumber(number, grouping))
+            ret.append('\n')
+        ret.append(word)
+        ret.append('\n')
+    return "".join(ret)
+
+
+def _sayChunkTask(task):
+    """ Worker for the parallel mode of sayFile. """
+    numbers, options = task
+    return sayChunk(numbers, **options)
+
+
+def _iterTextsParallel(chunks, workers, options):
+    """
+    Say the chunks in a pool of worker processes; at most 2 * workers chunks are read ahead, so the memory stays flat
+    for files of any size.
+    @return generator of the texts, in the same order as chunks.
+    """
+    from multiprocessing import Pool
+    options = dict((name, options[name]) for name in CHUNK_OPTIONS if name in options)
+    pool = Pool(workers)
+    try:
+        pending = deque()
+        for numbers in chunks:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().get()
+            pending.append(pool.apply_async(_sayChunkTask, ((numbers, options), )))
+        while pending:
+            yield pending.popleft().get()
+        pool.close()
+    finally:
+        pool.terminate()
+
+
+def sayFile(inFile, out, chunkSize=CHUNK_SIZE, workers=None, **kwargs):
+    """
+    Say every number of inFile and write the words to out, in the same order.
+    @param chunkSize Lines per chunk; a chunk is said at once, by one worker.
+    @param workers Say the chunks in that many processes.
+    @return tuple (count of numbers, count of digits).
+    """
+    counts = [0, 0]
+
+    def countChunks():
+        for numbers in iterNumberChunks(inFile, chunkSize or CHUNK_SIZE):
+            counts[0] += len(numbers)
+            counts[1] += sum([len(number) for number in numbers])
+            yield numbers
+
+    if workers > 1:
+        texts = _iterTextsParallel(countChunks(), workers, kwargs)
+    else:
+        texts = (sayChunk(numbers, **kwargs) for numbers in countChunks())
+    for text in texts:
+        out.write(text)
+    return tuple(counts)
+
+
+def reportThroughput(count, digits, seconds, out=None):
+    """ Write how many numbers and digits were said per second. """
+    seconds = max(seconds, 10 ** -6)
+    (out or sys.stderr).write("%d numbers, %d digits in %.2fs: %d numbers/s, %d digits/s\n" %
+                              (count, digits, seconds, count / seconds, digits / seconds))
+
+
+def sayFiles(inputFile, outputFile='-', **kwargs):
+    """
+    Say every number of the file inputFile and write the words to the file outputFile; '-' is stdin or stdout.
+    The throughput gets reported on stderr.
+    """
+    inFile = sys.stdin if inputFile == '-' else open(inputFile, 'r', BUFFER_BYTES)
+    out = sys.stdout if outputFile == '-' else open(outputFile, 'w', BUFFER_BYTES)
+    start = time.time()
+    try:
+        count, digits = sayFile(inFile, out, **kwargs)
+    finally:
+        if inFile is not sys.stdin:
+            inFile.close()
+        if out is not sys.stdout:
+            out.close()
+    reportThroughput(count, digits, time.time() - start)
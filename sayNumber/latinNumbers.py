@@ -35,4 +35,28 @@ CHUQUET_PREFIXES = {
 }
 
 # This are the combined prefixes to use for numbers 1 to 999; plus the standalone prefix 'ni' for 000
-LATIN_NUMBERS = {    0: ['ni'],    1: ['mi', ],    2: ['bi', ],    3: ['tri', ],    4: ['quadri', ],    5: ['quinti', ],    6: ['sexti', ],    7: ['septi', ],    8: ['okti', ],    9: ['noni', ],    10: ['dezi', ],    11: ['un', 'dezi', ],    12: ['duo', 'dezi', ],    13: ['tre', 'dezi', ],    14: ['quattuor', 'dezi', ],    15: ['quin', 'dezi', ],    16: ['se', 'dezi', ],    17: ['septen', 'dezi', ],    18: ['okto', 'dezi', ],    19: ['noven', 'dezi', ],    20: ['viginti', ],    21: ['un', 'viginti', ],    22: ['duo', 'viginti', ],    23: ['tres', 'viginti', ],    24: ['quattuor', 'viginti', ],    25: ['quinqua', 'viginti', ],    26: ['ses', 'viginti', ],    27: ['septem', 'viginti', ],    28: ['okto', 'viginti', ],    29: ['novem', 'viginti', ],    30: ['triginta', ],    31: ['un', 'triginta', ],    32: ['duo', 'triginta', ],    33: ['tres', 'triginta', ],    34: ['quattuor', 'triginta', ],    35: ['quinqua', 'triginta', ],    36: ['ses', 'triginta', ],    37: ['septen', 'triginta', ],    38: ['okto', 'triginta', ],    39: ['noven', 'triginta', ],    40: ['quadraginta', ],    41: ['un', 'quadraginta', ],    42: ['duo', 'quadraginta', ],    43: ['tres', 'quadraginta', ],    44: ['quattuor', 'quadraginta', ],    45: ['quinqua', 'quadraginta', ],    46: ['ses', 'quadraginta', ],    47: ['septen', 'quadraginta', ],    48: ['okto', 'quadraginta', ],    49: ['noven', 'quadraginta', ],    50: ['quinquaginta', ],    51: ['un', 'quinquaginta', ],    52: ['duo', 'quinquaginta', ],    53: ['tres', 'quinquaginta', ],    54: ['quattuor', 'quinquaginta', ],    55: ['quinqua', 'quinquaginta', ],    56: ['ses', 'quinquaginta', ],    57: ['septen', 'quinquaginta', ],    58: ['okto', 'quinquaginta', ],    59: ['noven', 'quinquaginta', ],    60: ['sexaginta', ],    61: ['un', 'sexaginta', ],    62: ['duo', 'sexaginta', ],    63: ['tre', 'sexaginta', ],    64: ['quattuor', 'sexaginta', ],    65: ['quinqua', 'sexaginta', ],    66: ['se', 'sexaginta', ],    67: ['septen', 'sexaginta', ],    68: ['okto', 'sexaginta', ],    69: ['noven', 'sexaginta', ],    70: ['septuaginta', ],    71: ['un', 'septuaginta', ],    72: ['duo', 'septuaginta', ],    73: ['tre', 'septuaginta', ],    74: ['quattuor', 'septuaginta', ],    75: ['quinqua', 'septuaginta', ],    76: ['se', 'septuaginta', ],    77: ['septen', 'septuaginta', ],    78: ['okto', 'septuaginta', ],    79: ['noven', 'septuaginta', ],    80: ['oktoginta', ],    81: ['un', 'oktoginta', ],    82: ['duo', 'oktoginta', ],    83: ['tre', 'oktoginta', ],    84: ['quattuor', 'oktoginta', ],    85: ['quinqua', 'oktoginta', ],    86: ['sex', 'oktoginta', ],    87: ['septem', 'oktoginta', ],    88: ['okto', 'oktoginta', ],    89: ['novem', 'oktoginta', ],    90: ['nonaginta', ],    91: ['un', 'nonaginta', ],    92: ['duo', 'nonaginta', ],    93: ['tre', 'nonaginta', ],    94: ['quattuor', 'nonaginta', ],    95: ['quinqua', 'nonaginta', ],    96: ['se', 'nonaginta', ],    97: ['septe', 'nonaginta', ],    98: ['okto', 'nonaginta', ],    99: ['nove', 'nonaginta', ],    100: ['zenti', ],    101: ['un', 'zenti', ],    102: ['duo', 'zenti', ],    103: ['tres', 'zenti', ],    104: ['quattuor', 'zenti', ],    105: ['quinqua', 'zenti', ],    106: ['sex', 'zenti', ],    107: ['septen', 'zenti', ],    108: ['okto', 'zenti', ],    109: ['noven', 'zenti', ],    110: ['dezi', 'zenti', ],    111: ['un', 'dezi', 'zenti', ],    112: ['duo', 'dezi', 'zenti', ],    113: ['tre', 'dezi', 'zenti', ],    114: ['quattuor', 'dezi', 'zenti', ],    115: ['quin', 'dezi', 'zenti', ],    116: ['se', 'dezi', 'zenti', ],    117: ['septen', 'dezi', 'zenti', ],    118: ['okto', 'dezi', 'zenti', ],    119: ['noven', 'dezi', 'zenti', ],    120: ['viginti', 'zenti', ],    121: ['un', 'viginti', 'zenti', ],    122: ['duo', 'viginti', 'zenti', ],    123: ['tres', 'viginti', 'zenti', ],    124: ['quattuor', 'viginti', 'zenti', ],    125: ['quinqua', 'viginti', 'zenti', ],    126: ['ses', 'viginti', 'zenti', ],    127: ['septem', 'viginti', 'zenti', ],    128: ['okto', 'viginti', 'zenti', ],    129: ['novem', 'viginti', 'zenti', ],    130: ['triginta', 'zenti', ],    131: ['un', 'triginta', 'zenti', ],    132: ['duo', 'triginta', 'zenti', ],    133: ['tres', 'triginta', 'zenti', ],    134: ['quattuor', 'triginta', 'zenti', ],    135: ['quinqua', 'triginta', 'zenti', ],    136: ['ses', 'triginta', 'zenti', ],    137: ['septen', 'triginta', 'zenti', ],    138: ['okto', 'triginta', 'zenti', ],    139: ['noven', 'triginta', 'zenti', ],    140: ['quadraginta', 'zenti', ],    141: ['un', 'quadraginta', 'zenti', ],    142: ['duo', 'quadraginta', 'zenti', ],    143: ['tres', 'quadraginta', 'zenti', ],    144: ['quattuor', 'quadraginta', 'zenti', ],    145: ['quinqua', 'quadraginta', 'zenti', ],    146: ['ses', 'quadraginta', 'zenti', ],    147: ['septen', 'quadraginta', 'zenti', ],    148: ['okto', 'quadraginta', 'zenti', ],    149: ['noven', 'quadraginta', 'zenti', ],    150: ['quinquaginta', 'zenti', ],    151: ['un', 'quinquaginta', 'zenti', ],    152: ['duo', 'quinquaginta', 'zenti', ],    153: ['tres', 'quinquaginta', 'zenti', ],    154: ['quattuor', 'quinquaginta', 'zenti', ],    155: ['quinqua', 'quinquaginta', 'zenti', ],    156: ['ses', 'quinquaginta', 'zenti', ],    157: ['septen', 'quinquaginta', 'zenti', ],    158: ['okto', 'quinquaginta', 'zenti', ],    159: ['noven', 'quinquaginta', 'zenti', ],    160: ['sexaginta', 'zenti', ],    161: ['un', 'sexaginta', 'zenti', ],    162: ['duo', 'sexaginta', 'zenti', ],    163: ['tre', 'sexaginta', 'zenti', ],    164: ['quattuor', 'sexaginta', 'zenti', ],    165: ['quinqua', 'sexaginta', 'zenti', ],    166: ['se', 'sexaginta', 'zenti', ],    167: ['septen', 'sexaginta', 'zenti', ],    168: ['okto', 'sexaginta', 'zenti', ],    169: ['noven', 'sexaginta', 'zenti', ],    170: ['septuaginta', 'zenti', ],    171: ['un', 'septuaginta', 'zenti', ],    172: ['duo', 'septuaginta', 'zenti', ],    173: ['tre', 'septuaginta', 'zenti', ],    174: ['quattuor', 'septuaginta', 'zenti', ],    175: ['quinqua', 'septuaginta', 'zenti', ],    176: ['se', 'septuaginta', 'zenti', ],    177: ['septen', 'septuaginta', 'zenti', ],    178: ['okto', 'septuaginta', 'zenti', ],    179: ['noven', 'septuaginta', 'zenti', ],    180: ['oktoginta', 'zenti', ],    181: ['un', 'oktoginta', 'zenti', ],    182: ['duo', 'oktoginta', 'zenti', ],    183: ['tre', 'oktoginta', 'zenti', ],    184: ['quattuor', 'oktoginta', 'zenti', ],    185: ['quinqua', 'oktoginta', 'zenti', ],    186: ['sex', 'oktoginta', 'zenti', ],    187: ['septem', 'oktoginta', 'zenti', ],    188: ['okto', 'oktoginta', 'zenti', ],    189: ['novem', 'oktoginta', 'zenti', ],    190: ['nonaginta', 'zenti', ],    191: ['un', 'nonaginta', 'zenti', ],    192: ['duo', 'nonaginta', 'zenti', ],    193: ['tre', 'nonaginta', 'zenti', ],    194: ['quattuor', 'nonaginta', 'zenti', ],    195: ['quinqua', 'nonaginta', 'zenti', ],    196: ['se', 'nonaginta', 'zenti', ],    197: ['septe', 'nonaginta', 'zenti', ],    198: ['okto', 'nonaginta', 'zenti', ],    199: ['nove', 'nonaginta', 'zenti', ],    200: ['duzenti', ],    201: ['un', 'duzenti', ],    202: ['duo', 'duzenti', ],    203: ['tre', 'duzenti', ],    204: ['quattuor', 'duzenti', ],    205: ['quinqua', 'duzenti', ],    206: ['se', 'duzenti', ],    207: ['septen', 'duzenti', ],    208: ['okto', 'duzenti', ],    209: ['noven', 'duzenti', ],    210: ['dezi', 'duzenti', ],    211: ['un', 'dezi', 'duzenti', ],    212: ['duo', 'dezi', 'duzenti', ],    213: ['tre', 'dezi', 'duzenti', ],    214: ['quattuor', 'dezi', 'duzenti', ],    215: ['quin', 'dezi', 'duzenti', ],    216: ['se', 'dezi', 'duzenti', ],    217: ['septen', 'dezi', 'duzenti', ],    218: ['okto', 'dezi', 'duzenti', ],    219: ['noven', 'dezi', 'duzenti', ],    220: ['viginti', 'duzenti', ],    221: ['un', 'viginti', 'duzenti', ],    222: ['duo', 'viginti', 'duzenti', ],    223: ['tres', 'viginti', 'duzenti', ],    224: ['quattuor', 'viginti', 'duzenti', ],    225: ['quinqua', 'viginti', 'duzenti', ],    226: ['ses', 'viginti', 'duzenti', ],    227: ['septem', 'viginti', 'duzenti', ],    228: ['okto', 'viginti', 'duzenti', ],    229: ['novem', 'viginti', 'duzenti', ],    230: ['triginta', 'duzenti', ],    231: ['un', 'triginta', 'duzenti', ],    232: ['duo', 'triginta', 'duzenti', ],    233: ['tres', 'triginta', 'duzenti', ],    234: ['quattuor', 'triginta', 'duzenti', ],    235: ['quinqua', 'triginta', 'duzenti', ],    236: ['ses', 'triginta', 'duzenti', ],    237: ['septen', 'triginta', 'duzenti', ],    238: ['okto', 'triginta', 'duzenti', ],    239: ['noven', 'triginta', 'duzenti', ],    240: ['quadraginta', 'duzenti', ],    241: ['un', 'quadraginta', 'duzenti', ],    242: ['duo', 'quadraginta', 'duzenti', ],    243: ['tres', 'quadraginta', 'duzenti', ],    244: ['quattuor', 'quadraginta', 'duzenti', ],    245: ['quinqua', 'quadraginta', 'duzenti', ],    246: ['ses', 'quadraginta', 'duzenti', ],    247: ['septen', 'quadraginta', 'duzenti', ],    248: ['okto', 'quadraginta', 'duzenti', ],    249: ['noven', 'quadraginta', 'duzenti', ],    250: ['quinquaginta', 'duzenti', ],    251: ['un', 'quinquaginta', 'duzenti', ],    252: ['duo', 'quinquaginta', 'duzenti', ],    253: ['tres', 'quinquaginta', 'duzenti', ],    254: ['quattuor', 'quinquaginta', 'duzenti', ],    255: ['quinqua', 'quinquaginta', 'duzenti', ],    256: ['ses', 'quinquaginta', 'duzenti', ],    257: ['septen', 'quinquaginta', 'duzenti', ],    258: ['okto', 'quinquaginta', 'duzenti', ],    259: ['noven', 'quinquaginta', 'duzenti', ],    260: ['sexaginta', 'duzenti', ],    261: ['un', 'sexaginta', 'duzenti', ],    262: ['duo', 'sexaginta', 'duzenti', ],    263: ['tre', 'sexaginta', 'duzenti', ],    264: ['quattuor', 'sexaginta', 'duzenti', ],    265: ['quinqua', 'sexaginta', 'duzenti', ],    266: ['se', 'sexaginta', 'duzenti', ],    267: ['septen', 'sexaginta', 'duzenti', ],    268: ['okto', 'sexaginta', 'duzenti', ],    269: ['noven', 'sexaginta', 'duzenti', ],    270: ['septuaginta', 'duzenti', ],    271: ['un', 'septuaginta', 'duzenti', ],    272: ['duo', 'septuaginta', 'duzenti', ],    273: ['tre', 'septuaginta', 'duzenti', ],    274: ['quattuor', 'septuaginta', 'duzenti', ],    275: ['quinqua', 'septuaginta', 'duzenti', ],    276: ['se', 'septuaginta', 'duzenti', ],    277: ['septen', 'septuaginta', 'duzenti', ],    278: ['okto', 'septuaginta', 'duzenti', ],    279: ['noven', 'septuaginta', 'duzenti', ],    280: ['oktoginta', 'duzenti', ],    281: ['un', 'oktoginta', 'duzenti', ],    282: ['duo', 'oktoginta', 'duzenti', ],    283: ['tre', 'oktoginta', 'duzenti', ],    284: ['quattuor', 'oktoginta', 'duzenti', ],    285: ['quinqua', 'oktoginta', 'duzenti', ],    286: ['sex', 'oktoginta', 'duzenti', ],    287: ['septem', 'oktoginta', 'duzenti', ],    288: ['okto', 'oktoginta', 'duzenti', ],    289: ['novem', 'oktoginta', 'duzenti', ],    290: ['nonaginta', 'duzenti', ],    291: ['un', 'nonaginta', 'duzenti', ],    292: ['duo', 'nonaginta', 'duzenti', ],    293: ['tre', 'nonaginta', 'duzenti', ],    294: ['quattuor', 'nonaginta', 'duzenti', ],    295: ['quinqua', 'nonaginta', 'duzenti', ],    296: ['se', 'nonaginta', 'duzenti', ],    297: ['septe', 'nonaginta', 'duzenti', ],    298: ['okto', 'nonaginta', 'duzenti', ],    299: ['nove', 'nonaginta', 'duzenti', ],    300: ['trezenti', ],    301: ['un', 'trezenti', ],    302: ['duo', 'trezenti', ],    303: ['tres', 'trezenti', ],    304: ['quattuor', 'trezenti', ],    305: ['quinqua', 'trezenti', ],    306: ['ses', 'trezenti', ],    307: ['septen', 'trezenti', ],    308: ['okto', 'trezenti', ],    309: ['noven', 'trezenti', ],    310: ['dezi', 'trezenti', ],    311: ['un', 'dezi', 'trezenti', ],    312: ['duo', 'dezi', 'trezenti', ],    313: ['tre', 'dezi', 'trezenti', ],    314: ['quattuor', 'dezi', 'trezenti', ],    315: ['quin', 'dezi', 'trezenti', ],    316: ['se', 'dezi', 'trezenti', ],    317: ['septen', 'dezi', 'trezenti', ],    318: ['okto', 'dezi', 'trezenti', ],    319: ['noven', 'dezi', 'trezenti', ],    320: ['viginti', 'trezenti', ],    321: ['un', 'viginti', 'trezenti', ],    322: ['duo', 'viginti', 'trezenti', ],    323: ['tres', 'viginti', 'trezenti', ],    324: ['quattuor', 'viginti', 'trezenti', ],    325: ['quinqua', 'viginti', 'trezenti', ],    326: ['ses', 'viginti', 'trezenti', ],    327: ['septem', 'viginti', 'trezenti', ],    328: ['okto', 'viginti', 'trezenti', ],    329: ['novem', 'viginti', 'trezenti', ],    330: ['triginta', 'trezenti', ],    331: ['un', 'triginta', 'trezenti', ],    332: ['duo', 'triginta', 'trezenti', ],    333: ['tres', 'triginta', 'trezenti', ],    334: ['quattuor', 'triginta', 'trezenti', ],    335: ['quinqua', 'triginta', 'trezenti', ],    336: ['ses', 'triginta', 'trezenti', ],    337: ['septen', 'triginta', 'trezenti', ],    338: ['okto', 'triginta', 'trezenti', ],    339: ['noven', 'triginta', 'trezenti', ],    340: ['quadraginta', 'trezenti', ],    341: ['un', 'quadraginta', 'trezenti', ],    342: ['duo', 'quadraginta', 'trezenti', ],    343: ['tres', 'quadraginta', 'trezenti', ],    344: ['quattuor', 'quadraginta', 'trezenti', ],    345: ['quinqua', 'quadraginta', 'trezenti', ],    346: ['ses', 'quadraginta', 'trezenti', ],    347: ['septen', 'quadraginta', 'trezenti', ],    348: ['okto', 'quadraginta', 'trezenti', ],    349: ['noven', 'quadraginta', 'trezenti', ],    350: ['quinquaginta', 'trezenti', ],    351: ['un', 'quinquaginta', 'trezenti', ],    352: ['duo', 'quinquaginta', 'trezenti', ],    353: ['tres', 'quinquaginta', 'trezenti', ],    354: ['quattuor', 'quinquaginta', 'trezenti', ],    355: ['quinqua', 'quinquaginta', 'trezenti', ],    356: ['ses', 'quinquaginta', 'trezenti', ],    357: ['septen', 'quinquaginta', 'trezenti', ],    358: ['okto', 'quinquaginta', 'trezenti', ],    359: ['noven', 'quinquaginta', 'trezenti', ],    360: ['sexaginta', 'trezenti', ],    361: ['un', 'sexaginta', 'trezenti', ],    362: ['duo', 'sexaginta', 'trezenti', ],    363: ['tre', 'sexaginta', 'trezenti', ],    364: ['quattuor', 'sexaginta', 'trezenti', ],    365: ['quinqua', 'sexaginta', 'trezenti', ],    366: ['se', 'sexaginta', 'trezenti', ],    367: ['septen', 'sexaginta', 'trezenti', ],    368: ['okto', 'sexaginta', 'trezenti', ],    369: ['noven', 'sexaginta', 'trezenti', ],    370: ['septuaginta', 'trezenti', ],    371: ['un', 'septuaginta', 'trezenti', ],    372: ['duo', 'septuaginta', 'trezenti', ],    373: ['tre', 'septuaginta', 'trezenti', ],    374: ['quattuor', 'septuaginta', 'trezenti', ],    375: ['quinqua', 'septuaginta', 'trezenti', ],    376: ['se', 'septuaginta', 'trezenti', ],    377: ['septen', 'septuaginta', 'trezenti', ],    378: ['okto', 'septuaginta', 'trezenti', ],    379: ['noven', 'septuaginta', 'trezenti', ],    380: ['oktoginta', 'trezenti', ],    381: ['un', 'oktoginta', 'trezenti', ],    382: ['duo', 'oktoginta', 'trezenti', ],    383: ['tre', 'oktoginta', 'trezenti', ],    384: ['quattuor', 'oktoginta', 'trezenti', ],    385: ['quinqua', 'oktoginta', 'trezenti', ],    386: ['sex', 'oktoginta', 'trezenti', ],    387: ['septem', 'oktoginta', 'trezenti', ],    388: ['okto', 'oktoginta', 'trezenti', ],    389: ['novem', 'oktoginta', 'trezenti', ],    390: ['nonaginta', 'trezenti', ],    391: ['un', 'nonaginta', 'trezenti', ],    392: ['duo', 'nonaginta', 'trezenti', ],    393: ['tre', 'nonaginta', 'trezenti', ],    394: ['quattuor', 'nonaginta', 'trezenti', ],    395: ['quinqua', 'nonaginta', 'trezenti', ],    396: ['se', 'nonaginta', 'trezenti', ],    397: ['septe', 'nonaginta', 'trezenti', ],    398: ['okto', 'nonaginta', 'trezenti', ],    399: ['nove', 'nonaginta', 'trezenti', ],    400: ['quadringenti', ],    401: ['un', 'quadringenti', ],    402: ['duo', 'quadringenti', ],    403: ['tres', 'quadringenti', ],    404: ['quattuor', 'quadringenti', ],    405: ['quinqua', 'quadringenti', ],    406: ['ses', 'quadringenti', ],    407: ['septen', 'quadringenti', ],    408: ['okto', 'quadringenti', ],    409: ['noven', 'quadringenti', ],    410: ['dezi', 'quadringenti', ],    411: ['un', 'dezi', 'quadringenti', ],    412: ['duo', 'dezi', 'quadringenti', ],    413: ['tre', 'dezi', 'quadringenti', ],    414: ['quattuor', 'dezi', 'quadringenti', ],    415: ['quin', 'dezi', 'quadringenti', ],    416: ['se', 'dezi', 'quadringenti', ],    417: ['septen', 'dezi', 'quadringenti', ],    418: ['okto', 'dezi', 'quadringenti', ],    419: ['noven', 'dezi', 'quadringenti', ],    420: ['viginti', 'quadringenti', ],    421: ['un', 'viginti', 'quadringenti', ],    422: ['duo', 'viginti', 'quadringenti', ],    423: ['tres', 'viginti', 'quadringenti', ],    424: ['quattuor', 'viginti', 'quadringenti', ],    425: ['quinqua', 'viginti', 'quadringenti', ],    426: ['ses', 'viginti', 'quadringenti', ],    427: ['septem', 'viginti', 'quadringenti', ],    428: ['okto', 'viginti', 'quadringenti', ],    429: ['novem', 'viginti', 'quadringenti', ],    430: ['triginta', 'quadringenti', ],    431: ['un', 'triginta', 'quadringenti', ],    432: ['duo', 'triginta', 'quadringenti', ],    433: ['tres', 'triginta', 'quadringenti', ],    434: ['quattuor', 'triginta', 'quadringenti', ],    435: ['quinqua', 'triginta', 'quadringenti', ],    436: ['ses', 'triginta', 'quadringenti', ],    437: ['septen', 'triginta', 'quadringenti', ],    438: ['okto', 'triginta', 'quadringenti', ],    439: ['noven', 'triginta', 'quadringenti', ],    440: ['quadraginta', 'quadringenti', ],    441: ['un', 'quadraginta', 'quadringenti', ],    442: ['duo', 'quadraginta', 'quadringenti', ],    443: ['tres', 'quadraginta', 'quadringenti', ],    444: ['quattuor', 'quadraginta', 'quadringenti', ],    445: ['quinqua', 'quadraginta', 'quadringenti', ],    446: ['ses', 'quadraginta', 'quadringenti', ],    447: ['septen', 'quadraginta', 'quadringenti', ],    448: ['okto', 'quadraginta', 'quadringenti', ],    449: ['noven', 'quadraginta', 'quadringenti', ],    450: ['quinquaginta', 'quadringenti', ],    451: ['un', 'quinquaginta', 'quadringenti', ],    452: ['duo', 'quinquaginta', 'quadringenti', ],    453: ['tres', 'quinquaginta', 'quadringenti', ],    454: ['quattuor', 'quinquaginta', 'quadringenti', ],    455: ['quinqua', 'quinquaginta', 'quadringenti', ],    456: ['ses', 'quinquaginta', 'quadringenti', ],    457: ['septen', 'quinquaginta', 'quadringenti', ],    458: ['okto', 'quinquaginta', 'quadringenti', ],    459: ['noven', 'quinquaginta', 'quadringenti', ],    460: ['sexaginta', 'quadringenti', ],    461: ['un', 'sexaginta', 'quadringenti', ],    462: ['duo', 'sexaginta', 'quadringenti', ],    463: ['tre', 'sexaginta', 'quadringenti', ],    464: ['quattuor', 'sexaginta', 'quadringenti', ],    465: ['quinqua', 'sexaginta', 'quadringenti', ],    466: ['se', 'sexaginta', 'quadringenti', ],    467: ['septen', 'sexaginta', 'quadringenti', ],    468: ['okto', 'sexaginta', 'quadringenti', ],    469: ['noven', 'sexaginta', 'quadringenti', ],    470: ['septuaginta', 'quadringenti', ],    471: ['un', 'septuaginta', 'quadringenti', ],    472: ['duo', 'septuaginta', 'quadringenti', ],    473: ['tre', 'septuaginta', 'quadringenti', ],    474: ['quattuor', 'septuaginta', 'quadringenti', ],    475: ['quinqua', 'septuaginta', 'quadringenti', ],    476: ['se', 'septuaginta', 'quadringenti', ],    477: ['septen', 'septuaginta', 'quadringenti', ],    478: ['okto', 'septuaginta', 'quadringenti', ],    479: ['noven', 'septuaginta', 'quadringenti', ],    480: ['oktoginta', 'quadringenti', ],    481: ['un', 'oktoginta', 'quadringenti', ],    482: ['duo', 'oktoginta', 'quadringenti', ],    483: ['tre', 'oktoginta', 'quadringenti', ],    484: ['quattuor', 'oktoginta', 'quadringenti', ],    485: ['quinqua', 'oktoginta', 'quadringenti', ],    486: ['sex', 'oktoginta', 'quadringenti', ],    487: ['septem', 'oktoginta', 'quadringenti', ],    488: ['okto', 'oktoginta', 'quadringenti', ],    489: ['novem', 'oktoginta', 'quadringenti', ],    490: ['nonaginta', 'quadringenti', ],    491: ['un', 'nonaginta', 'quadringenti', ],    492: ['duo', 'nonaginta', 'quadringenti', ],    493: ['tre', 'nonaginta', 'quadringenti', ],    494: ['quattuor', 'nonaginta', 'quadringenti', ],    495: ['quinqua', 'nonaginta', 'quadringenti', ],    496: ['se', 'nonaginta', 'quadringenti', ],    497: ['septe', 'nonaginta', 'quadringenti', ],    498: ['okto', 'nonaginta', 'quadringenti', ],    499: ['nove', 'nonaginta', 'quadringenti', ],    500: ['quingenti', ],    501: ['un', 'quingenti', ],    502: ['duo', 'quingenti', ],    503: ['tres', 'quingenti', ],    504: ['quattuor', 'quingenti', ],    505: ['quinqua', 'quingenti', ],    506: ['ses', 'quingenti', ],    507: ['septen', 'quingenti', ],    508: ['okto', 'quingenti', ],    509: ['noven', 'quingenti', ],    510: ['dezi', 'quingenti', ],    511: ['un', 'dezi', 'quingenti', ],    512: ['duo', 'dezi', 'quingenti', ],    513: ['tre', 'dezi', 'quingenti', ],    514: ['quattuor', 'dezi', 'quingenti', ],    515: ['quin', 'dezi', 'quingenti', ],    516: ['se', 'dezi', 'quingenti', ],    517: ['septen', 'dezi', 'quingenti', ],    518: ['okto', 'dezi', 'quingenti', ],    519: ['noven', 'dezi', 'quingenti', ],    520: ['viginti', 'quingenti', ],    521: ['un', 'viginti', 'quingenti', ],    522: ['duo', 'viginti', 'quingenti', ],    523: ['tres', 'viginti', 'quingenti', ],    524: ['quattuor', 'viginti', 'quingenti', ],    525: ['quinqua', 'viginti', 'quingenti', ],    526: ['ses', 'viginti', 'quingenti', ],    527: ['septem', 'viginti', 'quingenti', ],    528: ['okto', 'viginti', 'quingenti', ],    529: ['novem', 'viginti', 'quingenti', ],    530: ['triginta', 'quingenti', ],    531: ['un', 'triginta', 'quingenti', ],    532: ['duo', 'triginta', 'quingenti', ],    533: ['tres', 'triginta', 'quingenti', ],    534: ['quattuor', 'triginta', 'quingenti', ],    535: ['quinqua', 'triginta', 'quingenti', ],    536: ['ses', 'triginta', 'quingenti', ],    537: ['septen', 'triginta', 'quingenti', ],    538: ['okto', 'triginta', 'quingenti', ],    539: ['noven', 'triginta', 'quingenti', ],    540: ['quadraginta', 'quingenti', ],    541: ['un', 'quadraginta', 'quingenti', ],    542: ['duo', 'quadraginta', 'quingenti', ],    543: ['tres', 'quadraginta', 'quingenti', ],    544: ['quattuor', 'quadraginta', 'quingenti', ],    545: ['quinqua', 'quadraginta', 'quingenti', ],    546: ['ses', 'quadraginta', 'quingenti', ],    547: ['septen', 'quadraginta', 'quingenti', ],    548: ['okto', 'quadraginta', 'quingenti', ],    549: ['noven', 'quadraginta', 'quingenti', ],    550: ['quinquaginta', 'quingenti', ],    551: ['un', 'quinquaginta', 'quingenti', ],    552: ['duo', 'quinquaginta', 'quingenti', ],    553: ['tres', 'quinquaginta', 'quingenti', ],    554: ['quattuor', 'quinquaginta', 'quingenti', ],    555: ['quinqua', 'quinquaginta', 'quingenti', ],    556: ['ses', 'quinquaginta', 'quingenti', ],    557: ['septen', 'quinquaginta', 'quingenti', ],    558: ['okto', 'quinquaginta', 'quingenti', ],    559: ['noven', 'quinquaginta', 'quingenti', ],    560: ['sexaginta', 'quingenti', ],    561: ['un', 'sexaginta', 'quingenti', ],    562: ['duo', 'sexaginta', 'quingenti', ],    563: ['tre', 'sexaginta', 'quingenti', ],    564: ['quattuor', 'sexaginta', 'quingenti', ],    565: ['quinqua', 'sexaginta', 'quingenti', ],    566: ['se', 'sexaginta', 'quingenti', ],    567: ['septen', 'sexaginta', 'quingenti', ],    568: ['okto', 'sexaginta', 'quingenti', ],    569: ['noven', 'sexaginta', 'quingenti', ],    570: ['septuaginta', 'quingenti', ],    571: ['un', 'septuaginta', 'quingenti', ],    572: ['duo', 'septuaginta', 'quingenti', ],    573: ['tre', 'septuaginta', 'quingenti', ],    574: ['quattuor', 'septuaginta', 'quingenti', ],    575: ['quinqua', 'septuaginta', 'quingenti', ],    576: ['se', 'septuaginta', 'quingenti', ],    577: ['septen', 'septuaginta', 'quingenti', ],    578: ['okto', 'septuaginta', 'quingenti', ],    579: ['noven', 'septuaginta', 'quingenti', ],    580: ['oktoginta', 'quingenti', ],    581: ['un', 'oktoginta', 'quingenti', ],    582: ['duo', 'oktoginta', 'quingenti', ],    583: ['tre', 'oktoginta', 'quingenti', ],    584: ['quattuor', 'oktoginta', 'quingenti', ],    585: ['quinqua', 'oktoginta', 'quingenti', ],    586: ['sex', 'oktoginta', 'quingenti', ],    587: ['septem', 'oktoginta', 'quingenti', ],    588: ['okto', 'oktoginta', 'quingenti', ],    589: ['novem', 'oktoginta', 'quingenti', ],    590: ['nonaginta', 'quingenti', ],    591: ['un', 'nonaginta', 'quingenti', ],    592: ['duo', 'nonaginta', 'quingenti', ],    593: ['tre', 'nonaginta', 'quingenti', ],    594: ['quattuor', 'nonaginta', 'quingenti', ],    595: ['quinqua', 'nonaginta', 'quingenti', ],    596: ['se', 'nonaginta', 'quingenti', ],    597: ['septe', 'nonaginta', 'quingenti', ],    598: ['okto', 'nonaginta', 'quingenti', ],    599: ['nove', 'nonaginta', 'quingenti', ],    600: ['seszenti', ],    601: ['un', 'seszenti', ],    602: ['duo', 'seszenti', ],    603: ['tre', 'seszenti', ],    604: ['quattuor', 'seszenti', ],    605: ['quinqua', 'seszenti', ],    606: ['se', 'seszenti', ],    607: ['septen', 'seszenti', ],    608: ['okto', 'seszenti', ],    609: ['noven', 'seszenti', ],    610: ['dezi', 'seszenti', ],    611: ['un', 'dezi', 'seszenti', ],    612: ['duo', 'dezi', 'seszenti', ],    613: ['tre', 'dezi', 'seszenti', ],    614: ['quattuor', 'dezi', 'seszenti', ],    615: ['quin', 'dezi', 'seszenti', ],    616: ['se', 'dezi', 'seszenti', ],    617: ['septen', 'dezi', 'seszenti', ],    618: ['okto', 'dezi', 'seszenti', ],    619: ['noven', 'dezi', 'seszenti', ],    620: ['viginti', 'seszenti', ],    621: ['un', 'viginti', 'seszenti', ],    622: ['duo', 'viginti', 'seszenti', ],    623: ['tres', 'viginti', 'seszenti', ],    624: ['quattuor', 'viginti', 'seszenti', ],    625: ['quinqua', 'viginti', 'seszenti', ],    626: ['ses', 'viginti', 'seszenti', ],    627: ['septem', 'viginti', 'seszenti', ],    628: ['okto', 'viginti', 'seszenti', ],    629: ['novem', 'viginti', 'seszenti', ],    630: ['triginta', 'seszenti', ],    631: ['un', 'triginta', 'seszenti', ],    632: ['duo', 'triginta', 'seszenti', ],    633: ['tres', 'triginta', 'seszenti', ],    634: ['quattuor', 'triginta', 'seszenti', ],    635: ['quinqua', 'triginta', 'seszenti', ],    636: ['ses', 'triginta', 'seszenti', ],    637: ['septen', 'triginta', 'seszenti', ],    638: ['okto', 'triginta', 'seszenti', ],    639: ['noven', 'triginta', 'seszenti', ],    640: ['quadraginta', 'seszenti', ],    641: ['un', 'quadraginta', 'seszenti', ],    642: ['duo', 'quadraginta', 'seszenti', ],    643: ['tres', 'quadraginta', 'seszenti', ],    644: ['quattuor', 'quadraginta', 'seszenti', ],    645: ['quinqua', 'quadraginta', 'seszenti', ],    646: ['ses', 'quadraginta', 'seszenti', ],    647: ['septen', 'quadraginta', 'seszenti', ],    648: ['okto', 'quadraginta', 'seszenti', ],    649: ['noven', 'quadraginta', 'seszenti', ],    650: ['quinquaginta', 'seszenti', ],    651: ['un', 'quinquaginta', 'seszenti', ],    652: ['duo', 'quinquaginta', 'seszenti', ],    653: ['tres', 'quinquaginta', 'seszenti', ],    654: ['quattuor', 'quinquaginta', 'seszenti', ],    655: ['quinqua', 'quinquaginta', 'seszenti', ],    656: ['ses', 'quinquaginta', 'seszenti', ],    657: ['septen', 'quinquaginta', 'seszenti', ],    658: ['okto', 'quinquaginta', 'seszenti', ],    659: ['noven', 'quinquaginta', 'seszenti', ],    660: ['sexaginta', 'seszenti', ],    661: ['un', 'sexaginta', 'seszenti', ],    662: ['duo', 'sexaginta', 'seszenti', ],    663: ['tre', 'sexaginta', 'seszenti', ],    664: ['quattuor', 'sexaginta', 'seszenti', ],    665: ['quinqua', 'sexaginta', 'seszenti', ],    666: ['se', 'sexaginta', 'seszenti', ],    667: ['septen', 'sexaginta', 'seszenti', ],    668: ['okto', 'sexaginta', 'seszenti', ],    669: ['noven', 'sexaginta', 'seszenti', ],    670: ['septuaginta', 'seszenti', ],    671: ['un', 'septuaginta', 'seszenti', ],    672: ['duo', 'septuaginta', 'seszenti', ],    673: ['tre', 'septuaginta', 'seszenti', ],    674: ['quattuor', 'septuaginta', 'seszenti', ],    675: ['quinqua', 'septuaginta', 'seszenti', ],    676: ['se', 'septuaginta', 'seszenti', ],    677: ['septen', 'septuaginta', 'seszenti', ],    678: ['okto', 'septuaginta', 'seszenti', ],    679: ['noven', 'septuaginta', 'seszenti', ],    680: ['oktoginta', 'seszenti', ],    681: ['un', 'oktoginta', 'seszenti', ],    682: ['duo', 'oktoginta', 'seszenti', ],    683: ['tre', 'oktoginta', 'seszenti', ],    684: ['quattuor', 'oktoginta', 'seszenti', ],    685: ['quinqua', 'oktoginta', 'seszenti', ],    686: ['sex', 'oktoginta', 'seszenti', ],    687: ['septem', 'oktoginta', 'seszenti', ],    688: ['okto', 'oktoginta', 'seszenti', ],    689: ['novem', 'oktoginta', 'seszenti', ],    690: ['nonaginta', 'seszenti', ],    691: ['un', 'nonaginta', 'seszenti', ],    692: ['duo', 'nonaginta', 'seszenti', ],    693: ['tre', 'nonaginta', 'seszenti', ],    694: ['quattuor', 'nonaginta', 'seszenti', ],    695: ['quinqua', 'nonaginta', 'seszenti', ],    696: ['se', 'nonaginta', 'seszenti', ],    697: ['septe', 'nonaginta', 'seszenti', ],    698: ['okto', 'nonaginta', 'seszenti', ],    699: ['nove', 'nonaginta', 'seszenti', ],    700: ['septingenti', ],    701: ['un', 'septingenti', ],    702: ['duo', 'septingenti', ],    703: ['tre', 'septingenti', ],    704: ['quattuor', 'septingenti', ],    705: ['quinqua', 'septingenti', ],    706: ['se', 'septingenti', ],    707: ['septen', 'septingenti', ],    708: ['okto', 'septingenti', ],    709: ['noven', 'septingenti', ],    710: ['dezi', 'septingenti', ],    711: ['un', 'dezi', 'septingenti', ],    712: ['duo', 'dezi', 'septingenti', ],    713: ['tre', 'dezi', 'septingenti', ],    714: ['quattuor', 'dezi', 'septingenti', ],    715: ['quin', 'dezi', 'septingenti', ],    716: ['se', 'dezi', 'septingenti', ],    717: ['septen', 'dezi', 'septingenti', ],    718: ['okto', 'dezi', 'septingenti', ],    719: ['noven', 'dezi', 'septingenti', ],    720: ['viginti', 'septingenti', ],    721: ['un', 'viginti', 'septingenti', ],    722: ['duo', 'viginti', 'septingenti', ],    723: ['tres', 'viginti', 'septingenti', ],    724: ['quattuor', 'viginti', 'septingenti', ],    725: ['quinqua', 'viginti', 'septingenti', ],    726: ['ses', 'viginti', 'septingenti', ],    727: ['septem', 'viginti', 'septingenti', ],    728: ['okto', 'viginti', 'septingenti', ],    729: ['novem', 'viginti', 'septingenti', ],    730: ['triginta', 'septingenti', ],    731: ['un', 'triginta', 'septingenti', ],    732: ['duo', 'triginta', 'septingenti', ],    733: ['tres', 'triginta', 'septingenti', ],    734: ['quattuor', 'triginta', 'septingenti', ],    735: ['quinqua', 'triginta', 'septingenti', ],    736: ['ses', 'triginta', 'septingenti', ],    737: ['septen', 'triginta', 'septingenti', ],    738: ['okto', 'triginta', 'septingenti', ],    739: ['noven', 'triginta', 'septingenti', ],    740: ['quadraginta', 'septingenti', ],    741: ['un', 'quadraginta', 'septingenti', ],    742: ['duo', 'quadraginta', 'septingenti', ],    743: ['tres', 'quadraginta', 'septingenti', ],    744: ['quattuor', 'quadraginta', 'septingenti', ],    745: ['quinqua', 'quadraginta', 'septingenti', ],    746: ['ses', 'quadraginta', 'septingenti', ],    747: ['septen', 'quadraginta', 'septingenti', ],    748: ['okto', 'quadraginta', 'septingenti', ],    749: ['noven', 'quadraginta', 'septingenti', ],    750: ['quinquaginta', 'septingenti', ],    751: ['un', 'quinquaginta', 'septingenti', ],    752: ['duo', 'quinquaginta', 'septingenti', ],    753: ['tres', 'quinquaginta', 'septingenti', ],    754: ['quattuor', 'quinquaginta', 'septingenti', ],    755: ['quinqua', 'quinquaginta', 'septingenti', ],    756: ['ses', 'quinquaginta', 'septingenti', ],    757: ['septen', 'quinquaginta', 'septingenti', ],    758: ['okto', 'quinquaginta', 'septingenti', ],    759: ['noven', 'quinquaginta', 'septingenti', ],    760: ['sexaginta', 'septingenti', ],    761: ['un', 'sexaginta', 'septingenti', ],    762: ['duo', 'sexaginta', 'septingenti', ],    763: ['tre', 'sexaginta', 'septingenti', ],    764: ['quattuor', 'sexaginta', 'septingenti', ],    765: ['quinqua', 'sexaginta', 'septingenti', ],    766: ['se', 'sexaginta', 'septingenti', ],    767: ['septen', 'sexaginta', 'septingenti', ],    768: ['okto', 'sexaginta', 'septingenti', ],    769: ['noven', 'sexaginta', 'septingenti', ],    770: ['septuaginta', 'septingenti', ],    771: ['un', 'septuaginta', 'septingenti', ],    772: ['duo', 'septuaginta', 'septingenti', ],    773: ['tre', 'septuaginta', 'septingenti', ],    774: ['quattuor', 'septuaginta', 'septingenti', ],    775: ['quinqua', 'septuaginta', 'septingenti', ],    776: ['se', 'septuaginta', 'septingenti', ],    777: ['septen', 'septuaginta', 'septingenti', ],    778: ['okto', 'septuaginta', 'septingenti', ],    779: ['noven', 'septuaginta', 'septingenti', ],    780: ['oktoginta', 'septingenti', ],    781: ['un', 'oktoginta', 'septingenti', ],    782: ['duo', 'oktoginta', 'septingenti', ],    783: ['tre', 'oktoginta', 'septingenti', ],    784: ['quattuor', 'oktoginta', 'septingenti', ],    785: ['quinqua', 'oktoginta', 'septingenti', ],    786: ['sex', 'oktoginta', 'septingenti', ],    787: ['septem', 'oktoginta', 'septingenti', ],    788: ['okto', 'oktoginta', 'septingenti', ],    789: ['novem', 'oktoginta', 'septingenti', ],    790: ['nonaginta', 'septingenti', ],    791: ['un', 'nonaginta', 'septingenti', ],    792: ['duo', 'nonaginta', 'septingenti', ],    793: ['tre', 'nonaginta', 'septingenti', ],    794: ['quattuor', 'nonaginta', 'septingenti', ],    795: ['quinqua', 'nonaginta', 'septingenti', ],    796: ['se', 'nonaginta', 'septingenti', ],    797: ['septe', 'nonaginta', 'septingenti', ],    798: ['okto', 'nonaginta', 'septingenti', ],    799: ['nove', 'nonaginta', 'septingenti', ],    800: ['oktingenti', ],    801: ['un', 'oktingenti', ],    802: ['duo', 'oktingenti', ],    803: ['tre', 'oktingenti', ],    804: ['quattuor', 'oktingenti', ],    805: ['quinqua', 'oktingenti', ],    806: ['sex', 'oktingenti', ],    807: ['septem', 'oktingenti', ],    808: ['okto', 'oktingenti', ],    809: ['novem', 'oktingenti', ],    810: ['dezi', 'oktingenti', ],    811: ['un', 'dezi', 'oktingenti', ],    812: ['duo', 'dezi', 'oktingenti', ],    813: ['tre', 'dezi', 'oktingenti', ],    814: ['quattuor', 'dezi', 'oktingenti', ],    815: ['quin', 'dezi', 'oktingenti', ],    816: ['se', 'dezi', 'oktingenti', ],    817: ['septen', 'dezi', 'oktingenti', ],    818: ['okto', 'dezi', 'oktingenti', ],    819: ['noven', 'dezi', 'oktingenti', ],    820: ['viginti', 'oktingenti', ],    821: ['un', 'viginti', 'oktingenti', ],    822: ['duo', 'viginti', 'oktingenti', ],    823: ['tres', 'viginti', 'oktingenti', ],    824: ['quattuor', 'viginti', 'oktingenti', ],    825: ['quinqua', 'viginti', 'oktingenti', ],    826: ['ses', 'viginti', 'oktingenti', ],    827: ['septem', 'viginti', 'oktingenti', ],    828: ['okto', 'viginti', 'oktingenti', ],    829: ['novem', 'viginti', 'oktingenti', ],    830: ['triginta', 'oktingenti', ],    831: ['un', 'triginta', 'oktingenti', ],    832: ['duo', 'triginta', 'oktingenti', ],    833: ['tres', 'triginta', 'oktingenti', ],    834: ['quattuor', 'triginta', 'oktingenti', ],    835: ['quinqua', 'triginta', 'oktingenti', ],    836: ['ses', 'triginta', 'oktingenti', ],    837: ['septen', 'triginta', 'oktingenti', ],    838: ['okto', 'triginta', 'oktingenti', ],    839: ['noven', 'triginta', 'oktingenti', ],    840: ['quadraginta', 'oktingenti', ],    841: ['un', 'quadraginta', 'oktingenti', ],    842: ['duo', 'quadraginta', 'oktingenti', ],    843: ['tres', 'quadraginta', 'oktingenti', ],    844: ['quattuor', 'quadraginta', 'oktingenti', ],    845: ['quinqua', 'quadraginta', 'oktingenti', ],    846: ['ses', 'quadraginta', 'oktingenti', ],    847: ['septen', 'quadraginta', 'oktingenti', ],    848: ['okto', 'quadraginta', 'oktingenti', ],    849: ['noven', 'quadraginta', 'oktingenti', ],    850: ['quinquaginta', 'oktingenti', ],    851: ['un', 'quinquaginta', 'oktingenti', ],    852: ['duo', 'quinquaginta', 'oktingenti', ],    853: ['tres', 'quinquaginta', 'oktingenti', ],    854: ['quattuor', 'quinquaginta', 'oktingenti', ],    855: ['quinqua', 'quinquaginta', 'oktingenti', ],    856: ['ses', 'quinquaginta', 'oktingenti', ],    857: ['septen', 'quinquaginta', 'oktingenti', ],    858: ['okto', 'quinquaginta', 'oktingenti', ],    859: ['noven', 'quinquaginta', 'oktingenti', ],    860: ['sexaginta', 'oktingenti', ],    861: ['un', 'sexaginta', 'oktingenti', ],    862: ['duo', 'sexaginta', 'oktingenti', ],    863: ['tre', 'sexaginta', 'oktingenti', ],    864: ['quattuor', 'sexaginta', 'oktingenti', ],    865: ['quinqua', 'sexaginta', 'oktingenti', ],    866: ['se', 'sexaginta', 'oktingenti', ],    867: ['septen', 'sexaginta', 'oktingenti', ],    868: ['okto', 'sexaginta', 'oktingenti', ],    869: ['noven', 'sexaginta', 'oktingenti', ],    870: ['septuaginta', 'oktingenti', ],    871: ['un', 'septuaginta', 'oktingenti', ],    872: ['duo', 'septuaginta', 'oktingenti', ],    873: ['tre', 'septuaginta', 'oktingenti', ],    874: ['quattuor', 'septuaginta', 'oktingenti', ],    875: ['quinqua', 'septuaginta', 'oktingenti', ],    876: ['se', 'septuaginta', 'oktingenti', ],    877: ['septen', 'septuaginta', 'oktingenti', ],    878: ['okto', 'septuaginta', 'oktingenti', ],    879: ['noven', 'septuaginta', 'oktingenti', ],    880: ['oktoginta', 'oktingenti', ],    881: ['un', 'oktoginta', 'oktingenti', ],    882: ['duo', 'oktoginta', 'oktingenti', ],    883: ['tre', 'oktoginta', 'oktingenti', ],    884: ['quattuor', 'oktoginta', 'oktingenti', ],    885: ['quinqua', 'oktoginta', 'oktingenti', ],    886: ['sex', 'oktoginta', 'oktingenti', ],    887: ['septem', 'oktoginta', 'oktingenti', ],    888: ['okto', 'oktoginta', 'oktingenti', ],    889: ['novem', 'oktoginta', 'oktingenti', ],    890: ['nonaginta', 'oktingenti', ],    891: ['un', 'nonaginta', 'oktingenti', ],    892: ['duo', 'nonaginta', 'oktingenti', ],    893: ['tre', 'nonaginta', 'oktingenti', ],    894: ['quattuor', 'nonaginta', 'oktingenti', ],    895: ['quinqua', 'nonaginta', 'oktingenti', ],    896: ['se', 'nonaginta', 'oktingenti', ],    897: ['septe', 'nonaginta', 'oktingenti', ],    898: ['okto', 'nonaginta', 'oktingenti', ],    899: ['nove', 'nonaginta', 'oktingenti', ],    900: ['nongenti', ],    901: ['un', 'nongenti', ],    902: ['duo', 'nongenti', ],    903: ['tre', 'nongenti', ],    904: ['quattuor', 'nongenti', ],    905: ['quinqua', 'nongenti', ],    906: ['se', 'nongenti', ],    907: ['septe', 'nongenti', ],    908: ['okto', 'nongenti', ],    909: ['nove', 'nongenti', ],    910: ['dezi', 'nongenti', ],    911: ['un', 'dezi', 'nongenti', ],    912: ['duo', 'dezi', 'nongenti', ],    913: ['tre', 'dezi', 'nongenti', ],    914: ['quattuor', 'dezi', 'nongenti', ],    915: ['quin', 'dezi', 'nongenti', ],    916: ['se', 'dezi', 'nongenti', ],    917: ['septen', 'dezi', 'nongenti', ],    918: ['okto', 'dezi', 'nongenti', ],    919: ['noven', 'dezi', 'nongenti', ],    920: ['viginti', 'nongenti', ],    921: ['un', 'viginti', 'nongenti', ],    922: ['duo', 'viginti', 'nongenti', ],    923: ['tres', 'viginti', 'nongenti', ],    924: ['quattuor', 'viginti', 'nongenti', ],    925: ['quinqua', 'viginti', 'nongenti', ],    926: ['ses', 'viginti', 'nongenti', ],    927: ['septem', 'viginti', 'nongenti', ],    928: ['okto', 'viginti', 'nongenti', ],    929: ['novem', 'viginti', 'nongenti', ],    930: ['triginta', 'nongenti', ],    931: ['un', 'triginta', 'nongenti', ],    932: ['duo', 'triginta', 'nongenti', ],    933: ['tres', 'triginta', 'nongenti', ],    934: ['quattuor', 'triginta', 'nongenti', ],    935: ['quinqua', 'triginta', 'nongenti', ],    936: ['ses', 'triginta', 'nongenti', ],    937: ['septen', 'triginta', 'nongenti', ],    938: ['okto', 'triginta', 'nongenti', ],    939: ['noven', 'triginta', 'nongenti', ],    940: ['quadraginta', 'nongenti', ],    941: ['un', 'quadraginta', 'nongenti', ],    942: ['duo', 'quadraginta', 'nongenti', ],    943: ['tres', 'quadraginta', 'nongenti', ],    944: ['quattuor', 'quadraginta', 'nongenti', ],    945: ['quinqua', 'quadraginta', 'nongenti', ],    946: ['ses', 'quadraginta', 'nongenti', ],    947: ['septen', 'quadraginta', 'nongenti', ],    948: ['okto', 'quadraginta', 'nongenti', ],    949: ['noven', 'quadraginta', 'nongenti', ],    950: ['quinquaginta', 'nongenti', ],    951: ['un', 'quinquaginta', 'nongenti', ],    952: ['duo', 'quinquaginta', 'nongenti', ],    953: ['tres', 'quinquaginta', 'nongenti', ],    954: ['quattuor', 'quinquaginta', 'nongenti', ],    955: ['quinqua', 'quinquaginta', 'nongenti', ],    956: ['ses', 'quinquaginta', 'nongenti', ],    957: ['septen', 'quinquaginta', 'nongenti', ],    958: ['okto', 'quinquaginta', 'nongenti', ],    959: ['noven', 'quinquaginta', 'nongenti', ],    960: ['sexaginta', 'nongenti', ],    961: ['un', 'sexaginta', 'nongenti', ],    962: ['duo', 'sexaginta', 'nongenti', ],    963: ['tre', 'sexaginta', 'nongenti', ],    964: ['quattuor', 'sexaginta', 'nongenti', ],    965: ['quinqua', 'sexaginta', 'nongenti', ],    966: ['se', 'sexaginta', 'nongenti', ],    967: ['septen', 'sexaginta', 'nongenti', ],    968: ['okto', 'sexaginta', 'nongenti', ],    969: ['noven', 'sexaginta', 'nongenti', ],    970: ['septuaginta', 'nongenti', ],    971: ['un', 'septuaginta', 'nongenti', ],    972: ['duo', 'septuaginta', 'nongenti', ],    973: ['tre', 'septuaginta', 'nongenti', ],    974: ['quattuor', 'septuaginta', 'nongenti', ],    975: ['quinqua', 'septuaginta', 'nongenti', ],    976: ['se', 'septuaginta', 'nongenti', ],    977: ['septen', 'septuaginta', 'nongenti', ],    978: ['okto', 'septuaginta', 'nongenti', ],    979: ['noven', 'septuaginta', 'nongenti', ],    980: ['oktoginta', 'nongenti', ],    981: ['un', 'oktoginta', 'nongenti', ],    982: ['duo', 'oktoginta', 'nongenti', ],    983: ['tre', 'oktoginta', 'nongenti', ],    984: ['quattuor', 'oktoginta', 'nongenti', ],    985: ['quinqua', 'oktoginta', 'nongenti', ],    986: ['sex', 'oktoginta', 'nongenti', ],    987: ['septem', 'oktoginta', 'nongenti', ],    988: ['okto', 'oktoginta', 'nongenti', ],    989: ['novem', 'oktoginta', 'nongenti', ],    990: ['nonaginta', 'nongenti', ],    991: ['un', 'nonaginta', 'nongenti', ],    992: ['duo', 'nonaginta', 'nongenti', ],    993: ['tre', 'nonaginta', 'nongenti', ],    994: ['quattuor', 'nonaginta', 'nongenti', ],    995: ['quinqua', 'nonaginta', 'nongenti', ],    996: ['se', 'nonaginta', 'nongenti', ],    997: ['septe', 'nonaginta', 'nongenti', ],    998: ['okto', 'nonaginta', 'nongenti', ],    999: ['nove', 'nonaginta', 'nongenti', ],}
\ No newline at end of file
+LATIN_NUMBERS = {    0: ['ni'],    1: ['mi', ],    2: ['bi', ],    3: ['tri', ],    4: ['quadri', ],    5: ['quinti', ],    6: ['sexti', ],    7: ['septi', ],    8: ['okti', ],    9: ['noni', ],    10: ['dezi', ],    11: ['un', 'dezi', ],    12: ['duo', 'dezi', ],    13: ['tre', 'dezi', ],    14: ['quattuor', 'dezi', ],    15: ['quin', 'dezi', ],    16: ['se', 'dezi', ],    17: ['septen', 'dezi', ],    18: ['okto', 'dezi', ],    19: ['noven', 'dezi', ],    20: ['viginti', ],    21: ['un', 'viginti', ],    22: ['duo', 'viginti', ],    23: ['tres', 'viginti', ],    24: ['quattuor', 'viginti', ],    25: ['quinqua', 'viginti', ],    26: ['ses', 'viginti', ],    27: ['septem', 'viginti', ],    28: ['okto', 'viginti', ],    29: ['novem', 'viginti', ],    30: ['triginta', ],    31: ['un', 'triginta', ],    32: ['duo', 'triginta', ],    33: ['tres', 'triginta', ],    34: ['quattuor', 'triginta', ],    35: ['quinqua', 'triginta', ],    36: ['ses', 'triginta', ],    37: ['septen', 'triginta', ],    38: ['okto', 'triginta', ],    39: ['noven', 'triginta', ],    40: ['quadraginta', ],    41: ['un', 'quadraginta', ],    42: ['duo', 'quadraginta', ],    43: ['tres', 'quadraginta', ],    44: ['quattuor', 'quadraginta', ],    45: ['quinqua', 'quadraginta', ],    46: ['ses', 'quadraginta', ],    47: ['septen', 'quadraginta', ],    48: ['okto', 'quadraginta', ],    49: ['noven', 'quadraginta', ],    50: ['quinquaginta', ],    51: ['un', 'quinquaginta', ],    52: ['duo', 'quinquaginta', ],    53: ['tres', 'quinquaginta', ],    54: ['quattuor', 'quinquaginta', ],    55: ['quinqua', 'quinquaginta', ],    56: ['ses', 'quinquaginta', ],    57: ['septen', 'quinquaginta', ],    58: ['okto', 'quinquaginta', ],    59: ['noven', 'quinquaginta', ],    60: ['sexaginta', ],    61: ['un', 'sexaginta', ],    62: ['duo', 'sexaginta', ],    63: ['tre', 'sexaginta', ],    64: ['quattuor', 'sexaginta', ],    65: ['quinqua', 'sexaginta', ],    66: ['se', 'sexaginta', ],    67: ['septen', 'sexaginta', ],    68: ['okto', 'sexaginta', ],    69: ['noven', 'sexaginta', ],    70: ['septuaginta', ],    71: ['un', 'septuaginta', ],    72: ['duo', 'septuaginta', ],    73: ['tre', 'septuaginta', ],    74: ['quattuor', 'septuaginta', ],    75: ['quinqua', 'septuaginta', ],    76: ['se', 'septuaginta', ],    77: ['septen', 'septuaginta', ],    78: ['okto', 'septuaginta', ],    79: ['noven', 'septuaginta', ],    80: ['oktoginta', ],    81: ['un', 'oktoginta', ],    82: ['duo', 'oktoginta', ],    83: ['tre', 'oktoginta', ],    84: ['quattuor', 'oktoginta', ],    85: ['quinqua', 'oktoginta', ],    86: ['sex', 'oktoginta', ],    87: ['septem', 'oktoginta', ],    88: ['okto', 'oktoginta', ],    89: ['novem', 'oktoginta', ],    90: ['nonaginta', ],    91: ['un', 'nonaginta', ],    92: ['duo', 'nonaginta', ],    93: ['tre', 'nonaginta', ],    94: ['quattuor', 'nonaginta', ],    95: ['quinqua', 'nonaginta', ],    96: ['se', 'nonaginta', ],    97: ['septe', 'nonaginta', ],    98: ['okto', 'nonaginta', ],    99: ['nove', 'nonaginta', ],    100: ['zenti', ],    101: ['un', 'zenti', ],    102: ['duo', 'zenti', ],    103: ['tres', 'zenti', ],    104: ['quattuor', 'zenti', ],    105: ['quinqua', 'zenti', ],    106: ['sex', 'zenti', ],    107: ['septen', 'zenti', ],    108: ['okto', 'zenti', ],    109: ['noven', 'zenti', ],    110: ['dezi', 'zenti', ],    111: ['un', 'dezi', 'zenti', ],    112: ['duo', 'dezi', 'zenti', ],    113: ['tre', 'dezi', 'zenti', ],    114: ['quattuor', 'dezi', 'zenti', ],    115: ['quin', 'dezi', 'zenti', ],    116: ['se', 'dezi', 'zenti', ],    117: ['septen', 'dezi', 'zenti', ],    118: ['okto', 'dezi', 'zenti', ],    119: ['noven', 'dezi', 'zenti', ],    120: ['viginti', 'zenti', ],    121: ['un', 'viginti', 'zenti', ],    122: ['duo', 'viginti', 'zenti', ],    123: ['tres', 'viginti', 'zenti', ],    124: ['quattuor', 'viginti', 'zenti', ],    125: ['quinqua', 'viginti', 'zenti', ],    126: ['ses', 'viginti', 'zenti', ],    127: ['septem', 'viginti', 'zenti', ],    128: ['okto', 'viginti', 'zenti', ],    129: ['novem', 'viginti', 'zenti', ],    130: ['triginta', 'zenti', ],    131: ['un', 'triginta', 'zenti', ],    132: ['duo', 'triginta', 'zenti', ],    133: ['tres', 'triginta', 'zenti', ],    134: ['quattuor', 'triginta', 'zenti', ],    135: ['quinqua', 'triginta', 'zenti', ],    136: ['ses', 'triginta', 'zenti', ],    137: ['septen', 'triginta', 'zenti', ],    138: ['okto', 'triginta', 'zenti', ],    139: ['noven', 'triginta', 'zenti', ],    140: ['quadraginta', 'zenti', ],    141: ['un', 'quadraginta', 'zenti', ],    142: ['duo', 'quadraginta', 'zenti', ],    143: ['tres', 'quadraginta', 'zenti', ],    144: ['quattuor', 'quadraginta', 'zenti', ],    145: ['quinqua', 'quadraginta', 'zenti', ],    146: ['ses', 'quadraginta', 'zenti', ],    147: ['septen', 'quadraginta', 'zenti', ],    148: ['okto', 'quadraginta', 'zenti', ],    149: ['noven', 'quadraginta', 'zenti', ],    150: ['quinquaginta', 'zenti', ],    151: ['un', 'quinquaginta', 'zenti', ],    152: ['duo', 'quinquaginta', 'zenti', ],    153: ['tres', 'quinquaginta', 'zenti', ],    154: ['quattuor', 'quinquaginta', 'zenti', ],    155: ['quinqua', 'quinquaginta', 'zenti', ],    156: ['ses', 'quinquaginta', 'zenti', ],    157: ['septen', 'quinquaginta', 'zenti', ],    158: ['okto', 'quinquaginta', 'zenti', ],    159: ['noven', 'quinquaginta', 'zenti', ],    160: ['sexaginta', 'zenti', ],    161: ['un', 'sexaginta', 'zenti', ],    162: ['duo', 'sexaginta', 'zenti', ],    163: ['tre', 'sexaginta', 'zenti', ],    164: ['quattuor', 'sexaginta', 'zenti', ],    165: ['quinqua', 'sexaginta', 'zenti', ],    166: ['se', 'sexaginta', 'zenti', ],    167: ['septen', 'sexaginta', 'zenti', ],    168: ['okto', 'sexaginta', 'zenti', ],    169: ['noven', 'sexaginta', 'zenti', ],    170: ['septuaginta', 'zenti', ],    171: ['un', 'septuaginta', 'zenti', ],    172: ['duo', 'septuaginta', 'zenti', ],    173: ['tre', 'septuaginta', 'zenti', ],    174: ['quattuor', 'septuaginta', 'zenti', ],    175: ['quinqua', 'septuaginta', 'zenti', ],    176: ['se', 'septuaginta', 'zenti', ],    177: ['septen', 'septuaginta', 'zenti', ],    178: ['okto', 'septuaginta', 'zenti', ],    179: ['noven', 'septuaginta', 'zenti', ],    180: ['oktoginta', 'zenti', ],    181: ['un', 'oktoginta', 'zenti', ],    182: ['duo', 'oktoginta', 'zenti', ],    183: ['tre', 'oktoginta', 'zenti', ],    184: ['quattuor', 'oktoginta', 'zenti', ],    185: ['quinqua', 'oktoginta', 'zenti', ],    186: ['sex', 'oktoginta', 'zenti', ],    187: ['septem', 'oktoginta', 'zenti', ],    188: ['okto', 'oktoginta', 'zenti', ],    189: ['novem', 'oktoginta', 'zenti', ],    190: ['nonaginta', 'zenti', ],    191: ['un', 'nonaginta', 'zenti', ],    192: ['duo', 'nonaginta', 'zenti', ],    193: ['tre', 'nonaginta', 'zenti', ],    194: ['quattuor', 'nonaginta', 'zenti', ],    195: ['quinqua', 'nonaginta', 'zenti', ],    196: ['se', 'nonaginta', 'zenti', ],    197: ['septe', 'nonaginta', 'zenti', ],    198: ['okto', 'nonaginta', 'zenti', ],    199: ['nove', 'nonaginta', 'zenti', ],    200: ['duzenti', ],    201: ['un', 'duzenti', ],    202: ['duo', 'duzenti', ],    203: ['tre', 'duzenti', ],    204: ['quattuor', 'duzenti', ],    205: ['quinqua', 'duzenti', ],    206: ['se', 'duzenti', ],    207: ['septen', 'duzenti', ],    208: ['okto', 'duzenti', ],    209: ['noven', 'duzenti', ],    210: ['dezi', 'duzenti', ],    211: ['un', 'dezi', 'duzenti', ],    212: ['duo', 'dezi', 'duzenti', ],    213: ['tre', 'dezi', 'duzenti', ],    214: ['quattuor', 'dezi', 'duzenti', ],    215: ['quin', 'dezi', 'duzenti', ],    216: ['se', 'dezi', 'duzenti', ],    217: ['septen', 'dezi', 'duzenti', ],    218: ['okto', 'dezi', 'duzenti', ],    219: ['noven', 'dezi', 'duzenti', ],    220: ['viginti', 'duzenti', ],    221: ['un', 'viginti', 'duzenti', ],    222: ['duo', 'viginti', 'duzenti', ],    223: ['tres', 'viginti', 'duzenti', ],    224: ['quattuor', 'viginti', 'duzenti', ],    225: ['quinqua', 'viginti', 'duzenti', ],    226: ['ses', 'viginti', 'duzenti', ],    227: ['septem', 'viginti', 'duzenti', ],    228: ['okto', 'viginti', 'duzenti', ],    229: ['novem', 'viginti', 'duzenti', ],    230: ['triginta', 'duzenti', ],    231: ['un', 'triginta', 'duzenti', ],    232: ['duo', 'triginta', 'duzenti', ],    233: ['tres', 'triginta', 'duzenti', ],    234: ['quattuor', 'triginta', 'duzenti', ],    235: ['quinqua', 'triginta', 'duzenti', ],    236: ['ses', 'triginta', 'duzenti', ],    237: ['septen', 'triginta', 'duzenti', ],    238: ['okto', 'triginta', 'duzenti', ],    239: ['noven', 'triginta', 'duzenti', ],    240: ['quadraginta', 'duzenti', ],    241: ['un', 'quadraginta', 'duzenti', ],    242: ['duo', 'quadraginta', 'duzenti', ],    243: ['tres', 'quadraginta', 'duzenti', ],    244: ['quattuor', 'quadraginta', 'duzenti', ],    245: ['quinqua', 'quadraginta', 'duzenti', ],    246: ['ses', 'quadraginta', 'duzenti', ],    247: ['septen', 'quadraginta', 'duzenti', ],    248: ['okto', 'quadraginta', 'duzenti', ],    249: ['noven', 'quadraginta', 'duzenti', ],    250: ['quinquaginta', 'duzenti', ],    251: ['un', 'quinquaginta', 'duzenti', ],    252: ['duo', 'quinquaginta', 'duzenti', ],    253: ['tres', 'quinquaginta', 'duzenti', ],    254: ['quattuor', 'quinquaginta', 'duzenti', ],    255: ['quinqua', 'quinquaginta', 'duzenti', ],    256: ['ses', 'quinquaginta', 'duzenti', ],    257: ['septen', 'quinquaginta', 'duzenti', ],    258: ['okto', 'quinquaginta', 'duzenti', ],    259: ['noven', 'quinquaginta', 'duzenti', ],    260: ['sexaginta', 'duzenti', ],    261: ['un', 'sexaginta', 'duzenti', ],    262: ['duo', 'sexaginta', 'duzenti', ],    263: ['tre', 'sexaginta', 'duzenti', ],    264: ['quattuor', 'sexaginta', 'duzenti', ],    265: ['quinqua', 'sexaginta', 'duzenti', ],    266: ['se', 'sexaginta', 'duzenti', ],    267: ['septen', 'sexaginta', 'duzenti', ],    268: ['okto', 'sexaginta', 'duzenti', ],    269: ['noven', 'sexaginta', 'duzenti', ],    270: ['septuaginta', 'duzenti', ],    271: ['un', 'septuaginta', 'duzenti', ],    272: ['duo', 'septuaginta', 'duzenti', ],    273: ['tre', 'septuaginta', 'duzenti', ],    274: ['quattuor', 'septuaginta', 'duzenti', ],    275: ['quinqua', 'septuaginta', 'duzenti', ],    276: ['se', 'septuaginta', 'duzenti', ],    277: ['septen', 'septuaginta', 'duzenti', ],    278: ['okto', 'septuaginta', 'duzenti', ],    279: ['noven', 'septuaginta', 'duzenti', ],    280: ['oktoginta', 'duzenti', ],    281: ['un', 'oktoginta', 'duzenti', ],    282: ['duo', 'oktoginta', 'duzenti', ],    283: ['tre', 'oktoginta', 'duzenti', ],    284: ['quattuor', 'oktoginta', 'duzenti', ],    285: ['quinqua', 'oktoginta', 'duzenti', ],    286: ['sex', 'oktoginta', 'duzenti', ],    287: ['septem', 'oktoginta', 'duzenti', ],    288: ['okto', 'oktoginta', 'duzenti', ],    289: ['novem', 'oktoginta', 'duzenti', ],    290: ['nonaginta', 'duzenti', ],    291: ['un', 'nonaginta', 'duzenti', ],    292: ['duo', 'nonaginta', 'duzenti', ],    293: ['tre', 'nonaginta', 'duzenti', ],    294: ['quattuor', 'nonaginta', 'duzenti', ],    295: ['quinqua', 'nonaginta', 'duzenti', ],    296: ['se', 'nonaginta', 'duzenti', ],    297: ['septe', 'nonaginta', 'duzenti', ],    298: ['okto', 'nonaginta', 'duzenti', ],    299: ['nove', 'nonaginta', 'duzenti', ],    300: ['trezenti', ],    301: ['un', 'trezenti', ],    302: ['duo', 'trezenti', ],    303: ['tres', 'trezenti', ],    304: ['quattuor', 'trezenti', ],    305: ['quinqua', 'trezenti', ],    306: ['ses', 'trezenti', ],    307: ['septen', 'trezenti', ],    308: ['okto', 'trezenti', ],    309: ['noven', 'trezenti', ],    310: ['dezi', 'trezenti', ],    311: ['un', 'dezi', 'trezenti', ],    312: ['duo', 'dezi', 'trezenti', ],    313: ['tre', 'dezi', 'trezenti', ],    314: ['quattuor', 'dezi', 'trezenti', ],    315: ['quin', 'dezi', 'trezenti', ],    316: ['se', 'dezi', 'trezenti', ],    317: ['septen', 'dezi', 'trezenti', ],    318: ['okto', 'dezi', 'trezenti', ],    319: ['noven', 'dezi', 'trezenti', ],    320: ['viginti', 'trezenti', ],    321: ['un', 'viginti', 'trezenti', ],    322: ['duo', 'viginti', 'trezenti', ],    323: ['tres', 'viginti', 'trezenti', ],    324: ['quattuor', 'viginti', 'trezenti', ],    325: ['quinqua', 'viginti', 'trezenti', ],    326: ['ses', 'viginti', 'trezenti', ],    327: ['septem', 'viginti', 'trezenti', ],    328: ['okto', 'viginti', 'trezenti', ],    329: ['novem', 'viginti', 'trezenti', ],    330: ['triginta', 'trezenti', ],    331: ['un', 'triginta', 'trezenti', ],    332: ['duo', 'triginta', 'trezenti', ],    333: ['tres', 'triginta', 'trezenti', ],    334: ['quattuor', 'triginta', 'trezenti', ],    335: ['quinqua', 'triginta', 'trezenti', ],    336: ['ses', 'triginta', 'trezenti', ],    337: ['septen', 'triginta', 'trezenti', ],    338: ['okto', 'triginta', 'trezenti', ],    339: ['noven', 'triginta', 'trezenti', ],    340: ['quadraginta', 'trezenti', ],    341: ['un', 'quadraginta', 'trezenti', ],    342: ['duo', 'quadraginta', 'trezenti', ],    343: ['tres', 'quadraginta', 'trezenti', ],    344: ['quattuor', 'quadraginta', 'trezenti', ],    345: ['quinqua', 'quadraginta', 'trezenti', ],    346: ['ses', 'quadraginta', 'trezenti', ],    347: ['septen', 'quadraginta', 'trezenti', ],    348: ['okto', 'quadraginta', 'trezenti', ],    349: ['noven', 'quadraginta', 'trezenti', ],    350: ['quinquaginta', 'trezenti', ],    351: ['un', 'quinquaginta', 'trezenti', ],    352: ['duo', 'quinquaginta', 'trezenti', ],    353: ['tres', 'quinquaginta', 'trezenti', ],    354: ['quattuor', 'quinquaginta', 'trezenti', ],    355: ['quinqua', 'quinquaginta', 'trezenti', ],    356: ['ses', 'quinquaginta', 'trezenti', ],    357: ['septen', 'quinquaginta', 'trezenti', ],    358: ['okto', 'quinquaginta', 'trezenti', ],    359: ['noven', 'quinquaginta', 'trezenti', ],    360: ['sexaginta', 'trezenti', ],    361: ['un', 'sexaginta', 'trezenti', ],    362: ['duo', 'sexaginta', 'trezenti', ],    363: ['tre', 'sexaginta', 'trezenti', ],    364: ['quattuor', 'sexaginta', 'trezenti', ],    365: ['quinqua', 'sexaginta', 'trezenti', ],    366: ['se', 'sexaginta', 'trezenti', ],    367: ['septen', 'sexaginta', 'trezenti', ],    368: ['okto', 'sexaginta', 'trezenti', ],    369: ['noven', 'sexaginta', 'trezenti', ],    370: ['septuaginta', 'trezenti', ],    371: ['un', 'septuaginta', 'trezenti', ],    372: ['duo', 'septuaginta', 'trezenti', ],    373: ['tre', 'septuaginta', 'trezenti', ],    374: ['quattuor', 'septuaginta', 'trezenti', ],    375: ['quinqua', 'septuaginta', 'trezenti', ],    376: ['se', 'septuaginta', 'trezenti', ],    377: ['septen', 'septuaginta', 'trezenti', ],    378: ['okto', 'septuaginta', 'trezenti', ],    379: ['noven', 'septuaginta', 'trezenti', ],    380: ['oktoginta', 'trezenti', ],    381: ['un', 'oktoginta', 'trezenti', ],    382: ['duo', 'oktoginta', 'trezenti', ],    383: ['tre', 'oktoginta', 'trezenti', ],    384: ['quattuor', 'oktoginta', 'trezenti', ],    385: ['quinqua', 'oktoginta', 'trezenti', ],    386: ['sex', 'oktoginta', 'trezenti', ],    387: ['septem', 'oktoginta', 'trezenti', ],    388: ['okto', 'oktoginta', 'trezenti', ],    389: ['novem', 'oktoginta', 'trezenti', ],    390: ['nonaginta', 'trezenti', ],    391: ['un', 'nonaginta', 'trezenti', ],    392: ['duo', 'nonaginta', 'trezenti', ],    393: ['tre', 'nonaginta', 'trezenti', ],    394: ['quattuor', 'nonaginta', 'trezenti', ],    395: ['quinqua', 'nonaginta', 'trezenti', ],    396: ['se', 'nonaginta', 'trezenti', ],    397: ['septe', 'nonaginta', 'trezenti', ],    398: ['okto', 'nonaginta', 'trezenti', ],    399: ['nove', 'nonaginta', 'trezenti', ],    400: ['quadringenti', ],    401: ['un', 'quadringenti', ],    402: ['duo', 'quadringenti', ],    403: ['tres', 'quadringenti', ],    404: ['quattuor', 'quadringenti', ],    405: ['quinqua', 'quadringenti', ],    406: ['ses', 'quadringenti', ],    407: ['septen', 'quadringenti', ],    408: ['okto', 'quadringenti', ],    409: ['noven', 'quadringenti', ],    410: ['dezi', 'quadringenti', ],    411: ['un', 'dezi', 'quadringenti', ],    412: ['duo', 'dezi', 'quadringenti', ],    413: ['tre', 'dezi', 'quadringenti', ],    414: ['quattuor', 'dezi', 'quadringenti', ],    415: ['quin', 'dezi', 'quadringenti', ],    416: ['se', 'dezi', 'quadringenti', ],    417: ['septen', 'dezi', 'quadringenti', ],    418: ['okto', 'dezi', 'quadringenti', ],    419: ['noven', 'dezi', 'quadringenti', ],    420: ['viginti', 'quadringenti', ],    421: ['un', 'viginti', 'quadringenti', ],    422: ['duo', 'viginti', 'quadringenti', ],    423: ['tres', 'viginti', 'quadringenti', ],    424: ['quattuor', 'viginti', 'quadringenti', ],    425: ['quinqua', 'viginti', 'quadringenti', ],    426: ['ses', 'viginti', 'quadringenti', ],    427: ['septem', 'viginti', 'quadringenti', ],    428: ['okto', 'viginti', 'quadringenti', ],    429: ['novem', 'viginti', 'quadringenti', ],    430: ['triginta', 'quadringenti', ],    431: ['un', 'triginta', 'quadringenti', ],    432: ['duo', 'triginta', 'quadringenti', ],    433: ['tres', 'triginta', 'quadringenti', ],    434: ['quattuor', 'triginta', 'quadringenti', ],    435: ['quinqua', 'triginta', 'quadringenti', ],    436: ['ses', 'triginta', 'quadringenti', ],    437: ['septen', 'triginta', 'quadringenti', ],    438: ['okto', 'triginta', 'quadringenti', ],    439: ['noven', 'triginta', 'quadringenti', ],    440: ['quadraginta', 'quadringenti', ],    441: ['un', 'quadraginta', 'quadringenti', ],    442: ['duo', 'quadraginta', 'quadringenti', ],    443: ['tres', 'quadraginta', 'quadringenti', ],    444: ['quattuor', 'quadraginta', 'quadringenti', ],    445: ['quinqua', 'quadraginta', 'quadringenti', ],    446: ['ses', 'quadraginta', 'quadringenti', ],    447: ['septen', 'quadraginta', 'quadringenti', ],    448: ['okto', 'quadraginta', 'quadringenti', ],    449: ['noven', 'quadraginta', 'quadringenti', ],    450: ['quinquaginta', 'quadringenti', ],    451: ['un', 'quinquaginta', 'quadringenti', ],    452: ['duo', 'quinquaginta', 'quadringenti', ],    453: ['tres', 'quinquaginta', 'quadringenti', ],    454: ['quattuor', 'quinquaginta', 'quadringenti', ],    455: ['quinqua', 'quinquaginta', 'quadringenti', ],    456: ['ses', 'quinquaginta', 'quadringenti', ],    457: ['septen', 'quinquaginta', 'quadringenti', ],    458: ['okto', 'quinquaginta', 'quadringenti', ],    459: ['noven', 'quinquaginta', 'quadringenti', ],    460: ['sexaginta', 'quadringenti', ],    461: ['un', 'sexaginta', 'quadringenti', ],    462: ['duo', 'sexaginta', 'quadringenti', ],    463: ['tre', 'sexaginta', 'quadringenti', ],    464: ['quattuor', 'sexaginta', 'quadringenti', ],    465: ['quinqua', 'sexaginta', 'quadringenti', ],    466: ['se', 'sexaginta', 'quadringenti', ],    467: ['septen', 'sexaginta', 'quadringenti', ],    468: ['okto', 'sexaginta', 'quadringenti', ],    469: ['noven', 'sexaginta', 'quadringenti', ],    470: ['septuaginta', 'quadringenti', ],    471: ['un', 'septuaginta', 'quadringenti', ],    472: ['duo', 'septuaginta', 'quadringenti', ],    473: ['tre', 'septuaginta', 'quadringenti', ],    474: ['quattuor', 'septuaginta', 'quadringenti', ],    475: ['quinqua', 'septuaginta', 'quadringenti', ],    476: ['se', 'septuaginta', 'quadringenti', ],    477: ['septen', 'septuaginta', 'quadringenti', ],    478: ['okto', 'septuaginta', 'quadringenti', ],    479: ['noven', 'septuaginta', 'quadringenti', ],    480: ['oktoginta', 'quadringenti', ],    481: ['un', 'oktoginta', 'quadringenti', ],    482: ['duo', 'oktoginta', 'quadringenti', ],    483: ['tre', 'oktoginta', 'quadringenti', ],    484: ['quattuor', 'oktoginta', 'quadringenti', ],    485: ['quinqua', 'oktoginta', 'quadringenti', ],    486: ['sex', 'oktoginta', 'quadringenti', ],    487: ['septem', 'oktoginta', 'quadringenti', ],    488: ['okto', 'oktoginta', 'quadringenti', ],    489: ['novem', 'oktoginta', 'quadringenti', ],    490: ['nonaginta', 'quadringenti', ],    491: ['un', 'nonaginta', 'quadringenti', ],    492: ['duo', 'nonaginta', 'quadringenti', ],    493: ['tre', 'nonaginta', 'quadringenti', ],    494: ['quattuor', 'nonaginta', 'quadringenti', ],    495: ['quinqua', 'nonaginta', 'quadringenti', ],    496: ['se', 'nonaginta', 'quadringenti', ],    497: ['septe', 'nonaginta', 'quadringenti', ],    498: ['okto', 'nonaginta', 'quadringenti', ],    499: ['nove', 'nonaginta', 'quadringenti', ],    500: ['quingenti', ],    501: ['un', 'quingenti', ],    502: ['duo', 'quingenti', ],    503: ['tres', 'quingenti', ],    504: ['quattuor', 'quingenti', ],    505: ['quinqua', 'quingenti', ],    506: ['ses', 'quingenti', ],    507: ['septen', 'quingenti', ],    508: ['okto', 'quingenti', ],    509: ['noven', 'quingenti', ],    510: ['dezi', 'quingenti', ],    511: ['un', 'dezi', 'quingenti', ],    512: ['duo', 'dezi', 'quingenti', ],    513: ['tre', 'dezi', 'quingenti', ],    514: ['quattuor', 'dezi', 'quingenti', ],    515: ['quin', 'dezi', 'quingenti', ],    516: ['se', 'dezi', 'quingenti', ],    517: ['septen', 'dezi', 'quingenti', ],    518: ['okto', 'dezi', 'quingenti', ],    519: ['noven', 'dezi', 'quingenti', ],    520: ['viginti', 'quingenti', ],    521: ['un', 'viginti', 'quingenti', ],    522: ['duo', 'viginti', 'quingenti', ],    523: ['tres', 'viginti', 'quingenti', ],    524: ['quattuor', 'viginti', 'quingenti', ],    525: ['quinqua', 'viginti', 'quingenti', ],    526: ['ses', 'viginti', 'quingenti', ],    527: ['septem', 'viginti', 'quingenti', ],    528: ['okto', 'viginti', 'quingenti', ],    529: ['novem', 'viginti', 'quingenti', ],    530: ['triginta', 'quingenti', ],    531: ['un', 'triginta', 'quingenti', ],    532: ['duo', 'triginta', 'quingenti', ],    533: ['tres', 'triginta', 'quingenti', ],    534: ['quattuor', 'triginta', 'quingenti', ],    535: ['quinqua', 'triginta', 'quingenti', ],    536: ['ses', 'triginta', 'quingenti', ],    537: ['septen', 'triginta', 'quingenti', ],    538: ['okto', 'triginta', 'quingenti', ],    539: ['noven', 'triginta', 'quingenti', ],    540: ['quadraginta', 'quingenti', ],    541: ['un', 'quadraginta', 'quingenti', ],    542: ['duo', 'quadraginta', 'quingenti', ],    543: ['tres', 'quadraginta', 'quingenti', ],    544: ['quattuor', 'quadraginta', 'quingenti', ],    545: ['quinqua', 'quadraginta', 'quingenti', ],    546: ['ses', 'quadraginta', 'quingenti', ],    547: ['septen', 'quadraginta', 'quingenti', ],    548: ['okto', 'quadraginta', 'quingenti', ],    549: ['noven', 'quadraginta', 'quingenti', ],    550: ['quinquaginta', 'quingenti', ],    551: ['un', 'quinquaginta', 'quingenti', ],    552: ['duo', 'quinquaginta', 'quingenti', ],    553: ['tres', 'quinquaginta', 'quingenti', ],    554: ['quattuor', 'quinquaginta', 'quingenti', ],    555: ['quinqua', 'quinquaginta', 'quingenti', ],    556: ['ses', 'quinquaginta', 'quingenti', ],    557: ['septen', 'quinquaginta', 'quingenti', ],    558: ['okto', 'quinquaginta', 'quingenti', ],    559: ['noven', 'quinquaginta', 'quingenti', ],    560: ['sexaginta', 'quingenti', ],    561: ['un', 'sexaginta', 'quingenti', ],    562: ['duo', 'sexaginta', 'quingenti', ],    563: ['tre', 'sexaginta', 'quingenti', ],    564: ['quattuor', 'sexaginta', 'quingenti', ],    565: ['quinqua', 'sexaginta', 'quingenti', ],    566: ['se', 'sexaginta', 'quingenti', ],    567: ['septen', 'sexaginta', 'quingenti', ],    568: ['okto', 'sexaginta', 'quingenti', ],    569: ['noven', 'sexaginta', 'quingenti', ],    570: ['septuaginta', 'quingenti', ],    571: ['un', 'septuaginta', 'quingenti', ],    572: ['duo', 'septuaginta', 'quingenti', ],    573: ['tre', 'septuaginta', 'quingenti', ],    574: ['quattuor', 'septuaginta', 'quingenti', ],    575: ['quinqua', 'septuaginta', 'quingenti', ],    576: ['se', 'septuaginta', 'quingenti', ],    577: ['septen', 'septuaginta', 'quingenti', ],    578: ['okto', 'septuaginta', 'quingenti', ],    579: ['noven', 'septuaginta', 'quingenti', ],    580: ['oktoginta', 'quingenti', ],    581: ['un', 'oktoginta', 'quingenti', ],    582: ['duo', 'oktoginta', 'quingenti', ],    583: ['tre', 'oktoginta', 'quingenti', ],    584: ['quattuor', 'oktoginta', 'quingenti', ],    585: ['quinqua', 'oktoginta', 'quingenti', ],    586: ['sex', 'oktoginta', 'quingenti', ],    587: ['septem', 'oktoginta', 'quingenti', ],    588: ['okto', 'oktoginta', 'quingenti', ],    589: ['novem', 'oktoginta', 'quingenti', ],    590: ['nonaginta', 'quingenti', ],    591: ['un', 'nonaginta', 'quingenti', ],    592: ['duo', 'nonaginta', 'quingenti', ],    593: ['tre', 'nonaginta', 'quingenti', ],    594: ['quattuor', 'nonaginta', 'quingenti', ],    595: ['quinqua', 'nonaginta', 'quingenti', ],    596: ['se', 'nonaginta', 'quingenti', ],    597: ['septe', 'nonaginta', 'quingenti', ],    598: ['okto', 'nonaginta', 'quingenti', ],    599: ['nove', 'nonaginta', 'quingenti', ],    600: ['seszenti', ],    601: ['un', 'seszenti', ],    602: ['duo', 'seszenti', ],    603: ['tre', 'seszenti', ],    604: ['quattuor', 'seszenti', ],    605: ['quinqua', 'seszenti', ],    606: ['se', 'seszenti', ],    607: ['septen', 'seszenti', ],    608: ['okto', 'seszenti', ],    609: ['noven', 'seszenti', ],    610: ['dezi', 'seszenti', ],    611: ['un', 'dezi', 'seszenti', ],    612: ['duo', 'dezi', 'seszenti', ],    613: ['tre', 'dezi', 'seszenti', ],    614: ['quattuor', 'dezi', 'seszenti', ],    615: ['quin', 'dezi', 'seszenti', ],    616: ['se', 'dezi', 'seszenti', ],    617: ['septen', 'dezi', 'seszenti', ],    618: ['okto', 'dezi', 'seszenti', ],    619: ['noven', 'dezi', 'seszenti', ],    620: ['viginti', 'seszenti', ],    621: ['un', 'viginti', 'seszenti', ],    622: ['duo', 'viginti', 'seszenti', ],    623: ['tres', 'viginti', 'seszenti', ],    624: ['quattuor', 'viginti', 'seszenti', ],    625: ['quinqua', 'viginti', 'seszenti', ],    626: ['ses', 'viginti', 'seszenti', ],    627: ['septem', 'viginti', 'seszenti', ],    628: ['okto', 'viginti', 'seszenti', ],    629: ['novem', 'viginti', 'seszenti', ],    630: ['triginta', 'seszenti', ],    631: ['un', 'triginta', 'seszenti', ],    632: ['duo', 'triginta', 'seszenti', ],    633: ['tres', 'triginta', 'seszenti', ],    634: ['quattuor', 'triginta', 'seszenti', ],    635: ['quinqua', 'triginta', 'seszenti', ],    636: ['ses', 'triginta', 'seszenti', ],    637: ['septen', 'triginta', 'seszenti', ],    638: ['okto', 'triginta', 'seszenti', ],    639: ['noven', 'triginta', 'seszenti', ],    640: ['quadraginta', 'seszenti', ],    641: ['un', 'quadraginta', 'seszenti', ],    642: ['duo', 'quadraginta', 'seszenti', ],    643: ['tres', 'quadraginta', 'seszenti', ],    644: ['quattuor', 'quadraginta', 'seszenti', ],    645: ['quinqua', 'quadraginta', 'seszenti', ],    646: ['ses', 'quadraginta', 'seszenti', ],    647: ['septen', 'quadraginta', 'seszenti', ],    648: ['okto', 'quadraginta', 'seszenti', ],    649: ['noven', 'quadraginta', 'seszenti', ],    650: ['quinquaginta', 'seszenti', ],    651: ['un', 'quinquaginta', 'seszenti', ],    652: ['duo', 'quinquaginta', 'seszenti', ],    653: ['tres', 'quinquaginta', 'seszenti', ],    654: ['quattuor', 'quinquaginta', 'seszenti', ],    655: ['quinqua', 'quinquaginta', 'seszenti', ],    656: ['ses', 'quinquaginta', 'seszenti', ],    657: ['septen', 'quinquaginta', 'seszenti', ],    658: ['okto', 'quinquaginta', 'seszenti', ],    659: ['noven', 'quinquaginta', 'seszenti', ],    660: ['sexaginta', 'seszenti', ],    661: ['un', 'sexaginta', 'seszenti', ],    662: ['duo', 'sexaginta', 'seszenti', ],    663: ['tre', 'sexaginta', 'seszenti', ],    664: ['quattuor', 'sexaginta', 'seszenti', ],    665: ['quinqua', 'sexaginta', 'seszenti', ],    666: ['se', 'sexaginta', 'seszenti', ],    667: ['septen', 'sexaginta', 'seszenti', ],    668: ['okto', 'sexaginta', 'seszenti', ],    669: ['noven', 'sexaginta', 'seszenti', ],    670: ['septuaginta', 'seszenti', ],    671: ['un', 'septuaginta', 'seszenti', ],    672: ['duo', 'septuaginta', 'seszenti', ],    673: ['tre', 'septuaginta', 'seszenti', ],    674: ['quattuor', 'septuaginta', 'seszenti', ],    675: ['quinqua', 'septuaginta', 'seszenti', ],    676: ['se', 'septuaginta', 'seszenti', ],    677: ['septen', 'septuaginta', 'seszenti', ],    678: ['okto', 'septuaginta', 'seszenti', ],    679: ['noven', 'septuaginta', 'seszenti', ],    680: ['oktoginta', 'seszenti', ],    681: ['un', 'oktoginta', 'seszenti', ],    682: ['duo', 'oktoginta', 'seszenti', ],    683: ['tre', 'oktoginta', 'seszenti', ],    684: ['quattuor', 'oktoginta', 'seszenti', ],    685: ['quinqua', 'oktoginta', 'seszenti', ],    686: ['sex', 'oktoginta', 'seszenti', ],    687: ['septem', 'oktoginta', 'seszenti', ],    688: ['okto', 'oktoginta', 'seszenti', ],    689: ['novem', 'oktoginta', 'seszenti', ],    690: ['nonaginta', 'seszenti', ],    691: ['un', 'nonaginta', 'seszenti', ],    692: ['duo', 'nonaginta', 'seszenti', ],    693: ['tre', 'nonaginta', 'seszenti', ],    694: ['quattuor', 'nonaginta', 'seszenti', ],    695: ['quinqua', 'nonaginta', 'seszenti', ],    696: ['se', 'nonaginta', 'seszenti', ],    697: ['septe', 'nonaginta', 'seszenti', ],    698: ['okto', 'nonaginta', 'seszenti', ],    699: ['nove', 'nonaginta', 'seszenti', ],    700: ['septingenti', ],    701: ['un', 'septingenti', ],    702: ['duo', 'septingenti', ],    703: ['tre', 'septingenti', ],    704: ['quattuor', 'septingenti', ],    705: ['quinqua', 'septingenti', ],    706: ['se', 'septingenti', ],    707: ['septen', 'septingenti', ],    708: ['okto', 'septingenti', ],    709: ['noven', 'septingenti', ],    710: ['dezi', 'septingenti', ],    711: ['un', 'dezi', 'septingenti', ],    712: ['duo', 'dezi', 'septingenti', ],    713: ['tre', 'dezi', 'septingenti', ],    714: ['quattuor', 'dezi', 'septingenti', ],    715: ['quin', 'dezi', 'septingenti', ],    716: ['se', 'dezi', 'septingenti', ],    717: ['septen', 'dezi', 'septingenti', ],    718: ['okto', 'dezi', 'septingenti', ],    719: ['noven', 'dezi', 'septingenti', ],    720: ['viginti', 'septingenti', ],    721: ['un', 'viginti', 'septingenti', ],    722: ['duo', 'viginti', 'septingenti', ],    723: ['tres', 'viginti', 'septingenti', ],    724: ['quattuor', 'viginti', 'septingenti', ],    725: ['quinqua', 'viginti', 'septingenti', ],    726: ['ses', 'viginti', 'septingenti', ],    727: ['septem', 'viginti', 'septingenti', ],    728: ['okto', 'viginti', 'septingenti', ],    729: ['novem', 'viginti', 'septingenti', ],    730: ['triginta', 'septingenti', ],    731: ['un', 'triginta', 'septingenti', ],    732: ['duo', 'triginta', 'septingenti', ],    733: ['tres', 'triginta', 'septingenti', ],    734: ['quattuor', 'triginta', 'septingenti', ],    735: ['quinqua', 'triginta', 'septingenti', ],    736: ['ses', 'triginta', 'septingenti', ],    737: ['septen', 'triginta', 'septingenti', ],    738: ['okto', 'triginta', 'septingenti', ],    739: ['noven', 'triginta', 'septingenti', ],    740: ['quadraginta', 'septingenti', ],    741: ['un', 'quadraginta', 'septingenti', ],    742: ['duo', 'quadraginta', 'septingenti', ],    743: ['tres', 'quadraginta', 'septingenti', ],    744: ['quattuor', 'quadraginta', 'septingenti', ],    745: ['quinqua', 'quadraginta', 'septingenti', ],    746: ['ses', 'quadraginta', 'septingenti', ],    747: ['septen', 'quadraginta', 'septingenti', ],    748: ['okto', 'quadraginta', 'septingenti', ],    749: ['noven', 'quadraginta', 'septingenti', ],    750: ['quinquaginta', 'septingenti', ],    751: ['un', 'quinquaginta', 'septingenti', ],    752: ['duo', 'quinquaginta', 'septingenti', ],    753: ['tres', 'quinquaginta', 'septingenti', ],    754: ['quattuor', 'quinquaginta', 'septingenti', ],    755: ['quinqua', 'quinquaginta', 'septingenti', ],    756: ['ses', 'quinquaginta', 'septingenti', ],    757: ['septen', 'quinquaginta', 'septingenti', ],    758: ['okto', 'quinquaginta', 'septingenti', ],    759: ['noven', 'quinquaginta', 'septingenti', ],    760: ['sexaginta', 'septingenti', ],    761: ['un', 'sexaginta', 'septingenti', ],    762: ['duo', 'sexaginta', 'septingenti', ],    763: ['tre', 'sexaginta', 'septingenti', ],    764: ['quattuor', 'sexaginta', 'septingenti', ],    765: ['quinqua', 'sexaginta', 'septingenti', ],    766: ['se', 'sexaginta', 'septingenti', ],    767: ['septen', 'sexaginta', 'septingenti', ],    768: ['okto', 'sexaginta', 'septingenti', ],    769: ['noven', 'sexaginta', 'septingenti', ],    770: ['septuaginta', 'septingenti', ],    771: ['un', 'septuaginta', 'septingenti', ],    772: ['duo', 'septuaginta', 'septingenti', ],    773: ['tre', 'septuaginta', 'septingenti', ],    774: ['quattuor', 'septuaginta', 'septingenti', ],    775: ['quinqua', 'septuaginta', 'septingenti', ],    776: ['se', 'septuaginta', 'septingenti', ],    777: ['septen', 'septuaginta', 'septingenti', ],    778: ['okto', 'septuaginta', 'septingenti', ],    779: ['noven', 'septuaginta', 'septingenti', ],    780: ['oktoginta', 'septingenti', ],    781: ['un', 'oktoginta', 'septingenti', ],    782: ['duo', 'oktoginta', 'septingenti', ],    783: ['tre', 'oktoginta', 'septingenti', ],    784: ['quattuor', 'oktoginta', 'septingenti', ],    785: ['quinqua', 'oktoginta', 'septingenti', ],    786: ['sex', 'oktoginta', 'septingenti', ],    787: ['septem', 'oktoginta', 'septingenti', ],    788: ['okto', 'oktoginta', 'septingenti', ],    789: ['novem', 'oktoginta', 'septingenti', ],    790: ['nonaginta', 'septingenti', ],    791: ['un', 'nonaginta', 'septingenti', ],    792: ['duo', 'nonaginta', 'septingenti', ],    793: ['tre', 'nonaginta', 'septingenti', ],    794: ['quattuor', 'nonaginta', 'septingenti', ],    795: ['quinqua', 'nonaginta', 'septingenti', ],    796: ['se', 'nonaginta', 'septingenti', ],    797: ['septe', 'nonaginta', 'septingenti', ],    798: ['okto', 'nonaginta', 'septingenti', ],    799: ['nove', 'nonaginta', 'septingenti', ],    800: ['oktingenti', ],    801: ['un', 'oktingenti', ],    802: ['duo', 'oktingenti', ],    803: ['tre', 'oktingenti', ],    804: ['quattuor', 'oktingenti', ],    805: ['quinqua', 'oktingenti', ],    806: ['sex', 'oktingenti', ],    807: ['septem', 'oktingenti', ],    808: ['okto', 'oktingenti', ],    809: ['novem', 'oktingenti', ],    810: ['dezi', 'oktingenti', ],    811: ['un', 'dezi', 'oktingenti', ],    812: ['duo', 'dezi', 'oktingenti', ],    813: ['tre', 'dezi', 'oktingenti', ],    814: ['quattuor', 'dezi', 'oktingenti', ],    815: ['quin', 'dezi', 'oktingenti', ],    816: ['se', 'dezi', 'oktingenti', ],    817: ['septen', 'dezi', 'oktingenti', ],    818: ['okto', 'dezi', 'oktingenti', ],    819: ['noven', 'dezi', 'oktingenti', ],    820: ['viginti', 'oktingenti', ],    821: ['un', 'viginti', 'oktingenti', ],    822: ['duo', 'viginti', 'oktingenti', ],    823: ['tres', 'viginti', 'oktingenti', ],    824: ['quattuor', 'viginti', 'oktingenti', ],    825: ['quinqua', 'viginti', 'oktingenti', ],    826: ['ses', 'viginti', 'oktingenti', ],    827: ['septem', 'viginti', 'oktingenti', ],    828: ['okto', 'viginti', 'oktingenti', ],    829: ['novem', 'viginti', 'oktingenti', ],    830: ['triginta', 'oktingenti', ],    831: ['un', 'triginta', 'oktingenti', ],    832: ['duo', 'triginta', 'oktingenti', ],    833: ['tres', 'triginta', 'oktingenti', ],    834: ['quattuor', 'triginta', 'oktingenti', ],    835: ['quinqua', 'triginta', 'oktingenti', ],    836: ['ses', 'triginta', 'oktingenti', ],    837: ['septen', 'triginta', 'oktingenti', ],    838: ['okto', 'triginta', 'oktingenti', ],    839: ['noven', 'triginta', 'oktingenti', ],    840: ['quadraginta', 'oktingenti', ],    841: ['un', 'quadraginta', 'oktingenti', ],    842: ['duo', 'quadraginta', 'oktingenti', ],    843: ['tres', 'quadraginta', 'oktingenti', ],    844: ['quattuor', 'quadraginta', 'oktingenti', ],    845: ['quinqua', 'quadraginta', 'oktingenti', ],    846: ['ses', 'quadraginta', 'oktingenti', ],    847: ['septen', 'quadraginta', 'oktingenti', ],    848: ['okto', 'quadraginta', 'oktingenti', ],    849: ['noven', 'quadraginta', 'oktingenti', ],    850: ['quinquaginta', 'oktingenti', ],    851: ['un', 'quinquaginta', 'oktingenti', ],    852: ['duo', 'quinquaginta', 'oktingenti', ],    853: ['tres', 'quinquaginta', 'oktingenti', ],    854: ['quattuor', 'quinquaginta', 'oktingenti', ],    855: ['quinqua', 'quinquaginta', 'oktingenti', ],    856: ['ses', 'quinquaginta', 'oktingenti', ],    857: ['septen', 'quinquaginta', 'oktingenti', ],    858: ['okto', 'quinquaginta', 'oktingenti', ],    859: ['noven', 'quinquaginta', 'oktingenti', ],    860: ['sexaginta', 'oktingenti', ],    861: ['un', 'sexaginta', 'oktingenti', ],    862: ['duo', 'sexaginta', 'oktingenti', ],    863: ['tre', 'sexaginta', 'oktingenti', ],    864: ['quattuor', 'sexaginta', 'oktingenti', ],    865: ['quinqua', 'sexaginta', 'oktingenti', ],    866: ['se', 'sexaginta', 'oktingenti', ],    867: ['septen', 'sexaginta', 'oktingenti', ],    868: ['okto', 'sexaginta', 'oktingenti', ],    869: ['noven', 'sexaginta', 'oktingenti', ],    870: ['septuaginta', 'oktingenti', ],    871: ['un', 'septuaginta', 'oktingenti', ],    872: ['duo', 'septuaginta', 'oktingenti', ],    873: ['tre', 'septuaginta', 'oktingenti', ],    874: ['quattuor', 'septuaginta', 'oktingenti', ],    875: ['quinqua', 'septuaginta', 'oktingenti', ],    876: ['se', 'septuaginta', 'oktingenti', ],    877: ['septen', 'septuaginta', 'oktingenti', ],    878: ['okto', 'septuaginta', 'oktingenti', ],    879: ['noven', 'septuaginta', 'oktingenti', ],    880: ['oktoginta', 'oktingenti', ],    881: ['un', 'oktoginta', 'oktingenti', ],    882: ['duo', 'oktoginta', 'oktingenti', ],    883: ['tre', 'oktoginta', 'oktingenti', ],    884: ['quattuor', 'oktoginta', 'oktingenti', ],    885: ['quinqua', 'oktoginta', 'oktingenti', ],    886: ['sex', 'oktoginta', 'oktingenti', ],    887: ['septem', 'oktoginta', 'oktingenti', ],    888: ['okto', 'oktoginta', 'oktingenti', ],    889: ['novem', 'oktoginta', 'oktingenti', ],    890: ['nonaginta', 'oktingenti', ],    891: ['un', 'nonaginta', 'oktingenti', ],    892: ['duo', 'nonaginta', 'oktingenti', ],    893: ['tre', 'nonaginta', 'oktingenti', ],    894: ['quattuor', 'nonaginta', 'oktingenti', ],    895: ['quinqua', 'nonaginta', 'oktingenti', ],    896: ['se', 'nonaginta', 'oktingenti', ],    897: ['septe', 'nonaginta', 'oktingenti', ],    898: ['okto', 'nonaginta', 'oktingenti', ],    899: ['nove', 'nonaginta', 'oktingenti', ],    900: ['nongenti', ],    901: ['un', 'nongenti', ],    902: ['duo', 'nongenti', ],    903: ['tre', 'nongenti', ],    904: ['quattuor', 'nongenti', ],    905: ['quinqua', 'nongenti', ],    906: ['se', 'nongenti', ],    907: ['septe', 'nongenti', ],    908: ['okto', 'nongenti', ],    909: ['nove', 'nongenti', ],    910: ['dezi', 'nongenti', ],    911: ['un', 'dezi', 'nongenti', ],    912: ['duo', 'dezi', 'nongenti', ],    913: ['tre', 'dezi', 'nongenti', ],    914: ['quattuor', 'dezi', 'nongenti', ],    915: ['quin', 'dezi', 'nongenti', ],    916: ['se', 'dezi', 'nongenti', ],    917: ['septen', 'dezi', 'nongenti', ],    918: ['okto', 'dezi', 'nongenti', ],    919: ['noven', 'dezi', 'nongenti', ],    920: ['viginti', 'nongenti', ],    921: ['un', 'viginti', 'nongenti', ],    922: ['duo', 'viginti', 'nongenti', ],    923: ['tres', 'viginti', 'nongenti', ],    924: ['quattuor', 'viginti', 'nongenti', ],    925: ['quinqua', 'viginti', 'nongenti', ],    926: ['ses', 'viginti', 'nongenti', ],    927: ['septem', 'viginti', 'nongenti', ],    928: ['okto', 'viginti', 'nongenti', ],    929: ['novem', 'viginti', 'nongenti', ],    930: ['triginta', 'nongenti', ],    931: ['un', 'triginta', 'nongenti', ],    932: ['duo', 'triginta', 'nongenti', ],    933: ['tres', 'triginta', 'nongenti', ],    934: ['quattuor', 'triginta', 'nongenti', ],    935: ['quinqua', 'triginta', 'nongenti', ],    936: ['ses', 'triginta', 'nongenti', ],    937: ['septen', 'triginta', 'nongenti', ],    938: ['okto', 'triginta', 'nongenti', ],    939: ['noven', 'triginta', 'nongenti', ],    940: ['quadraginta', 'nongenti', ],    941: ['un', 'quadraginta', 'nongenti', ],    942: ['duo', 'quadraginta', 'nongenti', ],    943: ['tres', 'quadraginta', 'nongenti', ],    944: ['quattuor', 'quadraginta', 'nongenti', ],    945: ['quinqua', 'quadraginta', 'nongenti', ],    946: ['ses', 'quadraginta', 'nongenti', ],    947: ['septen', 'quadraginta', 'nongenti', ],    948: ['okto', 'quadraginta', 'nongenti', ],    949: ['noven', 'quadraginta', 'nongenti', ],    950: ['quinquaginta', 'nongenti', ],    951: ['un', 'quinquaginta', 'nongenti', ],    952: ['duo', 'quinquaginta', 'nongenti', ],    953: ['tres', 'quinquaginta', 'nongenti', ],    954: ['quattuor', 'quinquaginta', 'nongenti', ],    955: ['quinqua', 'quinquaginta', 'nongenti', ],    956: ['ses', 'quinquaginta', 'nongenti', ],    957: ['septen', 'quinquaginta', 'nongenti', ],    958: ['okto', 'quinquaginta', 'nongenti', ],    959: ['noven', 'quinquaginta', 'nongenti', ],    960: ['sexaginta', 'nongenti', ],    961: ['un', 'sexaginta', 'nongenti', ],    962: ['duo', 'sexaginta', 'nongenti', ],    963: ['tre', 'sexaginta', 'nongenti', ],    964: ['quattuor', 'sexaginta', 'nongenti', ],    965: ['quinqua', 'sexaginta', 'nongenti', ],    966: ['se', 'sexaginta', 'nongenti', ],    967: ['septen', 'sexaginta', 'nongenti', ],    968: ['okto', 'sexaginta', 'nongenti', ],    969: ['noven', 'sexaginta', 'nongenti', ],    970: ['septuaginta', 'nongenti', ],    971: ['un', 'septuaginta', 'nongenti', ],    972: ['duo', 'septuaginta', 'nongenti', ],    973: ['tre', 'septuaginta', 'nongenti', ],    974: ['quattuor', 'septuaginta', 'nongenti', ],    975: ['quinqua', 'septuaginta', 'nongenti', ],    976: ['se', 'septuaginta', 'nongenti', ],    977: ['septen', 'septuaginta', 'nongenti', ],    978: ['okto', 'septuaginta', 'nongenti', ],    979: ['noven', 'septuaginta', 'nongenti', ],    980: ['oktoginta', 'nongenti', ],    981: ['un', 'oktoginta', 'nongenti', ],    982: ['duo', 'oktoginta', 'nongenti', ],    983: ['tre', 'oktoginta', 'nongenti', ],    984: ['quattuor', 'oktoginta', 'nongenti', ],    985: ['quinqua', 'oktoginta', 'nongenti', ],    986: ['sex', 'oktoginta', 'nongenti', ],    987: ['septem', 'oktoginta', 'nongenti', ],    988: ['okto', 'oktoginta', 'nongenti', ],    989: ['novem', 'oktoginta', 'nongenti', ],    990: ['nonaginta', 'nongenti', ],    991: ['un', 'nonaginta', 'nongenti', ],    992: ['duo', 'nonaginta', 'nongenti', ],    993: ['tre', 'nonaginta', 'nongenti', ],    994: ['quattuor', 'nonaginta', 'nongenti', ],    995: ['quinqua', 'nonaginta', 'nongenti', ],    996: ['se', 'nonaginta', 'nongenti', ],    997: ['septe', 'nonaginta', 'nongenti', ],    998: ['okto', 'nonaginta', 'nongenti', ],    999: ['nove', 'nonaginta', 'nongenti', ],}
+
+
+def buildTable(delimiter='', synonym=False, chuquet=False, stem=False):
+    """
+    Join the prefixes for all numbers from 0 to 999.
+    @param delimiter Separates the prefixes.
+    @param synonym Use LATIN_SYNONYMS, if available.
+    @param chuquet Use CHUQUET_PREFIXES, if available; wins against synonym.
+    @param stem True, to replace a trailing 'a' of numbers 10-99 with 'i', as needed to build a word like trigintillion.
+    @return tuple with the joined prefixes; the index is the number.
+    """
+    ret = []
+    for number in range(1000):
+        if chuquet and number in CHUQUET_PREFIXES:
+            target = CHUQUET_PREFIXES[number]
+        elif synonym and number in LATIN_SYNONYMS:
+            target = LATIN_SYNONYMS[number]
+        else:
+            target = LATIN_NUMBERS[number]
+        latin = delimiter.join(target)
+        if stem and 100 > number > 9 and latin[-1] == 'a':
+            latin = latin[:-1] + 'i'
+        ret.append(latin)
+    return tuple(ret)
@@ -0,0 +1,31 @@
+# Copyright (C) 2013 Daniel Marohn - daniel.marohn@gmail.com
+# This program is free software; find details in file LICENCE or here:
+# https://raw.github.com/camillo/sayNumber/master/sayNumber/LICENSE
+
+# This file is auto generated, running python buildLatinNumbers.py -p.
+# Changes to this file will be overridden without warning, when running buildLatinNumbers.py again (will not happen automatically).
+
+# The joined prefixes of the numbers 0 to 999 of all tables in one string; see unpackTable.
+PACKED = 'nimibitriquadriquintisextiseptioktinonideziundeziduodezitredeziquattuordeziquindezisedeziseptendezioktodezinovendezivigintiunvigintiduovigintitresvigintiquattuorvigintiquinquavigintisesvigintiseptemvigintioktovigintinovemvigintitrigintauntrigintaduotrigintatrestrigintaquattuortrigintaquinquatrigintasestrigintaseptentrigintaoktotrigintanoventrigintaquadragintaunquadragintaduoquadragintatresquadragintaquattuorquadragintaquinquaquadragintasesquadragintaseptenquadragintaoktoquadragintanovenquadragintaquinquagintaunquinquagintaduoquinquagintatresquinquagintaquattuorquinquagintaquinquaquinquagintasesquinquagintaseptenquinquagintaoktoquinquagintanovenquinquagintasexagintaunsexagintaduosexagintatresexagintaquattuorsexagintaquinquasexagintasesexagintaseptensexagintaoktosexagintanovensexagintaseptuagintaunseptuagintaduoseptuagintatreseptuagintaquattuorseptuagintaquinquaseptuagintaseseptuagintaseptenseptuagintaoktoseptuagintanovenseptuagintaoktogintaunoktogintaduooktogintatreoktogintaquattuoroktogintaquinquaoktogintasexoktogintaseptemoktogintaoktooktogintanovemoktogintanonagintaunnonagintaduononagintatrenonagintaquattuornonagintaquinquanonagintasenonagintaseptenonagintaoktononagintanovenonagintazentiunzentiduozentitreszentiquattuorzentiquinquazentisexzentiseptenzentioktozentinovenzentidezizentiundezizentiduodezizentitredezizentiquattuordezizentiquindezizentisedezizentiseptendezizentioktodezizentinovendezizentivigintizentiunvigintizentiduovigintizentitresvigintizentiquattuorvigintizentiquinquavigintizentisesvigintizentiseptemvigintizentioktovigintizentinovemvigintizentitrigintazentiuntrigintazentiduotrigintazentitrestrigintazentiquattuortrigintazentiquinquatrigintazentisestrigintazentiseptentrigintazentioktotrigintazentinoventrigintazentiquadragintazentiunquadragintazentiduoquadragintazentitresquadragintazentiquattuorquadragintazentiquinquaquadragintazentisesquadragintazentiseptenquadragintazentioktoquadragintazentinovenquadragintazentiquinquagintazentiunquinquagintazentiduoquinquagintazentitresquinquagintazentiquattuorquinquagintazentiquinquaquinquagintazentisesquinquagintazentiseptenquinquagintazentioktoquinquagintazentinovenquinquagintazentisexagintazentiunsexagintazentiduosexagintazentitresexagintazentiquattuorsexagintazentiquinquasexagintazentisesexagintazentiseptensexagintazentioktosexagintazentinovensexagintazentiseptuagintazentiunseptuagintazentiduoseptuagintazentitreseptuagintazentiquattuorseptuagintazentiquinquaseptuagintazentiseseptuagintazentiseptenseptuagintazentioktoseptuagintazentinovenseptuagintazentioktogintazentiunoktogintazentiduooktogintazentitreoktogintazentiquattuoroktogintazentiquinquaoktogintazentisexoktogintazentiseptemoktogintazentioktooktogintazentinovemoktogintazentinonagintazentiunnonagintazentiduononagintazentitrenonagintazentiquattuornonagintazentiquinquanonagintazentisenonagintazentiseptenonagintazentioktononagintazentinovenonagintazentiduzentiunduzentiduoduzentitreduzentiquattuorduzentiquinquaduzentiseduzentiseptenduzentioktoduzentinovenduzentideziduzentiundeziduzentiduodeziduzentitredeziduzentiquattuordeziduzentiquindeziduzentisedeziduzentiseptendeziduzentioktodeziduzentinovendeziduzentivigintiduzentiunvigintiduzentiduovigintiduzentitresvigintiduzentiquattuorvigintiduzentiquinquavigintiduzentisesvigintiduzentiseptemvigintiduzentioktovigintiduzentinovemvigintiduzentitrigintaduzentiuntrigintaduzentiduotrigintaduzentitrestrigintaduzentiquattuortrigintaduzentiquinquatrigintaduzentisestrigintaduzentiseptentrigintaduzentioktotrigintaduzentinoventrigintaduzentiquadragintaduzentiunquadragintaduzentiduoquadragintaduzentitresquadragintaduzentiquattuorquadragintaduzentiquinquaquadragintaduzentisesquadragintaduzentiseptenquadragintaduzentioktoquadragintaduzentinovenquadragintaduzentiquinquagintaduzentiunquinquagintaduzentiduoquinquagintaduzentitresquinquagintaduzentiquattuorquinquagintaduzentiquinquaquinquagintaduzentisesquinquagintaduzentiseptenquinquagintaduzentioktoquinquagintaduzentinovenquinquagintaduzentisexagintaduzentiunsexagintaduzentiduosexagintaduzentitresexagintaduzentiquattuorsexagintaduzentiquinquasexagintaduzentisesexagintaduzentiseptensexagintaduzentioktosexagintaduzentinovensexagintaduzentiseptuagintaduzentiunseptuagintaduzentiduoseptuagintaduzentitreseptuagintaduzentiquattuorseptuagintaduzentiquinquaseptuagintaduzentiseseptuagintaduzentiseptenseptuagintaduzentioktoseptuagintaduzentinovenseptuagintaduzentioktogintaduzentiunoktogintaduzentiduooktogintaduzentitreoktogintaduzentiquattuoroktogintaduzentiquinquaoktogintaduzentisexoktogintaduzentiseptemoktogintaduzentioktooktogintaduzentinovemoktogintaduzentinonagintaduzentiunnonagintaduzentiduononagintaduzentitrenonagintaduzentiquattuornonagintaduzentiquinquanonagintaduzentisenonagintaduzentiseptenonagintaduzentioktononagintaduzentinovenonagintaduzentitrezentiuntrezentiduotrezentitrestrezentiquattuortrezentiquinquatrezentisestrezentiseptentrezentioktotrezentinoventrezentidezitrezentiundezitrezentiduodezitrezentitredezitrezentiquattuordezitrezentiquindezitrezentisedezitrezentiseptendezitrezentioktodezitrezentinovendezitrezentivigintitrezentiunvigintitrezentiduovigintitrezentitresvigintitrezentiquattuorvigintitrezentiquinquavigintitrezentisesvigintitrezentiseptemvigintitrezentioktovigintitrezentinovemvigintitrezentitrigintatrezentiuntrigintatrezentiduotrigintatrezentitrestrigintatrezentiquattuortrigintatrezentiquinquatrigintatrezentisestrigintatrezentiseptentrigintatrezentioktotrigintatrezentinoventrigintatrezentiquadragintatrezentiunquadragintatrezentiduoquadragintatrezentitresquadragintatrezentiquattuorquadragintatrezentiquinquaquadragintatrezentisesquadragintatrezentiseptenquadragintatrezentioktoquadragintatrezentinovenquadragintatrezentiquinquagintatrezentiunquinquagintatrezentiduoquinquagintatrezentitresquinquagintatrezentiquattuorquinquagintatrezentiquinquaquinquagintatrezentisesquinquagintatrezentiseptenquinquagintatrezentioktoquinquagintatrezentinovenquinquagintatrezentisexagintatrezentiunsexagintatrezentiduosexagintatrezentitresexagintatrezentiquattuorsexagintatrezentiquinquasexagintatrezentisesexagintatrezentiseptensexagintatrezentioktosexagintatrezentinovensexagintatrezentiseptuagintatrezentiunseptuagintatrezentiduoseptuagintatrezentitreseptuagintatrezentiquattuorseptuagintatrezentiquinquaseptuagintatrezentiseseptuagintatrezentiseptenseptuagintatrezentioktoseptuagintatrezentinovenseptuagintatrezentioktogintatrezentiunoktogintatrezentiduooktogintatrezentitreoktogintatrezentiquattuoroktogintatrezentiquinquaoktogintatrezentisexoktogintatrezentiseptemoktogintatrezentioktooktogintatrezentinovemoktogintatrezentinonagintatrezentiunnonagintatrezentiduononagintatrezentitrenonagintatrezentiquattuornonagintatrezentiquinquanonagintatrezentisenonagintatrezentiseptenonagintatrezentioktononagintatrezentinovenonagintatrezentiquadringentiunquadringentiduoquadringentitresquadringentiquattuorquadringentiquinquaquadringentisesquadringentiseptenquadringentioktoquadringentinovenquadringentideziquadringentiundeziquadringentiduodeziquadringentitredeziquadringentiquattuordeziquadringentiquindeziquadringentisedeziquadringentiseptendeziquadringentioktodeziquadringentinovendeziquadringentivigintiquadringentiunvigintiquadringentiduovigintiquadringentitresvigintiquadringentiquattuorvigintiquadringentiquinquavigintiquadringentisesvigintiquadringentiseptemvigintiquadringentioktovigintiquadringentinovemvigintiquadringentitrigintaquadringentiuntrigintaquadringentiduotrigintaquadringentitrestrigintaquadringentiquattuortrigintaquadringentiquinquatrigintaquadringentisestrigintaquadringentiseptentrigintaquadringentioktotrigintaquadringentinoventrigintaquadringentiquadragintaquadringentiunquadragintaquadringentiduoquadragintaquadringentitresquadragintaquadringentiquattuorquadragintaquadringentiquinquaquadragintaquadringentisesquadragintaquadringentiseptenquadragintaquadringentioktoquadragintaquadringentinovenquadragintaquadringentiquinquagintaquadringentiunquinquagintaquadringentiduoquinquagintaquadringentitresquinquagintaquadringentiquattuorquinquagintaquadringentiquinquaquinquagintaquadringentisesquinquagintaquadringentiseptenquinquagintaquadringentioktoquinquagintaquadringentinovenquinquagintaquadringentisexagintaquadringentiunsexagintaquadringentiduosexagintaquadringentitresexagintaquadringentiquattuorsexagintaquadringentiquinquasexagintaquadringentisesexagintaquadringentiseptensexagintaquadringentioktosexagintaquadringentinovensexagintaquadringentiseptuagintaquadringentiunseptuagintaquadringentiduoseptuagintaquadringentitreseptuagintaquadringentiquattuorseptuagintaquadringentiquinquaseptuagintaquadringentiseseptuagintaquadringentiseptenseptuagintaquadringentioktoseptuagintaquadringentinovenseptuagintaquadringentioktogintaquadringentiunoktogintaquadringentiduooktogintaquadringentitreoktogintaquadringentiquattuoroktogintaquadringentiquinquaoktogintaquadringentisexoktogintaquadringentiseptemoktogintaquadringentioktooktogintaquadringentinovemoktogintaquadringentinonagintaquadringentiunnonagintaquadringentiduononagintaquadringentitrenonagintaquadringentiquattuornonagintaquadringentiquinquanonagintaquadringentisenonagintaquadringentiseptenonagintaquadringentioktononagintaquadringentinovenonagintaquadringentiquingentiunquingentiduoquingentitresquingentiquattuorquingentiquinquaquingentisesquingentiseptenquingentioktoquingentinovenquingentideziquingentiundeziquingentiduodeziquingentitredeziquingentiquattuordeziquingentiquindeziquingentisedeziquingentiseptendeziquingentioktodeziquingentinovendeziquingentivigintiquingentiunvigintiquingentiduovigintiquingentitresvigintiquingentiquattuorvigintiquingentiquinquavigintiquingentisesvigintiquingentiseptemvigintiquingentioktovigintiquingentinovemvigintiquingentitrigintaquingentiuntrigintaquingentiduotrigintaquingentitrestrigintaquingentiquattuortrigintaquingentiquinquatrigintaquingentisestrigintaquingentiseptentrigintaquingentioktotrigintaquingentinoventrigintaquingentiquadragintaquingentiunquadragintaquingentiduoquadragintaquingentitresquadragintaquingentiquattuorquadragintaquingentiquinquaquadragintaquingentisesquadragintaquingentiseptenquadragintaquingentioktoquadragintaquingentinovenquadragintaquingentiquinquagintaquingentiunquinquagintaquingentiduoquinquagintaquingentitresquinquagintaquingentiquattuorquinquagintaquingentiquinquaquinquagintaquingentisesquinquagintaquingentiseptenquinquagintaquingentioktoquinquagintaquingentinovenquinquagintaquingentisexagintaquingentiunsexagintaquingentiduosexagintaquingentitresexagintaquingentiquattuorsexagintaquingentiquinquasexagintaquingentisesexagintaquingentiseptensexagintaquingentioktosexagintaquingentinovensexagintaquingentiseptuagintaquingentiunseptuagintaquingentiduoseptuagintaquingentitreseptuagintaquingentiquattuorseptuagintaquingentiquinquaseptuagintaquingentiseseptuagintaquingentiseptenseptuagintaquingentioktoseptuagintaquingentinovenseptuagintaquingentioktogintaquingentiunoktogintaquingentiduooktogintaquingentitreoktogintaquingentiquattuoroktogintaquingentiquinquaoktogintaquingentisexoktogintaquingentiseptemoktogintaquingentioktooktogintaquingentinovemoktogintaquingentinonagintaquingentiunnonagintaquingentiduononagintaquingentitrenonagintaquingentiquattuornonagintaquingentiquinquanonagintaquingentisenonagintaquingentiseptenonagintaquingentioktononagintaquingentinovenonagintaquingentiseszentiunseszentiduoseszentitreseszentiquattuorseszentiquinquaseszentiseseszentiseptenseszentioktoseszentinovenseszentideziseszentiundeziseszentiduodeziseszentitredeziseszentiquattuordeziseszentiquindeziseszentisedeziseszentiseptendeziseszentioktodeziseszentinovendeziseszentivigintiseszentiunvigintiseszentiduovigintiseszentitresvigintiseszentiquattuorvigintiseszentiquinquavigintiseszentisesvigintiseszentiseptemvigintiseszentioktovigintiseszentinovemvigintiseszentitrigintaseszentiuntrigintaseszentiduotrigintaseszentitrestrigintaseszentiquattuortrigintaseszentiquinquatrigintaseszentisestrigintaseszentiseptentrigintaseszentioktotrigintaseszentinoventrigintaseszentiquadragintaseszentiunquadragintaseszentiduoquadragintaseszentitresquadragintaseszentiquattuorquadragintaseszentiquinquaquadragintaseszentisesquadragintaseszentiseptenquadragintaseszentioktoquadragintaseszentinovenquadragintaseszentiquinquagintaseszentiunquinquagintaseszentiduoquinquagintaseszentitresquinquagintaseszentiquattuorquinquagintaseszentiquinquaquinquagintaseszentisesquinquagintaseszentiseptenquinquagintaseszentioktoquinquagintaseszentinovenquinquagintaseszentisexagintaseszentiunsexagintaseszentiduosexagintaseszentitresexagintaseszentiquattuorsexagintaseszentiquinquasexagintaseszentisesexagintaseszentiseptensexagintaseszentioktosexagintaseszentinovensexagintaseszentiseptuagintaseszentiunseptuagintaseszentiduoseptuagintaseszentitreseptuagintaseszentiquattuorseptuagintaseszentiquinquaseptuagintaseszentiseseptuagintaseszentiseptenseptuagintaseszentioktoseptuagintaseszentinovenseptuagintaseszentioktogintaseszentiunoktogintaseszentiduooktogintaseszentitreoktogintaseszentiquattuoroktogintaseszentiquinquaoktogintaseszentisexoktogintaseszentiseptemoktogintaseszentioktooktogintaseszentinovemoktogintaseszentinonagintaseszentiunnonagintaseszentiduononagintaseszentitrenonagintaseszentiquattuornonagintaseszentiquinquanonagintaseszentisenonagintaseszentiseptenonagintaseszentioktononagintaseszentinovenonagintaseszentiseptingentiunseptingentiduoseptingentitreseptingentiquattuorseptingentiquinquaseptingentiseseptingentiseptenseptingentioktoseptingentinovenseptingentideziseptingentiundeziseptingentiduodeziseptingentitredeziseptingentiquattuordeziseptingentiquindeziseptingentisedeziseptingentiseptendeziseptingentioktodeziseptingentinovendeziseptingentivigintiseptingentiunvigintiseptingentiduovigintiseptingentitresvigintiseptingentiquattuorvigintiseptingentiquinquavigintiseptingentisesvigintiseptingentiseptemvigintiseptingentioktovigintiseptingentinovemvigintiseptingentitrigintaseptingentiuntrigintaseptingentiduotrigintaseptingentitrestrigintaseptingentiquattuortrigintaseptingentiquinquatrigintaseptingentisestrigintaseptingentiseptentrigintaseptingentioktotrigintaseptingentinoventrigintaseptingentiquadragintaseptingentiunquadragintaseptingentiduoquadragintaseptingentitresquadragintaseptingentiquattuorquadragintaseptingentiquinquaquadragintaseptingentisesquadragintaseptingentiseptenquadragintaseptingentioktoquadragintaseptingentinovenquadragintaseptingentiquinquagintaseptingentiunquinquagintaseptingentiduoquinquagintaseptingentitresquinquagintaseptingentiquattuorquinquagintaseptingentiquinquaquinquagintaseptingentisesquinquagintaseptingentiseptenquinquagintaseptingentioktoquinquagintaseptingentinovenquinquagintaseptingentisexagintaseptingentiunsexagintaseptingentiduosexagintaseptingentitresexagintaseptingentiquattuorsexagintaseptingentiquinquasexagintaseptingentisesexagintaseptingentiseptensexagintaseptingentioktosexagintaseptingentinovensexagintaseptingentiseptuagintaseptingentiunseptuagintaseptingentiduoseptuagintaseptingentitreseptuagintaseptingentiquattuorseptuagintaseptingentiquinquaseptuagintaseptingentiseseptuagintaseptingentiseptenseptuagintaseptingentioktoseptuagintaseptingentinovenseptuagintaseptingentioktogintaseptingentiunoktogintaseptingentiduooktogintaseptingentitreoktogintaseptingentiquattuoroktogintaseptingentiquinquaoktogintaseptingentisexoktogintaseptingentiseptemoktogintaseptingentioktooktogintaseptingentinovemoktogintaseptingentinonagintaseptingentiunnonagintaseptingentiduononagintaseptingentitrenonagintaseptingentiquattuornonagintaseptingentiquinquanonagintaseptingentisenonagintaseptingentiseptenonagintaseptingentioktononagintaseptingentinovenonagintaseptingentioktingentiunoktingentiduooktingentitreoktingentiquattuoroktingentiquinquaoktingentisexoktingentiseptemoktingentioktooktingentinovemoktingentidezioktingentiundezioktingentiduodezioktingentitredezioktingentiquattuordezioktingentiquindezioktingentisedezioktingentiseptendezioktingentioktodezioktingentinovendezioktingentivigintioktingentiunvigintioktingentiduovigintioktingentitresvigintioktingentiquattuorvigintioktingentiquinquavigintioktingentisesvigintioktingentiseptemvigintioktingentioktovigintioktingentinovemvigintioktingentitrigintaoktingentiuntrigintaoktingentiduotrigintaoktingentitrestrigintaoktingentiquattuortrigintaoktingentiquinquatrigintaoktingentisestrigintaoktingentiseptentrigintaoktingentioktotrigintaoktingentinoventrigintaoktingentiquadragintaoktingentiunquadragintaoktingentiduoquadragintaoktingentitresquadragintaoktingentiquattuorquadragintaoktingentiquinquaquadragintaoktingentisesquadragintaoktingentiseptenquadragintaoktingentioktoquadragintaoktingentinovenquadragintaoktingentiquinquagintaoktingentiunquinquagintaoktingentiduoquinquagintaoktingentitresquinquagintaoktingentiquattuorquinquagintaoktingentiquinquaquinquagintaoktingentisesquinquagintaoktingentiseptenquinquagintaoktingentioktoquinquagintaoktingentinovenquinquagintaoktingentisexagintaoktingentiunsexagintaoktingentiduosexagintaoktingentitresexagintaoktingentiquattuorsexagintaoktingentiquinquasexagintaoktingentisesexagintaoktingentiseptensexagintaoktingentioktosexagintaoktingentinovensexagintaoktingentiseptuagintaoktingentiunseptuagintaoktingentiduoseptuagintaoktingentitreseptuagintaoktingentiquattuorseptuagintaoktingentiquinquaseptuagintaoktingentiseseptuagintaoktingentiseptenseptuagintaoktingentioktoseptuagintaoktingentinovenseptuagintaoktingentioktogintaoktingentiunoktogintaoktingentiduooktogintaoktingentitreoktogintaoktingentiquattuoroktogintaoktingentiquinquaoktogintaoktingentisexoktogintaoktingentiseptemoktogintaoktingentioktooktogintaoktingentinovemoktogintaoktingentinonagintaoktingentiunnonagintaoktingentiduononagintaoktingentitrenonagintaoktingentiquattuornonagintaoktingentiquinquanonagintaoktingentisenonagintaoktingentiseptenonagintaoktingentioktononagintaoktingentinovenonagintaoktingentinongentiunnongentiduonongentitrenongentiquattuornongentiquinquanongentisenongentiseptenongentioktonongentinovenongentidezinongentiundezinongentiduodezinongentitredezinongentiquattuordezinongentiquindezinongentisedezinongentiseptendezinongentioktodezinongentinovendezinongentivigintinongentiunvigintinongentiduovigintinongentitresvigintinongentiquattuorvigintinongentiquinquavigintinongentisesvigintinongentiseptemvigintinongentioktovigintinongentinovemvigintinongentitrigintanongentiuntrigintanongentiduotrigintanongentitrestrigintanongentiquattuortrigintanongentiquinquatrigintanongentisestrigintanongentiseptentrigintanongentioktotrigintanongentinoventrigintanongentiquadragintanongentiunquadragintanongentiduoquadragintanongentitresquadragintanongentiquattuorquadragintanongentiquinquaquadragintanongentisesquadragintanongentiseptenquadragintanongentioktoquadragintanongentinovenquadragintanongentiquinquagintanongentiunquinquagintanongentiduoquinquagintanongentitresquinquagintanongentiquattuorquinquagintanongentiquinquaquinquagintanongentisesquinquagintanongentiseptenquinquagintanongentioktoquinquagintanongentinovenquinquagintanongentisexagintanongentiunsexagintanongentiduosexagintanongentitresexagintanongentiquattuorsexagintanongentiquinquasexagintanongentisesexagintanongentiseptensexagintanongentioktosexagintanongentinovensexagintanongentiseptuagintanongentiunseptuagintanongentiduoseptuagintanongentitreseptuagintanongentiquattuorseptuagintanongentiquinquaseptuagintanongentiseseptuagintanongentiseptenseptuagintanongentioktoseptuagintanongentinovenseptuagintanongentioktogintanongentiunoktogintanongentiduooktogintanongentitreoktogintanongentiquattuoroktogintanongentiquinquaoktogintanongentisexoktogintanongentiseptemoktogintanongentioktooktogintanongentinovemoktogintanongentinonagintanongentiunnonagintanongentiduononagintanongentitrenonagintanongentiquattuornonagintanongentiquinquanonagintanongentisenonagintanongentiseptenonagintanongentioktononagintanongentinovenonagintanongentinimibitriquadriquintisextiseptioktinonideziundeziduodezitredeziquattuordeziquindezisedeziseptendezioktodezinovendezivigintiunvigintiduovigintitresvigintiquattuorvigintiquinquavigintisesvigintiseptemvigintioktovigintinovemvigintitrigintiuntrigintiduotrigintitrestrigintiquattuortrigintiquinquatrigintisestrigintiseptentrigintioktotrigintinoventrigintiquadragintiunquadragintiduoquadragintitresquadragintiquattuorquadragintiquinquaquadragintisesquadragintiseptenquadragintioktoquadragintinovenquadragintiquinquagintiunquinquagintiduoquinquagintitresquinquagintiquattuorquinquagintiquinquaquinquagintisesquinquagintiseptenquinquagintioktoquinquagintinovenquinquagintisexagintiunsexagintiduosexagintitresexagintiquattuorsexagintiquinquasexagintisesexagintiseptensexagintioktosexagintinovensexagintiseptuagintiunseptuagintiduoseptuagintitreseptuagintiquattuorseptuagintiquinquaseptuagintiseseptuagintiseptenseptuagintioktoseptuagintinovenseptuagintioktogintiunoktogintiduooktogintitreoktogintiquattuoroktogintiquinquaoktogintisexoktogintiseptemoktogintioktooktogintinovemoktogintinonagintiunnonagintiduononagintitrenonagintiquattuornonagintiquinquanonagintisenonagintiseptenonagintioktononagintinovenonagintizentiunzentiduozentitreszentiquattuorzentiquinquazentisexzentiseptenzentioktozentinovenzentidezizentiundezizentiduodezizentitredezizentiquattuordezizentiquindezizentisedezizentiseptendezizentioktodezizentinovendezizentivigintizentiunvigintizentiduovigintizentitresvigintizentiquattuorvigintizentiquinquavigintizentisesvigintizentiseptemvigintizentioktovigintizentinovemvigintizentitrigintazentiuntrigintazentiduotrigintazentitrestrigintazentiquattuortrigintazentiquinquatrigintazentisestrigintazentiseptentrigintazentioktotrigintazentinoventrigintazentiquadragintazentiunquadragintazentiduoquadragintazentitresquadragintazentiquattuorquadragintazentiquinquaquadragintazentisesquadragintazentiseptenquadragintazentioktoquadragintazentinovenquadragintazentiquinquagintazentiunquinquagintazentiduoquinquagintazentitresquinquagintazentiquattuorquinquagintazentiquinquaquinquagintazentisesquinquagintazentiseptenquinquagintazentioktoquinquagintazentinovenquinquagintazentisexagintazentiunsexagintazentiduosexagintazentitresexagintazentiquattuorsexagintazentiquinquasexagintazentisesexagintazentiseptensexagintazentioktosexagintazentinovensexagintazentiseptuagintazentiunseptuagintazentiduoseptuagintazentitreseptuagintazentiquattuorseptuagintazentiquinquaseptuagintazentiseseptuagintazentiseptenseptuagintazentioktoseptuagintazentinovenseptuagintazentioktogintazentiunoktogintazentiduooktogintazentitreoktogintazentiquattuoroktogintazentiquinquaoktogintazentisexoktogintazentiseptemoktogintazentioktooktogintazentinovemoktogintazentinonagintazentiunnonagintazentiduononagintazentitrenonagintazentiquattuornonagintazentiquinquanonagintazentisenonagintazentiseptenonagintazentioktononagintazentinovenonagintazentiduzentiunduzentiduoduzentitreduzentiquattuorduzentiquinquaduzentiseduzentiseptenduzentioktoduzentinovenduzentideziduzentiundeziduzentiduodeziduzentitredeziduzentiquattuordeziduzentiquindeziduzentisedeziduzentiseptendeziduzentioktodeziduzentinovendeziduzentivigintiduzentiunvigintiduzentiduovigintiduzentitresvigintiduzentiquattuorvigintiduzentiquinquavigintiduzentisesvigintiduzentiseptemvigintiduzentioktovigintiduzentinovemvigintiduzentitrigintaduzentiuntrigintaduzentiduotrigintaduzentitrestrigintaduzentiquattuortrigintaduzentiquinquatrigintaduzentisestrigintaduzentiseptentrigintaduzentioktotrigintaduzentinoventrigintaduzentiquadragintaduzentiunquadragintaduzentiduoquadragintaduzentitresquadragintaduzentiquattuorquadragintaduzentiquinquaquadragintaduzentisesquadragintaduzentiseptenquadragintaduzentioktoquadragintaduzentinovenquadragintaduzentiquinquagintaduzentiunquinquagintaduzentiduoquinquagintaduzentitresquinquagintaduzentiquattuorquinquagintaduzentiquinquaquinquagintaduzentisesquinquagintaduzentiseptenquinquagintaduzentioktoquinquagintaduzentinovenquinquagintaduzentisexagintaduzentiunsexagintaduzentiduosexagintaduzentitresexagintaduzentiquattuorsexagintaduzentiquinquasexagintaduzentisesexagintaduzentiseptensexagintaduzentioktosexagintaduzentinovensexagintaduzentiseptuagintaduzentiunseptuagintaduzentiduoseptuagintaduzentitreseptuagintaduzentiquattuorseptuagintaduzentiquinquaseptuagintaduzentiseseptuagintaduzentiseptenseptuagintaduzentioktoseptuagintaduzentinovenseptuagintaduzentioktogintaduzentiunoktogintaduzentiduooktogintaduzentitreoktogintaduzentiquattuoroktogintaduzentiquinquaoktogintaduzentisexoktogintaduzentiseptemoktogintaduzentioktooktogintaduzentinovemoktogintaduzentinonagintaduzentiunnonagintaduzentiduononagintaduzentitrenonagintaduzentiquattuornonagintaduzentiquinquanonagintaduzentisenonagintaduzentiseptenonagintaduzentioktononagintaduzentinovenonagintaduzentitrezentiuntrezentiduotrezentitrestrezentiquattuortrezentiquinquatrezentisestrezentiseptentrezentioktotrezentinoventrezentidezitrezentiundezitrezentiduodezitrezentitredezitrezentiquattuordezitrezentiquindezitrezentisedezitrezentiseptendezitrezentioktodezitrezentinovendezitrezentivigintitrezentiunvigintitrezentiduovigintitrezentitresvigintitrezentiquattuorvigintitrezentiquinquavigintitrezentisesvigintitrezentiseptemvigintitrezentioktovigintitrezentinovemvigintitrezentitrigintatrezentiuntrigintatrezentiduotrigintatrezentitrestrigintatrezentiquattuortrigintatrezentiquinquatrigintatrezentisestrigintatrezentiseptentrigintatrezentioktotrigintatrezentinoventrigintatrezentiquadragintatrezentiunquadragintatrezentiduoquadragintatrezentitresquadragintatrezentiquattuorquadragintatrezentiquinquaquadragintatrezentisesquadragintatrezentiseptenquadragintatrezentioktoquadragintatrezentinovenquadragintatrezentiquinquagintatrezentiunquinquagintatrezentiduoquinquagintatrezentitresquinquagintatrezentiquattuorquinquagintatrezentiquinquaquinquagintatrezentisesquinquagintatrezentiseptenquinquagintatrezentioktoquinquagintatrezentinovenquinquagintatrezentisexagintatrezentiunsexagintatrezentiduosexagintatrezentitresexagintatrezentiquattuorsexagintatrezentiquinquasexagintatrezentisesexagintatrezentiseptensexagintatrezentioktosexagintatrezentinovensexagintatrezentiseptuagintatrezentiunseptuagintatrezentiduoseptuagintatrezentitreseptuagintatrezentiquattuorseptuagintatrezentiquinquaseptuagintatrezentiseseptuagintatrezentiseptenseptuagintatrezentioktoseptuagintatrezentinovenseptuagintatrezentioktogintatrezentiunoktogintatrezentiduooktogintatrezentitreoktogintatrezentiquattuoroktogintatrezentiquinquaoktogintatrezentisexoktogintatrezentiseptemoktogintatrezentioktooktogintatrezentinovemoktogintatrezentinonagintatrezentiunnonagintatrezentiduononagintatrezentitrenonagintatrezentiquattuornonagintatrezentiquinquanonagintatrezentisenonagintatrezentiseptenonagintatrezentioktononagintatrezentinovenonagintatrezentiquadringentiunquadringentiduoquadringentitresquadringentiquattuorquadringentiquinquaquadringentisesquadringentiseptenquadringentioktoquadringentinovenquadringentideziquadringentiundeziquadringentiduodeziquadringentitredeziquadringentiquattuordeziquadringentiquindeziquadringentisedeziquadringentiseptendeziquadringentioktodeziquadringentinovendeziquadringentivigintiquadringentiunvigintiquadringentiduovigintiquadringentitresvigintiquadringentiquattuorvigintiquadringentiquinquavigintiquadringentisesvigintiquadringentiseptemvigintiquadringentioktovigintiquadringentinovemvigintiquadringentitrigintaquadringentiuntrigintaquadringentiduotrigintaquadringentitrestrigintaquadringentiquattuortrigintaquadringentiquinquatrigintaquadringentisestrigintaquadringentiseptentrigintaquadringentioktotrigintaquadringentinoventrigintaquadringentiquadragintaquadringentiunquadragintaquadringentiduoquadragintaquadringentitresquadragintaquadringentiquattuorquadragintaquadringentiquinquaquadragintaquadringentisesquadragintaquadringentiseptenquadragintaquadringentioktoquadragintaquadringentinovenquadragintaquadringentiquinquagintaquadringentiunquinquagintaquadringentiduoquinquagintaquadringentitresquinquagintaquadringentiquattuorquinquagintaquadringentiquinquaquinquagintaquadringentisesquinquagintaquadringentiseptenquinquagintaquadringentioktoquinquagintaquadringentinovenquinquagintaquadringentisexagintaquadringentiunsexagintaquadringentiduosexagintaquadringentitresexagintaquadringentiquattuorsexagintaquadringentiquinquasexagintaquadringentisesexagintaquadringentiseptensexagintaquadringentioktosexagintaquadringentinovensexagintaquadringentiseptuagintaquadringentiunseptuagintaquadringentiduoseptuagintaquadringentitreseptuagintaquadringentiquattuorseptuagintaquadringentiquinquaseptuagintaquadringentiseseptuagintaquadringentiseptenseptuagintaquadringentioktoseptuagintaquadringentinovenseptuagintaquadringentioktogintaquadringentiunoktogintaquadringentiduooktogintaquadringentitreoktogintaquadringentiquattuoroktogintaquadringentiquinquaoktogintaquadringentisexoktogintaquadringentiseptemoktogintaquadringentioktooktogintaquadringentinovemoktogintaquadringentinonagintaquadringentiunnonagintaquadringentiduononagintaquadringentitrenonagintaquadringentiquattuornonagintaquadringentiquinquanonagintaquadringentisenonagintaquadringentiseptenonagintaquadringentioktononagintaquadringentinovenonagintaquadringentiquingentiunquingentiduoquingentitresquingentiquattuorquingentiquinquaquingentisesquingentiseptenquingentioktoquingentinovenquingentideziquingentiundeziquingentiduodeziquingentitredeziquingentiquattuordeziquingentiquindeziquingentisedeziquingentiseptendeziquingentioktodeziquingentinovendeziquingentivigintiquingentiunvigintiquingentiduovigintiquingentitresvigintiquingentiquattuorvigintiquingentiquinquavigintiquingentisesvigintiquingentiseptemvigintiquingentioktovigintiquingentinovemvigintiquingentitrigintaquingentiuntrigintaquingentiduotrigintaquingentitrestrigintaquingentiquattuortrigintaquingentiquinquatrigintaquingentisestrigintaquingentiseptentrigintaquingentioktotrigintaquingentinoventrigintaquingentiquadragintaquingentiunquadragintaquingentiduoquadragintaquingentitresquadragintaquingentiquattuorquadragintaquingentiquinquaquadragintaquingentisesquadragintaquingentiseptenquadragintaquingentioktoquadragintaquingentinovenquadragintaquingentiquinquagintaquingentiunquinquagintaquingentiduoquinquagintaquingentitresquinquagintaquingentiquattuorquinquagintaquingentiquinquaquinquagintaquingentisesquinquagintaquingentiseptenquinquagintaquingentioktoquinquagintaquingentinovenquinquagintaquingentisexagintaquingentiunsexagintaquingentiduosexagintaquingentitresexagintaquingentiquattuorsexagintaquingentiquinquasexagintaquingentisesexagintaquingentiseptensexagintaquingentioktosexagintaquingentinovensexagintaquingentiseptuagintaquingentiunseptuagintaquingentiduoseptuagintaquingentitreseptuagintaquingentiquattuorseptuagintaquingentiquinquaseptuagintaquingentiseseptuagintaquingentiseptenseptuagintaquingentioktoseptuagintaquingentinovenseptuagintaquingentioktogintaquingentiunoktogintaquingentiduooktogintaquingentitreoktogintaquingentiquattuoroktogintaquingentiquinquaoktogintaquingentisexoktogintaquingentiseptemoktogintaquingentioktooktogintaquingentinovemoktogintaquingentinonagintaquingentiunnonagintaquingentiduononagintaquingentitrenonagintaquingentiquattuornonagintaquingentiquinquanonagintaquingentisenonagintaquingentiseptenonagintaquingentioktononagintaquingentinovenonagintaquingentiseszentiunseszentiduoseszentitreseszentiquattuorseszentiquinquaseszentiseseszentiseptenseszentioktoseszentinovenseszentideziseszentiundeziseszentiduodeziseszentitredeziseszentiquattuordeziseszentiquindeziseszentisedeziseszentiseptendeziseszentioktodeziseszentinovendeziseszentivigintiseszentiunvigintiseszentiduovigintiseszentitresvigintiseszentiquattuorvigintiseszentiquinquavigintiseszentisesvigintiseszentiseptemvigintiseszentioktovigintiseszentinovemvigintiseszentitrigintaseszentiuntrigintaseszentiduotrigintaseszentitrestrigintaseszentiquattuortrigintaseszentiquinquatrigintaseszentisestrigintaseszentiseptentrigintaseszentioktotrigintaseszentinoventrigintaseszentiquadragintaseszentiunquadragintaseszentiduoquadragintaseszentitresquadragintaseszentiquattuorquadragintaseszentiquinquaquadragintaseszentisesquadragintaseszentiseptenquadragintaseszentioktoquadragintaseszentinovenquadragintaseszentiquinquagintaseszentiunquinquagintaseszentiduoquinquagintaseszentitresquinquagintaseszentiquattuorquinquagintaseszentiquinquaquinquagintaseszentisesquinquagintaseszentiseptenquinquagintaseszentioktoquinquagintaseszentinovenquinquagintaseszentisexagintaseszentiunsexagintaseszentiduosexagintaseszentitresexagintaseszentiquattuorsexagintaseszentiquinquasexagintaseszentisesexagintaseszentiseptensexagintaseszentioktosexagintaseszentinovensexagintaseszentiseptuagintaseszentiunseptuagintaseszentiduoseptuagintaseszentitreseptuagintaseszentiquattuorseptuagintaseszentiquinquaseptuagintaseszentiseseptuagintaseszentiseptenseptuagintaseszentioktoseptuagintaseszentinovenseptuagintaseszentioktogintaseszentiunoktogintaseszentiduooktogintaseszentitreoktogintaseszentiquattuoroktogintaseszentiquinquaoktogintaseszentisexoktogintaseszentiseptemoktogintaseszentioktooktogintaseszentinovemoktogintaseszentinonagintaseszentiunnonagintaseszentiduononagintaseszentitrenonagintaseszentiquattuornonagintaseszentiquinquanonagintaseszentisenonagintaseszentiseptenonagintaseszentioktononagintaseszentinovenonagintaseszentiseptingentiunseptingentiduoseptingentitreseptingentiquattuorseptingentiquinquaseptingentiseseptingentiseptenseptingentioktoseptingentinovenseptingentideziseptingentiundeziseptingentiduodeziseptingentitredeziseptingentiquattuordeziseptingentiquindeziseptingentisedeziseptingentiseptendeziseptingentioktodeziseptingentinovendeziseptingentivigintiseptingentiunvigintiseptingentiduovigintiseptingentitresvigintiseptingentiquattuorvigintiseptingentiquinquavigintiseptingentisesvigintiseptingentiseptemvigintiseptingentioktovigintiseptingentinovemvigintiseptingentitrigintaseptingentiuntrigintaseptingentiduotrigintaseptingentitrestrigintaseptingentiquattuortrigintaseptingentiquinquatrigintaseptingentisestrigintaseptingentiseptentrigintaseptingentioktotrigintaseptingentinoventrigintaseptingentiquadragintaseptingentiunquadragintaseptingentiduoquadragintaseptingentitresquadragintaseptingentiquattuorquadragintaseptingentiquinquaquadragintaseptingentisesquadragintaseptingentiseptenquadragintaseptingentioktoquadragintaseptingentinovenquadragintaseptingentiquinquagintaseptingentiunquinquagintaseptingentiduoquinquagintaseptingentitresquinquagintaseptingentiquattuorquinquagintaseptingentiquinquaquinquagintaseptingentisesquinquagintaseptingentiseptenquinquagintaseptingentioktoquinquagintaseptingentinovenquinquagintaseptingentisexagintaseptingentiunsexagintaseptingentiduosexagintaseptingentitresexagintaseptingentiquattuorsexagintaseptingentiquinquasexagintaseptingentisesexagintaseptingentiseptensexagintaseptingentioktosexagintaseptingentinovensexagintaseptingentiseptuagintaseptingentiunseptuagintaseptingentiduoseptuagintaseptingentitreseptuagintaseptingentiquattuorseptuagintaseptingentiquinquaseptuagintaseptingentiseseptuagintaseptingentiseptenseptuagintaseptingentioktoseptuagintaseptingentinovenseptuagintaseptingentioktogintaseptingentiunoktogintaseptingentiduooktogintaseptingentitreoktogintaseptingentiquattuoroktogintaseptingentiquinquaoktogintaseptingentisexoktogintaseptingentiseptemoktogintaseptingentioktooktogintaseptingentinovemoktogintaseptingentinonagintaseptingentiunnonagintaseptingentiduononagintaseptingentitrenonagintaseptingentiquattuornonagintaseptingentiquinquanonagintaseptingentisenonagintaseptingentiseptenonagintaseptingentioktononagintaseptingentinovenonagintaseptingentioktingentiunoktingentiduooktingentitreoktingentiquattuoroktingentiquinquaoktingentisexoktingentiseptemoktingentioktooktingentinovemoktingentidezioktingentiundezioktingentiduodezioktingentitredezioktingentiquattuordezioktingentiquindezioktingentisedezioktingentiseptendezioktingentioktodezioktingentinovendezioktingentivigintioktingentiunvigintioktingentiduovigintioktingentitresvigintioktingentiquattuorvigintioktingentiquinquavigintioktingentisesvigintioktingentiseptemvigintioktingentioktovigintioktingentinovemvigintioktingentitrigintaoktingentiuntrigintaoktingentiduotrigintaoktingentitrestrigintaoktingentiquattuortrigintaoktingentiquinquatrigintaoktingentisestrigintaoktingentiseptentrigintaoktingentioktotrigintaoktingentinoventrigintaoktingentiquadragintaoktingentiunquadragintaoktingentiduoquadragintaoktingentitresquadragintaoktingentiquattuorquadragintaoktingentiquinquaquadragintaoktingentisesquadragintaoktingentiseptenquadragintaoktingentioktoquadragintaoktingentinovenquadragintaoktingentiquinquagintaoktingentiunquinquagintaoktingentiduoquinquagintaoktingentitresquinquagintaoktingentiquattuorquinquagintaoktingentiquinquaquinquagintaoktingentisesquinquagintaoktingentiseptenquinquagintaoktingentioktoquinquagintaoktingentinovenquinquagintaoktingentisexagintaoktingentiunsexagintaoktingentiduosexagintaoktingentitresexagintaoktingentiquattuorsexagintaoktingentiquinquasexagintaoktingentisesexagintaoktingentiseptensexagintaoktingentioktosexagintaoktingentinovensexagintaoktingentiseptuagintaoktingentiunseptuagintaoktingentiduoseptuagintaoktingentitreseptuagintaoktingentiquattuorseptuagintaoktingentiquinquaseptuagintaoktingentiseseptuagintaoktingentiseptenseptuagintaoktingentioktoseptuagintaoktingentinovenseptuagintaoktingentioktogintaoktingentiunoktogintaoktingentiduooktogintaoktingentitreoktogintaoktingentiquattuoroktogintaoktingentiquinquaoktogintaoktingentisexoktogintaoktingentiseptemoktogintaoktingentioktooktogintaoktingentinovemoktogintaoktingentinonagintaoktingentiunnonagintaoktingentiduononagintaoktingentitrenonagintaoktingentiquattuornonagintaoktingentiquinquanonagintaoktingentisenonagintaoktingentiseptenonagintaoktingentioktononagintaoktingentinovenonagintaoktingentinongentiunnongentiduonongentitrenongentiquattuornongentiquinquanongentisenongentiseptenongentioktonongentinovenongentidezinongentiundezinongentiduodezinongentitredezinongentiquattuordezinongentiquindezinongentisedezinongentiseptendezinongentioktodezinongentinovendezinongentivigintinongentiunvigintinongentiduovigintinongentitresvigintinongentiquattuorvigintinongentiquinquavigintinongentisesvigintinongentiseptemvigintinongentioktovigintinongentinovemvigintinongentitrigintanongentiuntrigintanongentiduotrigintanongentitrestrigintanongentiquattuortrigintanongentiquinquatrigintanongentisestrigintanongentiseptentrigintanongentioktotrigintanongentinoventrigintanongentiquadragintanongentiunquadragintanongentiduoquadragintanongentitresquadragintanongentiquattuorquadragintanongentiquinquaquadragintanongentisesquadragintanongentiseptenquadragintanongentioktoquadragintanongentinovenquadragintanongentiquinquagintanongentiunquinquagintanongentiduoquinquagintanongentitresquinquagintanongentiquattuorquinquagintanongentiquinquaquinquagintanongentisesquinquagintanongentiseptenquinquagintanongentioktoquinquagintanongentinovenquinquagintanongentisexagintanongentiunsexagintanongentiduosexagintanongentitresexagintanongentiquattuorsexagintanongentiquinquasexagintanongentisesexagintanongentiseptensexagintanongentioktosexagintanongentinovensexagintanongentiseptuagintanongentiunseptuagintanongentiduoseptuagintanongentitreseptuagintanongentiquattuorseptuagintanongentiquinquaseptuagintanongentiseseptuagintanongentiseptenseptuagintanongentioktoseptuagintanongentinovenseptuagintanongentioktogintanongentiunoktogintanongentiduooktogintanongentitreoktogintanongentiquattuoroktogintanongentiquinquaoktogintanongentisexoktogintanongentiseptemoktogintanongentioktooktogintanongentinovemoktogintanongentinonagintanongentiunnonagintanongentiduononagintanongentitrenonagintanongentiquattuornonagintanongentiquinquanonagintanongentisenonagintanongentiseptenonagintanongentioktononagintanongentinovenonagintanongentinimibitriquadriquintisextiseptioktinonideziundeziduodezitredeziquattuordeziquindezisedeziseptendeziduodevigintiundevigintivigintiunvigintiduovigintitresvigintiquattuorvigintiquinquavigintisesvigintiseptemvigintiduodetrigintaundetrigintatrigintauntrigintaduotrigintatrestrigintaquattuortrigintaquinquatrigintasestrigintaseptentrigintaduodequadragintaundequadragintaquadragintaunquadragintaduoquadragintatresquadragintaquattuorquadragintaquinquaquadragintasesquadragintaseptenquadragintaduodequinquagintaundequinquagintaquinquagintaunquinquagintaduoquinquagintatresquinquagintaquattuorquinquagintaquinquaquinquagintasesquinquagintaseptenquinquagintaduodesexagintaundesexagintasexagintaunsexagintaduosexagintatresexagintaquattuorsexagintaquinquasexagintasesexagintaseptensexagintaduodeseptuagintaundeseptuagintaseptuagintaunseptuagintaduoseptuagintatreseptuagintaquattuorseptuagintaquinquaseptuagintaseseptuagintaseptenseptuagintaduodeoctogintaundeoctogintaoktogintaunoktogintaduooktogintatreoktogintaquattuoroktogintaquinquaoktogintasexoktogintaseptemoktogintaduodenonagintaundenonagintanonagintaunnonagintaduononagintatrenonagintaquattuornonagintaquinquanonagintasenonagintaseptenonagintaduodecentiundecentizentiunzentiduozentitreszentiquattuorzentiquinquazentisexzentiseptenzentioktozentinovenzentidezizentiundezizentiduodezizentitredezizentiquattuordezizentiquindezizentisedezizentiseptendezizentioktodezizentinovendezizentivigintizentiunvigintizentiduovigintizentitresvigintizentiquattuorvigintizentiquinquavigintizentisesvigintizentiseptemvigintizentioktovigintizentinovemvigintizentitrigintazentiuntrigintazentiduotrigintazentitrestrigintazentiquattuortrigintazentiquinquatrigintazentisestrigintazentiseptentrigintazentioktotrigintazentinoventrigintazentiquadragintazentiunquadragintazentiduoquadragintazentitresquadragintazentiquattuorquadragintazentiquinquaquadragintazentisesquadragintazentiseptenquadragintazentioktoquadragintazentinovenquadragintazentiquinquagintazentiunquinquagintazentiduoquinquagintazentitresquinquagintazentiquattuorquinquagintazentiquinquaquinquagintazentisesquinquagintazentiseptenquinquagintazentioktoquinquagintazentinovenquinquagintazentisexagintazentiunsexagintazentiduosexagintazentitresexagintazentiquattuorsexagintazentiquinquasexagintazentisesexagintazentiseptensexagintazentioktosexagintazentinovensexagintazentiseptuagintazentiunseptuagintazentiduoseptuagintazentitreseptuagintazentiquattuorseptuagintazentiquinquaseptuagintazentiseseptuagintazentiseptenseptuagintazentioktoseptuagintazentinovenseptuagintazentioktogintazentiunoktogintazentiduooktogintazentitreoktogintazentiquattuoroktogintazentiquinquaoktogintazentisexoktogintazentiseptemoktogintazentioktooktogintazentinovemoktogintazentinonagintazentiunnonagintazentiduononagintazentitrenonagintazentiquattuornonagintazentiquinquanonagintazentisenonagintazentiseptenonagintazentioktononagintazentinovenonagintazentiduzentiunduzentiduoduzentitreduzentiquattuorduzentiquinquaduzentiseduzentiseptenduzentioktoduzentinovenduzentideziduzentiundeziduzentiduodeziduzentitredeziduzentiquattuordeziduzentiquindeziduzentisedeziduzentiseptendeziduzentioktodeziduzentinovendeziduzentivigintiduzentiunvigintiduzentiduovigintiduzentitresvigintiduzentiquattuorvigintiduzentiquinquavigintiduzentisesvigintiduzentiseptemvigintiduzentioktovigintiduzentinovemvigintiduzentitrigintaduzentiuntrigintaduzentiduotrigintaduzentitrestrigintaduzentiquattuortrigintaduzentiquinquatrigintaduzentisestrigintaduzentiseptentrigintaduzentioktotrigintaduzentinoventrigintaduzentiquadragintaduzentiunquadragintaduzentiduoquadragintaduzentitresquadragintaduzentiquattuorquadragintaduzentiquinquaquadragintaduzentisesquadragintaduzentiseptenquadragintaduzentioktoquadragintaduzentinovenquadragintaduzentiquinquagintaduzentiunquinquagintaduzentiduoquinquagintaduzentitresquinquagintaduzentiquattuorquinquagintaduzentiquinquaquinquagintaduzentisesquinquagintaduzentiseptenquinquagintaduzentioktoquinquagintaduzentinovenquinquagintaduzentisexagintaduzentiunsexagintaduzentiduosexagintaduzentitresexagintaduzentiquattuorsexagintaduzentiquinquasexagintaduzentisesexagintaduzentiseptensexagintaduzentioktosexagintaduzentinovensexagintaduzentiseptuagintaduzentiunseptuagintaduzentiduoseptuagintaduzentitreseptuagintaduzentiquattuorseptuagintaduzentiquinquaseptuagintaduzentiseseptuagintaduzentiseptenseptuagintaduzentioktoseptuagintaduzentinovenseptuagintaduzentioktogintaduzentiunoktogintaduzentiduooktogintaduzentitreoktogintaduzentiquattuoroktogintaduzentiquinquaoktogintaduzentisexoktogintaduzentiseptemoktogintaduzentioktooktogintaduzentinovemoktogintaduzentinonagintaduzentiunnonagintaduzentiduononagintaduzentitrenonagintaduzentiquattuornonagintaduzentiquinquanonagintaduzentisenonagintaduzentiseptenonagintaduzentioktononagintaduzentinovenonagintaduzentitrezentiuntrezentiduotrezentitrestrezentiquattuortrezentiquinquatrezentisestrezentiseptentrezentioktotrezentinoventrezentidezitrezentiundezitrezentiduodezitrezentitredezitrezentiquattuordezitrezentiquindezitrezentisedezitrezentiseptendezitrezentioktodezitrezentinovendezitrezentivigintitrezentiunvigintitrezentiduovigintitrezentitresvigintitrezentiquattuorvigintitrezentiquinquavigintitrezentisesvigintitrezentiseptemvigintitrezentioktovigintitrezentinovemvigintitrezentitrigintatrezentiuntrigintatrezentiduotrigintatrezentitrestrigintatrezentiquattuortrigintatrezentiquinquatrigintatrezentisestrigintatrezentiseptentrigintatrezentioktotrigintatrezentinoventrigintatrezentiquadragintatrezentiunquadragintatrezentiduoquadragintatrezentitresquadragintatrezentiquattuorquadragintatrezentiquinquaquadragintatrezentisesquadragintatrezentiseptenquadragintatrezentioktoquadragintatrezentinovenquadragintatrezentiquinquagintatrezentiunquinquagintatrezentiduoquinquagintatrezentitresquinquagintatrezentiquattuorquinquagintatrezentiquinquaquinquagintatrezentisesquinquagintatrezentiseptenquinquagintatrezentioktoquinquagintatrezentinovenquinquagintatrezentisexagintatrezentiunsexagintatrezentiduosexagintatrezentitresexagintatrezentiquattuorsexagintatrezentiquinquasexagintatrezentisesexagintatrezentiseptensexagintatrezentioktosexagintatrezentinovensexagintatrezentiseptuagintatrezentiunseptuagintatrezentiduoseptuagintatrezentitreseptuagintatrezentiquattuorseptuagintatrezentiquinquaseptuagintatrezentiseseptuagintatrezentiseptenseptuagintatrezentioktoseptuagintatrezentinovenseptuagintatrezentioktogintatrezentiunoktogintatrezentiduooktogintatrezentitreoktogintatrezentiquattuoroktogintatrezentiquinquaoktogintatrezentisexoktogintatrezentiseptemoktogintatrezentioktooktogintatrezentinovemoktogintatrezentinonagintatrezentiunnonagintatrezentiduononagintatrezentitrenonagintatrezentiquattuornonagintatrezentiquinquanonagintatrezentisenonagintatrezentiseptenonagintatrezentioktononagintatrezentinovenonagintatrezentiquadringentiunquadringentiduoquadringentitresquadringentiquattuorquadringentiquinquaquadringentisesquadringentiseptenquadringentioktoquadringentinovenquadringentideziquadringentiundeziquadringentiduodeziquadringentitredeziquadringentiquattuordeziquadringentiquindeziquadringentisedeziquadringentiseptendeziquadringentioktodeziquadringentinovendeziquadringentivigintiquadringentiunvigintiquadringentiduovigintiquadringentitresvigintiquadringentiquattuorvigintiquadringentiquinquavigintiquadringentisesvigintiquadringentiseptemvigintiquadringentioktovigintiquadringentinovemvigintiquadringentitrigintaquadringentiuntrigintaquadringentiduotrigintaquadringentitrestrigintaquadringentiquattuortrigintaquadringentiquinquatrigintaquadringentisestrigintaquadringentiseptentrigintaquadringentioktotrigintaquadringentinoventrigintaquadringentiquadragintaquadringentiunquadragintaquadringentiduoquadragintaquadringentitresquadragintaquadringentiquattuorquadragintaquadringentiquinquaquadragintaquadringentisesquadragintaquadringentiseptenquadragintaquadringentioktoquadragintaquadringentinovenquadragintaquadringentiquinquagintaquadringentiunquinquagintaquadringentiduoquinquagintaquadringentitresquinquagintaquadringentiquattuorquinquagintaquadringentiquinquaquinquagintaquadringentisesquinquagintaquadringentiseptenquinquagintaquadringentioktoquinquagintaquadringentinovenquinquagintaquadringentisexagintaquadringentiunsexagintaquadringentiduosexagintaquadringentitresexagintaquadringentiquattuorsexagintaquadringentiquinquasexagintaquadringentisesexagintaquadringentiseptensexagintaquadringentioktosexagintaquadringentinovensexagintaquadringentiseptuagintaquadringentiunseptuagintaquadringentiduoseptuagintaquadringentitreseptuagintaquadringentiquattuorseptuagintaquadringentiquinquaseptuagintaquadringentiseseptuagintaquadringentiseptenseptuagintaquadringentioktoseptuagintaquadringentinovenseptuagintaquadringentioktogintaquadringentiunoktogintaquadringentiduooktogintaquadringentitreoktogintaquadringentiquattuoroktogintaquadringentiquinquaoktogintaquadringentisexoktogintaquadringentiseptemoktogintaquadringentioktooktogintaquadringentinovemoktogintaquadringentinonagintaquadringentiunnonagintaquadringentiduononagintaquadringentitrenonagintaquadringentiquattuornonagintaquadringentiquinquanonagintaquadringentisenonagintaquadringentiseptenonagintaquadringentioktononagintaquadringentinovenonagintaquadringentiquingentiunquingentiduoquingentitresquingentiquattuorquingentiquinquaquingentisesquingentiseptenquingentioktoquingentinovenquingentideziquingentiundeziquingentiduodeziquingentitredeziquingentiquattuordeziquingentiquindeziquingentisedeziquingentiseptendeziquingentioktodeziquingentinovendeziquingentivigintiquingentiunvigintiquingentiduovigintiquingentitresvigintiquingentiquattuorvigintiquingentiquinquavigintiquingentisesvigintiquingentiseptemvigintiquingentioktovigintiquingentinovemvigintiquingentitrigintaquingentiuntrigintaquingentiduotrigintaquingentitrestrigintaquingentiquattuortrigintaquingentiquinquatrigintaquingentisestrigintaquingentiseptentrigintaquingentioktotrigintaquingentinoventrigintaquingentiquadragintaquingentiunquadragintaquingentiduoquadragintaquingentitresquadragintaquingentiquattuorquadragintaquingentiquinquaquadragintaquingentisesquadragintaquingentiseptenquadragintaquingentioktoquadragintaquingentinovenquadragintaquingentiquinquagintaquingentiunquinquagintaquingentiduoquinquagintaquingentitresquinquagintaquingentiquattuorquinquagintaquingentiquinquaquinquagintaquingentisesquinquagintaquingentiseptenquinquagintaquingentioktoquinquagintaquingentinovenquinquagintaquingentisexagintaquingentiunsexagintaquingentiduosexagintaquingentitresexagintaquingentiquattuorsexagintaquingentiquinquasexagintaquingentisesexagintaquingentiseptensexagintaquingentioktosexagintaquingentinovensexagintaquingentiseptuagintaquingentiunseptuagintaquingentiduoseptuagintaquingentitreseptuagintaquingentiquattuorseptuagintaquingentiquinquaseptuagintaquingentiseseptuagintaquingentiseptenseptuagintaquingentioktoseptuagintaquingentinovenseptuagintaquingentioktogintaquingentiunoktogintaquingentiduooktogintaquingentitreoktogintaquingentiquattuoroktogintaquingentiquinquaoktogintaquingentisexoktogintaquingentiseptemoktogintaquingentioktooktogintaquingentinovemoktogintaquingentinonagintaquingentiunnonagintaquingentiduononagintaquingentitrenonagintaquingentiquattuornonagintaquingentiquinquanonagintaquingentisenonagintaquingentiseptenonagintaquingentioktononagintaquingentinovenonagintaquingentiseszentiunseszentiduoseszentitreseszentiquattuorseszentiquinquaseszentiseseszentiseptenseszentioktoseszentinovenseszentideziseszentiundeziseszentiduodeziseszentitredeziseszentiquattuordeziseszentiquindeziseszentisedeziseszentiseptendeziseszentioktodeziseszentinovendeziseszentivigintiseszentiunvigintiseszentiduovigintiseszentitresvigintiseszentiquattuorvigintiseszentiquinquavigintiseszentisesvigintiseszentiseptemvigintiseszentioktovigintiseszentinovemvigintiseszentitrigintaseszentiuntrigintaseszentiduotrigintaseszentitrestrigintaseszentiquattuortrigintaseszentiquinquatrigintaseszentisestrigintaseszentiseptentrigintaseszentioktotrigintaseszentinoventrigintaseszentiquadragintaseszentiunquadragintaseszentiduoquadragintaseszentitresquadragintaseszentiquattuorquadragintaseszentiquinquaquadragintaseszentisesquadragintaseszentiseptenquadragintaseszentioktoquadragintaseszentinovenquadragintaseszentiquinquagintaseszentiunquinquagintaseszentiduoquinquagintaseszentitresquinquagintaseszentiquattuorquinquagintaseszentiquinquaquinquagintaseszentisesquinquagintaseszentiseptenquinquagintaseszentioktoquinquagintaseszentinovenquinquagintaseszentisexagintaseszentiunsexagintaseszentiduosexagintaseszentitresexagintaseszentiquattuorsexagintaseszentiquinquasexagintaseszentisesexagintaseszentiseptensexagintaseszentioktosexagintaseszentinovensexagintaseszentiseptuagintaseszentiunseptuagintaseszentiduoseptuagintaseszentitreseptuagintaseszentiquattuorseptuagintaseszentiquinquaseptuagintaseszentiseseptuagintaseszentiseptenseptuagintaseszentioktoseptuagintaseszentinovenseptuagintaseszentioktogintaseszentiunoktogintaseszentiduooktogintaseszentitreoktogintaseszentiquattuoroktogintaseszentiquinquaoktogintaseszentisexoktogintaseszentiseptemoktogintaseszentioktooktogintaseszentinovemoktogintaseszentinonagintaseszentiunnonagintaseszentiduononagintaseszentitrenonagintaseszentiquattuornonagintaseszentiquinquanonagintaseszentisenonagintaseszentiseptenonagintaseszentioktononagintaseszentinovenonagintaseszentiseptingentiunseptingentiduoseptingentitreseptingentiquattuorseptingentiquinquaseptingentiseseptingentiseptenseptingentioktoseptingentinovenseptingentideziseptingentiundeziseptingentiduodeziseptingentitredeziseptingentiquattuordeziseptingentiquindeziseptingentisedeziseptingentiseptendeziseptingentioktodeziseptingentinovendeziseptingentivigintiseptingentiunvigintiseptingentiduovigintiseptingentitresvigintiseptingentiquattuorvigintiseptingentiquinquavigintiseptingentisesvigintiseptingentiseptemvigintiseptingentioktovigintiseptingentinovemvigintiseptingentitrigintaseptingentiuntrigintaseptingentiduotrigintaseptingentitrestrigintaseptingentiquattuortrigintaseptingentiquinquatrigintaseptingentisestrigintaseptingentiseptentrigintaseptingentioktotrigintaseptingentinoventrigintaseptingentiquadragintaseptingentiunquadragintaseptingentiduoquadragintaseptingentitresquadragintaseptingentiquattuorquadragintaseptingentiquinquaquadragintaseptingentisesquadragintaseptingentiseptenquadragintaseptingentioktoquadragintaseptingentinovenquadragintaseptingentiquinquagintaseptingentiunquinquagintaseptingentiduoquinquagintaseptingentitresquinquagintaseptingentiquattuorquinquagintaseptingentiquinquaquinquagintaseptingentisesquinquagintaseptingentiseptenquinquagintaseptingentioktoquinquagintaseptingentinovenquinquagintaseptingentisexagintaseptingentiunsexagintaseptingentiduosexagintaseptingentitresexagintaseptingentiquattuorsexagintaseptingentiquinquasexagintaseptingentisesexagintaseptingentiseptensexagintaseptingentioktosexagintaseptingentinovensexagintaseptingentiseptuagintaseptingentiunseptuagintaseptingentiduoseptuagintaseptingentitreseptuagintaseptingentiquattuorseptuagintaseptingentiquinquaseptuagintaseptingentiseseptuagintaseptingentiseptenseptuagintaseptingentioktoseptuagintaseptingentinovenseptuagintaseptingentioktogintaseptingentiunoktogintaseptingentiduooktogintaseptingentitreoktogintaseptingentiquattuoroktogintaseptingentiquinquaoktogintaseptingentisexoktogintaseptingentiseptemoktogintaseptingentioktooktogintaseptingentinovemoktogintaseptingentinonagintaseptingentiunnonagintaseptingentiduononagintaseptingentitrenonagintaseptingentiquattuornonagintaseptingentiquinquanonagintaseptingentisenonagintaseptingentiseptenonagintaseptingentioktononagintaseptingentinovenonagintaseptingentioktingentiunoktingentiduooktingentitreoktingentiquattuoroktingentiquinquaoktingentisexoktingentiseptemoktingentioktooktingentinovemoktingentidezioktingentiundezioktingentiduodezioktingentitredezioktingentiquattuordezioktingentiquindezioktingentisedezioktingentiseptendezioktingentioktodezioktingentinovendezioktingentivigintioktingentiunvigintioktingentiduovigintioktingentitresvigintioktingentiquattuorvigintioktingentiquinquavigintioktingentisesvigintioktingentiseptemvigintioktingentioktovigintioktingentinovemvigintioktingentitrigintaoktingentiuntrigintaoktingentiduotrigintaoktingentitrestrigintaoktingentiquattuortrigintaoktingentiquinquatrigintaoktingentisestrigintaoktingentiseptentrigintaoktingentioktotrigintaoktingentinoventrigintaoktingentiquadragintaoktingentiunquadragintaoktingentiduoquadragintaoktingentitresquadragintaoktingentiquattuorquadragintaoktingentiquinquaquadragintaoktingentisesquadragintaoktingentiseptenquadragintaoktingentioktoquadragintaoktingentinovenquadragintaoktingentiquinquagintaoktingentiunquinquagintaoktingentiduoquinquagintaoktingentitresquinquagintaoktingentiquattuorquinquagintaoktingentiquinquaquinquagintaoktingentisesquinquagintaoktingentiseptenquinquagintaoktingentioktoquinquagintaoktingentinovenquinquagintaoktingentisexagintaoktingentiunsexagintaoktingentiduosexagintaoktingentitresexagintaoktingentiquattuorsexagintaoktingentiquinquasexagintaoktingentisesexagintaoktingentiseptensexagintaoktingentioktosexagintaoktingentinovensexagintaoktingentiseptuagintaoktingentiunseptuagintaoktingentiduoseptuagintaoktingentitreseptuagintaoktingentiquattuorseptuagintaoktingentiquinquaseptuagintaoktingentiseseptuagintaoktingentiseptenseptuagintaoktingentioktoseptuagintaoktingentinovenseptuagintaoktingentioktogintaoktingentiunoktogintaoktingentiduooktogintaoktingentitreoktogintaoktingentiquattuoroktogintaoktingentiquinquaoktogintaoktingentisexoktogintaoktingentiseptemoktogintaoktingentioktooktogintaoktingentinovemoktogintaoktingentinonagintaoktingentiunnonagintaoktingentiduononagintaoktingentitrenonagintaoktingentiquattuornonagintaoktingentiquinquanonagintaoktingentisenonagintaoktingentiseptenonagintaoktingentioktononagintaoktingentinovenonagintaoktingentinongentiunnongentiduonongentitrenongentiquattuornongentiquinquanongentisenongentiseptenongentioktonongentinovenongentidezinongentiundezinongentiduodezinongentitredezinongentiquattuordezinongentiquindezinongentisedezinongentiseptendezinongentioktodezinongentinovendezinongentivigintinongentiunvigintinongentiduovigintinongentitresvigintinongentiquattuorvigintinongentiquinquavigintinongentisesvigintinongentiseptemvigintinongentioktovigintinongentinovemvigintinongentitrigintanongentiuntrigintanongentiduotrigintanongentitrestrigintanongentiquattuortrigintanongentiquinquatrigintanongentisestrigintanongentiseptentrigintanongentioktotrigintanongentinoventrigintanongentiquadragintanongentiunquadragintanongentiduoquadragintanongentitresquadragintanongentiquattuorquadragintanongentiquinquaquadragintanongentisesquadragintanongentiseptenquadragintanongentioktoquadragintanongentinovenquadragintanongentiquinquagintanongentiunquinquagintanongentiduoquinquagintanongentitresquinquagintanongentiquattuorquinquagintanongentiquinquaquinquagintanongentisesquinquagintanongentiseptenquinquagintanongentioktoquinquagintanongentinovenquinquagintanongentisexagintanongentiunsexagintanongentiduosexagintanongentitresexagintanongentiquattuorsexagintanongentiquinquasexagintanongentisesexagintanongentiseptensexagintanongentioktosexagintanongentinovensexagintanongentiseptuagintanongentiunseptuagintanongentiduoseptuagintanongentitreseptuagintanongentiquattuorseptuagintanongentiquinquaseptuagintanongentiseseptuagintanongentiseptenseptuagintanongentioktoseptuagintanongentinovenseptuagintanongentioktogintanongentiunoktogintanongentiduooktogintanongentitreoktogintanongentiquattuoroktogintanongentiquinquaoktogintanongentisexoktogintanongentiseptemoktogintanongentioktooktogintanongentinovemoktogintanongentinonagintanongentiunnonagintanongentiduononagintanongentitrenonagintanongentiquattuornonagintanongentiquinquanonagintanongentisenonagintanongentiseptenonagintanongentioktononagintanongentinovenonagintanongentinimibitriquadriquintisextiseptioktinonideziundeziduodezitredeziquattuordeziquindezisedeziseptendeziduodevigintiundevigintivigintiunvigintiduovigintitresvigintiquattuorvigintiquinquavigintisesvigintiseptemvigintiduodetrigintiundetrigintitrigintiuntrigintiduotrigintitrestrigintiquattuortrigintiquinquatrigintisestrigintiseptentrigintiduodequadragintiundequadragintiquadragintiunquadragintiduoquadragintitresquadragintiquattuorquadragintiquinquaquadragintisesquadragintiseptenquadragintiduodequinquagintiundequinquagintiquinquagintiunquinquagintiduoquinquagintitresquinquagintiquattuorquinquagintiquinquaquinquagintisesquinquagintiseptenquinquagintiduodesexagintiundesexagintisexagintiunsexagintiduosexagintitresexagintiquattuorsexagintiquinquasexagintisesexagintiseptensexagintiduodeseptuagintiundeseptuagintiseptuagintiunseptuagintiduoseptuagintitreseptuagintiquattuorseptuagintiquinquaseptuagintiseseptuagintiseptenseptuagintiduodeoctogintiundeoctogintioktogintiunoktogintiduooktogintitreoktogintiquattuoroktogintiquinquaoktogintisexoktogintiseptemoktogintiduodenonagintiundenonagintinonagintiunnonagintiduononagintitrenonagintiquattuornonagintiquinquanonagintisenonagintiseptenonagintiduodecentiundecentizentiunzentiduozentitreszentiquattuorzentiquinquazentisexzentiseptenzentioktozentinovenzentidezizentiundezizentiduodezizentitredezizentiquattuordezizentiquindezizentisedezizentiseptendezizentioktodezizentinovendezizentivigintizentiunvigintizentiduovigintizentitresvigintizentiquattuorvigintizentiquinquavigintizentisesvigintizentiseptemvigintizentioktovigintizentinovemvigintizentitrigintazentiuntrigintazentiduotrigintazentitrestrigintazentiquattuortrigintazentiquinquatrigintazentisestrigintazentiseptentrigintazentioktotrigintazentinoventrigintazentiquadragintazentiunquadragintazentiduoquadragintazentitresquadragintazentiquattuorquadragintazentiquinquaquadragintazentisesquadragintazentiseptenquadragintazentioktoquadragintazentinovenquadragintazentiquinquagintazentiunquinquagintazentiduoquinquagintazentitresquinquagintazentiquattuorquinquagintazentiquinquaquinquagintazentisesquinquagintazentiseptenquinquagintazentioktoquinquagintazentinovenquinquagintazentisexagintazentiunsexagintazentiduosexagintazentitresexagintazentiquattuorsexagintazentiquinquasexagintazentisesexagintazentiseptensexagintazentioktosexagintazentinovensexagintazentiseptuagintazentiunseptuagintazentiduoseptuagintazentitreseptuagintazentiquattuorseptuagintazentiquinquaseptuagintazentiseseptuagintazentiseptenseptuagintazentioktoseptuagintazentinovenseptuagintazentioktogintazentiunoktogintazentiduooktogintazentitreoktogintazentiquattuoroktogintazentiquinquaoktogintazentisexoktogintazentiseptemoktogintazentioktooktogintazentinovemoktogintazentinonagintazentiunnonagintazentiduononagintazentitrenonagintazentiquattuornonagintazentiquinquanonagintazentisenonagintazentiseptenonagintazentioktononagintazentinovenonagintazentiduzentiunduzentiduoduzentitreduzentiquattuorduzentiquinquaduzentiseduzentiseptenduzentioktoduzentinovenduzentideziduzentiundeziduzentiduodeziduzentitredeziduzentiquattuordeziduzentiquindeziduzentisedeziduzentiseptendeziduzentioktodeziduzentinovendeziduzentivigintiduzentiunvigintiduzentiduovigintiduzentitresvigintiduzentiquattuorvigintiduzentiquinquavigintiduzentisesvigintiduzentiseptemvigintiduzentioktovigintiduzentinovemvigintiduzentitrigintaduzentiuntrigintaduzentiduotrigintaduzentitrestrigintaduzentiquattuortrigintaduzentiquinquatrigintaduzentisestrigintaduzentiseptentrigintaduzentioktotrigintaduzentinoventrigintaduzentiquadragintaduzentiunquadragintaduzentiduoquadragintaduzentitresquadragintaduzentiquattuorquadragintaduzentiquinquaquadragintaduzentisesquadragintaduzentiseptenquadragintaduzentioktoquadragintaduzentinovenquadragintaduzentiquinquagintaduzentiunquinquagintaduzentiduoquinquagintaduzentitresquinquagintaduzentiquattuorquinquagintaduzentiquinquaquinquagintaduzentisesquinquagintaduzentiseptenquinquagintaduzentioktoquinquagintaduzentinovenquinquagintaduzentisexagintaduzentiunsexagintaduzentiduosexagintaduzentitresexagintaduzentiquattuorsexagintaduzentiquinquasexagintaduzentisesexagintaduzentiseptensexagintaduzentioktosexagintaduzentinovensexagintaduzentiseptuagintaduzentiunseptuagintaduzentiduoseptuagintaduzentitreseptuagintaduzentiquattuorseptuagintaduzentiquinquaseptuagintaduzentiseseptuagintaduzentiseptenseptuagintaduzentioktoseptuagintaduzentinovenseptuagintaduzentioktogintaduzentiunoktogintaduzentiduooktogintaduzentitreoktogintaduzentiquattuoroktogintaduzentiquinquaoktogintaduzentisexoktogintaduzentiseptemoktogintaduzentioktooktogintaduzentinovemoktogintaduzentinonagintaduzentiunnonagintaduzentiduononagintaduzentitrenonagintaduzentiquattuornonagintaduzentiquinquanonagintaduzentisenonagintaduzentiseptenonagintaduzentioktononagintaduzentinovenonagintaduzentitrezentiuntrezentiduotrezentitrestrezentiquattuortrezentiquinquatrezentisestrezentiseptentrezentioktotrezentinoventrezentidezitrezentiundezitrezentiduodezitrezentitredezitrezentiquattuordezitrezentiquindezitrezentisedezitrezentiseptendezitrezentioktodezitrezentinovendezitrezentivigintitrezentiunvigintitrezentiduovigintitrezentitresvigintitrezentiquattuorvigintitrezentiquinquavigintitrezentisesvigintitrezentiseptemvigintitrezentioktovigintitrezentinovemvigintitrezentitrigintatrezentiuntrigintatrezentiduotrigintatrezentitrestrigintatrezentiquattuortrigintatrezentiquinquatrigintatrezentisestrigintatrezentiseptentrigintatrezentioktotrigintatrezentinoventrigintatrezentiquadragintatrezentiunquadragintatrezentiduoquadragintatrezentitresquadragintatrezentiquattuorquadragintatrezentiquinquaquadragintatrezentisesquadragintatrezentiseptenquadragintatrezentioktoquadragintatrezentinovenquadragintatrezentiquinquagintatrezentiunquinquagintatrezentiduoquinquagintatrezentitresquinquagintatrezentiquattuorquinquagintatrezentiquinquaquinquagintatrezentisesquinquagintatrezentiseptenquinquagintatrezentioktoquinquagintatrezentinovenquinquagintatrezentisexagintatrezentiunsexagintatrezentiduosexagintatrezentitresexagintatrezentiquattuorsexagintatrezentiquinquasexagintatrezentisesexagintatrezentiseptensexagintatrezentioktosexagintatrezentinovensexagintatrezentiseptuagintatrezentiunseptuagintatrezentiduoseptuagintatrezentitreseptuagintatrezentiquattuorseptuagintatrezentiquinquaseptuagintatrezentiseseptuagintatrezentiseptenseptuagintatrezentioktoseptuagintatrezentinovenseptuagintatrezentioktogintatrezentiunoktogintatrezentiduooktogintatrezentitreoktogintatrezentiquattuoroktogintatrezentiquinquaoktogintatrezentisexoktogintatrezentiseptemoktogintatrezentioktooktogintatrezentinovemoktogintatrezentinonagintatrezentiunnonagintatrezentiduononagintatrezentitrenonagintatrezentiquattuornonagintatrezentiquinquanonagintatrezentisenonagintatrezentiseptenonagintatrezentioktononagintatrezentinovenonagintatrezentiquadringentiunquadringentiduoquadringentitresquadringentiquattuorquadringentiquinquaquadringentisesquadringentiseptenquadringentioktoquadringentinovenquadringentideziquadringentiundeziquadringentiduodeziquadringentitredeziquadringentiquattuordeziquadringentiquindeziquadringentisedeziquadringentiseptendeziquadringentioktodeziquadringentinovendeziquadringentivigintiquadringentiunvigintiquadringentiduovigintiquadringentitresvigintiquadringentiquattuorvigintiquadringentiquinquavigintiquadringentisesvigintiquadringentiseptemvigintiquadringentioktovigintiquadringentinovemvigintiquadringentitrigintaquadringentiuntrigintaquadringentiduotrigintaquadringentitrestrigintaquadringentiquattuortrigintaquadringentiquinquatrigintaquadringentisestrigintaquadringentiseptentrigintaquadringentioktotrigintaquadringentinoventrigintaquadringentiquadragintaquadringentiunquadragintaquadringentiduoquadragintaquadringentitresquadragintaquadringentiquattuorquadragintaquadringentiquinquaquadragintaquadringentisesquadragintaquadringentiseptenquadragintaquadringentioktoquadragintaquadringentinovenquadragintaquadringentiquinquagintaquadringentiunquinquagintaquadringentiduoquinquagintaquadringentitresquinquagintaquadringentiquattuorquinquagintaquadringentiquinquaquinquagintaquadringentisesquinquagintaquadringentiseptenquinquagintaquadringentioktoquinquagintaquadringentinovenquinquagintaquadringentisexagintaquadringentiunsexagintaquadringentiduosexagintaquadringentitresexagintaquadringentiquattuorsexagintaquadringentiquinquasexagintaquadringentisesexagintaquadringentiseptensexagintaquadringentioktosexagintaquadringentinovensexagintaquadringentiseptuagintaquadringentiunseptuagintaquadringentiduoseptuagintaquadringentitreseptuagintaquadringentiquattuorseptuagintaquadringentiquinquaseptuagintaquadringentiseseptuagintaquadringentiseptenseptuagintaquadringentioktoseptuagintaquadringentinovenseptuagintaquadringentioktogintaquadringentiunoktogintaquadringentiduooktogintaquadringentitreoktogintaquadringentiquattuoroktogintaquadringentiquinquaoktogintaquadringentisexoktogintaquadringentiseptemoktogintaquadringentioktooktogintaquadringentinovemoktogintaquadringentinonagintaquadringentiunnonagintaquadringentiduononagintaquadringentitrenonagintaquadringentiquattuornonagintaquadringentiquinquanonagintaquadringentisenonagintaquadringentiseptenonagintaquadringentioktononagintaquadringentinovenonagintaquadringentiquingentiunquingentiduoquingentitresquingentiquattuorquingentiquinquaquingentisesquingentiseptenquingentioktoquingentinovenquingentideziquingentiundeziquingentiduodeziquingentitredeziquingentiquattuordeziquingentiquindeziquingentisedeziquingentiseptendeziquingentioktodeziquingentinovendeziquingentivigintiquingentiunvigintiquingentiduovigintiquingentitresvigintiquingentiquattuorvigintiquingentiquinquavigintiquingentisesvigintiquingentiseptemvigintiquingentioktovigintiquingentinovemvigintiquingentitrigintaquingentiuntrigintaquingentiduotrigintaquingentitrestrigintaquingentiquattuortrigintaquingentiquinquatrigintaquingentisestrigintaquingentiseptentrigintaquingentioktotrigintaquingentinoventrigintaquingentiquadragintaquingentiunquadragintaquingentiduoquadragintaquingentitresquadragintaquingentiquattuorquadragintaquingentiquinquaquadragintaquingentisesquadragintaquingentiseptenquadragintaquingentioktoquadragintaquingentinovenquadragintaquingentiquinquagintaquingentiunquinquagintaquingentiduoquinquagintaquingentitresquinquagintaquingentiquattuorquinquagintaquingentiquinquaquinquagintaquingentisesquinquagintaquingentiseptenquinquagintaquingentioktoquinquagintaquingentinovenquinquagintaquingentisexagintaquingentiunsexagintaquingentiduosexagintaquingentitresexagintaquingentiquattuorsexagintaquingentiquinquasexagintaquingentisesexagintaquingentiseptensexagintaquingentioktosexagintaquingentinovensexagintaquingentiseptuagintaquingentiunseptuagintaquingentiduoseptuagintaquingentitreseptuagintaquingentiquattuorseptuagintaquingentiquinquaseptuagintaquingentiseseptuagintaquingentiseptenseptuagintaquingentioktoseptuagintaquingentinovenseptuagintaquingentioktogintaquingentiunoktogintaquingentiduooktogintaquingentitreoktogintaquingentiquattuoroktogintaquingentiquinquaoktogintaquingentisexoktogintaquingentiseptemoktogintaquingentioktooktogintaquingentinovemoktogintaquingentinonagintaquingentiunnonagintaquingentiduononagintaquingentitrenonagintaquingentiquattuornonagintaquingentiquinquanonagintaquingentisenonagintaquingentiseptenonagintaquingentioktononagintaquingentinovenonagintaquingentiseszentiunseszentiduoseszentitreseszentiquattuorseszentiquinquaseszentiseseszentiseptenseszentioktoseszentinovenseszentideziseszentiundeziseszentiduodeziseszentitredeziseszentiquattuordeziseszentiquindeziseszentisedeziseszentiseptendeziseszentioktodeziseszentinovendeziseszentivigintiseszentiunvigintiseszentiduovigintiseszentitresvigintiseszentiquattuorvigintiseszentiquinquavigintiseszentisesvigintiseszentiseptemvigintiseszentioktovigintiseszentinovemvigintiseszentitrigintaseszentiuntrigintaseszentiduotrigintaseszentitrestrigintaseszentiquattuortrigintaseszentiquinquatrigintaseszentisestrigintaseszentiseptentrigintaseszentioktotrigintaseszentinoventrigintaseszentiquadragintaseszentiunquadragintaseszentiduoquadragintaseszentitresquadragintaseszentiquattuorquadragintaseszentiquinquaquadragintaseszentisesquadragintaseszentiseptenquadragintaseszentioktoquadragintaseszentinovenquadragintaseszentiquinquagintaseszentiunquinquagintaseszentiduoquinquagintaseszentitresquinquagintaseszentiquattuorquinquagintaseszentiquinquaquinquagintaseszentisesquinquagintaseszentiseptenquinquagintaseszentioktoquinquagintaseszentinovenquinquagintaseszentisexagintaseszentiunsexagintaseszentiduosexagintaseszentitresexagintaseszentiquattuorsexagintaseszentiquinquasexagintaseszentisesexagintaseszentiseptensexagintaseszentioktosexagintaseszentinovensexagintaseszentiseptuagintaseszentiunseptuagintaseszentiduoseptuagintaseszentitreseptuagintaseszentiquattuorseptuagintaseszentiquinquaseptuagintaseszentiseseptuagintaseszentiseptenseptuagintaseszentioktoseptuagintaseszentinovenseptuagintaseszentioktogintaseszentiunoktogintaseszentiduooktogintaseszentitreoktogintaseszentiquattuoroktogintaseszentiquinquaoktogintaseszentisexoktogintaseszentiseptemoktogintaseszentioktooktogintaseszentinovemoktogintaseszentinonagintaseszentiunnonagintaseszentiduononagintaseszentitrenonagintaseszentiquattuornonagintaseszentiquinquanonagintaseszentisenonagintaseszentiseptenonagintaseszentioktononagintaseszentinovenonagintaseszentiseptingentiunseptingentiduoseptingentitreseptingentiquattuorseptingentiquinquaseptingentiseseptingentiseptenseptingentioktoseptingentinovenseptingentideziseptingentiundeziseptingentiduodeziseptingentitredeziseptingentiquattuordeziseptingentiquindeziseptingentisedeziseptingentiseptendeziseptingentioktodeziseptingentinovendeziseptingentivigintiseptingentiunvigintiseptingentiduovigintiseptingentitresvigintiseptingentiquattuorvigintiseptingentiquinquavigintiseptingentisesvigintiseptingentiseptemvigintiseptingentioktovigintiseptingentinovemvigintiseptingentitrigintaseptingentiuntrigintaseptingentiduotrigintaseptingentitrestrigintaseptingentiquattuortrigintaseptingentiquinquatrigintaseptingentisestrigintaseptingentiseptentrigintaseptingentioktotrigintaseptingentinoventrigintaseptingentiquadragintaseptingentiunquadragintaseptingentiduoquadragintaseptingentitresquadragintaseptingentiquattuorquadragintaseptingentiquinquaquadragintaseptingentisesquadragintaseptingentiseptenquadragintaseptingentioktoquadragintaseptingentinovenquadragintaseptingentiquinquagintaseptingentiunquinquagintaseptingentiduoquinquagintaseptingentitresquinquagintaseptingentiquattuorquinquagintaseptingentiquinquaquinquagintaseptingentisesquinquagintaseptingentiseptenquinquagintaseptingentioktoquinquagintaseptingentinovenquinquagintaseptingentisexagintaseptingentiunsexagintaseptingentiduosexagintaseptingentitresexagintaseptingentiquattuorsexagintaseptingentiquinquasexagintaseptingentisesexagintaseptingentiseptensexagintaseptingentioktosexagintaseptingentinovensexagintaseptingentiseptuagintaseptingentiunseptuagintaseptingentiduoseptuagintaseptingentitreseptuagintaseptingentiquattuorseptuagintaseptingentiquinquaseptuagintaseptingentiseseptuagintaseptingentiseptenseptuagintaseptingentioktoseptuagintaseptingentinovenseptuagintaseptingentioktogintaseptingentiunoktogintaseptingentiduooktogintaseptingentitreoktogintaseptingentiquattuoroktogintaseptingentiquinquaoktogintaseptingentisexoktogintaseptingentiseptemoktogintaseptingentioktooktogintaseptingentinovemoktogintaseptingentinonagintaseptingentiunnonagintaseptingentiduononagintaseptingentitrenonagintaseptingentiquattuornonagintaseptingentiquinquanonagintaseptingentisenonagintaseptingentiseptenonagintaseptingentioktononagintaseptingentinovenonagintaseptingentioktingentiunoktingentiduooktingentitreoktingentiquattuoroktingentiquinquaoktingentisexoktingentiseptemoktingentioktooktingentinovemoktingentidezioktingentiundezioktingentiduodezioktingentitredezioktingentiquattuordezioktingentiquindezioktingentisedezioktingentiseptendezioktingentioktodezioktingentinovendezioktingentivigintioktingentiunvigintioktingentiduovigintioktingentitresvigintioktingentiquattuorvigintioktingentiquinquavigintioktingentisesvigintioktingentiseptemvigintioktingentioktovigintioktingentinovemvigintioktingentitrigintaoktingentiuntrigintaoktingentiduotrigintaoktingentitrestrigintaoktingentiquattuortrigintaoktingentiquinquatrigintaoktingentisestrigintaoktingentiseptentrigintaoktingentioktotrigintaoktingentinoventrigintaoktingentiquadragintaoktingentiunquadragintaoktingentiduoquadragintaoktingentitresquadragintaoktingentiquattuorquadragintaoktingentiquinquaquadragintaoktingentisesquadragintaoktingentiseptenquadragintaoktingentioktoquadragintaoktingentinovenquadragintaoktingentiquinquagintaoktingentiunquinquagintaoktingentiduoquinquagintaoktingentitresquinquagintaoktingentiquattuorquinquagintaoktingentiquinquaquinquagintaoktingentisesquinquagintaoktingentiseptenquinquagintaoktingentioktoquinquagintaoktingentinovenquinquagintaoktingentisexagintaoktingentiunsexagintaoktingentiduosexagintaoktingentitresexagintaoktingentiquattuorsexagintaoktingentiquinquasexagintaoktingentisesexagintaoktingentiseptensexagintaoktingentioktosexagintaoktingentinovensexagintaoktingentiseptuagintaoktingentiunseptuagintaoktingentiduoseptuagintaoktingentitreseptuagintaoktingentiquattuorseptuagintaoktingentiquinquaseptuagintaoktingentiseseptuagintaoktingentiseptenseptuagintaoktingentioktoseptuagintaoktingentinovenseptuagintaoktingentioktogintaoktingentiunoktogintaoktingentiduooktogintaoktingentitreoktogintaoktingentiquattuoroktogintaoktingentiquinquaoktogintaoktingentisexoktogintaoktingentiseptemoktogintaoktingentioktooktogintaoktingentinovemoktogintaoktingentinonagintaoktingentiunnonagintaoktingentiduononagintaoktingentitrenonagintaoktingentiquattuornonagintaoktingentiquinquanonagintaoktingentisenonagintaoktingentiseptenonagintaoktingentioktononagintaoktingentinovenonagintaoktingentinongentiunnongentiduonongentitrenongentiquattuornongentiquinquanongentisenongentiseptenongentioktonongentinovenongentidezinongentiundezinongentiduodezinongentitredezinongentiquattuordezinongentiquindezinongentisedezinongentiseptendezinongentioktodezinongentinovendezinongentivigintinongentiunvigintinongentiduovigintinongentitresvigintinongentiquattuorvigintinongentiquinquavigintinongentisesvigintinongentiseptemvigintinongentioktovigintinongentinovemvigintinongentitrigintanongentiuntrigintanongentiduotrigintanongentitrestrigintanongentiquattuortrigintanongentiquinquatrigintanongentisestrigintanongentiseptentrigintanongentioktotrigintanongentinoventrigintanongentiquadragintanongentiunquadragintanongentiduoquadragintanongentitresquadragintanongentiquattuorquadragintanongentiquinquaquadragintanongentisesquadragintanongentiseptenquadragintanongentioktoquadragintanongentinovenquadragintanongentiquinquagintanongentiunquinquagintanongentiduoquinquagintanongentitresquinquagintanongentiquattuorquinquagintanongentiquinquaquinquagintanongentisesquinquagintanongentiseptenquinquagintanongentioktoquinquagintanongentinovenquinquagintanongentisexagintanongentiunsexagintanongentiduosexagintanongentitresexagintanongentiquattuorsexagintanongentiquinquasexagintanongentisesexagintanongentiseptensexagintanongentioktosexagintanongentinovensexagintanongentiseptuagintanongentiunseptuagintanongentiduoseptuagintanongentitreseptuagintanongentiquattuorseptuagintanongentiquinquaseptuagintanongentiseseptuagintanongentiseptenseptuagintanongentioktoseptuagintanongentinovenseptuagintanongentioktogintanongentiunoktogintanongentiduooktogintanongentitreoktogintanongentiquattuoroktogintanongentiquinquaoktogintanongentisexoktogintanongentiseptemoktogintanongentioktooktogintanongentinovemoktogintanongentinonagintanongentiunnonagintanongentiduononagintanongentitrenonagintanongentiquattuornonagintanongentiquinquanonagintanongentisenonagintanongentiseptenonagintanongentioktononagintanongentinovenonagintanongentinimibitriquadriquinquisextiseptioktinonideziundeziduodezitredeziquattuordeziquindezisexdeziseptendezioktodezinovemdezivigintiunvigintiduovigintitresvigintiquattuorvigintiquinquavigintisesvigintiseptemvigintioktovigintinovemvigintitrigintauntrigintaduotrigintatrestrigintaquattuortrigintaquinquatrigintasestrigintaseptentrigintaoktotrigintanoventrigintaquadragintaunquadragintaduoquadragintatresquadragintaquattuorquadragintaquinquaquadragintasesquadragintaseptenquadragintaoktoquadragintanovenquadragintaquinquagintaunquinquagintaduoquinquagintatresquinquagintaquattuorquinquagintaquinquaquinquagintasesquinquagintaseptenquinquagintaoktoquinquagintanovenquinquagintasexagintaunsexagintaduosexagintatresexagintaquattuorsexagintaquinquasexagintasesexagintaseptensexagintaoktosexagintanovensexagintaseptuagintaunseptuagintaduoseptuagintatreseptuagintaquattuorseptuagintaquinquaseptuagintaseseptuagintaseptenseptuagintaoktoseptuagintanovenseptuagintaoktogintaunoktogintaduooktogintatreoktogintaquattuoroktogintaquinquaoktogintasexoktogintaseptemoktogintaoktooktogintanovemoktogintanonagintaunnonagintaduononagintatrenonagintaquattuornonagintaquinquanonagintasenonagintaseptenonagintaoktononagintanovenonagintazentiunzentiduozentitreszentiquattuorzentiquinquazentisexzentiseptenzentioktozentinovenzentidezizentiundezizentiduodezizentitredezizentiquattuordezizentiquindezizentisedezizentiseptendezizentioktodezizentinovendezizentivigintizentiunvigintizentiduovigintizentitresvigintizentiquattuorvigintizentiquinquavigintizentisesvigintizentiseptemvigintizentioktovigintizentinovemvigintizentitrigintazentiuntrigintazentiduotrigintazentitrestrigintazentiquattuortrigintazentiquinquatrigintazentisestrigintazentiseptentrigintazentioktotrigintazentinoventrigintazentiquadragintazentiunquadragintazentiduoquadragintazentitresquadragintazentiquattuorquadragintazentiquinquaquadragintazentisesquadragintazentiseptenquadragintazentioktoquadragintazentinovenquadragintazentiquinquagintazentiunquinquagintazentiduoquinquagintazentitresquinquagintazentiquattuorquinquagintazentiquinquaquinquagintazentisesquinquagintazentiseptenquinquagintazentioktoquinquagintazentinovenquinquagintazentisexagintazentiunsexagintazentiduosexagintazentitresexagintazentiquattuorsexagintazentiquinquasexagintazentisesexagintazentiseptensexagintazentioktosexagintazentinovensexagintazentiseptuagintazentiunseptuagintazentiduoseptuagintazentitreseptuagintazentiquattuorseptuagintazentiquinquaseptuagintazentiseseptuagintazentiseptenseptuagintazentioktoseptuagintazentinovenseptuagintazentioktogintazentiunoktogintazentiduooktogintazentitreoktogintazentiquattuoroktogintazentiquinquaoktogintazentisexoktogintazentiseptemoktogintazentioktooktogintazentinovemoktogintazentinonagintazentiunnonagintazentiduononagintazentitrenonagintazentiquattuornonagintazentiquinquanonagintazentisenonagintazentiseptenonagintazentioktononagintazentinovenonagintazentiduzentiunduzentiduoduzentitreduzentiquattuorduzentiquinquaduzentiseduzentiseptenduzentioktoduzentinovenduzentideziduzentiundeziduzentiduodeziduzentitredeziduzentiquattuordeziduzentiquindeziduzentisedeziduzentiseptendeziduzentioktodeziduzentinovendeziduzentivigintiduzentiunvigintiduzentiduovigintiduzentitresvigintiduzentiquattuorvigintiduzentiquinquavigintiduzentisesvigintiduzentiseptemvigintiduzentioktovigintiduzentinovemvigintiduzentitrigintaduzentiuntrigintaduzentiduotrigintaduzentitrestrigintaduzentiquattuortrigintaduzentiquinquatrigintaduzentisestrigintaduzentiseptentrigintaduzentioktotrigintaduzentinoventrigintaduzentiquadragintaduzentiunquadragintaduzentiduoquadragintaduzentitresquadragintaduzentiquattuorquadragintaduzentiquinquaquadragintaduzentisesquadragintaduzentiseptenquadragintaduzentioktoquadragintaduzentinovenquadragintaduzentiquinquagintaduzentiunquinquagintaduzentiduoquinquagintaduzentitresquinquagintaduzentiquattuorquinquagintaduzentiquinquaquinquagintaduzentisesquinquagintaduzentiseptenquinquagintaduzentioktoquinquagintaduzentinovenquinquagintaduzentisexagintaduzentiunsexagintaduzentiduosexagintaduzentitresexagintaduzentiquattuorsexagintaduzentiquinquasexagintaduzentisesexagintaduzentiseptensexagintaduzentioktosexagintaduzentinovensexagintaduzentiseptuagintaduzentiunseptuagintaduzentiduoseptuagintaduzentitreseptuagintaduzentiquattuorseptuagintaduzentiquinquaseptuagintaduzentiseseptuagintaduzentiseptenseptuagintaduzentioktoseptuagintaduzentinovenseptuagintaduzentioktogintaduzentiunoktogintaduzentiduooktogintaduzentitreoktogintaduzentiquattuoroktogintaduzentiquinquaoktogintaduzentisexoktogintaduzentiseptemoktogintaduzentioktooktogintaduzentinovemoktogintaduzentinonagintaduzentiunnonagintaduzentiduononagintaduzentitrenonagintaduzentiquattuornonagintaduzentiquinquanonagintaduzentisenonagintaduzentiseptenonagintaduzentioktononagintaduzentinovenonagintaduzentitrezentiuntrezentiduotrezentitrestrezentiquattuortrezentiquinquatrezentisestrezentiseptentrezentioktotrezentinoventrezentidezitrezentiundezitrezentiduodezitrezentitredezitrezentiquattuordezitrezentiquindezitrezentisedezitrezentiseptendezitrezentioktodezitrezentinovendezitrezentivigintitrezentiunvigintitrezentiduovigintitrezentitresvigintitrezentiquattuorvigintitrezentiquinquavigintitrezentisesvigintitrezentiseptemvigintitrezentioktovigintitrezentinovemvigintitrezentitrigintatrezentiuntrigintatrezentiduotrigintatrezentitrestrigintatrezentiquattuortrigintatrezentiquinquatrigintatrezentisestrigintatrezentiseptentrigintatrezentioktotrigintatrezentinoventrigintatrezentiquadragintatrezentiunquadragintatrezentiduoquadragintatrezentitresquadragintatrezentiquattuorquadragintatrezentiquinquaquadragintatrezentisesquadragintatrezentiseptenquadragintatrezentioktoquadragintatrezentinovenquadragintatrezentiquinquagintatrezentiunquinquagintatrezentiduoquinquagintatrezentitresquinquagintatrezentiquattuorquinquagintatrezentiquinquaquinquagintatrezentisesquinquagintatrezentiseptenquinquagintatrezentioktoquinquagintatrezentinovenquinquagintatrezentisexagintatrezentiunsexagintatrezentiduosexagintatrezentitresexagintatrezentiquattuorsexagintatrezentiquinquasexagintatrezentisesexagintatrezentiseptensexagintatrezentioktosexagintatrezentinovensexagintatrezentiseptuagintatrezentiunseptuagintatrezentiduoseptuagintatrezentitreseptuagintatrezentiquattuorseptuagintatrezentiquinquaseptuagintatrezentiseseptuagintatrezentiseptenseptuagintatrezentioktoseptuagintatrezentinovenseptuagintatrezentioktogintatrezentiunoktogintatrezentiduooktogintatrezentitreoktogintatrezentiquattuoroktogintatrezentiquinquaoktogintatrezentisexoktogintatrezentiseptemoktogintatrezentioktooktogintatrezentinovemoktogintatrezentinonagintatrezentiunnonagintatrezentiduononagintatrezentitrenonagintatrezentiquattuornonagintatrezentiquinquanonagintatrezentisenonagintatrezentiseptenonagintatrezentioktononagintatrezentinovenonagintatrezentiquadringentiunquadringentiduoquadringentitresquadringentiquattuorquadringentiquinquaquadringentisesquadringentiseptenquadringentioktoquadringentinovenquadringentideziquadringentiundeziquadringentiduodeziquadringentitredeziquadringentiquattuordeziquadringentiquindeziquadringentisedeziquadringentiseptendeziquadringentioktodeziquadringentinovendeziquadringentivigintiquadringentiunvigintiquadringentiduovigintiquadringentitresvigintiquadringentiquattuorvigintiquadringentiquinquavigintiquadringentisesvigintiquadringentiseptemvigintiquadringentioktovigintiquadringentinovemvigintiquadringentitrigintaquadringentiuntrigintaquadringentiduotrigintaquadringentitrestrigintaquadringentiquattuortrigintaquadringentiquinquatrigintaquadringentisestrigintaquadringentiseptentrigintaquadringentioktotrigintaquadringentinoventrigintaquadringentiquadragintaquadringentiunquadragintaquadringentiduoquadragintaquadringentitresquadragintaquadringentiquattuorquadragintaquadringentiquinquaquadragintaquadringentisesquadragintaquadringentiseptenquadragintaquadringentioktoquadragintaquadringentinovenquadragintaquadringentiquinquagintaquadringentiunquinquagintaquadringentiduoquinquagintaquadringentitresquinquagintaquadringentiquattuorquinquagintaquadringentiquinquaquinquagintaquadringentisesquinquagintaquadringentiseptenquinquagintaquadringentioktoquinquagintaquadringentinovenquinquagintaquadringentisexagintaquadringentiunsexagintaquadringentiduosexagintaquadringentitresexagintaquadringentiquattuorsexagintaquadringentiquinquasexagintaquadringentisesexagintaquadringentiseptensexagintaquadringentioktosexagintaquadringentinovensexagintaquadringentiseptuagintaquadringentiunseptuagintaquadringentiduoseptuagintaquadringentitreseptuagintaquadringentiquattuorseptuagintaquadringentiquinquaseptuagintaquadringentiseseptuagintaquadringentiseptenseptuagintaquadringentioktoseptuagintaquadringentinovenseptuagintaquadringentioktogintaquadringentiunoktogintaquadringentiduooktogintaquadringentitreoktogintaquadringentiquattuoroktogintaquadringentiquinquaoktogintaquadringentisexoktogintaquadringentiseptemoktogintaquadringentioktooktogintaquadringentinovemoktogintaquadringentinonagintaquadringentiunnonagintaquadringentiduononagintaquadringentitrenonagintaquadringentiquattuornonagintaquadringentiquinquanonagintaquadringentisenonagintaquadringentiseptenonagintaquadringentioktononagintaquadringentinovenonagintaquadringentiquingentiunquingentiduoquingentitresquingentiquattuorquingentiquinquaquingentisesquingentiseptenquingentioktoquingentinovenquingentideziquingentiundeziquingentiduodeziquingentitredeziquingentiquattuordeziquingentiquindeziquingentisedeziquingentiseptendeziquingentioktodeziquingentinovendeziquingentivigintiquingentiunvigintiquingentiduovigintiquingentitresvigintiquingentiquattuorvigintiquingentiquinquavigintiquingentisesvigintiquingentiseptemvigintiquingentioktovigintiquingentinovemvigintiquingentitrigintaquingentiuntrigintaquingentiduotrigintaquingentitrestrigintaquingentiquattuortrigintaquingentiquinquatrigintaquingentisestrigintaquingentiseptentrigintaquingentioktotrigintaquingentinoventrigintaquingentiquadragintaquingentiunquadragintaquingentiduoquadragintaquingentitresquadragintaquingentiquattuorquadragintaquingentiquinquaquadragintaquingentisesquadragintaquingentiseptenquadragintaquingentioktoquadragintaquingentinovenquadragintaquingentiquinquagintaquingentiunquinquagintaquingentiduoquinquagintaquingentitresquinquagintaquingentiquattuorquinquagintaquingentiquinquaquinquagintaquingentisesquinquagintaquingentiseptenquinquagintaquingentioktoquinquagintaquingentinovenquinquagintaquingentisexagintaquingentiunsexagintaquingentiduosexagintaquingentitresexagintaquingentiquattuorsexagintaquingentiquinquasexagintaquingentisesexagintaquingentiseptensexagintaquingentioktosexagintaquingentinovensexagintaquingentiseptuagintaquingentiunseptuagintaquingentiduoseptuagintaquingentitreseptuagintaquingentiquattuorseptuagintaquingentiquinquaseptuagintaquingentiseseptuagintaquingentiseptenseptuagintaquingentioktoseptuagintaquingentinovenseptuagintaquingentioktogintaquingentiunoktogintaquingentiduooktogintaquingentitreoktogintaquingentiquattuoroktogintaquingentiquinquaoktogintaquingentisexoktogintaquingentiseptemoktogintaquingentioktooktogintaquingentinovemoktogintaquingentinonagintaquingentiunnonagintaquingentiduononagintaquingentitrenonagintaquingentiquattuornonagintaquingentiquinquanonagintaquingentisenonagintaquingentiseptenonagintaquingentioktononagintaquingentinovenonagintaquingentiseszentiunseszentiduoseszentitreseszentiquattuorseszentiquinquaseszentiseseszentiseptenseszentioktoseszentinovenseszentideziseszentiundeziseszentiduodeziseszentitredeziseszentiquattuordeziseszentiquindeziseszentisedeziseszentiseptendeziseszentioktodeziseszentinovendeziseszentivigintiseszentiunvigintiseszentiduovigintiseszentitresvigintiseszentiquattuorvigintiseszentiquinquavigintiseszentisesvigintiseszentiseptemvigintiseszentioktovigintiseszentinovemvigintiseszentitrigintaseszentiuntrigintaseszentiduotrigintaseszentitrestrigintaseszentiquattuortrigintaseszentiquinquatrigintaseszentisestrigintaseszentiseptentrigintaseszentioktotrigintaseszentinoventrigintaseszentiquadragintaseszentiunquadragintaseszentiduoquadragintaseszentitresquadragintaseszentiquattuorquadragintaseszentiquinquaquadragintaseszentisesquadragintaseszentiseptenquadragintaseszentioktoquadragintaseszentinovenquadragintaseszentiquinquagintaseszentiunquinquagintaseszentiduoquinquagintaseszentitresquinquagintaseszentiquattuorquinquagintaseszentiquinquaquinquagintaseszentisesquinquagintaseszentiseptenquinquagintaseszentioktoquinquagintaseszentinovenquinquagintaseszentisexagintaseszentiunsexagintaseszentiduosexagintaseszentitresexagintaseszentiquattuorsexagintaseszentiquinquasexagintaseszentisesexagintaseszentiseptensexagintaseszentioktosexagintaseszentinovensexagintaseszentiseptuagintaseszentiunseptuagintaseszentiduoseptuagintaseszentitreseptuagintaseszentiquattuorseptuagintaseszentiquinquaseptuagintaseszentiseseptuagintaseszentiseptenseptuagintaseszentioktoseptuagintaseszentinovenseptuagintaseszentioktogintaseszentiunoktogintaseszentiduooktogintaseszentitreoktogintaseszentiquattuoroktogintaseszentiquinquaoktogintaseszentisexoktogintaseszentiseptemoktogintaseszentioktooktogintaseszentinovemoktogintaseszentinonagintaseszentiunnonagintaseszentiduononagintaseszentitrenonagintaseszentiquattuornonagintaseszentiquinquanonagintaseszentisenonagintaseszentiseptenonagintaseszentioktononagintaseszentinovenonagintaseszentiseptingentiunseptingentiduoseptingentitreseptingentiquattuorseptingentiquinquaseptingentiseseptingentiseptenseptingentioktoseptingentinovenseptingentideziseptingentiundeziseptingentiduodeziseptingentitredeziseptingentiquattuordeziseptingentiquindeziseptingentisedeziseptingentiseptendeziseptingentioktodeziseptingentinovendeziseptingentivigintiseptingentiunvigintiseptingentiduovigintiseptingentitresvigintiseptingentiquattuorvigintiseptingentiquinquavigintiseptingentisesvigintiseptingentiseptemvigintiseptingentioktovigintiseptingentinovemvigintiseptingentitrigintaseptingentiuntrigintaseptingentiduotrigintaseptingentitrestrigintaseptingentiquattuortrigintaseptingentiquinquatrigintaseptingentisestrigintaseptingentiseptentrigintaseptingentioktotrigintaseptingentinoventrigintaseptingentiquadragintaseptingentiunquadragintaseptingentiduoquadragintaseptingentitresquadragintaseptingentiquattuorquadragintaseptingentiquinquaquadragintaseptingentisesquadragintaseptingentiseptenquadragintaseptingentioktoquadragintaseptingentinovenquadragintaseptingentiquinquagintaseptingentiunquinquagintaseptingentiduoquinquagintaseptingentitresquinquagintaseptingentiquattuorquinquagintaseptingentiquinquaquinquagintaseptingentisesquinquagintaseptingentiseptenquinquagintaseptingentioktoquinquagintaseptingentinovenquinquagintaseptingentisexagintaseptingentiunsexagintaseptingentiduosexagintaseptingentitresexagintaseptingentiquattuorsexagintaseptingentiquinquasexagintaseptingentisesexagintaseptingentiseptensexagintaseptingentioktosexagintaseptingentinovensexagintaseptingentiseptuagintaseptingentiunseptuagintaseptingentiduoseptuagintaseptingentitreseptuagintaseptingentiquattuorseptuagintaseptingentiquinquaseptuagintaseptingentiseseptuagintaseptingentiseptenseptuagintaseptingentioktoseptuagintaseptingentinovenseptuagintaseptingentioktogintaseptingentiunoktogintaseptingentiduooktogintaseptingentitreoktogintaseptingentiquattuoroktogintaseptingentiquinquaoktogintaseptingentisexoktogintaseptingentiseptemoktogintaseptingentioktooktogintaseptingentinovemoktogintaseptingentinonagintaseptingentiunnonagintaseptingentiduononagintaseptingentitrenonagintaseptingentiquattuornonagintaseptingentiquinquanonagintaseptingentisenonagintaseptingentiseptenonagintaseptingentioktononagintaseptingentinovenonagintaseptingentioktingentiunoktingentiduooktingentitreoktingentiquattuoroktingentiquinquaoktingentisexoktingentiseptemoktingentioktooktingentinovemoktingentidezioktingentiundezioktingentiduodezioktingentitredezioktingentiquattuordezioktingentiquindezioktingentisedezioktingentiseptendezioktingentioktodezioktingentinovendezioktingentivigintioktingentiunvigintioktingentiduovigintioktingentitresvigintioktingentiquattuorvigintioktingentiquinquavigintioktingentisesvigintioktingentiseptemvigintioktingentioktovigintioktingentinovemvigintioktingentitrigintaoktingentiuntrigintaoktingentiduotrigintaoktingentitrestrigintaoktingentiquattuortrigintaoktingentiquinquatrigintaoktingentisestrigintaoktingentiseptentrigintaoktingentioktotrigintaoktingentinoventrigintaoktingentiquadragintaoktingentiunquadragintaoktingentiduoquadragintaoktingentitresquadragintaoktingentiquattuorquadragintaoktingentiquinquaquadragintaoktingentisesquadragintaoktingentiseptenquadragintaoktingentioktoquadragintaoktingentinovenquadragintaoktingentiquinquagintaoktingentiunquinquagintaoktingentiduoquinquagintaoktingentitresquinquagintaoktingentiquattuorquinquagintaoktingentiquinquaquinquagintaoktingentisesquinquagintaoktingentiseptenquinquagintaoktingentioktoquinquagintaoktingentinovenquinquagintaoktingentisexagintaoktingentiunsexagintaoktingentiduosexagintaoktingentitresexagintaoktingentiquattuorsexagintaoktingentiquinquasexagintaoktingentisesexagintaoktingentiseptensexagintaoktingentioktosexagintaoktingentinovensexagintaoktingentiseptuagintaoktingentiunseptuagintaoktingentiduoseptuagintaoktingentitreseptuagintaoktingentiquattuorseptuagintaoktingentiquinquaseptuagintaoktingentiseseptuagintaoktingentiseptenseptuagintaoktingentioktoseptuagintaoktingentinovenseptuagintaoktingentioktogintaoktingentiunoktogintaoktingentiduooktogintaoktingentitreoktogintaoktingentiquattuoroktogintaoktingentiquinquaoktogintaoktingentisexoktogintaoktingentiseptemoktogintaoktingentioktooktogintaoktingentinovemoktogintaoktingentinonagintaoktingentiunnonagintaoktingentiduononagintaoktingentitrenonagintaoktingentiquattuornonagintaoktingentiquinquanonagintaoktingentisenonagintaoktingentiseptenonagintaoktingentioktononagintaoktingentinovenonagintaoktingentinongentiunnongentiduonongentitrenongentiquattuornongentiquinquanongentisenongentiseptenongentioktonongentinovenongentidezinongentiundezinongentiduodezinongentitredezinongentiquattuordezinongentiquindezinongentisedezinongentiseptendezinongentioktodezinongentinovendezinongentivigintinongentiunvigintinongentiduovigintinongentitresvigintinongentiquattuorvigintinongentiquinquavigintinongentisesvigintinongentiseptemvigintinongentioktovigintinongentinovemvigintinongentitrigintanongentiuntrigintanongentiduotrigintanongentitrestrigintanongentiquattuortrigintanongentiquinquatrigintanongentisestrigintanongentiseptentrigintanongentioktotrigintanongentinoventrigintanongentiquadragintanongentiunquadragintanongentiduoquadragintanongentitresquadragintanongentiquattuorquadragintanongentiquinquaquadragintanongentisesquadragintanongentiseptenquadragintanongentioktoquadragintanongentinovenquadragintanongentiquinquagintanongentiunquinquagintanongentiduoquinquagintanongentitresquinquagintanongentiquattuorquinquagintanongentiquinquaquinquagintanongentisesquinquagintanongentiseptenquinquagintanongentioktoquinquagintanongentinovenquinquagintanongentisexagintanongentiunsexagintanongentiduosexagintanongentitresexagintanongentiquattuorsexagintanongentiquinquasexagintanongentisesexagintanongentiseptensexagintanongentioktosexagintanongentinovensexagintanongentiseptuagintanongentiunseptuagintanongentiduoseptuagintanongentitreseptuagintanongentiquattuorseptuagintanongentiquinquaseptuagintanongentiseseptuagintanongentiseptenseptuagintanongentioktoseptuagintanongentinovenseptuagintanongentioktogintanongentiunoktogintanongentiduooktogintanongentitreoktogintanongentiquattuoroktogintanongentiquinquaoktogintanongentisexoktogintanongentiseptemoktogintanongentioktooktogintanongentinovemoktogintanongentinonagintanongentiunnonagintanongentiduononagintanongentitrenonagintanongentiquattuornonagintanongentiquinquanonagintanongentisenonagintanongentiseptenonagintanongentioktononagintanongentinovenonagintanongentinimibitriquadriquinquisextiseptioktinonideziundeziduodezitredeziquattuordeziquindezisexdeziseptendezioktodezinovemdezivigintiunvigintiduovigintitresvigintiquattuorvigintiquinquavigintisesvigintiseptemvigintioktovigintinovemvigintitrigintiuntrigintiduotrigintitrestrigintiquattuortrigintiquinquatrigintisestrigintiseptentrigintioktotrigintinoventrigintiquadragintiunquadragintiduoquadragintitresquadragintiquattuorquadragintiquinquaquadragintisesquadragintiseptenquadragintioktoquadragintinovenquadragintiquinquagintiunquinquagintiduoquinquagintitresquinquagintiquattuorquinquagintiquinquaquinquagintisesquinquagintiseptenquinquagintioktoquinquagintinovenquinquagintisexagintiunsexagintiduosexagintitresexagintiquattuorsexagintiquinquasexagintisesexagintiseptensexagintioktosexagintinovensexagintiseptuagintiunseptuagintiduoseptuagintitreseptuagintiquattuorseptuagintiquinquaseptuagintiseseptuagintiseptenseptuagintioktoseptuagintinovenseptuagintioktogintiunoktogintiduooktogintitreoktogintiquattuoroktogintiquinquaoktogintisexoktogintiseptemoktogintioktooktogintinovemoktogintinonagintiunnonagintiduononagintitrenonagintiquattuornonagintiquinquanonagintisenonagintiseptenonagintioktononagintinovenonagintizentiunzentiduozentitreszentiquattuorzentiquinquazentisexzentiseptenzentioktozentinovenzentidezizentiundezizentiduodezizentitredezizentiquattuordezizentiquindezizentisedezizentiseptendezizentioktodezizentinovendezizentivigintizentiunvigintizentiduovigintizentitresvigintizentiquattuorvigintizentiquinquavigintizentisesvigintizentiseptemvigintizentioktovigintizentinovemvigintizentitrigintazentiuntrigintazentiduotrigintazentitrestrigintazentiquattuortrigintazentiquinquatrigintazentisestrigintazentiseptentrigintazentioktotrigintazentinoventrigintazentiquadragintazentiunquadragintazentiduoquadragintazentitresquadragintazentiquattuorquadragintazentiquinquaquadragintazentisesquadragintazentiseptenquadragintazentioktoquadragintazentinovenquadragintazentiquinquagintazentiunquinquagintazentiduoquinquagintazentitresquinquagintazentiquattuorquinquagintazentiquinquaquinquagintazentisesquinquagintazentiseptenquinquagintazentioktoquinquagintazentinovenquinquagintazentisexagintazentiunsexagintazentiduosexagintazentitresexagintazentiquattuorsexagintazentiquinquasexagintazentisesexagintazentiseptensexagintazentioktosexagintazentinovensexagintazentiseptuagintazentiunseptuagintazentiduoseptuagintazentitreseptuagintazentiquattuorseptuagintazentiquinquaseptuagintazentiseseptuagintazentiseptenseptuagintazentioktoseptuagintazentinovenseptuagintazentioktogintazentiunoktogintazentiduooktogintazentitreoktogintazentiquattuoroktogintazentiquinquaoktogintazentisexoktogintazentiseptemoktogintazentioktooktogintazentinovemoktogintazentinonagintazentiunnonagintazentiduononagintazentitrenonagintazentiquattuornonagintazentiquinquanonagintazentisenonagintazentiseptenonagintazentioktononagintazentinovenonagintazentiduzentiunduzentiduoduzentitreduzentiquattuorduzentiquinquaduzentiseduzentiseptenduzentioktoduzentinovenduzentideziduzentiundeziduzentiduodeziduzentitredeziduzentiquattuordeziduzentiquindeziduzentisedeziduzentiseptendeziduzentioktodeziduzentinovendeziduzentivigintiduzentiunvigintiduzentiduovigintiduzentitresvigintiduzentiquattuorvigintiduzentiquinquavigintiduzentisesvigintiduzentiseptemvigintiduzentioktovigintiduzentinovemvigintiduzentitrigintaduzentiuntrigintaduzentiduotrigintaduzentitrestrigintaduzentiquattuortrigintaduzentiquinquatrigintaduzentisestrigintaduzentiseptentrigintaduzentioktotrigintaduzentinoventrigintaduzentiquadragintaduzentiunquadragintaduzentiduoquadragintaduzentitresquadragintaduzentiquattuorquadragintaduzentiquinquaquadragintaduzentisesquadragintaduzentiseptenquadragintaduzentioktoquadragintaduzentinovenquadragintaduzentiquinquagintaduzentiunquinquagintaduzentiduoquinquagintaduzentitresquinquagintaduzentiquattuorquinquagintaduzentiquinquaquinquagintaduzentisesquinquagintaduzentiseptenquinquagintaduzentioktoquinquagintaduzentinovenquinquagintaduzentisexagintaduzentiunsexagintaduzentiduosexagintaduzentitresexagintaduzentiquattuorsexagintaduzentiquinquasexagintaduzentisesexagintaduzentiseptensexagintaduzentioktosexagintaduzentinovensexagintaduzentiseptuagintaduzentiunseptuagintaduzentiduoseptuagintaduzentitreseptuagintaduzentiquattuorseptuagintaduzentiquinquaseptuagintaduzentiseseptuagintaduzentiseptenseptuagintaduzentioktoseptuagintaduzentinovenseptuagintaduzentioktogintaduzentiunoktogintaduzentiduooktogintaduzentitreoktogintaduzentiquattuoroktogintaduzentiquinquaoktogintaduzentisexoktogintaduzentiseptemoktogintaduzentioktooktogintaduzentinovemoktogintaduzentinonagintaduzentiunnonagintaduzentiduononagintaduzentitrenonagintaduzentiquattuornonagintaduzentiquinquanonagintaduzentisenonagintaduzentiseptenonagintaduzentioktononagintaduzentinovenonagintaduzentitrezentiuntrezentiduotrezentitrestrezentiquattuortrezentiquinquatrezentisestrezentiseptentrezentioktotrezentinoventrezentidezitrezentiundezitrezentiduodezitrezentitredezitrezentiquattuordezitrezentiquindezitrezentisedezitrezentiseptendezitrezentioktodezitrezentinovendezitrezentivigintitrezentiunvigintitrezentiduovigintitrezentitresvigintitrezentiquattuorvigintitrezentiquinquavigintitrezentisesvigintitrezentiseptemvigintitrezentioktovigintitrezentinovemvigintitrezentitrigintatrezentiuntrigintatrezentiduotrigintatrezentitrestrigintatrezentiquattuortrigintatrezentiquinquatrigintatrezentisestrigintatrezentiseptentrigintatrezentioktotrigintatrezentinoventrigintatrezentiquadragintatrezentiunquadragintatrezentiduoquadragintatrezentitresquadragintatrezentiquattuorquadragintatrezentiquinquaquadragintatrezentisesquadragintatrezentiseptenquadragintatrezentioktoquadragintatrezentinovenquadragintatrezentiquinquagintatrezentiunquinquagintatrezentiduoquinquagintatrezentitresquinquagintatrezentiquattuorquinquagintatrezentiquinquaquinquagintatrezentisesquinquagintatrezentiseptenquinquagintatrezentioktoquinquagintatrezentinovenquinquagintatrezentisexagintatrezentiunsexagintatrezentiduosexagintatrezentitresexagintatrezentiquattuorsexagintatrezentiquinquasexagintatrezentisesexagintatrezentiseptensexagintatrezentioktosexagintatrezentinovensexagintatrezentiseptuagintatrezentiunseptuagintatrezentiduoseptuagintatrezentitreseptuagintatrezentiquattuorseptuagintatrezentiquinquaseptuagintatrezentiseseptuagintatrezentiseptenseptuagintatrezentioktoseptuagintatrezentinovenseptuagintatrezentioktogintatrezentiunoktogintatrezentiduooktogintatrezentitreoktogintatrezentiquattuoroktogintatrezentiquinquaoktogintatrezentisexoktogintatrezentiseptemoktogintatrezentioktooktogintatrezentinovemoktogintatrezentinonagintatrezentiunnonagintatrezentiduononagintatrezentitrenonagintatrezentiquattuornonagintatrezentiquinquanonagintatrezentisenonagintatrezentiseptenonagintatrezentioktononagintatrezentinovenonagintatrezentiquadringentiunquadringentiduoquadringentitresquadringentiquattuorquadringentiquinquaquadringentisesquadringentiseptenquadringentioktoquadringentinovenquadringentideziquadringentiundeziquadringentiduodeziquadringentitredeziquadringentiquattuordeziquadringentiquindeziquadringentisedeziquadringentiseptendeziquadringentioktodeziquadringentinovendeziquadringentivigintiquadringentiunvigintiquadringentiduovigintiquadringentitresvigintiquadringentiquattuorvigintiquadringentiquinquavigintiquadringentisesvigintiquadringentiseptemvigintiquadringentioktovigintiquadringentinovemvigintiquadringentitrigintaquadringentiuntrigintaquadringentiduotrigintaquadringentitrestrigintaquadringentiquattuortrigintaquadringentiquinquatrigintaquadringentisestrigintaquadringentiseptentrigintaquadringentioktotrigintaquadringentinoventrigintaquadringentiquadragintaquadringentiunquadragintaquadringentiduoquadragintaquadringentitresquadragintaquadringentiquattuorquadragintaquadringentiquinquaquadragintaquadringentisesquadragintaquadringentiseptenquadragintaquadringentioktoquadragintaquadringentinovenquadragintaquadringentiquinquagintaquadringentiunquinquagintaquadringentiduoquinquagintaquadringentitresquinquagintaquadringentiquattuorquinquagintaquadringentiquinquaquinquagintaquadringentisesquinquagintaquadringentiseptenquinquagintaquadringentioktoquinquagintaquadringentinovenquinquagintaquadringentisexagintaquadringentiunsexagintaquadringentiduosexagintaquadringentitresexagintaquadringentiquattuorsexagintaquadringentiquinquasexagintaquadringentisesexagintaquadringentiseptensexagintaquadringentioktosexagintaquadringentinovensexagintaquadringentiseptuagintaquadringentiunseptuagintaquadringentiduoseptuagintaquadringentitreseptuagintaquadringentiquattuorseptuagintaquadringentiquinquaseptuagintaquadringentiseseptuagintaquadringentiseptenseptuagintaquadringentioktoseptuagintaquadringentinovenseptuagintaquadringentioktogintaquadringentiunoktogintaquadringentiduooktogintaquadringentitreoktogintaquadringentiquattuoroktogintaquadringentiquinquaoktogintaquadringentisexoktogintaquadringentiseptemoktogintaquadringentioktooktogintaquadringentinovemoktogintaquadringentinonagintaquadringentiunnonagintaquadringentiduononagintaquadringentitrenonagintaquadringentiquattuornonagintaquadringentiquinquanonagintaquadringentisenonagintaquadringentiseptenonagintaquadringentioktononagintaquadringentinovenonagintaquadringentiquingentiunquingentiduoquingentitresquingentiquattuorquingentiquinquaquingentisesquingentiseptenquingentioktoquingentinovenquingentideziquingentiundeziquingentiduodeziquingentitredeziquingentiquattuordeziquingentiquindeziquingentisedeziquingentiseptendeziquingentioktodeziquingentinovendeziquingentivigintiquingentiunvigintiquingentiduovigintiquingentitresvigintiquingentiquattuorvigintiquingentiquinquavigintiquingentisesvigintiquingentiseptemvigintiquingentioktovigintiquingentinovemvigintiquingentitrigintaquingentiuntrigintaquingentiduotrigintaquingentitrestrigintaquingentiquattuortrigintaquingentiquinquatrigintaquingentisestrigintaquingentiseptentrigintaquingentioktotrigintaquingentinoventrigintaquingentiquadragintaquingentiunquadragintaquingentiduoquadragintaquingentitresquadragintaquingentiquattuorquadragintaquingentiquinquaquadragintaquingentisesquadragintaquingentiseptenquadragintaquingentioktoquadragintaquingentinovenquadragintaquingentiquinquagintaquingentiunquinquagintaquingentiduoquinquagintaquingentitresquinquagintaquingentiquattuorquinquagintaquingentiquinquaquinquagintaquingentisesquinquagintaquingentiseptenquinquagintaquingentioktoquinquagintaquingentinovenquinquagintaquingentisexagintaquingentiunsexagintaquingentiduosexagintaquingentitresexagintaquingentiquattuorsexagintaquingentiquinquasexagintaquingentisesexagintaquingentiseptensexagintaquingentioktosexagintaquingentinovensexagintaquingentiseptuagintaquingentiunseptuagintaquingentiduoseptuagintaquingentitreseptuagintaquingentiquattuorseptuagintaquingentiquinquaseptuagintaquingentiseseptuagintaquingentiseptenseptuagintaquingentioktoseptuagintaquingentinovenseptuagintaquingentioktogintaquingentiunoktogintaquingentiduooktogintaquingentitreoktogintaquingentiquattuoroktogintaquingentiquinquaoktogintaquingentisexoktogintaquingentiseptemoktogintaquingentioktooktogintaquingentinovemoktogintaquingentinonagintaquingentiunnonagintaquingentiduononagintaquingentitrenonagintaquingentiquattuornonagintaquingentiquinquanonagintaquingentisenonagintaquingentiseptenonagintaquingentioktononagintaquingentinovenonagintaquingentiseszentiunseszentiduoseszentitreseszentiquattuorseszentiquinquaseszentiseseszentiseptenseszentioktoseszentinovenseszentideziseszentiundeziseszentiduodeziseszentitredeziseszentiquattuordeziseszentiquindeziseszentisedeziseszentiseptendeziseszentioktodeziseszentinovendeziseszentivigintiseszentiunvigintiseszentiduovigintiseszentitresvigintiseszentiquattuorvigintiseszentiquinquavigintiseszentisesvigintiseszentiseptemvigintiseszentioktovigintiseszentinovemvigintiseszentitrigintaseszentiuntrigintaseszentiduotrigintaseszentitrestrigintaseszentiquattuortrigintaseszentiquinquatrigintaseszentisestrigintaseszentiseptentrigintaseszentioktotrigintaseszentinoventrigintaseszentiquadragintaseszentiunquadragintaseszentiduoquadragintaseszentitresquadragintaseszentiquattuorquadragintaseszentiquinquaquadragintaseszentisesquadragintaseszentiseptenquadragintaseszentioktoquadragintaseszentinovenquadragintaseszentiquinquagintaseszentiunquinquagintaseszentiduoquinquagintaseszentitresquinquagintaseszentiquattuorquinquagintaseszentiquinquaquinquagintaseszentisesquinquagintaseszentiseptenquinquagintaseszentioktoquinquagintaseszentinovenquinquagintaseszentisexagintaseszentiunsexagintaseszentiduosexagintaseszentitresexagintaseszentiquattuorsexagintaseszentiquinquasexagintaseszentisesexagintaseszentiseptensexagintaseszentioktosexagintaseszentinovensexagintaseszentiseptuagintaseszentiunseptuagintaseszentiduoseptuagintaseszentitreseptuagintaseszentiquattuorseptuagintaseszentiquinquaseptuagintaseszentiseseptuagintaseszentiseptenseptuagintaseszentioktoseptuagintaseszentinovenseptuagintaseszentioktogintaseszentiunoktogintaseszentiduooktogintaseszentitreoktogintaseszentiquattuoroktogintaseszentiquinquaoktogintaseszentisexoktogintaseszentiseptemoktogintaseszentioktooktogintaseszentinovemoktogintaseszentinonagintaseszentiunnonagintaseszentiduononagintaseszentitrenonagintaseszentiquattuornonagintaseszentiquinquanonagintaseszentisenonagintaseszentiseptenonagintaseszentioktononagintaseszentinovenonagintaseszentiseptingentiunseptingentiduoseptingentitreseptingentiquattuorseptingentiquinquaseptingentiseseptingentiseptenseptingentioktoseptingentinovenseptingentideziseptingentiundeziseptingentiduodeziseptingentitredeziseptingentiquattuordeziseptingentiquindeziseptingentisedeziseptingentiseptendeziseptingentioktodeziseptingentinovendeziseptingentivigintiseptingentiunvigintiseptingentiduovigintiseptingentitresvigintiseptingentiquattuorvigintiseptingentiquinquavigintiseptingentisesvigintiseptingentiseptemvigintiseptingentioktovigintiseptingentinovemvigintiseptingentitrigintaseptingentiuntrigintaseptingentiduotrigintaseptingentitrestrigintaseptingentiquattuortrigintaseptingentiquinquatrigintaseptingentisestrigintaseptingentiseptentrigintaseptingentioktotrigintaseptingentinoventrigintaseptingentiquadragintaseptingentiunquadragintaseptingentiduoquadragintaseptingentitresquadragintaseptingentiquattuorquadragintaseptingentiquinquaquadragintaseptingentisesquadragintaseptingentiseptenquadragintaseptingentioktoquadragintaseptingentinovenquadragintaseptingentiquinquagintaseptingentiunquinquagintaseptingentiduoquinquagintaseptingentitresquinquagintaseptingentiquattuorquinquagintaseptingentiquinquaquinquagintaseptingentisesquinquagintaseptingentiseptenquinquagintaseptingentioktoquinquagintaseptingentinovenquinquagintaseptingentisexagintaseptingentiunsexagintaseptingentiduosexagintaseptingentitresexagintaseptingentiquattuorsexagintaseptingentiquinquasexagintaseptingentisesexagintaseptingentiseptensexagintaseptingentioktosexagintaseptingentinovensexagintaseptingentiseptuagintaseptingentiunseptuagintaseptingentiduoseptuagintaseptingentitreseptuagintaseptingentiquattuorseptuagintaseptingentiquinquaseptuagintaseptingentiseseptuagintaseptingentiseptenseptuagintaseptingentioktoseptuagintaseptingentinovenseptuagintaseptingentioktogintaseptingentiunoktogintaseptingentiduooktogintaseptingentitreoktogintaseptingentiquattuoroktogintaseptingentiquinquaoktogintaseptingentisexoktogintaseptingentiseptemoktogintaseptingentioktooktogintaseptingentinovemoktogintaseptingentinonagintaseptingentiunnonagintaseptingentiduononagintaseptingentitrenonagintaseptingentiquattuornonagintaseptingentiquinquanonagintaseptingentisenonagintaseptingentiseptenonagintaseptingentioktononagintaseptingentinovenonagintaseptingentioktingentiunoktingentiduooktingentitreoktingentiquattuoroktingentiquinquaoktingentisexoktingentiseptemoktingentioktooktingentinovemoktingentidezioktingentiundezioktingentiduodezioktingentitredezioktingentiquattuordezioktingentiquindezioktingentisedezioktingentiseptendezioktingentioktodezioktingentinovendezioktingentivigintioktingentiunvigintioktingentiduovigintioktingentitresvigintioktingentiquattuorvigintioktingentiquinquavigintioktingentisesvigintioktingentiseptemvigintioktingentioktovigintioktingentinovemvigintioktingentitrigintaoktingentiuntrigintaoktingentiduotrigintaoktingentitrestrigintaoktingentiquattuortrigintaoktingentiquinquatrigintaoktingentisestrigintaoktingentiseptentrigintaoktingentioktotrigintaoktingentinoventrigintaoktingentiquadragintaoktingentiunquadragintaoktingentiduoquadragintaoktingentitresquadragintaoktingentiquattuorquadragintaoktingentiquinquaquadragintaoktingentisesquadragintaoktingentiseptenquadragintaoktingentioktoquadragintaoktingentinovenquadragintaoktingentiquinquagintaoktingentiunquinquagintaoktingentiduoquinquagintaoktingentitresquinquagintaoktingentiquattuorquinquagintaoktingentiquinquaquinquagintaoktingentisesquinquagintaoktingentiseptenquinquagintaoktingentioktoquinquagintaoktingentinovenquinquagintaoktingentisexagintaoktingentiunsexagintaoktingentiduosexagintaoktingentitresexagintaoktingentiquattuorsexagintaoktingentiquinquasexagintaoktingentisesexagintaoktingentiseptensexagintaoktingentioktosexagintaoktingentinovensexagintaoktingentiseptuagintaoktingentiunseptuagintaoktingentiduoseptuagintaoktingentitreseptuagintaoktingentiquattuorseptuagintaoktingentiquinquaseptuagintaoktingentiseseptuagintaoktingentiseptenseptuagintaoktingentioktoseptuagintaoktingentinovenseptuagintaoktingentioktogintaoktingentiunoktogintaoktingentiduooktogintaoktingentitreoktogintaoktingentiquattuoroktogintaoktingentiquinquaoktogintaoktingentisexoktogintaoktingentiseptemoktogintaoktingentioktooktogintaoktingentinovemoktogintaoktingentinonagintaoktingentiunnonagintaoktingentiduononagintaoktingentitrenonagintaoktingentiquattuornonagintaoktingentiquinquanonagintaoktingentisenonagintaoktingentiseptenonagintaoktingentioktononagintaoktingentinovenonagintaoktingentinongentiunnongentiduonongentitrenongentiquattuornongentiquinquanongentisenongentiseptenongentioktonongentinovenongentidezinongentiundezinongentiduodezinongentitredezinongentiquattuordezinongentiquindezinongentisedezinongentiseptendezinongentioktodezinongentinovendezinongentivigintinongentiunvigintinongentiduovigintinongentitresvigintinongentiquattuorvigintinongentiquinquavigintinongentisesvigintinongentiseptemvigintinongentioktovigintinongentinovemvigintinongentitrigintanongentiuntrigintanongentiduotrigintanongentitrestrigintanongentiquattuortrigintanongentiquinquatrigintanongentisestrigintanongentiseptentrigintanongentioktotrigintanongentinoventrigintanongentiquadragintanongentiunquadragintanongentiduoquadragintanongentitresquadragintanongentiquattuorquadragintanongentiquinquaquadragintanongentisesquadragintanongentiseptenquadragintanongentioktoquadragintanongentinovenquadragintanongentiquinquagintanongentiunquinquagintanongentiduoquinquagintanongentitresquinquagintanongentiquattuorquinquagintanongentiquinquaquinquagintanongentisesquinquagintanongentiseptenquinquagintanongentioktoquinquagintanongentinovenquinquagintanongentisexagintanongentiunsexagintanongentiduosexagintanongentitresexagintanongentiquattuorsexagintanongentiquinquasexagintanongentisesexagintanongentiseptensexagintanongentioktosexagintanongentinovensexagintanongentiseptuagintanongentiunseptuagintanongentiduoseptuagintanongentitreseptuagintanongentiquattuorseptuagintanongentiquinquaseptuagintanongentiseseptuagintanongentiseptenseptuagintanongentioktoseptuagintanongentinovenseptuagintanongentioktogintanongentiunoktogintanongentiduooktogintanongentitreoktogintanongentiquattuoroktogintanongentiquinquaoktogintanongentisexoktogintanongentiseptemoktogintanongentioktooktogintanongentinovemoktogintanongentinonagintanongentiunnonagintanongentiduononagintanongentitrenonagintanongentiquattuornonagintanongentiquinquanonagintanongentisenonagintanongentiseptenonagintanongentioktononagintanongentinovenonagintanongentinimibitriquadriquinquisextiseptioktinonideziundeziduodezitredeziquattuordeziquindezisexdeziseptendeziduodevigintiundevigintivigintiunvigintiduovigintitresvigintiquattuorvigintiquinquavigintisesvigintiseptemvigintiduodetrigintaundetrigintatrigintauntrigintaduotrigintatrestrigintaquattuortrigintaquinquatrigintasestrigintaseptentrigintaduodequadragintaundequadragintaquadragintaunquadragintaduoquadragintatresquadragintaquattuorquadragintaquinquaquadragintasesquadragintaseptenquadragintaduodequinquagintaundequinquagintaquinquagintaunquinquagintaduoquinquagintatresquinquagintaquattuorquinquagintaquinquaquinquagintasesquinquagintaseptenquinquagintaduodesexagintaundesexagintasexagintaunsexagintaduosexagintatresexagintaquattuorsexagintaquinquasexagintasesexagintaseptensexagintaduodeseptuagintaundeseptuagintaseptuagintaunseptuagintaduoseptuagintatreseptuagintaquattuorseptuagintaquinquaseptuagintaseseptuagintaseptenseptuagintaduodeoctogintaundeoctogintaoktogintaunoktogintaduooktogintatreoktogintaquattuoroktogintaquinquaoktogintasexoktogintaseptemoktogintaduodenonagintaundenonagintanonagintaunnonagintaduononagintatrenonagintaquattuornonagintaquinquanonagintasenonagintaseptenonagintaduodecentiundecentizentiunzentiduozentitreszentiquattuorzentiquinquazentisexzentiseptenzentioktozentinovenzentidezizentiundezizentiduodezizentitredezizentiquattuordezizentiquindezizentisedezizentiseptendezizentioktodezizentinovendezizentivigintizentiunvigintizentiduovigintizentitresvigintizentiquattuorvigintizentiquinquavigintizentisesvigintizentiseptemvigintizentioktovigintizentinovemvigintizentitrigintazentiuntrigintazentiduotrigintazentitrestrigintazentiquattuortrigintazentiquinquatrigintazentisestrigintazentiseptentrigintazentioktotrigintazentinoventrigintazentiquadragintazentiunquadragintazentiduoquadragintazentitresquadragintazentiquattuorquadragintazentiquinquaquadragintazentisesquadragintazentiseptenquadragintazentioktoquadragintazentinovenquadragintazentiquinquagintazentiunquinquagintazentiduoquinquagintazentitresquinquagintazentiquattuorquinquagintazentiquinquaquinquagintazentisesquinquagintazentiseptenquinquagintazentioktoquinquagintazentinovenquinquagintazentisexagintazentiunsexagintazentiduosexagintazentitresexagintazentiquattuorsexagintazentiquinquasexagintazentisesexagintazentiseptensexagintazentioktosexagintazentinovensexagintazentiseptuagintazentiunseptuagintazentiduoseptuagintazentitreseptuagintazentiquattuorseptuagintazentiquinquaseptuagintazentiseseptuagintazentiseptenseptuagintazentioktoseptuagintazentinovenseptuagintazentioktogintazentiunoktogintazentiduooktogintazentitreoktogintazentiquattuoroktogintazentiquinquaoktogintazentisexoktogintazentiseptemoktogintazentioktooktogintazentinovemoktogintazentinonagintazentiunnonagintazentiduononagintazentitrenonagintazentiquattuornonagintazentiquinquanonagintazentisenonagintazentiseptenonagintazentioktononagintazentinovenonagintazentiduzentiunduzentiduoduzentitreduzentiquattuorduzentiquinquaduzentiseduzentiseptenduzentioktoduzentinovenduzentideziduzentiundeziduzentiduodeziduzentitredeziduzentiquattuordeziduzentiquindeziduzentisedeziduzentiseptendeziduzentioktodeziduzentinovendeziduzentivigintiduzentiunvigintiduzentiduovigintiduzentitresvigintiduzentiquattuorvigintiduzentiquinquavigintiduzentisesvigintiduzentiseptemvigintiduzentioktovigintiduzentinovemvigintiduzentitrigintaduzentiuntrigintaduzentiduotrigintaduzentitrestrigintaduzentiquattuortrigintaduzentiquinquatrigintaduzentisestrigintaduzentiseptentrigintaduzentioktotrigintaduzentinoventrigintaduzentiquadragintaduzentiunquadragintaduzentiduoquadragintaduzentitresquadragintaduzentiquattuorquadragintaduzentiquinquaquadragintaduzentisesquadragintaduzentiseptenquadragintaduzentioktoquadragintaduzentinovenquadragintaduzentiquinquagintaduzentiunquinquagintaduzentiduoquinquagintaduzentitresquinquagintaduzentiquattuorquinquagintaduzentiquinquaquinquagintaduzentisesquinquagintaduzentiseptenquinquagintaduzentioktoquinquagintaduzentinovenquinquagintaduzentisexagintaduzentiunsexagintaduzentiduosexagintaduzentitresexagintaduzentiquattuorsexagintaduzentiquinquasexagintaduzentisesexagintaduzentiseptensexagintaduzentioktosexagintaduzentinovensexagintaduzentiseptuagintaduzentiunseptuagintaduzentiduoseptuagintaduzentitreseptuagintaduzentiquattuorseptuagintaduzentiquinquaseptuagintaduzentiseseptuagintaduzentiseptenseptuagintaduzentioktoseptuagintaduzentinovenseptuagintaduzentioktogintaduzentiunoktogintaduzentiduooktogintaduzentitreoktogintaduzentiquattuoroktogintaduzentiquinquaoktogintaduzentisexoktogintaduzentiseptemoktogintaduzentioktooktogintaduzentinovemoktogintaduzentinonagintaduzentiunnonagintaduzentiduononagintaduzentitrenonagintaduzentiquattuornonagintaduzentiquinquanonagintaduzentisenonagintaduzentiseptenonagintaduzentioktononagintaduzentinovenonagintaduzentitrezentiuntrezentiduotrezentitrestrezentiquattuortrezentiquinquatrezentisestrezentiseptentrezentioktotrezentinoventrezentidezitrezentiundezitrezentiduodezitrezentitredezitrezentiquattuordezitrezentiquindezitrezentisedezitrezentiseptendezitrezentioktodezitrezentinovendezitrezentivigintitrezentiunvigintitrezentiduovigintitrezentitresvigintitrezentiquattuorvigintitrezentiquinquavigintitrezentisesvigintitrezentiseptemvigintitrezentioktovigintitrezentinovemvigintitrezentitrigintatrezentiuntrigintatrezentiduotrigintatrezentitrestrigintatrezentiquattuortrigintatrezentiquinquatrigintatrezentisestrigintatrezentiseptentrigintatrezentioktotrigintatrezentinoventrigintatrezentiquadragintatrezentiunquadragintatrezentiduoquadragintatrezentitresquadragintatrezentiquattuorquadragintatrezentiquinquaquadragintatrezentisesquadragintatrezentiseptenquadragintatrezentioktoquadragintatrezentinovenquadragintatrezentiquinquagintatrezentiunquinquagintatrezentiduoquinquagintatrezentitresquinquagintatrezentiquattuorquinquagintatrezentiquinquaquinquagintatrezentisesquinquagintatrezentiseptenquinquagintatrezentioktoquinquagintatrezentinovenquinquagintatrezentisexagintatrezentiunsexagintatrezentiduosexagintatrezentitresexagintatrezentiquattuorsexagintatrezentiquinquasexagintatrezentisesexagintatrezentiseptensexagintatrezentioktosexagintatrezentinovensexagintatrezentiseptuagintatrezentiunseptuagintatrezentiduoseptuagintatrezentitreseptuagintatrezentiquattuorseptuagintatrezentiquinquaseptuagintatrezentiseseptuagintatrezentiseptenseptuagintatrezentioktoseptuagintatrezentinovenseptuagintatrezentioktogintatrezentiunoktogintatrezentiduooktogintatrezentitreoktogintatrezentiquattuoroktogintatrezentiquinquaoktogintatrezentisexoktogintatrezentiseptemoktogintatrezentioktooktogintatrezentinovemoktogintatrezentinonagintatrezentiunnonagintatrezentiduononagintatrezentitrenonagintatrezentiquattuornonagintatrezentiquinquanonagintatrezentisenonagintatrezentiseptenonagintatrezentioktononagintatrezentinovenonagintatrezentiquadringentiunquadringentiduoquadringentitresquadringentiquattuorquadringentiquinquaquadringentisesquadringentiseptenquadringentioktoquadringentinovenquadringentideziquadringentiundeziquadringentiduodeziquadringentitredeziquadringentiquattuordeziquadringentiquindeziquadringentisedeziquadringentiseptendeziquadringentioktodeziquadringentinovendeziquadringentivigintiquadringentiunvigintiquadringentiduovigintiquadringentitresvigintiquadringentiquattuorvigintiquadringentiquinquavigintiquadringentisesvigintiquadringentiseptemvigintiquadringentioktovigintiquadringentinovemvigintiquadringentitrigintaquadringentiuntrigintaquadringentiduotrigintaquadringentitrestrigintaquadringentiquattuortrigintaquadringentiquinquatrigintaquadringentisestrigintaquadringentiseptentrigintaquadringentioktotrigintaquadringentinoventrigintaquadringentiquadragintaquadringentiunquadragintaquadringentiduoquadragintaquadringentitresquadragintaquadringentiquattuorquadragintaquadringentiquinquaquadragintaquadringentisesquadragintaquadringentiseptenquadragintaquadringentioktoquadragintaquadringentinovenquadragintaquadringentiquinquagintaquadringentiunquinquagintaquadringentiduoquinquagintaquadringentitresquinquagintaquadringentiquattuorquinquagintaquadringentiquinquaquinquagintaquadringentisesquinquagintaquadringentiseptenquinquagintaquadringentioktoquinquagintaquadringentinovenquinquagintaquadringentisexagintaquadringentiunsexagintaquadringentiduosexagintaquadringentitresexagintaquadringentiquattuorsexagintaquadringentiquinquasexagintaquadringentisesexagintaquadringentiseptensexagintaquadringentioktosexagintaquadringentinovensexagintaquadringentiseptuagintaquadringentiunseptuagintaquadringentiduoseptuagintaquadringentitreseptuagintaquadringentiquattuorseptuagintaquadringentiquinquaseptuagintaquadringentiseseptuagintaquadringentiseptenseptuagintaquadringentioktoseptuagintaquadringentinovenseptuagintaquadringentioktogintaquadringentiunoktogintaquadringentiduooktogintaquadringentitreoktogintaquadringentiquattuoroktogintaquadringentiquinquaoktogintaquadringentisexoktogintaquadringentiseptemoktogintaquadringentioktooktogintaquadringentinovemoktogintaquadringentinonagintaquadringentiunnonagintaquadringentiduononagintaquadringentitrenonagintaquadringentiquattuornonagintaquadringentiquinquanonagintaquadringentisenonagintaquadringentiseptenonagintaquadringentioktononagintaquadringentinovenonagintaquadringentiquingentiunquingentiduoquingentitresquingentiquattuorquingentiquinquaquingentisesquingentiseptenquingentioktoquingentinovenquingentideziquingentiundeziquingentiduodeziquingentitredeziquingentiquattuordeziquingentiquindeziquingentisedeziquingentiseptendeziquingentioktodeziquingentinovendeziquingentivigintiquingentiunvigintiquingentiduovigintiquingentitresvigintiquingentiquattuorvigintiquingentiquinquavigintiquingentisesvigintiquingentiseptemvigintiquingentioktovigintiquingentinovemvigintiquingentitrigintaquingentiuntrigintaquingentiduotrigintaquingentitrestrigintaquingentiquattuortrigintaquingentiquinquatrigintaquingentisestrigintaquingentiseptentrigintaquingentioktotrigintaquingentinoventrigintaquingentiquadragintaquingentiunquadragintaquingentiduoquadragintaquingentitresquadragintaquingentiquattuorquadragintaquingentiquinquaquadragintaquingentisesquadragintaquingentiseptenquadragintaquingentioktoquadragintaquingentinovenquadragintaquingentiquinquagintaquingentiunquinquagintaquingentiduoquinquagintaquingentitresquinquagintaquingentiquattuorquinquagintaquingentiquinquaquinquagintaquingentisesquinquagintaquingentiseptenquinquagintaquingentioktoquinquagintaquingentinovenquinquagintaquingentisexagintaquingentiunsexagintaquingentiduosexagintaquingentitresexagintaquingentiquattuorsexagintaquingentiquinquasexagintaquingentisesexagintaquingentiseptensexagintaquingentioktosexagintaquingentinovensexagintaquingentiseptuagintaquingentiunseptuagintaquingentiduoseptuagintaquingentitreseptuagintaquingentiquattuorseptuagintaquingentiquinquaseptuagintaquingentiseseptuagintaquingentiseptenseptuagintaquingentioktoseptuagintaquingentinovenseptuagintaquingentioktogintaquingentiunoktogintaquingentiduooktogintaquingentitreoktogintaquingentiquattuoroktogintaquingentiquinquaoktogintaquingentisexoktogintaquingentiseptemoktogintaquingentioktooktogintaquingentinovemoktogintaquingentinonagintaquingentiunnonagintaquingentiduononagintaquingentitrenonagintaquingentiquattuornonagintaquingentiquinquanonagintaquingentisenonagintaquingentiseptenonagintaquingentioktononagintaquingentinovenonagintaquingentiseszentiunseszentiduoseszentitreseszentiquattuorseszentiquinquaseszentiseseszentiseptenseszentioktoseszentinovenseszentideziseszentiundeziseszentiduodeziseszentitredeziseszentiquattuordeziseszentiquindeziseszentisedeziseszentiseptendeziseszentioktodeziseszentinovendeziseszentivigintiseszentiunvigintiseszentiduovigintiseszentitresvigintiseszentiquattuorvigintiseszentiquinquavigintiseszentisesvigintiseszentiseptemvigintiseszentioktovigintiseszentinovemvigintiseszentitrigintaseszentiuntrigintaseszentiduotrigintaseszentitrestrigintaseszentiquattuortrigintaseszentiquinquatrigintaseszentisestrigintaseszentiseptentrigintaseszentioktotrigintaseszentinoventrigintaseszentiquadragintaseszentiunquadragintaseszentiduoquadragintaseszentitresquadragintaseszentiquattuorquadragintaseszentiquinquaquadragintaseszentisesquadragintaseszentiseptenquadragintaseszentioktoquadragintaseszentinovenquadragintaseszentiquinquagintaseszentiunquinquagintaseszentiduoquinquagintaseszentitresquinquagintaseszentiquattuorquinquagintaseszentiquinquaquinquagintaseszentisesquinquagintaseszentiseptenquinquagintaseszentioktoquinquagintaseszentinovenquinquagintaseszentisexagintaseszentiunsexagintaseszentiduosexagintaseszentitresexagintaseszentiquattuorsexagintaseszentiquinquasexagintaseszentisesexagintaseszentiseptensexagintaseszentioktosexagintaseszentinovensexagintaseszentiseptuagintaseszentiunseptuagintaseszentiduoseptuagintaseszentitreseptuagintaseszentiquattuorseptuagintaseszentiquinquaseptuagintaseszentiseseptuagintaseszentiseptenseptuagintaseszentioktoseptuagintaseszentinovenseptuagintaseszentioktogintaseszentiunoktogintaseszentiduooktogintaseszentitreoktogintaseszentiquattuoroktogintaseszentiquinquaoktogintaseszentisexoktogintaseszentiseptemoktogintaseszentioktooktogintaseszentinovemoktogintaseszentinonagintaseszentiunnonagintaseszentiduononagintaseszentitrenonagintaseszentiquattuornonagintaseszentiquinquanonagintaseszentisenonagintaseszentiseptenonagintaseszentioktononagintaseszentinovenonagintaseszentiseptingentiunseptingentiduoseptingentitreseptingentiquattuorseptingentiquinquaseptingentiseseptingentiseptenseptingentioktoseptingentinovenseptingentideziseptingentiundeziseptingentiduodeziseptingentitredeziseptingentiquattuordeziseptingentiquindeziseptingentisedeziseptingentiseptendeziseptingentioktodeziseptingentinovendeziseptingentivigintiseptingentiunvigintiseptingentiduovigintiseptingentitresvigintiseptingentiquattuorvigintiseptingentiquinquavigintiseptingentisesvigintiseptingentiseptemvigintiseptingentioktovigintiseptingentinovemvigintiseptingentitrigintaseptingentiuntrigintaseptingentiduotrigintaseptingentitrestrigintaseptingentiquattuortrigintaseptingentiquinquatrigintaseptingentisestrigintaseptingentiseptentrigintaseptingentioktotrigintaseptingentinoventrigintaseptingentiquadragintaseptingentiunquadragintaseptingentiduoquadragintaseptingentitresquadragintaseptingentiquattuorquadragintaseptingentiquinquaquadragintaseptingentisesquadragintaseptingentiseptenquadragintaseptingentioktoquadragintaseptingentinovenquadragintaseptingentiquinquagintaseptingentiunquinquagintaseptingentiduoquinquagintaseptingentitresquinquagintaseptingentiquattuorquinquagintaseptingentiquinquaquinquagintaseptingentisesquinquagintaseptingentiseptenquinquagintaseptingentioktoquinquagintaseptingentinovenquinquagintaseptingentisexagintaseptingentiunsexagintaseptingentiduosexagintaseptingentitresexagintaseptingentiquattuorsexagintaseptingentiquinquasexagintaseptingentisesexagintaseptingentiseptensexagintaseptingentioktosexagintaseptingentinovensexagintaseptingentiseptuagintaseptingentiunseptuagintaseptingentiduoseptuagintaseptingentitreseptuagintaseptingentiquattuorseptuagintaseptingentiquinquaseptuagintaseptingentiseseptuagintaseptingentiseptenseptuagintaseptingentioktoseptuagintaseptingentinovenseptuagintaseptingentioktogintaseptingentiunoktogintaseptingentiduooktogintaseptingentitreoktogintaseptingentiquattuoroktogintaseptingentiquinquaoktogintaseptingentisexoktogintaseptingentiseptemoktogintaseptingentioktooktogintaseptingentinovemoktogintaseptingentinonagintaseptingentiunnonagintaseptingentiduononagintaseptingentitrenonagintaseptingentiquattuornonagintaseptingentiquinquanonagintaseptingentisenonagintaseptingentiseptenonagintaseptingentioktononagintaseptingentinovenonagintaseptingentioktingentiunoktingentiduooktingentitreoktingentiquattuoroktingentiquinquaoktingentisexoktingentiseptemoktingentioktooktingentinovemoktingentidezioktingentiundezioktingentiduodezioktingentitredezioktingentiquattuordezioktingentiquindezioktingentisedezioktingentiseptendezioktingentioktodezioktingentinovendezioktingentivigintioktingentiunvigintioktingentiduovigintioktingentitresvigintioktingentiquattuorvigintioktingentiquinquavigintioktingentisesvigintioktingentiseptemvigintioktingentioktovigintioktingentinovemvigintioktingentitrigintaoktingentiuntrigintaoktingentiduotrigintaoktingentitrestrigintaoktingentiquattuortrigintaoktingentiquinquatrigintaoktingentisestrigintaoktingentiseptentrigintaoktingentioktotrigintaoktingentinoventrigintaoktingentiquadragintaoktingentiunquadragintaoktingentiduoquadragintaoktingentitresquadragintaoktingentiquattuorquadragintaoktingentiquinquaquadragintaoktingentisesquadragintaoktingentiseptenquadragintaoktingentioktoquadragintaoktingentinovenquadragintaoktingentiquinquagintaoktingentiunquinquagintaoktingentiduoquinquagintaoktingentitresquinquagintaoktingentiquattuorquinquagintaoktingentiquinquaquinquagintaoktingentisesquinquagintaoktingentiseptenquinquagintaoktingentioktoquinquagintaoktingentinovenquinquagintaoktingentisexagintaoktingentiunsexagintaoktingentiduosexagintaoktingentitresexagintaoktingentiquattuorsexagintaoktingentiquinquasexagintaoktingentisesexagintaoktingentiseptensexagintaoktingentioktosexagintaoktingentinovensexagintaoktingentiseptuagintaoktingentiunseptuagintaoktingentiduoseptuagintaoktingentitreseptuagintaoktingentiquattuorseptuagintaoktingentiquinquaseptuagintaoktingentiseseptuagintaoktingentiseptenseptuagintaoktingentioktoseptuagintaoktingentinovenseptuagintaoktingentioktogintaoktingentiunoktogintaoktingentiduooktogintaoktingentitreoktogintaoktingentiquattuoroktogintaoktingentiquinquaoktogintaoktingentisexoktogintaoktingentiseptemoktogintaoktingentioktooktogintaoktingentinovemoktogintaoktingentinonagintaoktingentiunnonagintaoktingentiduononagintaoktingentitrenonagintaoktingentiquattuornonagintaoktingentiquinquanonagintaoktingentisenonagintaoktingentiseptenonagintaoktingentioktononagintaoktingentinovenonagintaoktingentinongentiunnongentiduonongentitrenongentiquattuornongentiquinquanongentisenongentiseptenongentioktonongentinovenongentidezinongentiundezinongentiduodezinongentitredezinongentiquattuordezinongentiquindezinongentisedezinongentiseptendezinongentioktodezinongentinovendezinongentivigintinongentiunvigintinongentiduovigintinongentitresvigintinongentiquattuorvigintinongentiquinquavigintinongentisesvigintinongentiseptemvigintinongentioktovigintinongentinovemvigintinongentitrigintanongentiuntrigintanongentiduotrigintanongentitrestrigintanongentiquattuortrigintanongentiquinquatrigintanongentisestrigintanongentiseptentrigintanongentioktotrigintanongentinoventrigintanongentiquadragintanongentiunquadragintanongentiduoquadragintanongentitresquadragintanongentiquattuorquadragintanongentiquinquaquadragintanongentisesquadragintanongentiseptenquadragintanongentioktoquadragintanongentinovenquadragintanongentiquinquagintanongentiunquinquagintanongentiduoquinquagintanongentitresquinquagintanongentiquattuorquinquagintanongentiquinquaquinquagintanongentisesquinquagintanongentiseptenquinquagintanongentioktoquinquagintanongentinovenquinquagintanongentisexagintanongentiunsexagintanongentiduosexagintanongentitresexagintanongentiquattuorsexagintanongentiquinquasexagintanongentisesexagintanongentiseptensexagintanongentioktosexagintanongentinovensexagintanongentiseptuagintanongentiunseptuagintanongentiduoseptuagintanongentitreseptuagintanongentiquattuorseptuagintanongentiquinquaseptuagintanongentiseseptuagintanongentiseptenseptuagintanongentioktoseptuagintanongentinovenseptuagintanongentioktogintanongentiunoktogintanongentiduooktogintanongentitreoktogintanongentiquattuoroktogintanongentiquinquaoktogintanongentisexoktogintanongentiseptemoktogintanongentioktooktogintanongentinovemoktogintanongentinonagintanongentiunnonagintanongentiduononagintanongentitrenonagintanongentiquattuornonagintanongentiquinquanonagintanongentisenonagintanongentiseptenonagintanongentioktononagintanongentinovenonagintanongentinimibitriquadriquinquisextiseptioktinonideziundeziduodezitredeziquattuordeziquindezisexdeziseptendeziduodevigintiundevigintivigintiunvigintiduovigintitresvigintiquattuorvigintiquinquavigintisesvigintiseptemvigintiduodetrigintiundetrigintitrigintiuntrigintiduotrigintitrestrigintiquattuortrigintiquinquatrigintisestrigintiseptentrigintiduodequadragintiundequadragintiquadragintiunquadragintiduoquadragintitresquadragintiquattuorquadragintiquinquaquadragintisesquadragintiseptenquadragintiduodequinquagintiundequinquagintiquinquagintiunquinquagintiduoquinquagintitresquinquagintiquattuorquinquagintiquinquaquinquagintisesquinquagintiseptenquinquagintiduodesexagintiundesexagintisexagintiunsexagintiduosexagintitresexagintiquattuorsexagintiquinquasexagintisesexagintiseptensexagintiduodeseptuagintiundeseptuagintiseptuagintiunseptuagintiduoseptuagintitreseptuagintiquattuorseptuagintiquinquaseptuagintiseseptuagintiseptenseptuagintiduodeoctogintiundeoctogintioktogintiunoktogintiduooktogintitreoktogintiquattuoroktogintiquinquaoktogintisexoktogintiseptemoktogintiduodenonagintiundenonagintinonagintiunnonagintiduononagintitrenonagintiquattuornonagintiquinquanonagintisenonagintiseptenonagintiduodecentiundecentizentiunzentiduozentitreszentiquattuorzentiquinquazentisexzentiseptenzentioktozentinovenzentidezizentiundezizentiduodezizentitredezizentiquattuordezizentiquindezizentisedezizentiseptendezizentioktodezizentinovendezizentivigintizentiunvigintizentiduovigintizentitresvigintizentiquattuorvigintizentiquinquavigintizentisesvigintizentiseptemvigintizentioktovigintizentinovemvigintizentitrigintazentiuntrigintazentiduotrigintazentitrestrigintazentiquattuortrigintazentiquinquatrigintazentisestrigintazentiseptentrigintazentioktotrigintazentinoventrigintazentiquadragintazentiunquadragintazentiduoquadragintazentitresquadragintazentiquattuorquadragintazentiquinquaquadragintazentisesquadragintazentiseptenquadragintazentioktoquadragintazentinovenquadragintazentiquinquagintazentiunquinquagintazentiduoquinquagintazentitresquinquagintazentiquattuorquinquagintazentiquinquaquinquagintazentisesquinquagintazentiseptenquinquagintazentioktoquinquagintazentinovenquinquagintazentisexagintazentiunsexagintazentiduosexagintazentitresexagintazentiquattuorsexagintazentiquinquasexagintazentisesexagintazentiseptensexagintazentioktosexagintazentinovensexagintazentiseptuagintazentiunseptuagintazentiduoseptuagintazentitreseptuagintazentiquattuorseptuagintazentiquinquaseptuagintazentiseseptuagintazentiseptenseptuagintazentioktoseptuagintazentinovenseptuagintazentioktogintazentiunoktogintazentiduooktogintazentitreoktogintazentiquattuoroktogintazentiquinquaoktogintazentisexoktogintazentiseptemoktogintazentioktooktogintazentinovemoktogintazentinonagintazentiunnonagintazentiduononagintazentitrenonagintazentiquattuornonagintazentiquinquanonagintazentisenonagintazentiseptenonagintazentioktononagintazentinovenonagintazentiduzentiunduzentiduoduzentitreduzentiquattuorduzentiquinquaduzentiseduzentiseptenduzentioktoduzentinovenduzentideziduzentiundeziduzentiduodeziduzentitredeziduzentiquattuordeziduzentiquindeziduzentisedeziduzentiseptendeziduzentioktodeziduzentinovendeziduzentivigintiduzentiunvigintiduzentiduovigintiduzentitresvigintiduzentiquattuorvigintiduzentiquinquavigintiduzentisesvigintiduzentiseptemvigintiduzentioktovigintiduzentinovemvigintiduzentitrigintaduzentiuntrigintaduzentiduotrigintaduzentitrestrigintaduzentiquattuortrigintaduzentiquinquatrigintaduzentisestrigintaduzentiseptentrigintaduzentioktotrigintaduzentinoventrigintaduzentiquadragintaduzentiunquadragintaduzentiduoquadragintaduzentitresquadragintaduzentiquattuorquadragintaduzentiquinquaquadragintaduzentisesquadragintaduzentiseptenquadragintaduzentioktoquadragintaduzentinovenquadragintaduzentiquinquagintaduzentiunquinquagintaduzentiduoquinquagintaduzentitresquinquagintaduzentiquattuorquinquagintaduzentiquinquaquinquagintaduzentisesquinquagintaduzentiseptenquinquagintaduzentioktoquinquagintaduzentinovenquinquagintaduzentisexagintaduzentiunsexagintaduzentiduosexagintaduzentitresexagintaduzentiquattuorsexagintaduzentiquinquasexagintaduzentisesexagintaduzentiseptensexagintaduzentioktosexagintaduzentinovensexagintaduzentiseptuagintaduzentiunseptuagintaduzentiduoseptuagintaduzentitreseptuagintaduzentiquattuorseptuagintaduzentiquinquaseptuagintaduzentiseseptuagintaduzentiseptenseptuagintaduzentioktoseptuagintaduzentinovenseptuagintaduzentioktogintaduzentiunoktogintaduzentiduooktogintaduzentitreoktogintaduzentiquattuoroktogintaduzentiquinquaoktogintaduzentisexoktogintaduzentiseptemoktogintaduzentioktooktogintaduzentinovemoktogintaduzentinonagintaduzentiunnonagintaduzentiduononagintaduzentitrenonagintaduzentiquattuornonagintaduzentiquinquanonagintaduzentisenonagintaduzentiseptenonagintaduzentioktononagintaduzentinovenonagintaduzentitrezentiuntrezentiduotrezentitrestrezentiquattuortrezentiquinquatrezentisestrezentiseptentrezentioktotrezentinoventrezentidezitrezentiundezitrezentiduodezitrezentitredezitrezentiquattuordezitrezentiquindezitrezentisedezitrezentiseptendezitrezentioktodezitrezentinovendezitrezentivigintitrezentiunvigintitrezentiduovigintitrezentitresvigintitrezentiquattuorvigintitrezentiquinquavigintitrezentisesvigintitrezentiseptemvigintitrezentioktovigintitrezentinovemvigintitrezentitrigintatrezentiuntrigintatrezentiduotrigintatrezentitrestrigintatrezentiquattuortrigintatrezentiquinquatrigintatrezentisestrigintatrezentiseptentrigintatrezentioktotrigintatrezentinoventrigintatrezentiquadragintatrezentiunquadragintatrezentiduoquadragintatrezentitresquadragintatrezentiquattuorquadragintatrezentiquinquaquadragintatrezentisesquadragintatrezentiseptenquadragintatrezentioktoquadragintatrezentinovenquadragintatrezentiquinquagintatrezentiunquinquagintatrezentiduoquinquagintatrezentitresquinquagintatrezentiquattuorquinquagintatrezentiquinquaquinquagintatrezentisesquinquagintatrezentiseptenquinquagintatrezentioktoquinquagintatrezentinovenquinquagintatrezentisexagintatrezentiunsexagintatrezentiduosexagintatrezentitresexagintatrezentiquattuorsexagintatrezentiquinquasexagintatrezentisesexagintatrezentiseptensexagintatrezentioktosexagintatrezentinovensexagintatrezentiseptuagintatrezentiunseptuagintatrezentiduoseptuagintatrezentitreseptuagintatrezentiquattuorseptuagintatrezentiquinquaseptuagintatrezentiseseptuagintatrezentiseptenseptuagintatrezentioktoseptuagintatrezentinovenseptuagintatrezentioktogintatrezentiunoktogintatrezentiduooktogintatrezentitreoktogintatrezentiquattuoroktogintatrezentiquinquaoktogintatrezentisexoktogintatrezentiseptemoktogintatrezentioktooktogintatrezentinovemoktogintatrezentinonagintatrezentiunnonagintatrezentiduononagintatrezentitrenonagintatrezentiquattuornonagintatrezentiquinquanonagintatrezentisenonagintatrezentiseptenonagintatrezentioktononagintatrezentinovenonagintatrezentiquadringentiunquadringentiduoquadringentitresquadringentiquattuorquadringentiquinquaquadringentisesquadringentiseptenquadringentioktoquadringentinovenquadringentideziquadringentiundeziquadringentiduodeziquadringentitredeziquadringentiquattuordeziquadringentiquindeziquadringentisedeziquadringentiseptendeziquadringentioktodeziquadringentinovendeziquadringentivigintiquadringentiunvigintiquadringentiduovigintiquadringentitresvigintiquadringentiquattuorvigintiquadringentiquinquavigintiquadringentisesvigintiquadringentiseptemvigintiquadringentioktovigintiquadringentinovemvigintiquadringentitrigintaquadringentiuntrigintaquadringentiduotrigintaquadringentitrestrigintaquadringentiquattuortrigintaquadringentiquinquatrigintaquadringentisestrigintaquadringentiseptentrigintaquadringentioktotrigintaquadringentinoventrigintaquadringentiquadragintaquadringentiunquadragintaquadringentiduoquadragintaquadringentitresquadragintaquadringentiquattuorquadragintaquadringentiquinquaquadragintaquadringentisesquadragintaquadringentiseptenquadragintaquadringentioktoquadragintaquadringentinovenquadragintaquadringentiquinquagintaquadringentiunquinquagintaquadringentiduoquinquagintaquadringentitresquinquagintaquadringentiquattuorquinquagintaquadringentiquinquaquinquagintaquadringentisesquinquagintaquadringentiseptenquinquagintaquadringentioktoquinquagintaquadringentinovenquinquagintaquadringentisexagintaquadringentiunsexagintaquadringentiduosexagintaquadringentitresexagintaquadringentiquattuorsexagintaquadringentiquinquasexagintaquadringentisesexagintaquadringentiseptensexagintaquadringentioktosexagintaquadringentinovensexagintaquadringentiseptuagintaquadringentiunseptuagintaquadringentiduoseptuagintaquadringentitreseptuagintaquadringentiquattuorseptuagintaquadringentiquinquaseptuagintaquadringentiseseptuagintaquadringentiseptenseptuagintaquadringentioktoseptuagintaquadringentinovenseptuagintaquadringentioktogintaquadringentiunoktogintaquadringentiduooktogintaquadringentitreoktogintaquadringentiquattuoroktogintaquadringentiquinquaoktogintaquadringentisexoktogintaquadringentiseptemoktogintaquadringentioktooktogintaquadringentinovemoktogintaquadringentinonagintaquadringentiunnonagintaquadringentiduononagintaquadringentitrenonagintaquadringentiquattuornonagintaquadringentiquinquanonagintaquadringentisenonagintaquadringentiseptenonagintaquadringentioktononagintaquadringentinovenonagintaquadringentiquingentiunquingentiduoquingentitresquingentiquattuorquingentiquinquaquingentisesquingentiseptenquingentioktoquingentinovenquingentideziquingentiundeziquingentiduodeziquingentitredeziquingentiquattuordeziquingentiquindeziquingentisedeziquingentiseptendeziquingentioktodeziquingentinovendeziquingentivigintiquingentiunvigintiquingentiduovigintiquingentitresvigintiquingentiquattuorvigintiquingentiquinquavigintiquingentisesvigintiquingentiseptemvigintiquingentioktovigintiquingentinovemvigintiquingentitrigintaquingentiuntrigintaquingentiduotrigintaquingentitrestrigintaquingentiquattuortrigintaquingentiquinquatrigintaquingentisestrigintaquingentiseptentrigintaquingentioktotrigintaquingentinoventrigintaquingentiquadragintaquingentiunquadragintaquingentiduoquadragintaquingentitresquadragintaquingentiquattuorquadragintaquingentiquinquaquadragintaquingentisesquadragintaquingentiseptenquadragintaquingentioktoquadragintaquingentinovenquadragintaquingentiquinquagintaquingentiunquinquagintaquingentiduoquinquagintaquingentitresquinquagintaquingentiquattuorquinquagintaquingentiquinquaquinquagintaquingentisesquinquagintaquingentiseptenquinquagintaquingentioktoquinquagintaquingentinovenquinquagintaquingentisexagintaquingentiunsexagintaquingentiduosexagintaquingentitresexagintaquingentiquattuorsexagintaquingentiquinquasexagintaquingentisesexagintaquingentiseptensexagintaquingentioktosexagintaquingentinovensexagintaquingentiseptuagintaquingentiunseptuagintaquingentiduoseptuagintaquingentitreseptuagintaquingentiquattuorseptuagintaquingentiquinquaseptuagintaquingentiseseptuagintaquingentiseptenseptuagintaquingentioktoseptuagintaquingentinovenseptuagintaquingentioktogintaquingentiunoktogintaquingentiduooktogintaquingentitreoktogintaquingentiquattuoroktogintaquingentiquinquaoktogintaquingentisexoktogintaquingentiseptemoktogintaquingentioktooktogintaquingentinovemoktogintaquingentinonagintaquingentiunnonagintaquingentiduononagintaquingentitrenonagintaquingentiquattuornonagintaquingentiquinquanonagintaquingentisenonagintaquingentiseptenonagintaquingentioktononagintaquingentinovenonagintaquingentiseszentiunseszentiduoseszentitreseszentiquattuorseszentiquinquaseszentiseseszentiseptenseszentioktoseszentinovenseszentideziseszentiundeziseszentiduodeziseszentitredeziseszentiquattuordeziseszentiquindeziseszentisedeziseszentiseptendeziseszentioktodeziseszentinovendeziseszentivigintiseszentiunvigintiseszentiduovigintiseszentitresvigintiseszentiquattuorvigintiseszentiquinquavigintiseszentisesvigintiseszentiseptemvigintiseszentioktovigintiseszentinovemvigintiseszentitrigintaseszentiuntrigintaseszentiduotrigintaseszentitrestrigintaseszentiquattuortrigintaseszentiquinquatrigintaseszentisestrigintaseszentiseptentrigintaseszentioktotrigintaseszentinoventrigintaseszentiquadragintaseszentiunquadragintaseszentiduoquadragintaseszentitresquadragintaseszentiquattuorquadragintaseszentiquinquaquadragintaseszentisesquadragintaseszentiseptenquadragintaseszentioktoquadragintaseszentinovenquadragintaseszentiquinquagintaseszentiunquinquagintaseszentiduoquinquagintaseszentitresquinquagintaseszentiquattuorquinquagintaseszentiquinquaquinquagintaseszentisesquinquagintaseszentiseptenquinquagintaseszentioktoquinquagintaseszentinovenquinquagintaseszentisexagintaseszentiunsexagintaseszentiduosexagintaseszentitresexagintaseszentiquattuorsexagintaseszentiquinquasexagintaseszentisesexagintaseszentiseptensexagintaseszentioktosexagintaseszentinovensexagintaseszentiseptuagintaseszentiunseptuagintaseszentiduoseptuagintaseszentitreseptuagintaseszentiquattuorseptuagintaseszentiquinquaseptuagintaseszentiseseptuagintaseszentiseptenseptuagintaseszentioktoseptuagintaseszentinovenseptuagintaseszentioktogintaseszentiunoktogintaseszentiduooktogintaseszentitreoktogintaseszentiquattuoroktogintaseszentiquinquaoktogintaseszentisexoktogintaseszentiseptemoktogintaseszentioktooktogintaseszentinovemoktogintaseszentinonagintaseszentiunnonagintaseszentiduononagintaseszentitrenonagintaseszentiquattuornonagintaseszentiquinquanonagintaseszentisenonagintaseszentiseptenonagintaseszentioktononagintaseszentinovenonagintaseszentiseptingentiunseptingentiduoseptingentitreseptingentiquattuorseptingentiquinquaseptingentiseseptingentiseptenseptingentioktoseptingentinovenseptingentideziseptingentiundeziseptingentiduodeziseptingentitredeziseptingentiquattuordeziseptingentiquindeziseptingentisedeziseptingentiseptendeziseptingentioktodeziseptingentinovendeziseptingentivigintiseptingentiunvigintiseptingentiduovigintiseptingentitresvigintiseptingentiquattuorvigintiseptingentiquinquavigintiseptingentisesvigintiseptingentiseptemvigintiseptingentioktovigintiseptingentinovemvigintiseptingentitrigintaseptingentiuntrigintaseptingentiduotrigintaseptingentitrestrigintaseptingentiquattuortrigintaseptingentiquinquatrigintaseptingentisestrigintaseptingentiseptentrigintaseptingentioktotrigintaseptingentinoventrigintaseptingentiquadragintaseptingentiunquadragintaseptingentiduoquadragintaseptingentitresquadragintaseptingentiquattuorquadragintaseptingentiquinquaquadragintaseptingentisesquadragintaseptingentiseptenquadragintaseptingentioktoquadragintaseptingentinovenquadragintaseptingentiquinquagintaseptingentiunquinquagintaseptingentiduoquinquagintaseptingentitresquinquagintaseptingentiquattuorquinquagintaseptingentiquinquaquinquagintaseptingentisesquinquagintaseptingentiseptenquinquagintaseptingentioktoquinquagintaseptingentinovenquinquagintaseptingentisexagintaseptingentiunsexagintaseptingentiduosexagintaseptingentitresexagintaseptingentiquattuorsexagintaseptingentiquinquasexagintaseptingentisesexagintaseptingentiseptensexagintaseptingentioktosexagintaseptingentinovensexagintaseptingentiseptuagintaseptingentiunseptuagintaseptingentiduoseptuagintaseptingentitreseptuagintaseptingentiquattuorseptuagintaseptingentiquinquaseptuagintaseptingentiseseptuagintaseptingentiseptenseptuagintaseptingentioktoseptuagintaseptingentinovenseptuagintaseptingentioktogintaseptingentiunoktogintaseptingentiduooktogintaseptingentitreoktogintaseptingentiquattuoroktogintaseptingentiquinquaoktogintaseptingentisexoktogintaseptingentiseptemoktogintaseptingentioktooktogintaseptingentinovemoktogintaseptingentinonagintaseptingentiunnonagintaseptingentiduononagintaseptingentitrenonagintaseptingentiquattuornonagintaseptingentiquinquanonagintaseptingentisenonagintaseptingentiseptenonagintaseptingentioktononagintaseptingentinovenonagintaseptingentioktingentiunoktingentiduooktingentitreoktingentiquattuoroktingentiquinquaoktingentisexoktingentiseptemoktingentioktooktingentinovemoktingentidezioktingentiundezioktingentiduodezioktingentitredezioktingentiquattuordezioktingentiquindezioktingentisedezioktingentiseptendezioktingentioktodezioktingentinovendezioktingentivigintioktingentiunvigintioktingentiduovigintioktingentitresvigintioktingentiquattuorvigintioktingentiquinquavigintioktingentisesvigintioktingentiseptemvigintioktingentioktovigintioktingentinovemvigintioktingentitrigintaoktingentiuntrigintaoktingentiduotrigintaoktingentitrestrigintaoktingentiquattuortrigintaoktingentiquinquatrigintaoktingentisestrigintaoktingentiseptentrigintaoktingentioktotrigintaoktingentinoventrigintaoktingentiquadragintaoktingentiunquadragintaoktingentiduoquadragintaoktingentitresquadragintaoktingentiquattuorquadragintaoktingentiquinquaquadragintaoktingentisesquadragintaoktingentiseptenquadragintaoktingentioktoquadragintaoktingentinovenquadragintaoktingentiquinquagintaoktingentiunquinquagintaoktingentiduoquinquagintaoktingentitresquinquagintaoktingentiquattuorquinquagintaoktingentiquinquaquinquagintaoktingentisesquinquagintaoktingentiseptenquinquagintaoktingentioktoquinquagintaoktingentinovenquinquagintaoktingentisexagintaoktingentiunsexagintaoktingentiduosexagintaoktingentitresexagintaoktingentiquattuorsexagintaoktingentiquinquasexagintaoktingentisesexagintaoktingentiseptensexagintaoktingentioktosexagintaoktingentinovensexagintaoktingentiseptuagintaoktingentiunseptuagintaoktingentiduoseptuagintaoktingentitreseptuagintaoktingentiquattuorseptuagintaoktingentiquinquaseptuagintaoktingentiseseptuagintaoktingentiseptenseptuagintaoktingentioktoseptuagintaoktingentinovenseptuagintaoktingentioktogintaoktingentiunoktogintaoktingentiduooktogintaoktingentitreoktogintaoktingentiquattuoroktogintaoktingentiquinquaoktogintaoktingentisexoktogintaoktingentiseptemoktogintaoktingentioktooktogintaoktingentinovemoktogintaoktingentinonagintaoktingentiunnonagintaoktingentiduononagintaoktingentitrenonagintaoktingentiquattuornonagintaoktingentiquinquanonagintaoktingentisenonagintaoktingentiseptenonagintaoktingentioktononagintaoktingentinovenonagintaoktingentinongentiunnongentiduonongentitrenongentiquattuornongentiquinquanongentisenongentiseptenongentioktonongentinovenongentidezinongentiundezinongentiduodezinongentitredezinongentiquattuordezinongentiquindezinongentisedezinongentiseptendezinongentioktodezinongentinovendezinongentivigintinongentiunvigintinongentiduovigintinongentitresvigintinongentiquattuorvigintinongentiquinquavigintinongentisesvigintinongentiseptemvigintinongentioktovigintinongentinovemvigintinongentitrigintanongentiuntrigintanongentiduotrigintanongentitrestrigintanongentiquattuortrigintanongentiquinquatrigintanongentisestrigintanongentiseptentrigintanongentioktotrigintanongentinoventrigintanongentiquadragintanongentiunquadragintanongentiduoquadragintanongentitresquadragintanongentiquattuorquadragintanongentiquinquaquadragintanongentisesquadragintanongentiseptenquadragintanongentioktoquadragintanongentinovenquadragintanongentiquinquagintanongentiunquinquagintanongentiduoquinquagintanongentitresquinquagintanongentiquattuorquinquagintanongentiquinquaquinquagintanongentisesquinquagintanongentiseptenquinquagintanongentioktoquinquagintanongentinovenquinquagintanongentisexagintanongentiunsexagintanongentiduosexagintanongentitresexagintanongentiquattuorsexagintanongentiquinquasexagintanongentisesexagintanongentiseptensexagintanongentioktosexagintanongentinovensexagintanongentiseptuagintanongentiunseptuagintanongentiduoseptuagintanongentitreseptuagintanongentiquattuorseptuagintanongentiquinquaseptuagintanongentiseseptuagintanongentiseptenseptuagintanongentioktoseptuagintanongentinovenseptuagintanongentioktogintanongentiunoktogintanongentiduooktogintanongentitreoktogintanongentiquattuoroktogintanongentiquinquaoktogintanongentisexoktogintanongentiseptemoktogintanongentioktooktogintanongentinovemoktogintanongentinonagintanongentiunnonagintanongentiduononagintanongentitrenonagintanongentiquattuornonagintanongentiquinquanonagintanongentisenonagintanongentiseptenonagintanongentioktononagintanongentinovenonagintanongenti'
+
+# Where the prefixes of the numbers start in PACKED; the last offset is the end of 999.
+# Key is (synonym, chuquet, stem).
+OFFSETS = {
+    (False, False, False): (0, 2, 4, 6, 9, 15, 21, 26, 31, 35, 39, 43, 49, 56, 63, 75, 83, 89, 99, 107, 116, 123, 132, 142, 153, 168, 182, 192, 205, 216, 228, 236, 246, 257, 269, 285, 300, 311, 325, 337, 350, 361, 374, 388, 403, 422, 440, 454, 471, 486, 502, 514, 528, 543, 559, 579, 598, 613, 631, 647, 664, 673, 684, 696, 708, 725, 741, 752, 767, 780, 794, 805, 818, 832, 846, 865, 883, 896, 913, 928, 944, 953, 964, 976, 988, 1005, 1021, 1033, 1048, 1061, 1075, 1084, 1095, 1107, 1119, 1136, 1152, 1163, 1177, 1190, 1203, 1208, 1215, 1223, 1232, 1245, 1257, 1265, 1276, 1285, 1295, 1304, 1315, 1327, 1339, 1356, 1369, 1380, 1395, 1408, 1422, 1434, 1448, 1463, 1479, 1499, 1518, 1533, 1551, 1567, 1584, 1597, 1612, 1628, 1645, 1666, 1686, 1702, 1721, 1738, 1756, 1772, 1790, 1809, 1829, 1853, 1876, 1895, 1917, 1937, 1958, 1975, 1994, 2014, 2035, 2060, 2084, 2104, 2127, 2148, 2170, 2184, 2200, 2217, 2234, 2256, 2277, 2293, 2313, 2331, 2350, 2366, 2384, 2403, 2422, 2446, 2469, 2487, 2509, 2529, 2550, 2564, 2580, 2597, 2614, 2636, 2657, 2674, 2694, 2712, 2731, 2745, 2761, 2778, 2795, 2817, 2838, 2854, 2873, 2891, 2909, 2916, 2925, 2935, 2945, 2960, 2974, 2983, 2996, 3007, 3019, 3030, 3043, 3057, 3071, 3090, 3105, 3118, 3135, 3150, 3166, 3180, 3196, 3213, 3231, 3253, 3274, 3291, 3311, 3329, 3348, 3363, 3380, 3398, 3417, 3440, 3462, 3480, 3501, 3520, 3540, 3558, 3578, 3599, 3621, 3647, 3672, 3693, 3717, 3739, 3762, 3781, 3802, 3824, 3847, 3874, 3900, 3922, 3947, 3970, 3994, 4010, 4028, 4047, 4066, 4090, 4113, 4131, 4153, 4173, 4194, 4212, 4232, 4253, 4274, 4300, 4325, 4345, 4369, 4391, 4414, 4430, 4448, 4467, 4486, 4510, 4533, 4552, 4574, 4594, 4615, 4631, 4649, 4668, 4687, 4711, 4734, 4752, 4773, 4793, 4813, 4821, 4831, 4842, 4854, 4870, 4885, 4896, 4910, 4922, 4935, 4947, 4961, 4976, 4991, 5011, 5027, 5041, 5059, 5075, 5092, 5107, 5124, 5142, 5161, 5184, 5206, 5224, 5245, 5264, 5284, 5300, 5318, 5337, 5357, 5381, 5404, 5423, 5445, 5465, 5486, 5505, 5526, 5548, 5571, 5598, 5624, 5646, 5671, 5694, 5718, 5738, 5760, 5783, 5807, 5835, 5862, 5885, 5911, 5935, 5960, 5977, 5996, 6016, 6036, 6061, 6085, 6104, 6127, 6148, 6170, 6189, 6210, 6232, 6254, 6281, 6307, 6328, 6353, 6376, 6400, 6417, 6436, 6456, 6476, 6501, 6525, 6545, 6568, 6589, 6611, 6628, 6647, 6667, 6687, 6712, 6736, 6755, 6777, 6798, 6819, 6831, 6845, 6860, 6876, 6896, 6915, 6930, 6948, 6964, 6981, 6997, 7015, 7034, 7053, 7077, 7097, 7115, 7137, 7157, 7178, 7197, 7218, 7240, 7263, 7290, 7316, 7338, 7363, 7386, 7410, 7430, 7452, 7475, 7499, 7527, 7554, 7577, 7603, 7627, 7652, 7675, 7700, 7726, 7753, 7784, 7814, 7840, 7869, 7896, 7924, 7948, 7974, 8001, 8029, 8061, 8092, 8119, 8149, 8177, 8206, 8227, 8250, 8274, 8298, 8327, 8355, 8378, 8405, 8430, 8456, 8479, 8504, 8530, 8556, 8587, 8617, 8642, 8671, 8698, 8726, 8747, 8770, 8794, 8818, 8847, 8875, 8899, 8926, 8951, 8977, 8998, 9021, 9045, 9069, 9098, 9126, 9149, 9175, 9200, 9225, 9234, 9245, 9257, 9270, 9287, 9303, 9315, 9330, 9343, 9357, 9370, 9385, 9401, 9417, 9438, 9455, 9470, 9489, 9506, 9524, 9540, 9558, 9577, 9597, 9621, 9644, 9663, 9685, 9705, 9726, 9743, 9762, 9782, 9803, 9828, 9852, 9872, 9895, 9916, 9938, 9958, 9980, 10003, 10027, 10055, 10082, 10105, 10131, 10155, 10180, 10201, 10224, 10248, 10273, 10302, 10330, 10354, 10381, 10406, 10432, 10450, 10470, 10491, 10512, 10538, 10563, 10583, 10607, 10629, 10652, 10672, 10694, 10717, 10740, 10768, 10795, 10817, 10843, 10867, 10892, 10910, 10930, 10951, 10972, 10998, 11023, 11044, 11068, 11090, 11113, 11131, 11151, 11172, 11193, 11219, 11244, 11264, 11287, 11309, 11331, 11339, 11349, 11360, 11371, 11387, 11402, 11412, 11426, 11438, 11451, 11463, 11477, 11492, 11507, 11527, 11543, 11557, 11575, 11591, 11608, 11623, 11640, 11658, 11677, 11700, 11722, 11740, 11761, 11780, 11800, 11816, 11834, 11853, 11873, 11897, 11920, 11939, 11961, 11981, 12002, 12021, 12042, 12064, 12087, 12114, 12140, 12162, 12187, 12210, 12234, 12254, 12276, 12299, 12323, 12351, 12378, 12401, 12427, 12451, 12476, 12493, 12512, 12532, 12552, 12577, 12601, 12620, 12643, 12664, 12686, 12705, 12726, 12748, 12770, 12797, 12823, 12844, 12869, 12892, 12916, 12933, 12952, 12972, 12992, 13017, 13041, 13061, 13084, 13105, 13127, 13144, 13163, 13183, 13203, 13228, 13252, 13271, 13293, 13314, 13335, 13346, 13359, 13373, 13387, 13406, 13424, 13437, 13454, 13469, 13485, 13500, 13517, 13535, 13553, 13576, 13595, 13612, 13633, 13652, 13672, 13690, 13710, 13731, 13753, 13779, 13804, 13825, 13849, 13871, 13894, 13913, 13934, 13956, 13979, 14006, 14032, 14054, 14079, 14102, 14126, 14148, 14172, 14197, 14223, 14253, 14282, 14307, 14335, 14361, 14388, 14411, 14436, 14462, 14489, 14520, 14550, 14576, 14605, 14632, 14660, 14680, 14702, 14725, 14748, 14776, 14803, 14825, 14851, 14875, 14900, 14922, 14946, 14971, 14996, 15026, 15055, 15079, 15107, 15133, 15160, 15180, 15202, 15225, 15248, 15276, 15303, 15326, 15352, 15376, 15401, 15421, 15443, 15466, 15489, 15517, 15544, 15566, 15591, 15615, 15639, 15649, 15661, 15674, 15687, 15705, 15722, 15735, 15751, 15765, 15780, 15794, 15810, 15827, 15844, 15866, 15884, 15900, 15920, 15938, 15957, 15974, 15993, 16013, 16034, 16059, 16083, 16103, 16126, 16147, 16169, 16187, 16207, 16228, 16250, 16276, 16301, 16322, 16346, 16368, 16391, 16412, 16435, 16459, 16484, 16513, 16541, 16565, 16592, 16617, 16643, 16665, 16689, 16714, 16740, 16770, 16799, 16824, 16852, 16878, 16905, 16924, 16945, 16967, 16989, 17016, 17042, 17063, 17088, 17111, 17135, 17156, 17179, 17203, 17227, 17256, 17284, 17307, 17334, 17359, 17385, 17404, 17425, 17447, 17469, 17496, 17522, 17544, 17569, 17592, 17616, 17635, 17656, 17678, 17700, 17727, 17753, 17774, 17798, 17821, 17844, 17852, 17862, 17873, 17884, 17900, 17915, 17925, 17938, 17950, 17962, 17974, 17988, 18003, 18018, 18038, 18054, 18068, 18086, 18102, 18119, 18134, 18151, 18169, 18188, 18211, 18233, 18251, 18272, 18291, 18311, 18327, 18345, 18364, 18384, 18408, 18431, 18450, 18472, 18492, 18513, 18532, 18553, 18575, 18598, 18625, 18651, 18673, 18698, 18721, 18745, 18765, 18787, 18810, 18834, 18862, 18889, 18912, 18938, 18962, 18987, 19004, 19023, 19043, 19063, 19088, 19112, 19131, 19154, 19175, 19197, 19216, 19237, 19259, 19281, 19308, 19334, 19355, 19380, 19403, 19427, 19444, 19463, 19483, 19503, 19528, 19552, 19572, 19595, 19616, 19638, 19655, 19674, 19694, 19714, 19739, 19763, 19782, 19804, 19825, 19846),
+    (False, False, True): (19846, 19848, 19850, 19852, 19855, 19861, 19867, 19872, 19877, 19881, 19885, 19889, 19895, 19902, 19909, 19921, 19929, 19935, 19945, 19953, 19962, 19969, 19978, 19988, 19999, 20014, 20028, 20038, 20051, 20062, 20074, 20082, 20092, 20103, 20115, 20131, 20146, 20157, 20171, 20183, 20196, 20207, 20220, 20234, 20249, 20268, 20286, 20300, 20317, 20332, 20348, 20360, 20374, 20389, 20405, 20425, 20444, 20459, 20477, 20493, 20510, 20519, 20530, 20542, 20554, 20571, 20587, 20598, 20613, 20626, 20640, 20651, 20664, 20678, 20692, 20711, 20729, 20742, 20759, 20774, 20790, 20799, 20810, 20822, 20834, 20851, 20867, 20879, 20894, 20907, 20921, 20930, 20941, 20953, 20965, 20982, 20998, 21009, 21023, 21036, 21049, 21054, 21061, 21069, 21078, 21091, 21103, 21111, 21122, 21131, 21141, 21150, 21161, 21173, 21185, 21202, 21215, 21226, 21241, 21254, 21268, 21280, 21294, 21309, 21325, 21345, 21364, 21379, 21397, 21413, 21430, 21443, 21458, 21474, 21491, 21512, 21532, 21548, 21567, 21584, 21602, 21618, 21636, 21655, 21675, 21699, 21722, 21741, 21763, 21783, 21804, 21821, 21840, 21860, 21881, 21906, 21930, 21950, 21973, 21994, 22016, 22030, 22046, 22063, 22080, 22102, 22123, 22139, 22159, 22177, 22196, 22212, 22230, 22249, 22268, 22292, 22315, 22333, 22355, 22375, 22396, 22410, 22426, 22443, 22460, 22482, 22503, 22520, 22540, 22558, 22577, 22591, 22607, 22624, 22641, 22663, 22684, 22700, 22719, 22737, 22755, 22762, 22771, 22781, 22791, 22806, 22820, 22829, 22842, 22853, 22865, 22876, 22889, 22903, 22917, 22936, 22951, 22964, 22981, 22996, 23012, 23026, 23042, 23059, 23077, 23099, 23120, 23137, 23157, 23175, 23194, 23209, 23226, 23244, 23263, 23286, 23308, 23326, 23347, 23366, 23386, 23404, 23424, 23445, 23467, 23493, 23518, 23539, 23563, 23585, 23608, 23627, 23648, 23670, 23693, 23720, 23746, 23768, 23793, 23816, 23840, 23856, 23874, 23893, 23912, 23936, 23959, 23977, 23999, 24019, 24040, 24058, 24078, 24099, 24120, 24146, 24171, 24191, 24215, 24237, 24260, 24276, 24294, 24313, 24332, 24356, 24379, 24398, 24420, 24440, 24461, 24477, 24495, 24514, 24533, 24557, 24580, 24598, 24619, 24639, 24659, 24667, 24677, 24688, 24700, 24716, 24731, 24742, 24756, 24768, 24781, 24793, 24807, 24822, 24837, 24857, 24873, 24887, 24905, 24921, 24938, 24953, 24970, 24988, 25007, 25030, 25052, 25070, 25091, 25110, 25130, 25146, 25164, 25183, 25203, 25227, 25250, 25269, 25291, 25311, 25332, 25351, 25372, 25394, 25417, 25444, 25470, 25492, 25517, 25540, 25564, 25584, 25606, 25629, 25653, 25681, 25708, 25731, 25757, 25781, 25806, 25823, 25842, 25862, 25882, 25907, 25931, 25950, 25973, 25994, 26016, 26035, 26056, 26078, 26100, 26127, 26153, 26174, 26199, 26222, 26246, 26263, 26282, 26302, 26322, 26347, 26371, 26391, 26414, 26435, 26457, 26474, 26493, 26513, 26533, 26558, 26582, 26601, 26623, 26644, 26665, 26677, 26691, 26706, 26722, 26742, 26761, 26776, 26794, 26810, 26827, 26843, 26861, 26880, 26899, 26923, 26943, 26961, 26983, 27003, 27024, 27043, 27064, 27086, 27109, 27136, 27162, 27184, 27209, 27232, 27256, 27276, 27298, 27321, 27345, 27373, 27400, 27423, 27449, 27473, 27498, 27521, 27546, 27572, 27599, 27630, 27660, 27686, 27715, 27742, 27770, 27794, 27820, 27847, 27875, 27907, 27938, 27965, 27995, 28023, 28052, 28073, 28096, 28120, 28144, 28173, 28201, 28224, 28251, 28276, 28302, 28325, 28350, 28376, 28402, 28433, 28463, 28488, 28517, 28544, 28572, 28593, 28616, 28640, 28664, 28693, 28721, 28745, 28772, 28797, 28823, 28844, 28867, 28891, 28915, 28944, 28972, 28995, 29021, 29046, 29071, 29080, 29091, 29103, 29116, 29133, 29149, 29161, 29176, 29189, 29203, 29216, 29231, 29247, 29263, 29284, 29301, 29316, 29335, 29352, 29370, 29386, 29404, 29423, 29443, 29467, 29490, 29509, 29531, 29551, 29572, 29589, 29608, 29628, 29649, 29674, 29698, 29718, 29741, 29762, 29784, 29804, 29826, 29849, 29873, 29901, 29928, 29951, 29977, 30001, 30026, 30047, 30070, 30094, 30119, 30148, 30176, 30200, 30227, 30252, 30278, 30296, 30316, 30337, 30358, 30384, 30409, 30429, 30453, 30475, 30498, 30518, 30540, 30563, 30586, 30614, 30641, 30663, 30689, 30713, 30738, 30756, 30776, 30797, 30818, 30844, 30869, 30890, 30914, 30936, 30959, 30977, 30997, 31018, 31039, 31065, 31090, 31110, 31133, 31155, 31177, 31185, 31195, 31206, 31217, 31233, 31248, 31258, 31272, 31284, 31297, 31309, 31323, 31338, 31353, 31373, 31389, 31403, 31421, 31437, 31454, 31469, 31486, 31504, 31523, 31546, 31568, 31586, 31607, 31626, 31646, 31662, 31680, 31699, 31719, 31743, 31766, 31785, 31807, 31827, 31848, 31867, 31888, 31910, 31933, 31960, 31986, 32008, 32033, 32056, 32080, 32100, 32122, 32145, 32169, 32197, 32224, 32247, 32273, 32297, 32322, 32339, 32358, 32378, 32398, 32423, 32447, 32466, 32489, 32510, 32532, 32551, 32572, 32594, 32616, 32643, 32669, 32690, 32715, 32738, 32762, 32779, 32798, 32818, 32838, 32863, 32887, 32907, 32930, 32951, 32973, 32990, 33009, 33029, 33049, 33074, 33098, 33117, 33139, 33160, 33181, 33192, 33205, 33219, 33233, 33252, 33270, 33283, 33300, 33315, 33331, 33346, 33363, 33381, 33399, 33422, 33441, 33458, 33479, 33498, 33518, 33536, 33556, 33577, 33599, 33625, 33650, 33671, 33695, 33717, 33740, 33759, 33780, 33802, 33825, 33852, 33878, 33900, 33925, 33948, 33972, 33994, 34018, 34043, 34069, 34099, 34128, 34153, 34181, 34207, 34234, 34257, 34282, 34308, 34335, 34366, 34396, 34422, 34451, 34478, 34506, 34526, 34548, 34571, 34594, 34622, 34649, 34671, 34697, 34721, 34746, 34768, 34792, 34817, 34842, 34872, 34901, 34925, 34953, 34979, 35006, 35026, 35048, 35071, 35094, 35122, 35149, 35172, 35198, 35222, 35247, 35267, 35289, 35312, 35335, 35363, 35390, 35412, 35437, 35461, 35485, 35495, 35507, 35520, 35533, 35551, 35568, 35581, 35597, 35611, 35626, 35640, 35656, 35673, 35690, 35712, 35730, 35746, 35766, 35784, 35803, 35820, 35839, 35859, 35880, 35905, 35929, 35949, 35972, 35993, 36015, 36033, 36053, 36074, 36096, 36122, 36147, 36168, 36192, 36214, 36237, 36258, 36281, 36305, 36330, 36359, 36387, 36411, 36438, 36463, 36489, 36511, 36535, 36560, 36586, 36616, 36645, 36670, 36698, 36724, 36751, 36770, 36791, 36813, 36835, 36862, 36888, 36909, 36934, 36957, 36981, 37002, 37025, 37049, 37073, 37102, 37130, 37153, 37180, 37205, 37231, 37250, 37271, 37293, 37315, 37342, 37368, 37390, 37415, 37438, 37462, 37481, 37502, 37524, 37546, 37573, 37599, 37620, 37644, 37667, 37690, 37698, 37708, 37719, 37730, 37746, 37761, 37771, 37784, 37796, 37808, 37820, 37834, 37849, 37864, 37884, 37900, 37914, 37932, 37948, 37965, 37980, 37997, 38015, 38034, 38057, 38079, 38097, 38118, 38137, 38157, 38173, 38191, 38210, 38230, 38254, 38277, 38296, 38318, 38338, 38359, 38378, 38399, 38421, 38444, 38471, 38497, 38519, 38544, 38567, 38591, 38611, 38633, 38656, 38680, 38708, 38735, 38758, 38784, 38808, 38833, 38850, 38869, 38889, 38909, 38934, 38958, 38977, 39000, 39021, 39043, 39062, 39083, 39105, 39127, 39154, 39180, 39201, 39226, 39249, 39273, 39290, 39309, 39329, 39349, 39374, 39398, 39418, 39441, 39462, 39484, 39501, 39520, 39540, 39560, 39585, 39609, 39628, 39650, 39671, 39692),
+    (False, True, False): (39692, 39694, 39696, 39698, 39701, 39707, 39713, 39718, 39723, 39727, 39731, 39735, 39741, 39748, 39755, 39767, 39775, 39781, 39791, 39803, 39814, 39821, 39830, 39840, 39851, 39866, 39880, 39890, 39903, 39916, 39928, 39936, 39946, 39957, 39969, 39985, 40000, 40011, 40025, 40041, 40056, 40067, 40080, 40094, 40109, 40128, 40146, 40160, 40177, 40194, 40210, 40222, 40236, 40251, 40267, 40287, 40306, 40321, 40339, 40353, 40366, 40375, 40386, 40398, 40410, 40427, 40443, 40454, 40469, 40485, 40500, 40511, 40524, 40538, 40552, 40571, 40589, 40602, 40619, 40633, 40646, 40655, 40666, 40678, 40690, 40707, 40723, 40735, 40750, 40764, 40777, 40786, 40797, 40809, 40821, 40838, 40854, 40865, 40879, 40889, 40898, 40903, 40910, 40918, 40927, 40940, 40952, 40960, 40971, 40980, 40990, 40999, 41010, 41022, 41034, 41051, 41064, 41075, 41090, 41103, 41117, 41129, 41143, 41158, 41174, 41194, 41213, 41228, 41246, 41262, 41279, 41292, 41307, 41323, 41340, 41361, 41381, 41397, 41416, 41433, 41451, 41467, 41485, 41504, 41524, 41548, 41571, 41590, 41612, 41632, 41653, 41670, 41689, 41709, 41730, 41755, 41779, 41799, 41822, 41843, 41865, 41879, 41895, 41912, 41929, 41951, 41972, 41988, 42008, 42026, 42045, 42061, 42079, 42098, 42117, 42141, 42164, 42182, 42204, 42224, 42245, 42259, 42275, 42292, 42309, 42331, 42352, 42369, 42389, 42407, 42426, 42440, 42456, 42473, 42490, 42512, 42533, 42549, 42568, 42586, 42604, 42611, 42620, 42630, 42640, 42655, 42669, 42678, 42691, 42702, 42714, 42725, 42738, 42752, 42766, 42785, 42800, 42813, 42830, 42845, 42861, 42875, 42891, 42908, 42926, 42948, 42969, 42986, 43006, 43024, 43043, 43058, 43075, 43093, 43112, 43135, 43157, 43175, 43196, 43215, 43235, 43253, 43273, 43294, 43316, 43342, 43367, 43388, 43412, 43434, 43457, 43476, 43497, 43519, 43542, 43569, 43595, 43617, 43642, 43665, 43689, 43705, 43723, 43742, 43761, 43785, 43808, 43826, 43848, 43868, 43889, 43907, 43927, 43948, 43969, 43995, 44020, 44040, 44064, 44086, 44109, 44125, 44143, 44162, 44181, 44205, 44228, 44247, 44269, 44289, 44310, 44326, 44344, 44363, 44382, 44406, 44429, 44447, 44468, 44488, 44508, 44516, 44526, 44537, 44549, 44565, 44580, 44591, 44605, 44617, 44630, 44642, 44656, 44671, 44686, 44706, 44722, 44736, 44754, 44770, 44787, 44802, 44819, 44837, 44856, 44879, 44901, 44919, 44940, 44959, 44979, 44995, 45013, 45032, 45052, 45076, 45099, 45118, 45140, 45160, 45181, 45200, 45221, 45243, 45266, 45293, 45319, 45341, 45366, 45389, 45413, 45433, 45455, 45478, 45502, 45530, 45557, 45580, 45606, 45630, 45655, 45672, 45691, 45711, 45731, 45756, 45780, 45799, 45822, 45843, 45865, 45884, 45905, 45927, 45949, 45976, 46002, 46023, 46048, 46071, 46095, 46112, 46131, 46151, 46171, 46196, 46220, 46240, 46263, 46284, 46306, 46323, 46342, 46362, 46382, 46407, 46431, 46450, 46472, 46493, 46514, 46526, 46540, 46555, 46571, 46591, 46610, 46625, 46643, 46659, 46676, 46692, 46710, 46729, 46748, 46772, 46792, 46810, 46832, 46852, 46873, 46892, 46913, 46935, 46958, 46985, 47011, 47033, 47058, 47081, 47105, 47125, 47147, 47170, 47194, 47222, 47249, 47272, 47298, 47322, 47347, 47370, 47395, 47421, 47448, 47479, 47509, 47535, 47564, 47591, 47619, 47643, 47669, 47696, 47724, 47756, 47787, 47814, 47844, 47872, 47901, 47922, 47945, 47969, 47993, 48022, 48050, 48073, 48100, 48125, 48151, 48174, 48199, 48225, 48251, 48282, 48312, 48337, 48366, 48393, 48421, 48442, 48465, 48489, 48513, 48542, 48570, 48594, 48621, 48646, 48672, 48693, 48716, 48740, 48764, 48793, 48821, 48844, 48870, 48895, 48920, 48929, 48940, 48952, 48965, 48982, 48998, 49010, 49025, 49038, 49052, 49065, 49080, 49096, 49112, 49133, 49150, 49165, 49184, 49201, 49219, 49235, 49253, 49272, 49292, 49316, 49339, 49358, 49380, 49400, 49421, 49438, 49457, 49477, 49498, 49523, 49547, 49567, 49590, 49611, 49633, 49653, 49675, 49698, 49722, 49750, 49777, 49800, 49826, 49850, 49875, 49896, 49919, 49943, 49968, 49997, 50025, 50049, 50076, 50101, 50127, 50145, 50165, 50186, 50207, 50233, 50258, 50278, 50302, 50324, 50347, 50367, 50389, 50412, 50435, 50463, 50490, 50512, 50538, 50562, 50587, 50605, 50625, 50646, 50667, 50693, 50718, 50739, 50763, 50785, 50808, 50826, 50846, 50867, 50888, 50914, 50939, 50959, 50982, 51004, 51026, 51034, 51044, 51055, 51066, 51082, 51097, 51107, 51121, 51133, 51146, 51158, 51172, 51187, 51202, 51222, 51238, 51252, 51270, 51286, 51303, 51318, 51335, 51353, 51372, 51395, 51417, 51435, 51456, 51475, 51495, 51511, 51529, 51548, 51568, 51592, 51615, 51634, 51656, 51676, 51697, 51716, 51737, 51759, 51782, 51809, 51835, 51857, 51882, 51905, 51929, 51949, 51971, 51994, 52018, 52046, 52073, 52096, 52122, 52146, 52171, 52188, 52207, 52227, 52247, 52272, 52296, 52315, 52338, 52359, 52381, 52400, 52421, 52443, 52465, 52492, 52518, 52539, 52564, 52587, 52611, 52628, 52647, 52667, 52687, 52712, 52736, 52756, 52779, 52800, 52822, 52839, 52858, 52878, 52898, 52923, 52947, 52966, 52988, 53009, 53030, 53041, 53054, 53068, 53082, 53101, 53119, 53132, 53149, 53164, 53180, 53195, 53212, 53230, 53248, 53271, 53290, 53307, 53328, 53347, 53367, 53385, 53405, 53426, 53448, 53474, 53499, 53520, 53544, 53566, 53589, 53608, 53629, 53651, 53674, 53701, 53727, 53749, 53774, 53797, 53821, 53843, 53867, 53892, 53918, 53948, 53977, 54002, 54030, 54056, 54083, 54106, 54131, 54157, 54184, 54215, 54245, 54271, 54300, 54327, 54355, 54375, 54397, 54420, 54443, 54471, 54498, 54520, 54546, 54570, 54595, 54617, 54641, 54666, 54691, 54721, 54750, 54774, 54802, 54828, 54855, 54875, 54897, 54920, 54943, 54971, 54998, 55021, 55047, 55071, 55096, 55116, 55138, 55161, 55184, 55212, 55239, 55261, 55286, 55310, 55334, 55344, 55356, 55369, 55382, 55400, 55417, 55430, 55446, 55460, 55475, 55489, 55505, 55522, 55539, 55561, 55579, 55595, 55615, 55633, 55652, 55669, 55688, 55708, 55729, 55754, 55778, 55798, 55821, 55842, 55864, 55882, 55902, 55923, 55945, 55971, 55996, 56017, 56041, 56063, 56086, 56107, 56130, 56154, 56179, 56208, 56236, 56260, 56287, 56312, 56338, 56360, 56384, 56409, 56435, 56465, 56494, 56519, 56547, 56573, 56600, 56619, 56640, 56662, 56684, 56711, 56737, 56758, 56783, 56806, 56830, 56851, 56874, 56898, 56922, 56951, 56979, 57002, 57029, 57054, 57080, 57099, 57120, 57142, 57164, 57191, 57217, 57239, 57264, 57287, 57311, 57330, 57351, 57373, 57395, 57422, 57448, 57469, 57493, 57516, 57539, 57547, 57557, 57568, 57579, 57595, 57610, 57620, 57633, 57645, 57657, 57669, 57683, 57698, 57713, 57733, 57749, 57763, 57781, 57797, 57814, 57829, 57846, 57864, 57883, 57906, 57928, 57946, 57967, 57986, 58006, 58022, 58040, 58059, 58079, 58103, 58126, 58145, 58167, 58187, 58208, 58227, 58248, 58270, 58293, 58320, 58346, 58368, 58393, 58416, 58440, 58460, 58482, 58505, 58529, 58557, 58584, 58607, 58633, 58657, 58682, 58699, 58718, 58738, 58758, 58783, 58807, 58826, 58849, 58870, 58892, 58911, 58932, 58954, 58976, 59003, 59029, 59050, 59075, 59098, 59122, 59139, 59158, 59178, 59198, 59223, 59247, 59267, 59290, 59311, 59333, 59350, 59369, 59389, 59409, 59434, 59458, 59477, 59499, 59520, 59541),
+    (False, True, True): (59541, 59543, 59545, 59547, 59550, 59556, 59562, 59567, 59572, 59576, 59580, 59584, 59590, 59597, 59604, 59616, 59624, 59630, 59640, 59652, 59663, 59670, 59679, 59689, 59700, 59715, 59729, 59739, 59752, 59765, 59777, 59785, 59795, 59806, 59818, 59834, 59849, 59860, 59874, 59890, 59905, 59916, 59929, 59943, 59958, 59977, 59995, 60009, 60026, 60043, 60059, 60071, 60085, 60100, 60116, 60136, 60155, 60170, 60188, 60202, 60215, 60224, 60235, 60247, 60259, 60276, 60292, 60303, 60318, 60334, 60349, 60360, 60373, 60387, 60401, 60420, 60438, 60451, 60468, 60482, 60495, 60504, 60515, 60527, 60539, 60556, 60572, 60584, 60599, 60613, 60626, 60635, 60646, 60658, 60670, 60687, 60703, 60714, 60728, 60738, 60747, 60752, 60759, 60767, 60776, 60789, 60801, 60809, 60820, 60829, 60839, 60848, 60859, 60871, 60883, 60900, 60913, 60924, 60939, 60952, 60966, 60978, 60992, 61007, 61023, 61043, 61062, 61077, 61095, 61111, 61128, 61141, 61156, 61172, 61189, 61210, 61230, 61246, 61265, 61282, 61300, 61316, 61334, 61353, 61373, 61397, 61420, 61439, 61461, 61481, 61502, 61519, 61538, 61558, 61579, 61604, 61628, 61648, 61671, 61692, 61714, 61728, 61744, 61761, 61778, 61800, 61821, 61837, 61857, 61875, 61894, 61910, 61928, 61947, 61966, 61990, 62013, 62031, 62053, 62073, 62094, 62108, 62124, 62141, 62158, 62180, 62201, 62218, 62238, 62256, 62275, 62289, 62305, 62322, 62339, 62361, 62382, 62398, 62417, 62435, 62453, 62460, 62469, 62479, 62489, 62504, 62518, 62527, 62540, 62551, 62563, 62574, 62587, 62601, 62615, 62634, 62649, 62662, 62679, 62694, 62710, 62724, 62740, 62757, 62775, 62797, 62818, 62835, 62855, 62873, 62892, 62907, 62924, 62942, 62961, 62984, 63006, 63024, 63045, 63064, 63084, 63102, 63122, 63143, 63165, 63191, 63216, 63237, 63261, 63283, 63306, 63325, 63346, 63368, 63391, 63418, 63444, 63466, 63491, 63514, 63538, 63554, 63572, 63591, 63610, 63634, 63657, 63675, 63697, 63717, 63738, 63756, 63776, 63797, 63818, 63844, 63869, 63889, 63913, 63935, 63958, 63974, 63992, 64011, 64030, 64054, 64077, 64096, 64118, 64138, 64159, 64175, 64193, 64212, 64231, 64255, 64278, 64296, 64317, 64337, 64357, 64365, 64375, 64386, 64398, 64414, 64429, 64440, 64454, 64466, 64479, 64491, 64505, 64520, 64535, 64555, 64571, 64585, 64603, 64619, 64636, 64651, 64668, 64686, 64705, 64728, 64750, 64768, 64789, 64808, 64828, 64844, 64862, 64881, 64901, 64925, 64948, 64967, 64989, 65009, 65030, 65049, 65070, 65092, 65115, 65142, 65168, 65190, 65215, 65238, 65262, 65282, 65304, 65327, 65351, 65379, 65406, 65429, 65455, 65479, 65504, 65521, 65540, 65560, 65580, 65605, 65629, 65648, 65671, 65692, 65714, 65733, 65754, 65776, 65798, 65825, 65851, 65872, 65897, 65920, 65944, 65961, 65980, 66000, 66020, 66045, 66069, 66089, 66112, 66133, 66155, 66172, 66191, 66211, 66231, 66256, 66280, 66299, 66321, 66342, 66363, 66375, 66389, 66404, 66420, 66440, 66459, 66474, 66492, 66508, 66525, 66541, 66559, 66578, 66597, 66621, 66641, 66659, 66681, 66701, 66722, 66741, 66762, 66784, 66807, 66834, 66860, 66882, 66907, 66930, 66954, 66974, 66996, 67019, 67043, 67071, 67098, 67121, 67147, 67171, 67196, 67219, 67244, 67270, 67297, 67328, 67358, 67384, 67413, 67440, 67468, 67492, 67518, 67545, 67573, 67605, 67636, 67663, 67693, 67721, 67750, 67771, 67794, 67818, 67842, 67871, 67899, 67922, 67949, 67974, 68000, 68023, 68048, 68074, 68100, 68131, 68161, 68186, 68215, 68242, 68270, 68291, 68314, 68338, 68362, 68391, 68419, 68443, 68470, 68495, 68521, 68542, 68565, 68589, 68613, 68642, 68670, 68693, 68719, 68744, 68769, 68778, 68789, 68801, 68814, 68831, 68847, 68859, 68874, 68887, 68901, 68914, 68929, 68945, 68961, 68982, 68999, 69014, 69033, 69050, 69068, 69084, 69102, 69121, 69141, 69165, 69188, 69207, 69229, 69249, 69270, 69287, 69306, 69326, 69347, 69372, 69396, 69416, 69439, 69460, 69482, 69502, 69524, 69547, 69571, 69599, 69626, 69649, 69675, 69699, 69724, 69745, 69768, 69792, 69817, 69846, 69874, 69898, 69925, 69950, 69976, 69994, 70014, 70035, 70056, 70082, 70107, 70127, 70151, 70173, 70196, 70216, 70238, 70261, 70284, 70312, 70339, 70361, 70387, 70411, 70436, 70454, 70474, 70495, 70516, 70542, 70567, 70588, 70612, 70634, 70657, 70675, 70695, 70716, 70737, 70763, 70788, 70808, 70831, 70853, 70875, 70883, 70893, 70904, 70915, 70931, 70946, 70956, 70970, 70982, 70995, 71007, 71021, 71036, 71051, 71071, 71087, 71101, 71119, 71135, 71152, 71167, 71184, 71202, 71221, 71244, 71266, 71284, 71305, 71324, 71344, 71360, 71378, 71397, 71417, 71441, 71464, 71483, 71505, 71525, 71546, 71565, 71586, 71608, 71631, 71658, 71684, 71706, 71731, 71754, 71778, 71798, 71820, 71843, 71867, 71895, 71922, 71945, 71971, 71995, 72020, 72037, 72056, 72076, 72096, 72121, 72145, 72164, 72187, 72208, 72230, 72249, 72270, 72292, 72314, 72341, 72367, 72388, 72413, 72436, 72460, 72477, 72496, 72516, 72536, 72561, 72585, 72605, 72628, 72649, 72671, 72688, 72707, 72727, 72747, 72772, 72796, 72815, 72837, 72858, 72879, 72890, 72903, 72917, 72931, 72950, 72968, 72981, 72998, 73013, 73029, 73044, 73061, 73079, 73097, 73120, 73139, 73156, 73177, 73196, 73216, 73234, 73254, 73275, 73297, 73323, 73348, 73369, 73393, 73415, 73438, 73457, 73478, 73500, 73523, 73550, 73576, 73598, 73623, 73646, 73670, 73692, 73716, 73741, 73767, 73797, 73826, 73851, 73879, 73905, 73932, 73955, 73980, 74006, 74033, 74064, 74094, 74120, 74149, 74176, 74204, 74224, 74246, 74269, 74292, 74320, 74347, 74369, 74395, 74419, 74444, 74466, 74490, 74515, 74540, 74570, 74599, 74623, 74651, 74677, 74704, 74724, 74746, 74769, 74792, 74820, 74847, 74870, 74896, 74920, 74945, 74965, 74987, 75010, 75033, 75061, 75088, 75110, 75135, 75159, 75183, 75193, 75205, 75218, 75231, 75249, 75266, 75279, 75295, 75309, 75324, 75338, 75354, 75371, 75388, 75410, 75428, 75444, 75464, 75482, 75501, 75518, 75537, 75557, 75578, 75603, 75627, 75647, 75670, 75691, 75713, 75731, 75751, 75772, 75794, 75820, 75845, 75866, 75890, 75912, 75935, 75956, 75979, 76003, 76028, 76057, 76085, 76109, 76136, 76161, 76187, 76209, 76233, 76258, 76284, 76314, 76343, 76368, 76396, 76422, 76449, 76468, 76489, 76511, 76533, 76560, 76586, 76607, 76632, 76655, 76679, 76700, 76723, 76747, 76771, 76800, 76828, 76851, 76878, 76903, 76929, 76948, 76969, 76991, 77013, 77040, 77066, 77088, 77113, 77136, 77160, 77179, 77200, 77222, 77244, 77271, 77297, 77318, 77342, 77365, 77388, 77396, 77406, 77417, 77428, 77444, 77459, 77469, 77482, 77494, 77506, 77518, 77532, 77547, 77562, 77582, 77598, 77612, 77630, 77646, 77663, 77678, 77695, 77713, 77732, 77755, 77777, 77795, 77816, 77835, 77855, 77871, 77889, 77908, 77928, 77952, 77975, 77994, 78016, 78036, 78057, 78076, 78097, 78119, 78142, 78169, 78195, 78217, 78242, 78265, 78289, 78309, 78331, 78354, 78378, 78406, 78433, 78456, 78482, 78506, 78531, 78548, 78567, 78587, 78607, 78632, 78656, 78675, 78698, 78719, 78741, 78760, 78781, 78803, 78825, 78852, 78878, 78899, 78924, 78947, 78971, 78988, 79007, 79027, 79047, 79072, 79096, 79116, 79139, 79160, 79182, 79199, 79218, 79238, 79258, 79283, 79307, 79326, 79348, 79369, 79390),
+    (True, False, False): (79390, 79392, 79394, 79396, 79399, 79405, 79412, 79417, 79422, 79426, 79430, 79434, 79440, 79447, 79454, 79466, 79474, 79481, 79491, 79499, 79508, 79515, 79524, 79534, 79545, 79560, 79574, 79584, 79597, 79608, 79620, 79628, 79638, 79649, 79661, 79677, 79692, 79703, 79717, 79729, 79742, 79753, 79766, 79780, 79795, 79814, 79832, 79846, 79863, 79878, 79894, 79906, 79920, 79935, 79951, 79971, 79990, 80005, 80023, 80039, 80056, 80065, 80076, 80088, 80100, 80117, 80133, 80144, 80159, 80172, 80186, 80197, 80210, 80224, 80238, 80257, 80275, 80288, 80305, 80320, 80336, 80345, 80356, 80368, 80380, 80397, 80413, 80425, 80440, 80453, 80467, 80476, 80487, 80499, 80511, 80528, 80544, 80555, 80569, 80582, 80595, 80600, 80607, 80615, 80624, 80637, 80649, 80657, 80668, 80677, 80687, 80696, 80707, 80719, 80731, 80748, 80761, 80772, 80787, 80800, 80814, 80826, 80840, 80855, 80871, 80891, 80910, 80925, 80943, 80959, 80976, 80989, 81004, 81020, 81037, 81058, 81078, 81094, 81113, 81130, 81148, 81164, 81182, 81201, 81221, 81245, 81268, 81287, 81309, 81329, 81350, 81367, 81386, 81406, 81427, 81452, 81476, 81496, 81519, 81540, 81562, 81576, 81592, 81609, 81626, 81648, 81669, 81685, 81705, 81723, 81742, 81758, 81776, 81795, 81814, 81838, 81861, 81879, 81901, 81921, 81942, 81956, 81972, 81989, 82006, 82028, 82049, 82066, 82086, 82104, 82123, 82137, 82153, 82170, 82187, 82209, 82230, 82246, 82265, 82283, 82301, 82308, 82317, 82327, 82337, 82352, 82366, 82375, 82388, 82399, 82411, 82422, 82435, 82449, 82463, 82482, 82497, 82510, 82527, 82542, 82558, 82572, 82588, 82605, 82623, 82645, 82666, 82683, 82703, 82721, 82740, 82755, 82772, 82790, 82809, 82832, 82854, 82872, 82893, 82912, 82932, 82950, 82970, 82991, 83013, 83039, 83064, 83085, 83109, 83131, 83154, 83173, 83194, 83216, 83239, 83266, 83292, 83314, 83339, 83362, 83386, 83402, 83420, 83439, 83458, 83482, 83505, 83523, 83545, 83565, 83586, 83604, 83624, 83645, 83666, 83692, 83717, 83737, 83761, 83783, 83806, 83822, 83840, 83859, 83878, 83902, 83925, 83944, 83966, 83986, 84007, 84023, 84041, 84060, 84079, 84103, 84126, 84144, 84165, 84185, 84205, 84213, 84223, 84234, 84246, 84262, 84277, 84288, 84302, 84314, 84327, 84339, 84353, 84368, 84383, 84403, 84419, 84433, 84451, 84467, 84484, 84499, 84516, 84534, 84553, 84576, 84598, 84616, 84637, 84656, 84676, 84692, 84710, 84729, 84749, 84773, 84796, 84815, 84837, 84857, 84878, 84897, 84918, 84940, 84963, 84990, 85016, 85038, 85063, 85086, 85110, 85130, 85152, 85175, 85199, 85227, 85254, 85277, 85303, 85327, 85352, 85369, 85388, 85408, 85428, 85453, 85477, 85496, 85519, 85540, 85562, 85581, 85602, 85624, 85646, 85673, 85699, 85720, 85745, 85768, 85792, 85809, 85828, 85848, 85868, 85893, 85917, 85937, 85960, 85981, 86003, 86020, 86039, 86059, 86079, 86104, 86128, 86147, 86169, 86190, 86211, 86223, 86237, 86252, 86268, 86288, 86307, 86322, 86340, 86356, 86373, 86389, 86407, 86426, 86445, 86469, 86489, 86507, 86529, 86549, 86570, 86589, 86610, 86632, 86655, 86682, 86708, 86730, 86755, 86778, 86802, 86822, 86844, 86867, 86891, 86919, 86946, 86969, 86995, 87019, 87044, 87067, 87092, 87118, 87145, 87176, 87206, 87232, 87261, 87288, 87316, 87340, 87366, 87393, 87421, 87453, 87484, 87511, 87541, 87569, 87598, 87619, 87642, 87666, 87690, 87719, 87747, 87770, 87797, 87822, 87848, 87871, 87896, 87922, 87948, 87979, 88009, 88034, 88063, 88090, 88118, 88139, 88162, 88186, 88210, 88239, 88267, 88291, 88318, 88343, 88369, 88390, 88413, 88437, 88461, 88490, 88518, 88541, 88567, 88592, 88617, 88626, 88637, 88649, 88662, 88679, 88695, 88707, 88722, 88735, 88749, 88762, 88777, 88793, 88809, 88830, 88847, 88862, 88881, 88898, 88916, 88932, 88950, 88969, 88989, 89013, 89036, 89055, 89077, 89097, 89118, 89135, 89154, 89174, 89195, 89220, 89244, 89264, 89287, 89308, 89330, 89350, 89372, 89395, 89419, 89447, 89474, 89497, 89523, 89547, 89572, 89593, 89616, 89640, 89665, 89694, 89722, 89746, 89773, 89798, 89824, 89842, 89862, 89883, 89904, 89930, 89955, 89975, 89999, 90021, 90044, 90064, 90086, 90109, 90132, 90160, 90187, 90209, 90235, 90259, 90284, 90302, 90322, 90343, 90364, 90390, 90415, 90436, 90460, 90482, 90505, 90523, 90543, 90564, 90585, 90611, 90636, 90656, 90679, 90701, 90723, 90731, 90741, 90752, 90763, 90779, 90794, 90804, 90818, 90830, 90843, 90855, 90869, 90884, 90899, 90919, 90935, 90949, 90967, 90983, 91000, 91015, 91032, 91050, 91069, 91092, 91114, 91132, 91153, 91172, 91192, 91208, 91226, 91245, 91265, 91289, 91312, 91331, 91353, 91373, 91394, 91413, 91434, 91456, 91479, 91506, 91532, 91554, 91579, 91602, 91626, 91646, 91668, 91691, 91715, 91743, 91770, 91793, 91819, 91843, 91868, 91885, 91904, 91924, 91944, 91969, 91993, 92012, 92035, 92056, 92078, 92097, 92118, 92140, 92162, 92189, 92215, 92236, 92261, 92284, 92308, 92325, 92344, 92364, 92384, 92409, 92433, 92453, 92476, 92497, 92519, 92536, 92555, 92575, 92595, 92620, 92644, 92663, 92685, 92706, 92727, 92738, 92751, 92765, 92779, 92798, 92816, 92829, 92846, 92861, 92877, 92892, 92909, 92927, 92945, 92968, 92987, 93004, 93025, 93044, 93064, 93082, 93102, 93123, 93145, 93171, 93196, 93217, 93241, 93263, 93286, 93305, 93326, 93348, 93371, 93398, 93424, 93446, 93471, 93494, 93518, 93540, 93564, 93589, 93615, 93645, 93674, 93699, 93727, 93753, 93780, 93803, 93828, 93854, 93881, 93912, 93942, 93968, 93997, 94024, 94052, 94072, 94094, 94117, 94140, 94168, 94195, 94217, 94243, 94267, 94292, 94314, 94338, 94363, 94388, 94418, 94447, 94471, 94499, 94525, 94552, 94572, 94594, 94617, 94640, 94668, 94695, 94718, 94744, 94768, 94793, 94813, 94835, 94858, 94881, 94909, 94936, 94958, 94983, 95007, 95031, 95041, 95053, 95066, 95079, 95097, 95114, 95127, 95143, 95157, 95172, 95186, 95202, 95219, 95236, 95258, 95276, 95292, 95312, 95330, 95349, 95366, 95385, 95405, 95426, 95451, 95475, 95495, 95518, 95539, 95561, 95579, 95599, 95620, 95642, 95668, 95693, 95714, 95738, 95760, 95783, 95804, 95827, 95851, 95876, 95905, 95933, 95957, 95984, 96009, 96035, 96057, 96081, 96106, 96132, 96162, 96191, 96216, 96244, 96270, 96297, 96316, 96337, 96359, 96381, 96408, 96434, 96455, 96480, 96503, 96527, 96548, 96571, 96595, 96619, 96648, 96676, 96699, 96726, 96751, 96777, 96796, 96817, 96839, 96861, 96888, 96914, 96936, 96961, 96984, 97008, 97027, 97048, 97070, 97092, 97119, 97145, 97166, 97190, 97213, 97236, 97244, 97254, 97265, 97276, 97292, 97307, 97317, 97330, 97342, 97354, 97366, 97380, 97395, 97410, 97430, 97446, 97460, 97478, 97494, 97511, 97526, 97543, 97561, 97580, 97603, 97625, 97643, 97664, 97683, 97703, 97719, 97737, 97756, 97776, 97800, 97823, 97842, 97864, 97884, 97905, 97924, 97945, 97967, 97990, 98017, 98043, 98065, 98090, 98113, 98137, 98157, 98179, 98202, 98226, 98254, 98281, 98304, 98330, 98354, 98379, 98396, 98415, 98435, 98455, 98480, 98504, 98523, 98546, 98567, 98589, 98608, 98629, 98651, 98673, 98700, 98726, 98747, 98772, 98795, 98819, 98836, 98855, 98875, 98895, 98920, 98944, 98964, 98987, 99008, 99030, 99047, 99066, 99086, 99106, 99131, 99155, 99174, 99196, 99217, 99238),
+    (True, False, True): (99238, 99240, 99242, 99244, 99247, 99253, 99260, 99265, 99270, 99274, 99278, 99282, 99288, 99295, 99302, 99314, 99322, 99329, 99339, 99347, 99356, 99363, 99372, 99382, 99393, 99408, 99422, 99432, 99445, 99456, 99468, 99476, 99486, 99497, 99509, 99525, 99540, 99551, 99565, 99577, 99590, 99601, 99614, 99628, 99643, 99662, 99680, 99694, 99711, 99726, 99742, 99754, 99768, 99783, 99799, 99819, 99838, 99853, 99871, 99887, 99904, 99913, 99924, 99936, 99948, 99965, 99981, 99992, 100007, 100020, 100034, 100045, 100058, 100072, 100086, 100105, 100123, 100136, 100153, 100168, 100184, 100193, 100204, 100216, 100228, 100245, 100261, 100273, 100288, 100301, 100315, 100324, 100335, 100347, 100359, 100376, 100392, 100403, 100417, 100430, 100443, 100448, 100455, 100463, 100472, 100485, 100497, 100505, 100516, 100525, 100535, 100544, 100555, 100567, 100579, 100596, 100609, 100620, 100635, 100648, 100662, 100674, 100688, 100703, 100719, 100739, 100758, 100773, 100791, 100807, 100824, 100837, 100852, 100868, 100885, 100906, 100926, 100942, 100961, 100978, 100996, 101012, 101030, 101049, 101069, 101093, 101116, 101135, 101157, 101177, 101198, 101215, 101234, 101254, 101275, 101300, 101324, 101344, 101367, 101388, 101410, 101424, 101440, 101457, 101474, 101496, 101517, 101533, 101553, 101571, 101590, 101606, 101624, 101643, 101662, 101686, 101709, 101727, 101749, 101769, 101790, 101804, 101820, 101837, 101854, 101876, 101897, 101914, 101934, 101952, 101971, 101985, 102001, 102018, 102035, 102057, 102078, 102094, 102113, 102131, 102149, 102156, 102165, 102175, 102185, 102200, 102214, 102223, 102236, 102247, 102259, 102270, 102283, 102297, 102311, 102330, 102345, 102358, 102375, 102390, 102406, 102420, 102436, 102453, 102471, 102493, 102514, 102531, 102551, 102569, 102588, 102603, 102620, 102638, 102657, 102680, 102702, 102720, 102741, 102760, 102780, 102798, 102818, 102839, 102861, 102887, 102912, 102933, 102957, 102979, 103002, 103021, 103042, 103064, 103087, 103114, 103140, 103162, 103187, 103210, 103234, 103250, 103268, 103287, 103306, 103330, 103353, 103371, 103393, 103413, 103434, 103452, 103472, 103493, 103514, 103540, 103565, 103585, 103609, 103631, 103654, 103670, 103688, 103707, 103726, 103750, 103773, 103792, 103814, 103834, 103855, 103871, 103889, 103908, 103927, 103951, 103974, 103992, 104013, 104033, 104053, 104061, 104071, 104082, 104094, 104110, 104125, 104136, 104150, 104162, 104175, 104187, 104201, 104216, 104231, 104251, 104267, 104281, 104299, 104315, 104332, 104347, 104364, 104382, 104401, 104424, 104446, 104464, 104485, 104504, 104524, 104540, 104558, 104577, 104597, 104621, 104644, 104663, 104685, 104705, 104726, 104745, 104766, 104788, 104811, 104838, 104864, 104886, 104911, 104934, 104958, 104978, 105000, 105023, 105047, 105075, 105102, 105125, 105151, 105175, 105200, 105217, 105236, 105256, 105276, 105301, 105325, 105344, 105367, 105388, 105410, 105429, 105450, 105472, 105494, 105521, 105547, 105568, 105593, 105616, 105640, 105657, 105676, 105696, 105716, 105741, 105765, 105785, 105808, 105829, 105851, 105868, 105887, 105907, 105927, 105952, 105976, 105995, 106017, 106038, 106059, 106071, 106085, 106100, 106116, 106136, 106155, 106170, 106188, 106204, 106221, 106237, 106255, 106274, 106293, 106317, 106337, 106355, 106377, 106397, 106418, 106437, 106458, 106480, 106503, 106530, 106556, 106578, 106603, 106626, 106650, 106670, 106692, 106715, 106739, 106767, 106794, 106817, 106843, 106867, 106892, 106915, 106940, 106966, 106993, 107024, 107054, 107080, 107109, 107136, 107164, 107188, 107214, 107241, 107269, 107301, 107332, 107359, 107389, 107417, 107446, 107467, 107490, 107514, 107538, 107567, 107595, 107618, 107645, 107670, 107696, 107719, 107744, 107770, 107796, 107827, 107857, 107882, 107911, 107938, 107966, 107987, 108010, 108034, 108058, 108087, 108115, 108139, 108166, 108191, 108217, 108238, 108261, 108285, 108309, 108338, 108366, 108389, 108415, 108440, 108465, 108474, 108485, 108497, 108510, 108527, 108543, 108555, 108570, 108583, 108597, 108610, 108625, 108641, 108657, 108678, 108695, 108710, 108729, 108746, 108764, 108780, 108798, 108817, 108837, 108861, 108884, 108903, 108925, 108945, 108966, 108983, 109002, 109022, 109043, 109068, 109092, 109112, 109135, 109156, 109178, 109198, 109220, 109243, 109267, 109295, 109322, 109345, 109371, 109395, 109420, 109441, 109464, 109488, 109513, 109542, 109570, 109594, 109621, 109646, 109672, 109690, 109710, 109731, 109752, 109778, 109803, 109823, 109847, 109869, 109892, 109912, 109934, 109957, 109980, 110008, 110035, 110057, 110083, 110107, 110132, 110150, 110170, 110191, 110212, 110238, 110263, 110284, 110308, 110330, 110353, 110371, 110391, 110412, 110433, 110459, 110484, 110504, 110527, 110549, 110571, 110579, 110589, 110600, 110611, 110627, 110642, 110652, 110666, 110678, 110691, 110703, 110717, 110732, 110747, 110767, 110783, 110797, 110815, 110831, 110848, 110863, 110880, 110898, 110917, 110940, 110962, 110980, 111001, 111020, 111040, 111056, 111074, 111093, 111113, 111137, 111160, 111179, 111201, 111221, 111242, 111261, 111282, 111304, 111327, 111354, 111380, 111402, 111427, 111450, 111474, 111494, 111516, 111539, 111563, 111591, 111618, 111641, 111667, 111691, 111716, 111733, 111752, 111772, 111792, 111817, 111841, 111860, 111883, 111904, 111926, 111945, 111966, 111988, 112010, 112037, 112063, 112084, 112109, 112132, 112156, 112173, 112192, 112212, 112232, 112257, 112281, 112301, 112324, 112345, 112367, 112384, 112403, 112423, 112443, 112468, 112492, 112511, 112533, 112554, 112575, 112586, 112599, 112613, 112627, 112646, 112664, 112677, 112694, 112709, 112725, 112740, 112757, 112775, 112793, 112816, 112835, 112852, 112873, 112892, 112912, 112930, 112950, 112971, 112993, 113019, 113044, 113065, 113089, 113111, 113134, 113153, 113174, 113196, 113219, 113246, 113272, 113294, 113319, 113342, 113366, 113388, 113412, 113437, 113463, 113493, 113522, 113547, 113575, 113601, 113628, 113651, 113676, 113702, 113729, 113760, 113790, 113816, 113845, 113872, 113900, 113920, 113942, 113965, 113988, 114016, 114043, 114065, 114091, 114115, 114140, 114162, 114186, 114211, 114236, 114266, 114295, 114319, 114347, 114373, 114400, 114420, 114442, 114465, 114488, 114516, 114543, 114566, 114592, 114616, 114641, 114661, 114683, 114706, 114729, 114757, 114784, 114806, 114831, 114855, 114879, 114889, 114901, 114914, 114927, 114945, 114962, 114975, 114991, 115005, 115020, 115034, 115050, 115067, 115084, 115106, 115124, 115140, 115160, 115178, 115197, 115214, 115233, 115253, 115274, 115299, 115323, 115343, 115366, 115387, 115409, 115427, 115447, 115468, 115490, 115516, 115541, 115562, 115586, 115608, 115631, 115652, 115675, 115699, 115724, 115753, 115781, 115805, 115832, 115857, 115883, 115905, 115929, 115954, 115980, 116010, 116039, 116064, 116092, 116118, 116145, 116164, 116185, 116207, 116229, 116256, 116282, 116303, 116328, 116351, 116375, 116396, 116419, 116443, 116467, 116496, 116524, 116547, 116574, 116599, 116625, 116644, 116665, 116687, 116709, 116736, 116762, 116784, 116809, 116832, 116856, 116875, 116896, 116918, 116940, 116967, 116993, 117014, 117038, 117061, 117084, 117092, 117102, 117113, 117124, 117140, 117155, 117165, 117178, 117190, 117202, 117214, 117228, 117243, 117258, 117278, 117294, 117308, 117326, 117342, 117359, 117374, 117391, 117409, 117428, 117451, 117473, 117491, 117512, 117531, 117551, 117567, 117585, 117604, 117624, 117648, 117671, 117690, 117712, 117732, 117753, 117772, 117793, 117815, 117838, 117865, 117891, 117913, 117938, 117961, 117985, 118005, 118027, 118050, 118074, 118102, 118129, 118152, 118178, 118202, 118227, 118244, 118263, 118283, 118303, 118328, 118352, 118371, 118394, 118415, 118437, 118456, 118477, 118499, 118521, 118548, 118574, 118595, 118620, 118643, 118667, 118684, 118703, 118723, 118743, 118768, 118792, 118812, 118835, 118856, 118878, 118895, 118914, 118934, 118954, 118979, 119003, 119022, 119044, 119065, 119086),
+    (True, True, False): (119086, 119088, 119090, 119092, 119095, 119101, 119108, 119113, 119118, 119122, 119126, 119130, 119136, 119143, 119150, 119162, 119170, 119177, 119187, 119199, 119210, 119217, 119226, 119236, 119247, 119262, 119276, 119286, 119299, 119312, 119324, 119332, 119342, 119353, 119365, 119381, 119396, 119407, 119421, 119437, 119452, 119463, 119476, 119490, 119505, 119524, 119542, 119556, 119573, 119590, 119606, 119618, 119632, 119647, 119663, 119683, 119702, 119717, 119735, 119749, 119762, 119771, 119782, 119794, 119806, 119823, 119839, 119850, 119865, 119881, 119896, 119907, 119920, 119934, 119948, 119967, 119985, 119998, 120015, 120029, 120042, 120051, 120062, 120074, 120086, 120103, 120119, 120131, 120146, 120160, 120173, 120182, 120193, 120205, 120217, 120234, 120250, 120261, 120275, 120285, 120294, 120299, 120306, 120314, 120323, 120336, 120348, 120356, 120367, 120376, 120386, 120395, 120406, 120418, 120430, 120447, 120460, 120471, 120486, 120499, 120513, 120525, 120539, 120554, 120570, 120590, 120609, 120624, 120642, 120658, 120675, 120688, 120703, 120719, 120736, 120757, 120777, 120793, 120812, 120829, 120847, 120863, 120881, 120900, 120920, 120944, 120967, 120986, 121008, 121028, 121049, 121066, 121085, 121105, 121126, 121151, 121175, 121195, 121218, 121239, 121261, 121275, 121291, 121308, 121325, 121347, 121368, 121384, 121404, 121422, 121441, 121457, 121475, 121494, 121513, 121537, 121560, 121578, 121600, 121620, 121641, 121655, 121671, 121688, 121705, 121727, 121748, 121765, 121785, 121803, 121822, 121836, 121852, 121869, 121886, 121908, 121929, 121945, 121964, 121982, 122000, 122007, 122016, 122026, 122036, 122051, 122065, 122074, 122087, 122098, 122110, 122121, 122134, 122148, 122162, 122181, 122196, 122209, 122226, 122241, 122257, 122271, 122287, 122304, 122322, 122344, 122365, 122382, 122402, 122420, 122439, 122454, 122471, 122489, 122508, 122531, 122553, 122571, 122592, 122611, 122631, 122649, 122669, 122690, 122712, 122738, 122763, 122784, 122808, 122830, 122853, 122872, 122893, 122915, 122938, 122965, 122991, 123013, 123038, 123061, 123085, 123101, 123119, 123138, 123157, 123181, 123204, 123222, 123244, 123264, 123285, 123303, 123323, 123344, 123365, 123391, 123416, 123436, 123460, 123482, 123505, 123521, 123539, 123558, 123577, 123601, 123624, 123643, 123665, 123685, 123706, 123722, 123740, 123759, 123778, 123802, 123825, 123843, 123864, 123884, 123904, 123912, 123922, 123933, 123945, 123961, 123976, 123987, 124001, 124013, 124026, 124038, 124052, 124067, 124082, 124102, 124118, 124132, 124150, 124166, 124183, 124198, 124215, 124233, 124252, 124275, 124297, 124315, 124336, 124355, 124375, 124391, 124409, 124428, 124448, 124472, 124495, 124514, 124536, 124556, 124577, 124596, 124617, 124639, 124662, 124689, 124715, 124737, 124762, 124785, 124809, 124829, 124851, 124874, 124898, 124926, 124953, 124976, 125002, 125026, 125051, 125068, 125087, 125107, 125127, 125152, 125176, 125195, 125218, 125239, 125261, 125280, 125301, 125323, 125345, 125372, 125398, 125419, 125444, 125467, 125491, 125508, 125527, 125547, 125567, 125592, 125616, 125636, 125659, 125680, 125702, 125719, 125738, 125758, 125778, 125803, 125827, 125846, 125868, 125889, 125910, 125922, 125936, 125951, 125967, 125987, 126006, 126021, 126039, 126055, 126072, 126088, 126106, 126125, 126144, 126168, 126188, 126206, 126228, 126248, 126269, 126288, 126309, 126331, 126354, 126381, 126407, 126429, 126454, 126477, 126501, 126521, 126543, 126566, 126590, 126618, 126645, 126668, 126694, 126718, 126743, 126766, 126791, 126817, 126844, 126875, 126905, 126931, 126960, 126987, 127015, 127039, 127065, 127092, 127120, 127152, 127183, 127210, 127240, 127268, 127297, 127318, 127341, 127365, 127389, 127418, 127446, 127469, 127496, 127521, 127547, 127570, 127595, 127621, 127647, 127678, 127708, 127733, 127762, 127789, 127817, 127838, 127861, 127885, 127909, 127938, 127966, 127990, 128017, 128042, 128068, 128089, 128112, 128136, 128160, 128189, 128217, 128240, 128266, 128291, 128316, 128325, 128336, 128348, 128361, 128378, 128394, 128406, 128421, 128434, 128448, 128461, 128476, 128492, 128508, 128529, 128546, 128561, 128580, 128597, 128615, 128631, 128649, 128668, 128688, 128712, 128735, 128754, 128776, 128796, 128817, 128834, 128853, 128873, 128894, 128919, 128943, 128963, 128986, 129007, 129029, 129049, 129071, 129094, 129118, 129146, 129173, 129196, 129222, 129246, 129271, 129292, 129315, 129339, 129364, 129393, 129421, 129445, 129472, 129497, 129523, 129541, 129561, 129582, 129603, 129629, 129654, 129674, 129698, 129720, 129743, 129763, 129785, 129808, 129831, 129859, 129886, 129908, 129934, 129958, 129983, 130001, 130021, 130042, 130063, 130089, 130114, 130135, 130159, 130181, 130204, 130222, 130242, 130263, 130284, 130310, 130335, 130355, 130378, 130400, 130422, 130430, 130440, 130451, 130462, 130478, 130493, 130503, 130517, 130529, 130542, 130554, 130568, 130583, 130598, 130618, 130634, 130648, 130666, 130682, 130699, 130714, 130731, 130749, 130768, 130791, 130813, 130831, 130852, 130871, 130891, 130907, 130925, 130944, 130964, 130988, 131011, 131030, 131052, 131072, 131093, 131112, 131133, 131155, 131178, 131205, 131231, 131253, 131278, 131301, 131325, 131345, 131367, 131390, 131414, 131442, 131469, 131492, 131518, 131542, 131567, 131584, 131603, 131623, 131643, 131668, 131692, 131711, 131734, 131755, 131777, 131796, 131817, 131839, 131861, 131888, 131914, 131935, 131960, 131983, 132007, 132024, 132043, 132063, 132083, 132108, 132132, 132152, 132175, 132196, 132218, 132235, 132254, 132274, 132294, 132319, 132343, 132362, 132384, 132405, 132426, 132437, 132450, 132464, 132478, 132497, 132515, 132528, 132545, 132560, 132576, 132591, 132608, 132626, 132644, 132667, 132686, 132703, 132724, 132743, 132763, 132781, 132801, 132822, 132844, 132870, 132895, 132916, 132940, 132962, 132985, 133004, 133025, 133047, 133070, 133097, 133123, 133145, 133170, 133193, 133217, 133239, 133263, 133288, 133314, 133344, 133373, 133398, 133426, 133452, 133479, 133502, 133527, 133553, 133580, 133611, 133641, 133667, 133696, 133723, 133751, 133771, 133793, 133816, 133839, 133867, 133894, 133916, 133942, 133966, 133991, 134013, 134037, 134062, 134087, 134117, 134146, 134170, 134198, 134224, 134251, 134271, 134293, 134316, 134339, 134367, 134394, 134417, 134443, 134467, 134492, 134512, 134534, 134557, 134580, 134608, 134635, 134657, 134682, 134706, 134730, 134740, 134752, 134765, 134778, 134796, 134813, 134826, 134842, 134856, 134871, 134885, 134901, 134918, 134935, 134957, 134975, 134991, 135011, 135029, 135048, 135065, 135084, 135104, 135125, 135150, 135174, 135194, 135217, 135238, 135260, 135278, 135298, 135319, 135341, 135367, 135392, 135413, 135437, 135459, 135482, 135503, 135526, 135550, 135575, 135604, 135632, 135656, 135683, 135708, 135734, 135756, 135780, 135805, 135831, 135861, 135890, 135915, 135943, 135969, 135996, 136015, 136036, 136058, 136080, 136107, 136133, 136154, 136179, 136202, 136226, 136247, 136270, 136294, 136318, 136347, 136375, 136398, 136425, 136450, 136476, 136495, 136516, 136538, 136560, 136587, 136613, 136635, 136660, 136683, 136707, 136726, 136747, 136769, 136791, 136818, 136844, 136865, 136889, 136912, 136935, 136943, 136953, 136964, 136975, 136991, 137006, 137016, 137029, 137041, 137053, 137065, 137079, 137094, 137109, 137129, 137145, 137159, 137177, 137193, 137210, 137225, 137242, 137260, 137279, 137302, 137324, 137342, 137363, 137382, 137402, 137418, 137436, 137455, 137475, 137499, 137522, 137541, 137563, 137583, 137604, 137623, 137644, 137666, 137689, 137716, 137742, 137764, 137789, 137812, 137836, 137856, 137878, 137901, 137925, 137953, 137980, 138003, 138029, 138053, 138078, 138095, 138114, 138134, 138154, 138179, 138203, 138222, 138245, 138266, 138288, 138307, 138328, 138350, 138372, 138399, 138425, 138446, 138471, 138494, 138518, 138535, 138554, 138574, 138594, 138619, 138643, 138663, 138686, 138707, 138729, 138746, 138765, 138785, 138805, 138830, 138854, 138873, 138895, 138916, 138937),
+    (True, True, True): (138937, 138939, 138941, 138943, 138946, 138952, 138959, 138964, 138969, 138973, 138977, 138981, 138987, 138994, 139001, 139013, 139021, 139028, 139038, 139050, 139061, 139068, 139077, 139087, 139098, 139113, 139127, 139137, 139150, 139163, 139175, 139183, 139193, 139204, 139216, 139232, 139247, 139258, 139272, 139288, 139303, 139314, 139327, 139341, 139356, 139375, 139393, 139407, 139424, 139441, 139457, 139469, 139483, 139498, 139514, 139534, 139553, 139568, 139586, 139600, 139613, 139622, 139633, 139645, 139657, 139674, 139690, 139701, 139716, 139732, 139747, 139758, 139771, 139785, 139799, 139818, 139836, 139849, 139866, 139880, 139893, 139902, 139913, 139925, 139937, 139954, 139970, 139982, 139997, 140011, 140024, 140033, 140044, 140056, 140068, 140085, 140101, 140112, 140126, 140136, 140145, 140150, 140157, 140165, 140174, 140187, 140199, 140207, 140218, 140227, 140237, 140246, 140257, 140269, 140281, 140298, 140311, 140322, 140337, 140350, 140364, 140376, 140390, 140405, 140421, 140441, 140460, 140475, 140493, 140509, 140526, 140539, 140554, 140570, 140587, 140608, 140628, 140644, 140663, 140680, 140698, 140714, 140732, 140751, 140771, 140795, 140818, 140837, 140859, 140879, 140900, 140917, 140936, 140956, 140977, 141002, 141026, 141046, 141069, 141090, 141112, 141126, 141142, 141159, 141176, 141198, 141219, 141235, 141255, 141273, 141292, 141308, 141326, 141345, 141364, 141388, 141411, 141429, 141451, 141471, 141492, 141506, 141522, 141539, 141556, 141578, 141599, 141616, 141636, 141654, 141673, 141687, 141703, 141720, 141737, 141759, 141780, 141796, 141815, 141833, 141851, 141858, 141867, 141877, 141887, 141902, 141916, 141925, 141938, 141949, 141961, 141972, 141985, 141999, 142013, 142032, 142047, 142060, 142077, 142092, 142108, 142122, 142138, 142155, 142173, 142195, 142216, 142233, 142253, 142271, 142290, 142305, 142322, 142340, 142359, 142382, 142404, 142422, 142443, 142462, 142482, 142500, 142520, 142541, 142563, 142589, 142614, 142635, 142659, 142681, 142704, 142723, 142744, 142766, 142789, 142816, 142842, 142864, 142889, 142912, 142936, 142952, 142970, 142989, 143008, 143032, 143055, 143073, 143095, 143115, 143136, 143154, 143174, 143195, 143216, 143242, 143267, 143287, 143311, 143333, 143356, 143372, 143390, 143409, 143428, 143452, 143475, 143494, 143516, 143536, 143557, 143573, 143591, 143610, 143629, 143653, 143676, 143694, 143715, 143735, 143755, 143763, 143773, 143784, 143796, 143812, 143827, 143838, 143852, 143864, 143877, 143889, 143903, 143918, 143933, 143953, 143969, 143983, 144001, 144017, 144034, 144049, 144066, 144084, 144103, 144126, 144148, 144166, 144187, 144206, 144226, 144242, 144260, 144279, 144299, 144323, 144346, 144365, 144387, 144407, 144428, 144447, 144468, 144490, 144513, 144540, 144566, 144588, 144613, 144636, 144660, 144680, 144702, 144725, 144749, 144777, 144804, 144827, 144853, 144877, 144902, 144919, 144938, 144958, 144978, 145003, 145027, 145046, 145069, 145090, 145112, 145131, 145152, 145174, 145196, 145223, 145249, 145270, 145295, 145318, 145342, 145359, 145378, 145398, 145418, 145443, 145467, 145487, 145510, 145531, 145553, 145570, 145589, 145609, 145629, 145654, 145678, 145697, 145719, 145740, 145761, 145773, 145787, 145802, 145818, 145838, 145857, 145872, 145890, 145906, 145923, 145939, 145957, 145976, 145995, 146019, 146039, 146057, 146079, 146099, 146120, 146139, 146160, 146182, 146205, 146232, 146258, 146280, 146305, 146328, 146352, 146372, 146394, 146417, 146441, 146469, 146496, 146519, 146545, 146569, 146594, 146617, 146642, 146668, 146695, 146726, 146756, 146782, 146811, 146838, 146866, 146890, 146916, 146943, 146971, 147003, 147034, 147061, 147091, 147119, 147148, 147169, 147192, 147216, 147240, 147269, 147297, 147320, 147347, 147372, 147398, 147421, 147446, 147472, 147498, 147529, 147559, 147584, 147613, 147640, 147668, 147689, 147712, 147736, 147760, 147789, 147817, 147841, 147868, 147893, 147919, 147940, 147963, 147987, 148011, 148040, 148068, 148091, 148117, 148142, 148167, 148176, 148187, 148199, 148212, 148229, 148245, 148257, 148272, 148285, 148299, 148312, 148327, 148343, 148359, 148380, 148397, 148412, 148431, 148448, 148466, 148482, 148500, 148519, 148539, 148563, 148586, 148605, 148627, 148647, 148668, 148685, 148704, 148724, 148745, 148770, 148794, 148814, 148837, 148858, 148880, 148900, 148922, 148945, 148969, 148997, 149024, 149047, 149073, 149097, 149122, 149143, 149166, 149190, 149215, 149244, 149272, 149296, 149323, 149348, 149374, 149392, 149412, 149433, 149454, 149480, 149505, 149525, 149549, 149571, 149594, 149614, 149636, 149659, 149682, 149710, 149737, 149759, 149785, 149809, 149834, 149852, 149872, 149893, 149914, 149940, 149965, 149986, 150010, 150032, 150055, 150073, 150093, 150114, 150135, 150161, 150186, 150206, 150229, 150251, 150273, 150281, 150291, 150302, 150313, 150329, 150344, 150354, 150368, 150380, 150393, 150405, 150419, 150434, 150449, 150469, 150485, 150499, 150517, 150533, 150550, 150565, 150582, 150600, 150619, 150642, 150664, 150682, 150703, 150722, 150742, 150758, 150776, 150795, 150815, 150839, 150862, 150881, 150903, 150923, 150944, 150963, 150984, 151006, 151029, 151056, 151082, 151104, 151129, 151152, 151176, 151196, 151218, 151241, 151265, 151293, 151320, 151343, 151369, 151393, 151418, 151435, 151454, 151474, 151494, 151519, 151543, 151562, 151585, 151606, 151628, 151647, 151668, 151690, 151712, 151739, 151765, 151786, 151811, 151834, 151858, 151875, 151894, 151914, 151934, 151959, 151983, 152003, 152026, 152047, 152069, 152086, 152105, 152125, 152145, 152170, 152194, 152213, 152235, 152256, 152277, 152288, 152301, 152315, 152329, 152348, 152366, 152379, 152396, 152411, 152427, 152442, 152459, 152477, 152495, 152518, 152537, 152554, 152575, 152594, 152614, 152632, 152652, 152673, 152695, 152721, 152746, 152767, 152791, 152813, 152836, 152855, 152876, 152898, 152921, 152948, 152974, 152996, 153021, 153044, 153068, 153090, 153114, 153139, 153165, 153195, 153224, 153249, 153277, 153303, 153330, 153353, 153378, 153404, 153431, 153462, 153492, 153518, 153547, 153574, 153602, 153622, 153644, 153667, 153690, 153718, 153745, 153767, 153793, 153817, 153842, 153864, 153888, 153913, 153938, 153968, 153997, 154021, 154049, 154075, 154102, 154122, 154144, 154167, 154190, 154218, 154245, 154268, 154294, 154318, 154343, 154363, 154385, 154408, 154431, 154459, 154486, 154508, 154533, 154557, 154581, 154591, 154603, 154616, 154629, 154647, 154664, 154677, 154693, 154707, 154722, 154736, 154752, 154769, 154786, 154808, 154826, 154842, 154862, 154880, 154899, 154916, 154935, 154955, 154976, 155001, 155025, 155045, 155068, 155089, 155111, 155129, 155149, 155170, 155192, 155218, 155243, 155264, 155288, 155310, 155333, 155354, 155377, 155401, 155426, 155455, 155483, 155507, 155534, 155559, 155585, 155607, 155631, 155656, 155682, 155712, 155741, 155766, 155794, 155820, 155847, 155866, 155887, 155909, 155931, 155958, 155984, 156005, 156030, 156053, 156077, 156098, 156121, 156145, 156169, 156198, 156226, 156249, 156276, 156301, 156327, 156346, 156367, 156389, 156411, 156438, 156464, 156486, 156511, 156534, 156558, 156577, 156598, 156620, 156642, 156669, 156695, 156716, 156740, 156763, 156786, 156794, 156804, 156815, 156826, 156842, 156857, 156867, 156880, 156892, 156904, 156916, 156930, 156945, 156960, 156980, 156996, 157010, 157028, 157044, 157061, 157076, 157093, 157111, 157130, 157153, 157175, 157193, 157214, 157233, 157253, 157269, 157287, 157306, 157326, 157350, 157373, 157392, 157414, 157434, 157455, 157474, 157495, 157517, 157540, 157567, 157593, 157615, 157640, 157663, 157687, 157707, 157729, 157752, 157776, 157804, 157831, 157854, 157880, 157904, 157929, 157946, 157965, 157985, 158005, 158030, 158054, 158073, 158096, 158117, 158139, 158158, 158179, 158201, 158223, 158250, 158276, 158297, 158322, 158345, 158369, 158386, 158405, 158425, 158445, 158470, 158494, 158514, 158537, 158558, 158580, 158597, 158616, 158636, 158656, 158681, 158705, 158724, 158746, 158767, 158788),
+}
+
+
+def unpackTable(synonym=False, chuquet=False, stem=False):
+    """
+    @return tuple with the joined prefixes for 0 to 999;
+            the same as latinNumbers.buildTable('', synonym, chuquet, stem).
+    """
+    offsets = OFFSETS[(synonym, chuquet, stem)]
+    return tuple([PACKED[offsets[number]:offsets[number + 1]] for number in range(1000)])
@@ -9,6 +9,7 @@ VERSION = "1.0"
 
 import sys
 import os
+import time
 import argparse
 import locale
 
@@ -24,6 +25,13 @@ NAMED_NUMBERS = {
 }
 
 
+# Numbers given with more digits than this are kept as string of digits; see atLeastZeroDigits.
+LONG_NUMBER_DIGITS = 4000
+
+# -r/--random and -z/--zeros with -n/--numeric refuse to make more digits than this without -F/--force.
+RANDOM_WARNING_DIGITS = 10 ** 7
+
+
 class MessageAction(argparse._HelpAction):
     """ Write a message and exit. """
 
@@ -241,6 +249,16 @@ def atLeastZero(value):
         raise argparse.ArgumentTypeError("not a number: '%s'" % value)
 
 
+def atLeastZeroDigits(value):
+    """ Like atLeastZero, but keep very long numbers as string of digits; converting them to int is slow. """
+    if len(value) > LONG_NUMBER_DIGITS and value.isdigit():
+        # Leading zeros are dropped, like int() does it.
+        value = value.lstrip('0') or '0'
+        if len(value) > LONG_NUMBER_DIGITS:
+            return value
+    return atLeastZero(value)
+
+
 def atLeastOne(value):
     """ Check that value is numeric and > 0 """
     ret = atLeastZero(value)
@@ -263,6 +281,39 @@ def validLocale(value):
     return value
 
 
+def writeNumeric(chunks, out=None):
+    """ Write the numeric form of a number chunk by chunk, followed by a \\n. """
+    out = out or sys.stdout
+    for chunk in chunks:
+        out.write(chunk)
+    out.write('\n')
+
+
+def writeComponents(components, byLine=False, out=None):
+    """ Write the components of a name as soon as they get build; one per line, if byLine is set. """
+    out = out or sys.stdout
+    if byLine:
+        for component in components:
+            out.write(component + os.linesep)
+    else:
+        separator = ''
+        for component in components:
+            out.write(separator + component)
+            separator = ' '
+    out.write('\n')
+
+
+def writePieces(pieces, byLine=False, out=None):
+    """
+    Write a name of one component like writeComponents, but piece by piece; see backend.iterSayPowerOfTen.
+    byLine changes nothing for a single component.
+    """
+    out = out or sys.stdout
+    for piece in pieces:
+        out.write(piece)
+    out.write('\n')
+
+
 def main(args, looping=True):
     def handleBothScales():
         if args.bothScales and args.shortScale:
@@ -280,65 +331,87 @@ def main(args, looping=True):
         return number
 
     def sayNumber():
-        from backend import say, sayByExp
-        if args.zeros or args.googolplex:
-            # Do not say given number, but the number with that many zeros.
-            zeros, zerosLeft = divmod(number, 3)
-            zeros *= 3
-            ret = "1" + "0" * zerosLeft + " "
-            plural = args.forcePlural or (zerosLeft and not args.forceSingular)
-            ret += sayByExp(zeros, plural, **args.__dict__)
-
-            numeric = "1" + "0" * number if args.numeric else None
+        from backend import iterSay, iterSayPowerOfTen, iterGroupedNumber, iterGroupedPowerOfTen
+        if args.expression is not None:
+            # Say a sum of terms, without building its digits.
+            from backend import iterSayTerms
+            components = iterSayTerms(args.expression, **args.__dict__)
+            numeric = None
+        elif args.zeros or args.googolplex:
+            # Do not say given number, but the number with that many zeros; the scale word of a huge count of zeros
+            # is never built at once.
+            components = iterSayPowerOfTen(number, **args.__dict__)
+
+            # The numeric form is written chunk by chunk, without ever building it.
+            numeric = iterGroupedPowerOfTen(number, args.grouping)
+        elif args.numberFile:
+            # The digits stay in the mapped file; it is released, when say.py exits.
+            from backend import NumberFile
+            args.number = NumberFile(args.numberFile).digits
+            components = iterSay(**args.__dict__)
+            numeric = iterGroupedNumber(args.number, args.grouping)
         elif args.random:
             # Do not say given number, but a random number with that many digits.
-            import random
-            digits = ['1', '2', '3', '4', '5', '6', '7', '8', '9']
-            numeric = random.choice(digits)
-            digits.append('0')
-            numeric += "".join([random.choice(digits) for _ in range(number - 1)])
-            args.number = numeric
-            ret = say(**args.__dict__)
+            from backend import randomNumber
+            args.number = randomNumber(number, args.seed)
+            components = iterSay(**args.__dict__)
+            numeric = iterGroupedNumber(args.number, args.grouping)
         else:
             args.number = number
-            ret = say(**args.__dict__)
-            numeric = number
-        return ret, numeric
+            components = iterSay(**args.__dict__)
+            numeric = iterGroupedNumber(number, args.grouping)
+        return components, numeric
 
-    def printResult(ret, numeric):
+    def printResult(components, numeric, byLine=None):
+        """ Write the numeric form (an iterable of chunks) if needed and the components. """
         if args.numeric:
-            print locale.format("%d", int(numeric), grouping=args.grouping)
+            writeNumeric(numeric)
         if not args.numericOnly:
-            print ret
+            write = writePieces if args.zeros or args.googolplex else writeComponents
+            write(components, args.byLine if byLine is None else byLine)
 
     def handleLoop():
         if args.loop and looping:
             count, step = args.loop
+            args.number = int(args.number)
             args.googol, args.googolplex, args.namedNumber = None, None, None
 
-            while count > 1:
-                if not args.noNewLine:
-                    print
-                args.number += step
-                count -= 1
-                main(args, False)
+            if args.zeros or args.bothScales:
+                while count > 1:
+                    if not args.noNewLine:
+                        print
+                    args.number += step
+                    count -= 1
+                    main(args, False)
+            else:
+                # Plain numbers are said in one batch; see backend.sayMany.
+                from backend import sayMany, iterGroupedNumber
+                first = args.number
+                numbers = (first + step * index for index in xrange(1, count))
+                for ret in sayMany(numbers, **args.__dict__):
+                    if not args.noNewLine:
+                        print
+                    args.number += step
+                    # sayMany did already put the components of ret line by line, if needed.
+                    printResult([ret], iterGroupedNumber(args.number, args.grouping), byLine=False)
 
     handleBothScales()
     number = getNumberToUse()
-    ret, numeric = sayNumber()
-    printResult(ret, numeric)
+    components, numeric = sayNumber()
+    printResult(components, numeric)
     handleLoop()
 
 
 def createParser():
-    from logging import INFO, DEBUG
     parser = argparse.ArgumentParser(description='Write names of (very) big numbers.',
                                      epilog="Please report bugs to daniel.marohn@gmail.com." + os.linesep +
                                             "Find more information here: http://de.wikipedia.org/wiki/Zahlennamen",
                                      formatter_class=argparse.RawTextHelpFormatter, add_help=False)
 
     group = parser.add_argument_group("what to say", "select one of these").add_mutually_exclusive_group(required=True)
-    group.add_argument('number', nargs="?", type=atLeastZero, help='say this number')
+    group.add_argument('number', nargs="?", type=atLeastZeroDigits, help='say this number')
+    group.add_argument('-x', '--expr', dest='expression', metavar='EXPRESSION',
+                       help='say a sum of terms like 3e1000000+42 or 7*10^27+3*10^9, without building its digits')
     group.add_argument('-T', '--time', action="store_const", const=NAMED_NUMBERS['time'], dest="namedNumber",
                        help='say the number of seconds the universe exists')
     group.add_argument('-A', '--avogadro', action="store_const", const=NAMED_NUMBERS['avogadro'], dest="namedNumber",
@@ -356,6 +429,13 @@ def createParser():
     group.add_argument('-G', '--googol', action="store_true", help='say a googol (10^100)')
     group.add_argument('-GG', '--googolplex', action="store_true", help='say a googolplex (10^googol)')
     group.add_argument('-GGG', '--googolplexplex', action=GoogolplexplexAction, help='say a googolplexplex (10^googolplex)')
+    group.add_argument('--serve', nargs='?', const='-', metavar='SOCKET',
+                       help="keep running and answer JSON requests line by line, on stdin/stdout or on unix socket SOCKET;\n" +
+                            'like {"number": "1234567", "shortScale": true}; the given options are the defaults')
+    group.add_argument('--number-file', dest='numberFile', metavar='PATH',
+                       help='say the number in file PATH; the file is mapped into memory, not read, so it can have billions of digits')
+    group.add_argument('-i', '--input', dest='inputFile', metavar='FILE',
+                       help="say every number of FILE, one per line; '-' for stdin. The throughput gets written to stderr")
 
     group = parser.add_argument_group("how to say", "us or eu style, synonyms ...")
     group.add_argument('-s', '--shortScale', dest='shortScale', action="store_true",
@@ -367,7 +447,7 @@ def createParser():
     group.add_argument('-ch', '--chuquet', dest='chuquet', action='store_true',
                        help='use old latin prefixes like duodeviginti instead of oktodezi')
     group.add_argument('-n', '--numeric', dest='numeric', action='store_true',
-                       help="say the number also in numeric form; it is not recommended to use this option with more than 1 000 000 digits")
+                       help="say the number also in numeric form")
     group.add_argument('-N', '--numericOnly', dest='numericOnly', action=NumericOnlyAction,
                             help="say the number only in numeric form")
 
@@ -376,8 +456,15 @@ def createParser():
                        help='say <count> numbers; start with <number>, add <step> each iteration; can be combined with -z/--zeros, but not with -r/--random')
     group.add_argument('-F', '--force', dest='force', action='store_true',
                        help="ignore size warnings")
-    group.add_argument('-V', '--verbose', dest='verbose', action=VerboseAction, const=INFO,
+    group.add_argument('-j', '--jobs', dest='workers', type=atLeastOne, metavar='N',
+                       help="say the thousand blocks of very big numbers in N processes; with -i/--input the chunks of lines")
+    group.add_argument('--chunk-size', dest='chunkSize', type=atLeastOne, metavar='LINES',
+                       help="say -i/--input in chunks of LINES lines; default 10000")
+    group.add_argument('-V', '--verbose', dest='verbose', action=VerboseAction, const='INFO',
                        help="output debug information; very useful to understand how words get build")
+    group.add_argument('--stats', nargs='?', const='', metavar='JSONFILE',
+                       help="write to stderr where the time went: calls, seconds and bytes per phase and the peak memory;\n" +
+                            "also as JSON to JSONFILE")
 
     group = parser.add_argument_group('output', 'use these to format your output')
     group.add_argument('-d', '--delimiter', nargs="?", const='-', dest='delimiter', default='',
@@ -396,6 +483,8 @@ def createParser():
                             help='always use plural forms: 1 millions instead of 1 million')
     group.add_argument('-l', '--byLine', dest='byLine', action='store_true',
                        help='write components line by line')
+    group.add_argument('-o', '--output', dest='outputFile', metavar='FILE', default='-',
+                       help="write the words of -i/--input to FILE; stdout per default")
     group.add_argument('-nn', '--noNewLine', dest='noNewLine', action='store_true',
                        help='do not print \\n between for loops; only useful with -f/--for')
     group.add_argument('-L', '--locale', dest="locale", nargs=1, type=validLocale, default='',
@@ -407,9 +496,11 @@ def createParser():
                             help='the number with that many zeros')
     innerGroup.add_argument('-r', '--random', dest='random', action='store_true',
                             help='a random number with that many digits')
+    group.add_argument('--seed', dest='seed', type=atLeastZero,
+                       help='seed for -r/--random; the same seed makes the same number')
 
     group = parser.add_argument_group('hacking', 'these options are only useful for development')
-    group.add_argument('-VV', '--Verbose', dest='verbose', action='store_const', const=DEBUG,
+    group.add_argument('-VV', '--Verbose', dest='verbose', action='store_const', const='DEBUG',
                        help="output all debug information")
     group.add_argument('-FS', '--formatString', nargs=1, dest='formatString', default=["%(name)s: %(message)s", ],
                        help='use this python logging format string')
@@ -441,37 +532,106 @@ def parseCommandlineArguments():
     number = args.number
     if args.namedNumber:
         number = args.namedNumber
-    if (args.zeros or args.random) and number > sys.maxint and args.numeric:
+    if args.random and number > sys.maxint:
         locale.setlocale(locale.LC_NUMERIC, '')
-        parser.exit(status=3, message="When using -n/--numeric, together with -z/--zeros or -r/--random, number must be less or equal " + locale.format("%d", sys.maxint, grouping=True))
-    if args.numeric or args.random:
-        if number > 150000 and (args.zeros or args.random) and not args.force:
-            parser.exit(status=4, message="Building and writing the numeric version of such a big number may take a lot of time. " +
-                                          "Depending on the size, it my take minutes or longer." + os.linesep +
-                                          "Delete argument -n/--numeric or activate -F/--force, if you know what you are doing.")
+        parser.exit(status=3, message="When using -r/--random, number must be less or equal " + locale.format("%d", sys.maxint, grouping=True))
+    if args.random and number > RANDOM_WARNING_DIGITS and not args.force:
+        parser.exit(status=4, message="Building and saying such a big random number may take a lot of time. " +
+                                      "Depending on the size, it my take minutes or longer." + os.linesep +
+                                      "Activate -F/--force, if you know what you are doing.")
+    if args.zeros and args.numeric and isinstance(number, basestring):
+        parser.exit(status=3, message="Cannot print a number with more than 10^%d digits." % LONG_NUMBER_DIGITS)
+    if args.zeros and args.numeric and number > RANDOM_WARNING_DIGITS and not args.force:
+        parser.exit(status=4, message="Writing the numeric form of such a big number may take a lot of time and " +
+                                      "disk space; 10^9 zeros are about one gigabyte." + os.linesep +
+                                      "Activate -F/--force, if you know what you are doing.")
     if args.googolplex and (args.zeros or args.random or args.numeric):
         parser.exit(status=3, message="Sorry... there cannot be ever a computer available, that would be able to print or build a googoleplex digits.")
     if args.googol and args.random:
         parser.exit(status=3, message="I cannot append a googol random digits; no computer will EVER be able to do this.")
+    if args.expression is not None:
+        for option, name in [(args.numeric, '-n/--numeric'), (args.loop, '-f/--for'), (args.zeros, '-z/--zeros'),
+                             (args.random, '-r/--random')]:
+            if option:
+                parser.error('argument %s: not allowed with argument -x/--expr' % name)
+    if args.serve:
+        for option, name in [(args.loop, '-f/--for'), (args.random, '-r/--random'), (args.bothScales, '-b/--bothScales'),
+                             (args.numericOnly, '-N/--numericOnly')]:
+            if option:
+                parser.error('argument %s: not allowed with argument --serve' % name)
+    if args.numberFile and not os.path.isfile(args.numberFile):
+        parser.error("argument --number-file: not a file: '%s'" % args.numberFile)
+    if args.numberFile:
+        for option, name in [(args.loop, '-f/--for'), (args.random, '-r/--random'), (args.zeros, '-z/--zeros')]:
+            if option:
+                parser.error('argument %s: not allowed with argument --number-file' % name)
+    if args.inputFile:
+        for option, name in [(args.loop, '-f/--for'), (args.random, '-r/--random'), (args.zeros, '-z/--zeros'),
+                             (args.bothScales, '-b/--bothScales'), (args.numericOnly, '-N/--numericOnly')]:
+            if option:
+                parser.error('argument %s: not allowed with argument -i/--input' % name)
     if args.random and args.loop:
         parser.error('argument -r/--random: not allowed with argument -l/--loop')
+    if args.outputFile != '-' and not args.inputFile:
+        parser.error('argument -o/--output: only allowed with argument -i/--input')
+    if args.chunkSize and not args.inputFile:
+        parser.error('argument --chunk-size: only allowed with argument -i/--input')
+    if args.seed is not None and not args.random:
+        parser.error('argument --seed: only allowed with argument -r/--random')
 
     return args
 
 
+def enableStats(start):
+    """ Time the phases of the backend and the writing of the result; see backend.enableStats. """
+    from backend import enableStats
+    ret = enableStats(start)
+    ret.add('parseCommandlineArguments', time.time() - start)
+    for name in ('writeComponents', 'writePieces', 'writeNumeric'):
+        ret.wrap(sys.modules[__name__], name)
+    return ret
+
+
+def writeStats(stats, jsonFile=None):
+    """ Write the breakdown of --stats to stderr and as JSON to jsonFile, if set. """
+    stats.stop()
+    stats.report(sys.stderr)
+    if jsonFile:
+        import json
+        with open(jsonFile, 'w') as out:
+            json.dump(stats.asDict(), out, indent=2)
+
+
 def configureLogging(verbose, formatString, **_):
-    """ Configure logging; if level is not set in args (-V/-VV), use ERROR. """
-    from logging import basicConfig, ERROR
-    basicConfig(level=verbose if verbose else ERROR, format=formatString[0])
+    """ Configure logging, if level is set in args (-V/-VV); nothing gets logged otherwise, so logging is not imported. """
+    if verbose:
+        from logging import basicConfig
+        basicConfig(level=verbose, format=formatString[0])
 
 
 if __name__ == "__main__":
     """ This is where the magic starts """
+    start = time.time()
     args = parseCommandlineArguments()
+    if args.stats is not None:
+        # Written on every exit, also on errors and when --serve gets killed.
+        import atexit
+        atexit.register(writeStats, enableStats(start), args.stats)
     configureLogging(**args.__dict__)
     locale.setlocale(locale.LC_NUMERIC, args.locale[0] if args.locale else '')
+    if args.serve:
+        from server import serve
+        try:
+            serve(args.serve, args.__dict__)
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
     try:
-        main(args)
+        if args.inputFile:
+            from bulk import sayFiles
+            sayFiles(**args.__dict__)
+        else:
+            main(args)
     except ValueError as ex:
         print ex.message
         sys.exit(3)
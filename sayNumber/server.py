@@ -0,0 +1,141 @@
+# Copyright (C) 2013 Daniel Marohn - daniel.marohn@gmail.com
+# This program is free software; find details in file LICENCE or here:
+# https://raw.github.com/camillo/sayNumber/master/sayNumber/LICENSE
+
+"""
+Answer requests to say numbers, one JSON object per line; this is say.py --serve.
+The process keeps running, so the latin tables and the scale word cache stay warm between the requests.
+
+A request has the number to say and the options; the keys are the names of the say.py options:
+{"id": 1, "number": "1234567", "shortScale": true, "numeric": true, "grouping": true}
+{"expression": "3e1000000+42"}
+The answer has the word, the numeric form if requested and the id, if the request had one:
+{"id": 1, "say": "1 million 234 thousand 567", "numeric": "1,234,567"}
+{"id": 2, "error": "not a number: 'foo'"}
+"""
+
+import json
+import os
+import signal
+import stat
+import sys
+import threading
+
+# Request keys, that set how to say the number; say.py options with the same name are the defaults.
+SAY_OPTIONS = ('shortScale', 'synonym', 'chuquet', 'delimiter', 'forceZ', 'forceC', 'forceSingular', 'forcePlural',
+               'byLine', 'zeros', 'numeric', 'grouping')
+
+# Request keys, that select what to say; exactly one of them must be set.
+WHAT_TO_SAY = ('number', 'expression')
+
+# The numeric form of -z/--zeros is refused for more zeros than this; the answer is one line.
+MAX_NUMERIC_ZEROS = 10 ** 7
+
+
+def answer(request, defaults=None):
+    """
+    Say the number of one request.
+    @param request dict, decoded from one line.
+    @param defaults dict with the options, that are used if the request does not set them; like args.__dict__.
+    @return dict to send back; has the key "error" instead of "say", if the request was not valid.
+    """
+    from backend import say, sayTerms, sayPowerOfTen, iterGroupedNumber, iterGroupedPowerOfTen
+    ret = {'id': request['id']} if 'id' in request else {}
+    try:
+        unknown = set(request).difference(SAY_OPTIONS + WHAT_TO_SAY + ('id', ))
+        if unknown:
+            raise ValueError("unknown option: %s" % ", ".join(sorted(unknown)))
+        options = dict((name, (defaults or {}).get(name)) for name in SAY_OPTIONS)
+        options.update((name, request[name]) for name in SAY_OPTIONS if name in request)
+        options['delimiter'] = options['delimiter'] or ''
+        what = [name for name in WHAT_TO_SAY if request.get(name) is not None]
+        if len(what) != 1:
+            raise ValueError("set one of: %s" % ", ".join(WHAT_TO_SAY))
+
+        if what[0] == 'expression':
+            if options['zeros'] or options['numeric']:
+                raise ValueError("zeros and numeric are not allowed with expression")
+            ret['say'] = sayTerms(request['expression'], **options)
+            return ret
+        number = str(request['number'])
+        if not number.isdigit():
+            raise ValueError("not a number: '%s'" % number)
+        # Leading zeros are dropped, like int() does it.
+        number = number.lstrip('0') or '0'
+        if options['zeros']:
+            ret['say'] = sayPowerOfTen(number, **options)
+            if options['numeric']:
+                if len(number) > 8 or int(number) > MAX_NUMERIC_ZEROS:
+                    raise ValueError("numeric is allowed for up to %d zeros" % MAX_NUMERIC_ZEROS)
+                ret['numeric'] = "".join(iterGroupedPowerOfTen(int(number), options['grouping']))
+        else:
+            ret['say'] = say(number, **options)
+            if options['numeric']:
+                ret['numeric'] = "".join(iterGroupedNumber(number, options['grouping']))
+    except Exception as ex:
+        # Whatever goes wrong, the server keeps running.
+        ret.pop('say', None)
+        ret['error'] = ex.message
+    return ret
+
+
+def answerLine(line, defaults=None):
+    """ Decode one line, say its number and return the encoded answer; with \\n. """
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("request must be a JSON object")
+    except ValueError as ex:
+        return json.dumps({'error': "invalid request: %s" % ex.message}) + "\n"
+    return json.dumps(answer(request, defaults)) + "\n"
+
+
+def serveLines(readLine, out, defaults=None, lock=None):
+    """
+    Answer every line, until readLine returns an empty string; each answer gets flushed at once.
+    @param readLine callable, that returns the next line (like file.readline, it does not read ahead).
+    @param lock Hold this while answering; the caches of the backend are not thread safe.
+    """
+    for line in iter(readLine, ''):
+        if not line.strip():
+            continue
+        if lock:
+            with lock:
+                ret = answerLine(line, defaults)
+        else:
+            ret = answerLine(line, defaults)
+        out.write(ret)
+        out.flush()
+
+
+def serveSocket(path, defaults=None):
+    """
+    Answer the requests of many clients on the unix socket path; one thread per connection.
+    A socket, that is left at path from an earlier run, gets replaced.
+    """
+    from SocketServer import StreamRequestHandler, ThreadingUnixStreamServer
+    lock = threading.Lock()
+
+    class Handler(StreamRequestHandler):
+        def handle(self):
+            serveLines(self.rfile.readline, self.wfile, defaults, lock)
+
+    if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+        os.remove(path)
+    server = ThreadingUnixStreamServer(path, Handler)
+    server.daemon_threads = True
+    # Leave through the finally block on kill too; it removes the socket.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        os.remove(path)
+
+
+def serve(target, defaults=None):
+    """ Answer requests on stdin/stdout, if target is '-', or on the unix socket target. """
+    if target == '-':
+        serveLines(sys.stdin.readline, sys.stdout, defaults)
+    else:
+        serveSocket(target, defaults)
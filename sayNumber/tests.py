@@ -2,8 +2,18 @@
 # This program is free software; find details in file LICENCE or here:
 # https://raw.github.com/camillo/sayNumber/master/sayNumber/LICENSE
 
+import json
+import locale
+import os
 import unittest
-from backend import say, sayByExp, _splitThousandBlocks, _sayLongScale, _sayLatin
+from itertools import islice
+from backend import say, iterSay, sayMany, sayByExp, _splitThousandBlocks, _iterThousandBlocks, _sayLongScale
+from backend import _sayLatin, _iterNonZeroBlocks
+from backend import _ScaleWords, _latinTable, ScaleWordCache, scaleWordCache, randomNumber, iterGroupedNumber
+from backend import iterGroupedPowerOfTen, groupedPowerOfTenLength, parseTerms, sayTerms
+from backend import parse, iterDigits, iterSayByExp, sayPowerOfTen, NumberFile, enableStats, disableStats
+from backend import _iterComponents, _iterComponentsNumpy, _iterBlockValues, _importNumpy, _numpyFor
+from backend import ScaleWord, sayScaleWord, iterSayPowerOfTen, sayLength, sayByExpLength, Name
 
 
 class TestInternal(unittest.TestCase):
@@ -31,6 +41,29 @@ class TestInternal(unittest.TestCase):
         self.assertEqual('221', split[1])
         self.assertEqual('777', split[2])
 
+    def testIterBlocks(self):
+        self.assertEqual([(1, '1')], list(_iterThousandBlocks('1')))
+        self.assertEqual([(2, '42'), (1, '000')], list(_iterThousandBlocks('42000')))
+        self.assertEqual([(3, '123'), (2, '456'), (1, '789')], list(_iterThousandBlocks('123456789')))
+        self.assertEqual([], list(_iterThousandBlocks('')))
+
+    def testRandomNumber(self):
+        number = randomNumber(100000, seed=42)
+        self.assertEqual(100000, len(number))
+        self.assertNotEqual('0', number[0])
+        self.assertTrue(number.isdigit())
+        self.assertEqual(number, randomNumber(100000, seed=42))
+        self.assertEqual('', randomNumber(0))
+
+    def testIterNonZeroBlocks(self):
+        self.assertEqual([(1, '0')], list(_iterNonZeroBlocks('0')))
+        self.assertEqual([(2, '42')], list(_iterNonZeroBlocks('42000')))
+        self.assertEqual([(5, '1'), (1, '007')], list(_iterNonZeroBlocks('1' + '000' * 3 + '007')))
+        self.assertEqual([(4, '100'), (2, '010')], list(_iterNonZeroBlocks('100000010000')))
+        self.assertEqual('1 milliard 7', say('1000000007'))
+        self.assertEqual([(100002, '5'), (1, '001')], list(_iterNonZeroBlocks('5' + '000' * 100000 + '001')))
+        self.assertEqual([(100001, '5')], list(_iterNonZeroBlocks('5' + '000' * 100000)))
+
     def testLatinConsistence(self):
         numbers = []
         for current in range(1, 1000):
@@ -63,6 +96,222 @@ class TestE6ToE18(unittest.TestCase):
         self.assertEqual(say('2000000000'), '2 milliards')
         self.assertEqual(say('2100000000'), '2 milliards 100 millions')
 
+    def testIterSay(self):
+        components = iterSay('2100000042')
+        self.assertEqual('2 milliards', next(components))
+        self.assertEqual(['100 millions', '42'], list(components))
+
+    def testSayMany(self):
+        numbers = ['1000000', 2000000000, '42']
+        self.assertEqual([say(number, shortScale=True) for number in numbers], list(sayMany(numbers, shortScale=True)))
+        self.assertEqual([say(number, byLine=True) for number in numbers], list(sayMany(numbers, byLine=True)))
+
+    def testWorkers(self):
+        number = '12' + '345' * 2000 + '000' * 100 + '6'
+        self.assertEqual(say(number), say(number, workers=3))
+        self.assertEqual(say(number, shortScale=True, byLine=True),
+                         say(number, shortScale=True, byLine=True, workers=2))
+
+    def testWorkerSegments(self):
+        import backend
+        minBlocks, segmentBlocks = backend.PARALLEL_MIN_BLOCKS, backend.PARALLEL_SEGMENT_BLOCKS
+        backend.PARALLEL_MIN_BLOCKS, backend.PARALLEL_SEGMENT_BLOCKS = 10, 15
+        try:
+            number = '12' + '345' * 200 + '000' * 100 + '6'
+            self.assertEqual(say(number), say(number, workers=2))
+        finally:
+            backend.PARALLEL_MIN_BLOCKS, backend.PARALLEL_SEGMENT_BLOCKS = minBlocks, segmentBlocks
+
+    def testByLine(self):
+        self.assertEqual(say('2100000042', byLine=True), os.linesep.join(['2 milliards', '100 millions', '42', '']))
+
+
+class TermsTest(unittest.TestCase):
+    def testParse(self):
+        self.assertEqual([('3', 1000000), ('42', 0)], parseTerms('3e1000000+42'))
+        self.assertEqual([('602214129', 15), ('7', 27), ('1', 100)], parseTerms('6.02214129e23 + 7*10^27 + 10**100'))
+        self.assertRaises(ValueError, parseTerms, '5.5')
+        self.assertRaises(ValueError, parseTerms, '7*10^-2')
+
+    def testSameAsSay(self):
+        self.assertEqual(say(7 * 10 ** 27 + 3 * 10 ** 9), sayTerms('7*10^27+3*10^9'))
+        self.assertEqual(say(6022141290 * 10 ** 14, shortScale=True), sayTerms('6.02214129e23', shortScale=True))
+        self.assertEqual(say(1001005, byLine=True), sayTerms('999e3+2e3+5', byLine=True))
+        self.assertEqual(say(7 * 10 ** 27 + 3 * 10 ** 9), sayTerms({27: 7, 9: 3}))
+        self.assertEqual('0', sayTerms('0e9'))
+
+    def testHuge(self):
+        self.assertEqual('30 sesexagintazentillisesexagintaseszentilliards 42', sayTerms('3e1000000+42'))
+
+
+class DecimalExponentTest(unittest.TestCase):
+    def testSameAsInt(self):
+        for zeros in [3, 6, 9, 123, 6000, 999999, 10 ** 21 + 2, 9290823849028419271209381902381 * 3]:
+            for kwargs in [{}, {'shortScale': True}, {'synonym': True, 'delimiter': '-', 'plural': True},
+                           {'chuquet': True, 'forceC': True}]:
+                expected = sayByExp(zeros, **kwargs)
+                self.assertEqual(expected, "".join(iterSayByExp(str(zeros), chunkGroups=1, **kwargs)))
+                self.assertEqual(expected, sayByExp('0' * 20 + str(zeros), **kwargs))
+
+    def testInvalid(self):
+        for zeros in ['2', '0' * 30, '1' * 30 + '1']:
+            self.assertRaises(ValueError, sayByExp, zeros)
+
+    def testPowerOfTen(self):
+        self.assertEqual('100 milliards', sayPowerOfTen(11))
+        self.assertEqual('10 trillions', sayPowerOfTen('0' * 20 + '13', shortScale=True))
+        self.assertEqual(sayPowerOfTen(3 * 10 ** 30 + 1), sayPowerOfTen('3' + '0' * 29 + '1'))
+
+    def testHuge(self):
+        word = sayByExp('3' + '0' * 100000)
+        self.assertEqual('quintilli' + 'nilli' * 33333 + 'on', word)
+
+
+class ServerTest(unittest.TestCase):
+    def testAnswer(self):
+        from server import answer
+        self.assertEqual({'id': 7, 'say': say(1234567)}, answer({'id': 7, 'number': 1234567}))
+        self.assertEqual({'say': say('10' * 20, shortScale=True, byLine=True), 'numeric': '10' * 20},
+                         answer({'number': '10' * 20, 'byLine': True, 'numeric': True}, {'shortScale': True}))
+        self.assertEqual({'say': '100 milliards'}, answer({'number': 11, 'zeros': True}))
+        self.assertEqual({'say': say(7000), 'numeric': '7000'}, answer({'number': '0007000', 'numeric': True}))
+        self.assertEqual({'say': '0'}, answer({'number': '000'}))
+        self.assertEqual({'say': sayTerms('3e1000+42')}, answer({'expression': '3e1000+42'}))
+
+    def testErrors(self):
+        from server import answer
+        for request in [{'number': 'foo'}, {'number': -5}, {}, {'number': 1, 'expression': '1'}, {'number': 1, 'x': 1},
+                        {'expression': '1', 'numeric': True}, {'number': 10 ** 9, 'zeros': True, 'numeric': True}]:
+            self.assertEqual(['error'], answer(request).keys())
+
+    def testServeLines(self):
+        from StringIO import StringIO
+        from server import serveLines
+        out = StringIO()
+        serveLines(StringIO('{"number": 42, "id": "a"}\n\nfoo\n{"number": "5000"}\n').readline, out)
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual({'id': 'a', 'say': '42'}, lines[0])
+        self.assertEqual(['error'], lines[1].keys())
+        self.assertEqual({'say': '5 thousand'}, lines[2])
+
+
+class BulkTest(unittest.TestCase):
+    def sayFile(self, text, **kwargs):
+        from StringIO import StringIO
+        from bulk import sayFile
+        out = StringIO()
+        return sayFile(StringIO(text), out, **kwargs), out.getvalue()
+
+    def testSayFile(self):
+        numbers = ['1', '1000000', '9999999345349583045894', '0', '5' * 100, '0001000', '000']
+        (count, digits), text = self.sayFile(' \n'.join(numbers) + '\n\n', chunkSize=2, shortScale=True)
+        numbers = [number.lstrip('0') or '0' for number in numbers]
+        self.assertEqual((7, sum([len(number) for number in numbers])), (count, digits))
+        self.assertEqual([say(number, shortScale=True) for number in numbers], text.splitlines())
+
+    def testOptions(self):
+        text = self.sayFile('1001005\n', numeric=True, byLine=True, delimiter='-')[1]
+        self.assertEqual('1001005\n' + say(1001005, byLine=True, delimiter='-') + '\n', text)
+
+    def testInvalid(self):
+        self.assertRaises(ValueError, self.sayFile, '12\n-5\n')
+
+    def testWorkers(self):
+        text = "".join([str(7 ** power) + '\n' for power in range(200)])
+        self.assertEqual(self.sayFile(text, synonym=True), self.sayFile(text, chunkSize=7, workers=2, synonym=True))
+
+
+class NumberFileTest(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def numberFile(self, text):
+        with open(self.path, 'wb') as numberFile:
+            numberFile.write(text)
+        return NumberFile(self.path)
+
+    def testDigits(self):
+        number = '9999999345349583045894' + '000' * 30000 + '7' * 301
+        with self.numberFile(' \n00' + number + '\r\n') as numberFile:
+            self.assertEqual(number, numberFile.digits[:])
+            self.assertEqual(say(number, shortScale=True), say(numberFile.digits, shortScale=True))
+            self.assertEqual(number, "".join(iterGroupedNumber(numberFile.digits, False, chunkGroups=100)))
+        with self.numberFile('000\n') as numberFile:
+            self.assertEqual('0', say(numberFile.digits))
+
+    def testInvalid(self):
+        for text in ['', ' \n', '12 3', '-5', '4e9']:
+            self.assertRaises(ValueError, self.numberFile, text)
+
+
+class StatsTest(unittest.TestCase):
+    def tearDown(self):
+        disableStats()
+
+    def testPhases(self):
+        import backend
+        number = '1234567' * 20
+        components = list(iterSay(number))
+        scaleWordCache.clear()
+        stats = enableStats()
+        self.assertTrue(backend.stats is stats)
+        self.assertEqual(" ".join(components), say(number))
+        phases = stats.asDict()['phases']
+        json.dumps(phases)
+        phases = dict((phase['name'], phase) for phase in phases)
+        self.assertEqual(len(components), phases['_iterComponents']['calls'])
+        self.assertEqual(sum([len(component) for component in components]), phases['_iterComponents']['bytes'])
+        self.assertEqual(len(components) - 1, phases['_ScaleWords.word']['calls'])
+        self.assertTrue(stats.asDict()['other'] >= 0)
+
+    def testDisable(self):
+        import backend
+        original = backend._iterComponents, backend._ScaleWords.__dict__['word']
+        enableStats()
+        self.assertNotEqual(original[0], backend._iterComponents)
+        disableStats()
+        self.assertTrue(backend.stats is None)
+        self.assertEqual(original, (backend._iterComponents, backend._ScaleWords.__dict__['word']))
+
+    def testError(self):
+        import backend
+        stats = enableStats()
+        self.assertRaises(ValueError, backend.sayByExp, 4)
+        self.assertEqual(1, stats.phases['sayByExp'][0])
+        self.assertEqual([], stats._stack)
+
+
+class ParseTest(unittest.TestCase):
+    def checkRoundTrip(self, number, **kwargs):
+        self.assertEqual(number, "".join(iterDigits(parse(say(number, **kwargs), **kwargs))))
+
+    def testParse(self):
+        self.assertEqual([(21, 9), (18, 999), (3, 45), (0, 894)],
+                         parse('9 trilliards 999 trillions 45 thousand 894'))
+        self.assertEqual([(9, 2), (6, 100)], parse('2 billions\n100 millions', shortScale=True))
+        self.assertEqual([], parse('0'))
+
+    def testRoundTrip(self):
+        number = '9999999345349583045894' + '000' * 400 + '7' * 301
+        self.checkRoundTrip(number)
+        self.checkRoundTrip(number, shortScale=True, byLine=True)
+        self.checkRoundTrip(number, synonym=True, delimiter='-')
+        self.checkRoundTrip(number, chuquet=True, forceC=True, forcePlural=True)
+        self.checkRoundTrip('0')
+
+    def testInvalid(self):
+        for text in ['5 foo', '1000', '5 thousand 7 millions', '3 nillion', '2 milliards']:
+            self.assertRaises(ValueError, parse, text, shortScale=text.endswith('milliards'))
+
+    def testDigits(self):
+        self.assertEqual('1000000042', "".join(iterDigits([(9, 1), (0, 42)], chunkBlocks=1)))
+        self.assertEqual('0', "".join(iterDigits([])))
+
 
 class TestLatin(unittest.TestCase):
 
@@ -125,6 +374,22 @@ class TestLatin(unittest.TestCase):
         self.assertEqual('quinqui', _sayLatin(5, synonym=True))
 
 
+class LatinTableTest(unittest.TestCase):
+    def testVariants(self):
+        self.assertEqual('triginta', _latinTable()[30])
+        self.assertEqual('triginti', _latinTable(stem=True)[30])
+        self.assertEqual('duo-quinquaginti', _latinTable('-', stem=True)[52])
+        self.assertEqual('sex-dezi', _latinTable('-', synonym=True)[16])
+        self.assertEqual('undeviginti', _latinTable(synonym=True, chuquet=True)[19])
+        self.assertEqual('sexdezi', _latinTable(synonym=True, chuquet=True)[16])
+
+    def testPacked(self):
+        from latinNumbers import buildTable
+        from latinTables import OFFSETS, unpackTable
+        for key in OFFSETS:
+            self.assertEqual(buildTable('', *key), unpackTable(*key))
+
+
 class LongScaleTest(unittest.TestCase):
     def testForceC(self):
         self.assertEqual('duocentillion', sayByExp(612, forceC=True))
@@ -145,6 +410,266 @@ class LongScaleTest(unittest.TestCase):
         self.assertEqual('trigintillion', _sayLongScale(180))
 
 
+class ScaleWordsTest(unittest.TestCase):
+    def checkDescending(self, top, bottom, **kwargs):
+        scaleWords = _ScaleWords(**kwargs)
+        for zeros in range(top, bottom, -3):
+            self.assertEqual(sayByExp(zeros, zeros % 2 == 0, **kwargs), scaleWords.word(zeros, zeros % 2 == 0))
+
+    def testLongScale(self):
+        self.checkDescending(6030, 3)
+        self.checkDescending(6000030, 5999970, delimiter='-', synonym=True)
+
+    def testShortScale(self):
+        self.checkDescending(3039, 2970, shortScale=True)
+        self.checkDescending(330, 3, shortScale=True, forceZ=True, chuquet=True)
+
+    def testLogLatin(self):
+        import logging
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger = logging.getLogger("latin")
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        try:
+            _ScaleWords().word(6 * 1000003)
+            _sayLongScale(6 * 1000003)
+        finally:
+            logger.removeHandler(handler)
+            logger.setLevel(logging.NOTSET)
+        self.assertEqual(["1 -> mi", "0 -> ni", "3 -> tri"] * 2, [record.getMessage() for record in records])
+
+
+class ScaleWordTest(unittest.TestCase):
+    def testWord(self):
+        from StringIO import StringIO
+        for zeros in [3, 6, 9, 600, 3003, 6 * 10 ** 9 + 3, '6' * 40]:
+            for kwargs in [{}, {'plural': True, 'shortScale': True}, {'delimiter': '-', 'synonym': True},
+                           {'chuquet': True, 'forceC': True}]:
+                expected = sayByExp(zeros, **kwargs)
+                word = sayScaleWord(zeros, **kwargs)
+                self.assertEqual(expected, str(word))
+                self.assertEqual(len(expected), len(word))
+                self.assertEqual(expected, "".join(word.iterChunks(chunkGroups=1)))
+                out = StringIO()
+                word.write(out)
+                self.assertEqual(expected, out.getvalue())
+        self.assertRaises(ValueError, sayScaleWord, 4)
+        self.assertRaises(ValueError, sayScaleWord, '0')
+
+    def testCompare(self):
+        word = sayScaleWord('6' * 30, shortScale=True)
+        self.assertEqual(word, sayScaleWord(6 * int('1' * 30), shortScale=True))
+        self.assertEqual(hash(word), hash(sayScaleWord('6' * 30, shortScale=True)))
+        self.assertNotEqual(word, sayScaleWord('6' * 30, plural=True, shortScale=True))
+        self.assertNotEqual(word, sayScaleWord('6' * 30, shortScale=True, forceZ=True))
+        self.assertNotEqual(word, str(word))
+        self.assertEqual(1, len(set([word, sayScaleWord('6' * 30, shortScale=True)])))
+
+    def testPowerOfTen(self):
+        for zeros in [11, '3' * 30, '1' + '0' * 19, '0' * 30 + '13']:
+            self.assertEqual(sayPowerOfTen(zeros, shortScale=True),
+                             "".join(iterSayPowerOfTen(zeros, shortScale=True, chunkGroups=2)))
+
+
+class SayLengthTest(unittest.TestCase):
+    numbers = [0, 7, 1000, 1001, 10 ** 6, 2 * 10 ** 6 + 1, 10 ** 6000 + 5 * 10 ** 3000, '0001', '',
+               '1' + '0' * 3000 + '2' * 300, "".join([str(7 ** power)[-4:] for power in range(1, 800)])]
+    options = [{}, {'shortScale': True, 'forceC': True}, {'byLine': True}, {'forcePlural': True, 'delimiter': '-'},
+               {'forceSingular': True, 'synonym': True, 'chuquet': True}]
+
+    def testLength(self):
+        for number in self.numbers:
+            for kwargs in self.options:
+                self.assertEqual(len(say(number, **kwargs)), sayLength(number, **kwargs))
+
+    def testPurePython(self):
+        import backend
+        numpy, backend._numpy = backend._numpy, None
+        try:
+            self.testLength()
+        finally:
+            backend._numpy = numpy
+
+    @unittest.skipIf(_importNumpy() is None, "NumPy is not installed")
+    def testNumpy(self):
+        import backend
+        minBlocks, backend.NUMPY_MIN_BLOCKS = backend.NUMPY_MIN_BLOCKS, 1
+        try:
+            self.testLength()
+        finally:
+            backend.NUMPY_MIN_BLOCKS = minBlocks
+
+    def testByExp(self):
+        for zeros in [3, 6, 9, 600, 3003, 6 * 10 ** 9 + 3, '6' * 40]:
+            for kwargs in [{}, {'plural': True, 'shortScale': True}, {'delimiter': '-', 'synonym': True},
+                           {'chuquet': True, 'shortScale': True, 'forceZ': True}]:
+                self.assertEqual(len(sayByExp(zeros, **kwargs)), sayByExpLength(zeros, **kwargs))
+        self.assertRaises(ValueError, sayByExpLength, 4)
+
+
+class NameTest(unittest.TestCase):
+    numbers = [0, 1000, 10 ** 6, '0001', '', '000', '1' + '0' * 3000 + '2' * 300, '10' + '000' * 200 + '1',
+               "".join([str(7 ** power)[-4:] for power in range(1, 800)])]
+
+    def checkName(self, number, **kwargs):
+        components, text = list(iterSay(number, shortScale=True)), say(number, shortScale=True, **kwargs)
+        name = say(number, lazy=True, shortScale=True, **kwargs)
+        self.assertEqual(text, str(name))
+        for index in [0, 1, -1, -2, len(components) // 2, len(components), -len(components) - 1]:
+            if -len(components) <= index < len(components):
+                self.assertEqual(components[index], Name(number, shortScale=True)[index])
+            else:
+                self.assertRaises(IndexError, Name(number, shortScale=True).__getitem__, index)
+        for item in [slice(None, 3), slice(-3, None), slice(-5, -2), slice(1, -1), slice(None, None, 2)]:
+            self.assertEqual(components[item], Name(number, shortScale=True)[item])
+        self.assertEqual(len(components), len(Name(number)))
+        self.assertEqual(len(text), name.textLength())
+        for start, stop in [(None, 10), (3, 30), (-10, None), (-20, -5), (5, -5), (-3, -10), (0, len(text) + 5)]:
+            self.assertEqual(text[start:stop], Name(number, shortScale=True, **kwargs).text(start, stop))
+
+    def testName(self):
+        for number in self.numbers:
+            self.checkName(number)
+            self.checkName(number, byLine=True, forcePlural=True)
+
+    def testIndex(self):
+        import backend
+        scanComponents, backend.NAME_SCAN_COMPONENTS = backend.NAME_SCAN_COMPONENTS, 1
+        numpy, backend._numpy = backend._numpy, None
+        try:
+            for number in self.numbers:
+                self.checkName(number)
+        finally:
+            backend.NAME_SCAN_COMPONENTS, backend._numpy = scanComponents, numpy
+
+    @unittest.skipIf(_importNumpy() is None, "NumPy is not installed")
+    def testIndexNumpy(self):
+        import backend
+        scanComponents, backend.NAME_SCAN_COMPONENTS = backend.NAME_SCAN_COMPONENTS, 1
+        minBlocks, backend.NUMPY_MIN_BLOCKS = backend.NUMPY_MIN_BLOCKS, 1
+        try:
+            for number in self.numbers:
+                self.checkName(number)
+        finally:
+            backend.NAME_SCAN_COMPONENTS, backend.NUMPY_MIN_BLOCKS = scanComponents, minBlocks
+
+
+class NumpyEngineTest(unittest.TestCase):
+    numbers = ['1' + '0' * 300, '12' + '000' * 100 + '001', '5' * 1000, '1000' * 70 + '0' * 9, '000' + '1' * 300,
+               "".join([str(7 ** power)[-5:] for power in range(1, 2000)])]
+
+    @unittest.skipIf(_importNumpy() is None, "NumPy is not installed")
+    def testComponents(self):
+        numpy = _importNumpy()
+        for number in self.numbers:
+            for forceSingular, forcePlural, blocksBelow in [(False, False, 0), (True, False, 0), (False, True, 2)]:
+                self.assertEqual(list(_iterComponents(number, _ScaleWords(), forceSingular, forcePlural, blocksBelow)),
+                                 list(_iterComponentsNumpy(numpy, number, _ScaleWords(), forceSingular, forcePlural,
+                                                           blocksBelow)))
+
+    @unittest.skipIf(_importNumpy() is None, "NumPy is not installed")
+    def testChunks(self):
+        number = self.numbers[-1]
+        values = []
+        for blocksLeft, chunk in _iterBlockValues(_importNumpy(), number, chunkBlocks=7):
+            self.assertEqual((len(number) + 2) // 3 - len(values), blocksLeft)
+            values.extend(chunk.tolist())
+        self.assertEqual([int(block) for block in _splitThousandBlocks(number)], values)
+        self.assertRaises(ValueError, list, _iterBlockValues(_importNumpy(), '1' * 300 + ' '))
+
+    @unittest.skipIf(_importNumpy() is None, "NumPy is not installed")
+    def testThreshold(self):
+        import backend
+        blocks = backend.NUMPY_MIN_BLOCKS
+        self.assertIsNone(_numpyFor('1' * 3 * (blocks - 1)))
+        self.assertIs(_importNumpy(), _numpyFor('1' * 3 * blocks))
+        self.assertIsNone(_numpyFor('0' + '1' * 3 * blocks))
+
+    def testFallback(self):
+        import backend
+        numpy, backend._numpy = backend._numpy, None
+        try:
+            for number in self.numbers:
+                self.assertEqual(" ".join(_iterComponents(number, _ScaleWords())), say(number))
+        finally:
+            backend._numpy = numpy
+
+
+class ScaleWordCacheTest(unittest.TestCase):
+    def testEviction(self):
+        cache = ScaleWordCache(maxSize=2)
+        cache.put(1, 'a')
+        cache.put(2, 'b')
+        self.assertEqual('a', cache.get(1))
+        cache.put(3, 'c')
+        self.assertEqual(None, cache.get(2))
+        self.assertEqual('c', cache.get(3))
+        self.assertEqual({'hits': 2, 'misses': 1, 'evictions': 1, 'size': 2, 'maxSize': 2}, cache.info())
+        cache.resize(0)
+        cache.put(4, 'd')
+        self.assertEqual(0, len(cache))
+
+    def testSayByExp(self):
+        scaleWordCache.clear()
+        self.assertEqual('billion', sayByExp(9, shortScale=True))
+        self.assertEqual('milliard', sayByExp(9))
+        self.assertEqual('billion', sayByExp(9, shortScale=True))
+        self.assertEqual('bi-llion', sayByExp(9, shortScale=True, delimiter='-'))
+        self.assertEqual(1, scaleWordCache.hits)
+        self.assertEqual(3, scaleWordCache.misses)
+
+
+class GroupedNumberTest(unittest.TestCase):
+    def setUp(self):
+        self.localeconv = locale.localeconv
+
+    def tearDown(self):
+        locale.localeconv = self.localeconv
+
+    def useGrouping(self, grouping, separator):
+        conv = dict(self.localeconv(), grouping=grouping, thousands_sep=separator)
+        locale.localeconv = lambda: conv
+
+    def checkSameAsLocale(self, number):
+        for grouping in (True, False):
+            self.assertEqual(locale.format("%d", int(number), grouping=grouping),
+                             "".join(iterGroupedNumber(number, grouping, chunkGroups=2)))
+
+    def testRepeated(self):
+        self.useGrouping([3, 0], '.')
+        self.assertEqual('1.234.567', "".join(iterGroupedNumber('1234567')))
+        self.assertEqual('1234567', "".join(iterGroupedNumber('1234567', grouping=False)))
+        for number in ['0', '12', '123', '1234', '123456789012345678901', '1' + '0' * 40]:
+            self.checkSameAsLocale(number)
+
+    def testIrregular(self):
+        self.useGrouping([3, 2, 0], ',')
+        self.assertEqual('1,23,45,678', "".join(iterGroupedNumber(12345678)))
+        self.useGrouping([3, locale.CHAR_MAX], ' ')
+        self.assertEqual('12345 678', "".join(iterGroupedNumber(12345678)))
+        for number in ['0', '12', '123', '1234', '123456789012345678901']:
+            self.checkSameAsLocale(number)
+
+    def checkSameAsNumber(self, zeros):
+        for grouping in (True, False):
+            numeric = "".join(iterGroupedNumber('1' + '0' * zeros, grouping))
+            self.assertEqual(numeric, "".join(iterGroupedPowerOfTen(zeros, grouping, chunkGroups=2)))
+            self.assertEqual(len(numeric), groupedPowerOfTenLength(zeros, grouping))
+
+    def testPowersOfTen(self):
+        for grouping, separator in [([3, 0], '.'), ([3, 2, 0], ','), ([2, locale.CHAR_MAX], ' ')]:
+            self.useGrouping(grouping, separator)
+            for zeros in range(20):
+                self.checkSameAsNumber(zeros)
+
+    def testHuge(self):
+        self.useGrouping([3, 0], '.')
+        self.assertEqual(['1', '00', '.000.000'], list(islice(iterGroupedPowerOfTen(10 ** 30 + 1, chunkGroups=2), 3)))
+        self.assertEqual(10 ** 30 + 1 + 10 ** 30 // 3, groupedPowerOfTenLength(10 ** 30))
+
+
 class ShortScaleTest(unittest.TestCase):
     def testTo303(self):
         self.assertEqual('million', sayByExp(6, shortScale=True))